@@ -0,0 +1,162 @@
+"""Benchmarks de desempenho do Roteirista Pro (python -m benchmarks [memory] [search] [cursor])"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tkinter as tk
+import tracemalloc
+
+from roteirista_pro import ScriptDocument, ScriptWriterApp, SearchIndex, compile_search, iter_search_chunks
+
+from tests.sample_script import generate_sample_script
+
+
+def benchmark_cursor_move(app, page_counts=(1, 10, 50, 100, 250, 500), moves=500):
+    """Mede o custo de mover o cursor (destaque da linha atual) em documentos de tamanhos diferentes"""
+    print("Movimento do cursor (destaque da linha atual)")
+    print(f"{'Páginas':>8} {'Linhas':>8} {'µs/movimento':>14}")
+    for pages in page_counts:
+        app.text_editor.delete(1.0, tk.END)
+        app.text_editor.insert(1.0, generate_sample_script(pages))
+        app.root.update_idletasks()
+        
+        line_count = int(app.text_editor.index('end-1c').split('.')[0])
+        targets = [random.randint(1, line_count) for _ in range(moves)]
+        
+        start = time.perf_counter()
+        for line in targets:
+            app.text_editor.mark_set(tk.INSERT, f"{line}.0")
+            app.highlight_current_line()
+        elapsed = time.perf_counter() - start
+        
+        print(f"{pages:>8} {line_count:>8} {elapsed / moves * 1e6:>14.1f}")
+    print()
+
+def benchmark_memory(page_counts=(100, 500, 2000)):
+    """Mede com tracemalloc a memória do modelo do documento e da tabela de elementos"""
+    print("Memória do roteiro analisado (KB)")
+    print(f"{'Páginas':>8} {'Linhas':>8} {'Texto':>10} {'Modelo':>10} {'Elementos':>10} {'Tuplas':>10}")
+    for pages in page_counts:
+        lines = generate_sample_script(pages).split('\n')
+        text_size = sys.getsizeof(lines) + sum(sys.getsizeof(line) for line in lines)
+        
+        tracemalloc.start()
+        document = ScriptDocument(40)
+        document.reset(lines)
+        model_size = tracemalloc.get_traced_memory()[0]
+        elements = document.elements()
+        table_size = tracemalloc.get_traced_memory()[0] - model_size
+        # Para comparação: os mesmos elementos como tuplas com cópia do texto (formato anterior)
+        expanded = tuple(elements)
+        tuples_size = tracemalloc.get_traced_memory()[0] - model_size - table_size
+        tracemalloc.stop()
+        
+        print(f"{pages:>8} {len(lines):>8} {text_size / 1024:>10.0f} {model_size / 1024:>10.0f} "
+              f"{table_size / 1024:>10.0f} {tuples_size / 1024:>10.0f}")
+        del document, elements, expanded
+    print()
+
+def benchmark_search(page_counts=(100, 500, 2000), repeats=5):
+    """Compara a busca pelo índice de palavras/trigramas com a varredura por expressão regular"""
+    queries = [("LOCAL 1234", False), ("detetive souza", False), ("ambiente", True), ("oão", False), 
+               ("personagem", False)]
+    structured = [{'character': "Maria"}, {'kind': 'dialogue', 'location': 'EXT', 'period': 'NOITE'},
+                  {'scene': "LOCAL 123"}, {'kind': 'transition'}]
+    
+    print("Índice de busca")
+    print(f"{'Páginas':>8} {'Linhas':>8} {'Construção (ms)':>16} {'Memória (KB)':>13} "
+          f"{'Gravar (ms)':>12} {'Ler (ms)':>9} {'Arquivo (KB)':>13}")
+    timings = []
+    structured_timings = []
+    for pages in page_counts:
+        document = ScriptDocument(40)
+        document.reset(generate_sample_script(pages).split('\n'))
+        content_hash = document.content_hash()
+        
+        start = time.perf_counter()
+        document.search_index.build(document.lines)
+        build_ms = (time.perf_counter() - start) * 1000
+        tracemalloc.start()
+        document.search_index.build(document.lines)
+        index_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'roteiro.idx')
+            start = time.perf_counter()
+            document.search_index.save(path, content_hash)
+            save_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            SearchIndex().load(path, content_hash)
+            load_ms = (time.perf_counter() - start) * 1000
+            file_size = os.path.getsize(path)
+        
+        print(f"{pages:>8} {document.line_count:>8} {build_ms:>16.0f} {index_size / 1024:>13.0f} "
+              f"{save_ms:>12.0f} {load_ms:>9.0f} {file_size / 1024:>13.0f}")
+        
+        # Tempo até ter todas as ocorrências (melhor de algumas repetições)
+        for term, whole_word in queries:
+            pattern = compile_search(term, False, whole_word)
+            results = {}
+            for mode in ('scan', 'index'):
+                best = None
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    if mode == 'scan':
+                        chunks = iter_search_chunks(pattern, document.snapshot())
+                    else:
+                        chunks = document.iter_matches(pattern, term, whole_word)
+                    count = sum(len(found) for found in chunks)
+                    elapsed = (time.perf_counter() - start) * 1000
+                    best = elapsed if best is None else min(best, elapsed)
+                results[mode] = (best, count)
+            used = document.search_index.candidate_lines(term, whole_word) is not None
+            timings.append((pages, term + (" (palavra)" if whole_word else ""), results['scan'][1], 
+                            results['scan'][0], results['index'][0], used))
+        
+        # Busca estruturada: só os índices de elementos
+        for filters in structured:
+            best = None
+            for _ in range(repeats):
+                start = time.perf_counter()
+                count = len(document.structured_lines(**filters))
+                elapsed = (time.perf_counter() - start) * 1000
+                best = elapsed if best is None else min(best, elapsed)
+            label = ", ".join(f"{key}={value}" for key, value in filters.items())
+            structured_timings.append((pages, label, count, best))
+    print()
+    
+    print(f"{'Páginas':>8} {'Termo':<22} {'Ocorrências':>12} {'Varredura (ms)':>15} {'Índice (ms)':>12}")
+    for pages, term, count, scan_ms, index_ms, used in timings:
+        note = "" if used else "  (comum demais: varredura)"
+        print(f"{pages:>8} {term:<22} {count:>12} {scan_ms:>15.2f} {index_ms:>12.2f}{note}")
+    print()
+    
+    print(f"{'Páginas':>8} {'Filtros':<42} {'Linhas':>8} {'Tempo (ms)':>11}")
+    for pages, label, count, elapsed in structured_timings:
+        print(f"{pages:>8} {label:<42} {count:>8} {elapsed:>11.2f}")
+    print()
+
+def run_benchmarks(selected=()):
+    """Executa os benchmarks (python -m benchmarks [memory] [search] [cursor])"""
+    if not selected or 'memory' in selected:
+        benchmark_memory()
+    
+    if not selected or 'search' in selected:
+        benchmark_search()
+    
+    if not selected or 'cursor' in selected:
+        root = tk.Tk()
+        root.withdraw()
+        app = ScriptWriterApp(root)
+        app.settings['highlight_current_line'] = True
+        
+        try:
+            benchmark_cursor_move(app)
+        finally:
+            root.destroy()
+
+if __name__ == "__main__":
+    run_benchmarks(sys.argv[1:])
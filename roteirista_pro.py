@@ -1,4542 +1,7277 @@
-import tkinter as tk
-from tkinter import filedialog, messagebox, font, ttk, colorchooser, simpledialog
-import os
-import sys
-import json
-from datetime import datetime
-import re
-from PIL import Image, ImageTk
-import tempfile
-import subprocess
-import hashlib
-from cryptography.fernet import Fernet
-import base64
-import time
-import threading
-import io
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib.colors import black, blue
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-
-class ScriptWriterApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Roteirista Pro")
-        self.root.geometry("1400x900")
-        self.root.configure(bg='#0a0a0a')  # Fundo preto
-        
-        # Configurar cores
-        self.bg_color = '#0a0a0a'
-        self.fg_color = '#ffffff'
-        self.blue_color = '#003366'
-        self.highlight_color = '#0066cc'
-        self.secondary_color = '#1a1a1a'
-        self.accent_color = '#ff9900'
-        self.cursor_color = '#00ff00'
-        self.line_highlight_color = '#1a1a2e'
-        
-        # Configurar fonte padrão
-        self.default_font = font.Font(family="Courier", size=12)
-        self.title_font = font.Font(family="Arial", size=14, weight="bold")
-        
-        # Variável para controlar o arquivo atual
-        self.current_file = None
-        self.current_password = None
-        
-        # Configurações do aplicativo
-        self.settings = {
-            'auto_save': True,
-            'auto_save_interval': 5,  # minutos
-            'last_dir': os.path.expanduser('~'),
-            'theme': 'dark',
-            'font_size': 12,
-            'font_family': 'Courier',
-            'show_line_numbers': True,
-            'word_wrap': True,
-            'highlight_current_line': True,
-            'show_cursor_position': True,
-            'script_format': 'standard',  # standard, fountain, etc.
-            'page_width': 80,  # caracteres por linha
-            'character_width': 40,  # caracteres para nomes de personagens
-            'dialogue_width': 35,  # caracteres para diálogos
-            'action_width': 60,  # caracteres para ações
-            'scene_width': 60  # caracteres para cenas
-        }
-        
-        # Carregar configurações
-        self.load_settings()
-        
-        # Aplicar tema
-        self.apply_theme()
-        
-        # Criar componentes da interface
-        self.create_toolbar()
-        self.create_menu()
-        self.create_status_bar()
-        self.create_sidebar()
-        self.create_text_editor()
-        
-        # Atalhos de teclado
-        self.setup_shortcuts()
-        
-        # Iniciar auto-salvamento
-        self.auto_save()
-        
-        # Personagens e cenas
-        self.characters = []
-        self.scenes = []
-        
-        # Estado da busca
-        self.search_term = ""
-        self.search_matches = []
-        self.current_match = -1
-        
-        # Estado do cursor
-        self.cursor_visible = True
-        self.cursor_blink()
-        
-        # Estado da linha atual
-        self.current_line_tag = None
-        
-        # Timer para salvar
-        self.last_saved_time = time.time()
-        
-    def apply_theme(self):
-        if self.settings['theme'] == 'light':
-            self.bg_color = '#f0f0f0'
-            self.fg_color = '#000000'
-            self.blue_color = '#4a86e8'
-            self.highlight_color = '#1155cc'
-            self.secondary_color = '#e0e0e0'
-            self.accent_color = '#ff6600'
-            self.cursor_color = '#006600'
-            self.line_highlight_color = '#e6e6e6'
-        else:
-            self.bg_color = '#0a0a0a'
-            self.fg_color = '#ffffff'
-            self.blue_color = '#003366'
-            self.highlight_color = '#0066cc'
-            self.secondary_color = '#1a1a1a'
-            self.accent_color = '#ff9900'
-            self.cursor_color = '#00ff00'
-            self.line_highlight_color = '#1a1a2e'
-    
-    def create_toolbar(self):
-        # Barra de ferramentas principal
-        self.main_toolbar = tk.Frame(self.root, bg=self.secondary_color, height=40)
-        self.main_toolbar.pack(side=tk.TOP, fill=tk.X)
-        
-        # Barra de ferramentas de formatação
-        self.format_toolbar = tk.Frame(self.root, bg=self.secondary_color, height=40)
-        self.format_toolbar.pack(side=tk.TOP, fill=tk.X)
-        
-        # Barra de ferramentas de elementos
-        self.elements_toolbar = tk.Frame(self.root, bg=self.secondary_color, height=40)
-        self.elements_toolbar.pack(side=tk.TOP, fill=tk.X)
-        
-        # Botões da barra de ferramentas principal
-        main_buttons = [
-            ("Novo", self.new_file, "new.png"),
-            ("Abrir", self.open_file, "open.png"),
-            ("Salvar", self.save_file, "save.png"),
-            ("Salvar Seguro", self.save_secure_file, "secure.png"),
-            ("", None, ""),  # Separador
-            ("Desfazer", self.undo, "undo.png"),
-            ("Refazer", self.redo, "redo.png"),
-            ("", None, ""),  # Separador
-            ("Buscar", self.show_search_dialog, "search.png"),
-            ("Substituir", self.show_replace_dialog, "replace.png"),
-            ("", None, ""),  # Separador
-            ("Estatísticas", self.show_stats, "stats.png"),
-            ("Verificar Ortografia", self.check_spelling, "spell.png"),
-            ("", None, ""),  # Separador
-            ("PDF", self.export_pdf, "pdf.png"),
-            ("Imprimir", self.print_script, "print.png")
-        ]
-        
-        for text, command, icon in main_buttons:
-            if text == "":
-                # Separador
-                separator = ttk.Separator(self.main_toolbar, orient='vertical')
-                separator.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-            else:
-                # Botão
-                btn = tk.Button(self.main_toolbar, text=text, command=command,
-                               bg=self.secondary_color, fg=self.fg_color,
-                               bd=0, padx=10, pady=5)
-                btn.pack(side=tk.LEFT, padx=2)
-                
-                # Adicionar tooltip
-                self.create_tooltip(btn, text)
-        
-        # Botões da barra de ferramentas de formatação
-        format_buttons = [
-            ("Negrito", self.toggle_bold, "bold.png"),
-            ("Itálico", self.toggle_italic, "italic.png"),
-            ("Sublinhado", self.toggle_underline, "underline.png"),
-            ("", None, ""),  # Separador
-            ("Fonte", self.change_font, "font.png"),
-            ("Cor", self.change_color, "color.png"),
-            ("", None, ""),  # Separador
-            ("Zoom In", self.zoom_in, "zoom_in.png"),
-            ("Zoom Out", self.zoom_out, "zoom_out.png"),
-            ("Zoom Normal", self.zoom_normal, "zoom_normal.png")
-        ]
-        
-        for text, command, icon in format_buttons:
-            if text == "":
-                # Separador
-                separator = ttk.Separator(self.format_toolbar, orient='vertical')
-                separator.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-            else:
-                # Botão
-                btn = tk.Button(self.format_toolbar, text=text, command=command,
-                               bg=self.secondary_color, fg=self.fg_color,
-                               bd=0, padx=10, pady=5)
-                btn.pack(side=tk.LEFT, padx=2)
-                
-                # Adicionar tooltip
-                self.create_tooltip(btn, text)
-        
-        # Botões da barra de ferramentas de elementos
-        elements_buttons = [
-            ("Cena", self.insert_scene, "scene.png"),
-            ("Personagem", self.insert_character, "character.png"),
-            ("Diálogo", self.insert_dialogue, "dialogue.png"),
-            ("Ação", self.insert_action, "action.png"),
-            ("Transição", self.insert_transition, "transition.png"),
-            ("Nota", self.insert_note, "note.png"),
-            ("", None, ""),  # Separador
-            ("Reformatar", self.reformat_script, "reformat.png"),
-            ("Análise", self.analyze_script, "analyze.png")
-        ]
-        
-        for text, command, icon in elements_buttons:
-            if text == "":
-                # Separador
-                separator = ttk.Separator(self.elements_toolbar, orient='vertical')
-                separator.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-            else:
-                # Botão
-                btn = tk.Button(self.elements_toolbar, text=text, command=command,
-                               bg=self.secondary_color, fg=self.fg_color,
-                               bd=0, padx=10, pady=5)
-                btn.pack(side=tk.LEFT, padx=2)
-                
-                # Adicionar tooltip
-                self.create_tooltip(btn, text)
-    
-    def create_tooltip(self, widget, text):
-        def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = tk.Label(tooltip, text=text, bg=self.secondary_color, fg=self.fg_color,
-                            relief=tk.SOLID, borderwidth=1, font=("Arial", 9))
-            label.pack()
-            widget.tooltip = tooltip
-            
-        def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
-                
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
-    
-    def create_menu(self):
-        menubar = tk.Menu(self.root, bg=self.blue_color, fg=self.fg_color)
-        self.root.config(menu=menubar)
-        
-        # Menu Arquivo
-        file_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
-        menubar.add_cascade(label="Arquivo", menu=file_menu)
-        file_menu.add_command(label="Novo", command=self.new_file, accelerator="Ctrl+N")
-        file_menu.add_command(label="Abrir", command=self.open_file, accelerator="Ctrl+O")
-        file_menu.add_separator()
-        file_menu.add_command(label="Salvar", command=self.save_file, accelerator="Ctrl+S")
-        file_menu.add_command(label="Salvar Como", command=self.save_file_as, accelerator="Ctrl+Shift+S")
-        file_menu.add_command(label="Salvar Seguro", command=self.save_secure_file, accelerator="Ctrl+Alt+S")
-        file_menu.add_separator()
-        file_menu.add_command(label="Importar", command=self.import_file)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exportar PDF", command=self.export_pdf, accelerator="Ctrl+E")
-        file_menu.add_command(label="Exportar HTML", command=self.export_html)
-        file_menu.add_command(label="Exportar Fountain", command=self.export_fountain)
-        file_menu.add_separator()
-        file_menu.add_command(label="Imprimir", command=self.print_script, accelerator="Ctrl+P")
-        file_menu.add_separator()
-        file_menu.add_command(label="Sair", command=self.exit_app, accelerator="Ctrl+Q")
-        
-        # Menu Editar
-        edit_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
-        menubar.add_cascade(label="Editar", menu=edit_menu)
-        edit_menu.add_command(label="Desfazer", command=self.undo, accelerator="Ctrl+Z")
-        edit_menu.add_command(label="Refazer", command=self.redo, accelerator="Ctrl+Y")
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Recortar", command=self.cut_text, accelerator="Ctrl+X")
-        edit_menu.add_command(label="Copiar", command=self.copy_text, accelerator="Ctrl+C")
-        edit_menu.add_command(label="Colar", command=self.paste_text, accelerator="Ctrl+V")
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Negrito", command=self.toggle_bold, accelerator="Ctrl+B")
-        edit_menu.add_command(label="Itálico", command=self.toggle_italic, accelerator="Ctrl+I")
-        edit_menu.add_command(label="Sublinhado", command=self.toggle_underline, accelerator="Ctrl+U")
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Buscar", command=self.show_search_dialog, accelerator="Ctrl+F")
-        edit_menu.add_command(label="Substituir", command=self.show_replace_dialog, accelerator="Ctrl+R")
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Ir Para", command=self.go_to_line, accelerator="Ctrl+G")
-        edit_menu.add_command(label="Selecionar Tudo", command=self.select_all, accelerator="Ctrl+A")
-        
-        # Menu Formato
-        format_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
-        menubar.add_cascade(label="Formato", menu=format_menu)
-        format_menu.add_command(label="Personagem", command=self.insert_character, accelerator="Ctrl+P")
-        format_menu.add_command(label="Diálogo", command=self.insert_dialogue, accelerator="Ctrl+D")
-        format_menu.add_command(label="Ação", command=self.insert_action, accelerator="Ctrl+Shift+A")
-        format_menu.add_command(label="Cena", command=self.insert_scene, accelerator="Ctrl+Shift+C")
-        format_menu.add_command(label="Transição", command=self.insert_transition, accelerator="Ctrl+T")
-        format_menu.add_command(label="Nota", command=self.insert_note, accelerator="Ctrl+Shift+N")
-        format_menu.add_separator()
-        format_menu.add_command(label="Reformatar Roteiro", command=self.reformat_script)
-        format_menu.add_command(label="Configurar Formatação", command=self.configure_formatting)
-        format_menu.add_separator()
-        format_menu.add_command(label="Fonte", command=self.change_font)
-        format_menu.add_command(label="Cor", command=self.change_color)
-        format_menu.add_separator()
-        format_menu.add_checkbutton(label="Quebra de Linha", command=self.toggle_word_wrap)
-        format_menu.add_checkbutton(label="Números de Linha", command=self.toggle_line_numbers)
-        format_menu.add_checkbutton(label="Destacar Linha Atual", command=self.toggle_line_highlight)
-        
-        # Menu Ferramentas
-        tools_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
-        menubar.add_cascade(label="Ferramentas", menu=tools_menu)
-        tools_menu.add_checkbutton(label="Auto-salvar", command=self.toggle_auto_save)
-        tools_menu.add_command(label="Gerenciar Personagens", command=self.manage_characters)
-        tools_menu.add_command(label="Gerenciar Cenas", command=self.manage_scenes)
-        tools_menu.add_command(label="Contar Palavras", command=self.word_count)
-        tools_menu.add_command(label="Estatísticas", command=self.show_stats)
-        tools_menu.add_command(label="Verificar Ortografia", command=self.check_spelling)
-        tools_menu.add_command(label="Analisar Roteiro", command=self.analyze_script)
-        tools_menu.add_command(label="Tempo de Leitura", command=self.estimate_reading_time)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="Configurações", command=self.show_settings)
-        
-        # Menu Visualizar
-        view_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
-        menubar.add_cascade(label="Visualizar", menu=view_menu)
-        view_menu.add_radiobutton(label="Tema Escuro", command=lambda: self.change_theme('dark'))
-        view_menu.add_radiobutton(label="Tema Claro", command=lambda: self.change_theme('light'))
-        view_menu.add_separator()
-        view_menu.add_command(label="Zoom In", command=self.zoom_in, accelerator="Ctrl++")
-        view_menu.add_command(label="Zoom Out", command=self.zoom_out, accelerator="Ctrl+-")
-        view_menu.add_command(label="Zoom Normal", command=self.zoom_normal, accelerator="Ctrl+0")
-        view_menu.add_separator()
-        view_menu.add_checkbutton(label="Barra de Ferramentas Principal", command=self.toggle_main_toolbar)
-        view_menu.add_checkbutton(label="Barra de Formatação", command=self.toggle_format_toolbar)
-        view_menu.add_checkbutton(label="Barra de Elementos", command=self.toggle_elements_toolbar)
-        view_menu.add_checkbutton(label="Barra Lateral", command=self.toggle_sidebar)
-        view_menu.add_checkbutton(label="Barra de Status", command=self.toggle_status_bar)
-        
-        # Menu Ajuda
-        help_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
-        menubar.add_cascade(label="Ajuda", menu=help_menu)
-        help_menu.add_command(label="Atalhos", command=self.show_shortcuts)
-        help_menu.add_command(label="Tutorial", command=self.show_tutorial)
-        help_menu.add_command(label="Guia de Formatação", command=self.show_formatting_guide)
-        help_menu.add_command(label="Sobre", command=self.show_about)
-    
-    def create_status_bar(self):
-        # Barra de status
-        self.status_bar = tk.Frame(self.root, bg=self.secondary_color, height=25)
-        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        # Frame para informações de status
-        status_info_frame = tk.Frame(self.status_bar, bg=self.secondary_color)
-        status_info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Informações de status
-        self.status_text = tk.StringVar()
-        self.status_text.set("Pronto")
-        
-        self.status_label = tk.Label(status_info_frame, textvariable=self.status_text, 
-                                    bg=self.secondary_color, fg=self.fg_color, 
-                                    anchor=tk.W, padx=10)
-        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Frame para informações do documento
-        doc_info_frame = tk.Frame(self.status_bar, bg=self.secondary_color)
-        doc_info_frame.pack(side=tk.RIGHT)
-        
-        # Contador de palavras
-        self.word_count_label = tk.Label(doc_info_frame, text="Palavras: 0", 
-                                        bg=self.secondary_color, fg=self.fg_color, 
-                                        padx=10)
-        self.word_count_label.pack(side=tk.RIGHT)
-        
-        # Posição do cursor
-        self.cursor_pos_label = tk.Label(doc_info_frame, text="Ln 1, Col 1", 
-                                        bg=self.secondary_color, fg=self.fg_color, 
-                                        padx=10)
-        self.cursor_pos_label.pack(side=tk.RIGHT)
-        
-        # Formato do elemento atual
-        self.element_format_label = tk.Label(doc_info_frame, text="Normal", 
-                                           bg=self.secondary_color, fg=self.fg_color, 
-                                           padx=10)
-        self.element_format_label.pack(side=tk.RIGHT)
-        
-        # Indicador de salvamento
-        self.save_indicator = tk.Label(doc_info_frame, text="●", 
-                                      bg=self.secondary_color, fg=self.accent_color, 
-                                      padx=5)
-        self.save_indicator.pack(side=tk.RIGHT)
-    
-    def create_sidebar(self):
-        # Frame do menu lateral
-        self.sidebar = tk.Frame(self.root, bg=self.blue_color, width=220)
-        self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
-        
-        # Botão para retrair/expandir
-        self.toggle_button = tk.Button(self.sidebar, text="◀", command=self.toggle_sidebar, 
-                                      bg=self.blue_color, fg=self.fg_color, bd=0)
-        self.toggle_button.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Título do menu
-        title_label = tk.Label(self.sidebar, text="Ferramentas de Roteiro", 
-                              bg=self.blue_color, fg=self.fg_color, font=self.title_font)
-        title_label.pack(pady=10)
-        
-        # Notebook para abas
-        self.sidebar_notebook = ttk.Notebook(self.sidebar)
-        self.sidebar_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Aba de elementos
-        elements_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
-        self.sidebar_notebook.add(elements_frame, text="Elementos")
-        
-        # Funções de escrita
-        self.functions = [
-            ("Cena", self.insert_scene, "Ctrl+Shift+C"),
-            ("Personagem", self.insert_character, "Ctrl+P"),
-            ("Diálogo", self.insert_dialogue, "Ctrl+D"),
-            ("Ação", self.insert_action, "Ctrl+Shift+A"),
-            ("Transição", self.insert_transition, "Ctrl+T"),
-            ("Nota", self.insert_note, "Ctrl+Shift+N")
-        ]
-        
-        for func_name, command, shortcut in self.functions:
-            btn_frame = tk.Frame(elements_frame, bg=self.blue_color)
-            btn_frame.pack(fill=tk.X, padx=5, pady=2)
-            
-            # Ícone (simulado com texto)
-            icon_label = tk.Label(btn_frame, text="●", bg=self.blue_color, fg=self.highlight_color)
-            icon_label.pack(side=tk.LEFT, padx=5)
-            
-            # Botão
-            btn = tk.Button(btn_frame, text=f"{func_name}", command=command,
-                           bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w')
-            btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            
-            # Atalho
-            shortcut_label = tk.Label(btn_frame, text=shortcut, bg=self.blue_color, fg=self.fg_color)
-            shortcut_label.pack(side=tk.RIGHT, padx=5)
-        
-        # Aba de formatação
-        format_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
-        self.sidebar_notebook.add(format_frame, text="Formatação")
-        
-        format_functions = [
-            ("Negrito", self.toggle_bold, "Ctrl+B"),
-            ("Itálico", self.toggle_italic, "Ctrl+I"),
-            ("Sublinhado", self.toggle_underline, "Ctrl+U"),
-            ("Alinhar à Esquerda", self.align_left, ""),
-            ("Centralizar", self.align_center, ""),
-            ("Alinhar à Direita", self.align_right, "")
-        ]
-        
-        for func_name, command, shortcut in format_functions:
-            btn_frame = tk.Frame(format_frame, bg=self.blue_color)
-            btn_frame.pack(fill=tk.X, padx=5, pady=2)
-            
-            # Ícone (simulado com texto)
-            icon_label = tk.Label(btn_frame, text="●", bg=self.blue_color, fg=self.highlight_color)
-            icon_label.pack(side=tk.LEFT, padx=5)
-            
-            # Botão
-            btn = tk.Button(btn_frame, text=f"{func_name}", command=command,
-                           bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w')
-            btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            
-            # Atalho
-            if shortcut:
-                shortcut_label = tk.Label(btn_frame, text=shortcut, bg=self.blue_color, fg=self.fg_color)
-                shortcut_label.pack(side=tk.RIGHT, padx=5)
-        
-        # Aba de personagens
-        self.characters_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
-        self.sidebar_notebook.add(self.characters_frame, text="Personagens")
-        
-        # Lista de personagens
-        self.characters_listbox = tk.Listbox(self.characters_frame, bg=self.secondary_color, 
-                                            fg=self.fg_color, bd=0, height=10)
-        self.characters_listbox.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
-        
-        # Botões para personagens
-        char_buttons_frame = tk.Frame(self.characters_frame, bg=self.blue_color)
-        char_buttons_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        add_char_btn = tk.Button(char_buttons_frame, text="Adicionar", command=self.add_character,
-                                bg=self.blue_color, fg=self.fg_color, bd=0)
-        add_char_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
-        
-        edit_char_btn = tk.Button(char_buttons_frame, text="Editar", command=self.edit_character,
-                                 bg=self.blue_color, fg=self.fg_color, bd=0)
-        edit_char_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
-        
-        remove_char_btn = tk.Button(char_buttons_frame, text="Remover", command=self.remove_character,
-                                   bg=self.blue_color, fg=self.fg_color, bd=0)
-        remove_char_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
-        
-        # Aba de cenas
-        self.scenes_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
-        self.sidebar_notebook.add(self.scenes_frame, text="Cenas")
-        
-        # Lista de cenas
-        self.scenes_listbox = tk.Listbox(self.scenes_frame, bg=self.secondary_color, 
-                                        fg=self.fg_color, bd=0, height=10)
-        self.scenes_listbox.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
-        
-        # Botões para cenas
-        scene_buttons_frame = tk.Frame(self.scenes_frame, bg=self.blue_color)
-        scene_buttons_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        add_scene_btn = tk.Button(scene_buttons_frame, text="Adicionar", command=self.add_scene,
-                                 bg=self.blue_color, fg=self.fg_color, bd=0)
-        add_scene_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
-        
-        edit_scene_btn = tk.Button(scene_buttons_frame, text="Editar", command=self.edit_scene,
-                                 bg=self.blue_color, fg=self.fg_color, bd=0)
-        edit_scene_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
-        
-        remove_scene_btn = tk.Button(scene_buttons_frame, text="Remover", command=self.remove_scene,
-                                    bg=self.blue_color, fg=self.fg_color, bd=0)
-        remove_scene_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
-        
-        # Aba de notas
-        self.notes_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
-        self.sidebar_notebook.add(self.notes_frame, text="Notas")
-        
-        # Editor de notas
-        self.notes_editor = tk.Text(self.notes_frame, bg=self.secondary_color, fg=self.fg_color,
-                                   height=10, bd=0, wrap=tk.WORD)
-        self.notes_editor.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
-        
-        # Botão para salvar notas
-        save_notes_btn = tk.Button(self.notes_frame, text="Salvar Notas", command=self.save_notes,
-                                  bg=self.blue_color, fg=self.fg_color, bd=0)
-        save_notes_btn.pack(pady=5, padx=5, fill=tk.X)
-        
-        # Aba de ferramentas
-        tools_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
-        self.sidebar_notebook.add(tools_frame, text="Ferramentas")
-        
-        tools_functions = [
-            ("Verificar Ortografia", self.check_spelling, ""),
-            ("Contar Palavras", self.word_count, ""),
-            ("Estatísticas", self.show_stats, ""),
-            ("Analisar Roteiro", self.analyze_script, ""),
-            ("Tempo de Leitura", self.estimate_reading_time, ""),
-            ("Reformatar Roteiro", self.reformat_script, "")
-        ]
-        
-        for func_name, command, shortcut in tools_functions:
-            btn_frame = tk.Frame(tools_frame, bg=self.blue_color)
-            btn_frame.pack(fill=tk.X, padx=5, pady=2)
-            
-            # Ícone (simulado com texto)
-            icon_label = tk.Label(btn_frame, text="●", bg=self.blue_color, fg=self.highlight_color)
-            icon_label.pack(side=tk.LEFT, padx=5)
-            
-            # Botão
-            btn = tk.Button(btn_frame, text=f"{func_name}", command=command,
-                           bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w')
-            btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Separador
-        separator = tk.Frame(self.sidebar, height=2, bg=self.highlight_color)
-        separator.pack(fill=tk.X, pady=10, padx=5)
-        
-        # Botões de arquivo
-        file_btn = tk.Button(self.sidebar, text="Novo Roteiro", command=self.new_file,
-                            bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w', width=20)
-        file_btn.pack(pady=2, padx=5, fill=tk.X)
-        
-        open_btn = tk.Button(self.sidebar, text="Abrir Roteiro", command=self.open_file,
-                            bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w', width=20)
-        open_btn.pack(pady=2, padx=5, fill=tk.X)
-        
-        save_btn = tk.Button(self.sidebar, text="Salvar Roteiro", command=self.save_file,
-                            bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w', width=20)
-        save_btn.pack(pady=2, padx=5, fill=tk.X)
-        
-        secure_btn = tk.Button(self.sidebar, text="Salvar Seguro", command=self.save_secure_file,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w', width=20)
-        secure_btn.pack(pady=2, padx=5, fill=tk.X)
-        
-        # Estado do menu lateral (expandido ou retraído)
-        self.sidebar_expanded = True
-    
-    def toggle_sidebar(self):
-        if self.sidebar_expanded:
-            # Retrair
-            self.sidebar.pack_forget()
-            self.sidebar = tk.Frame(self.root, bg=self.blue_color, width=40)
-            self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
-            self.toggle_button = tk.Button(self.sidebar, text="▶", command=self.toggle_sidebar,
-                                          bg=self.blue_color, fg=self.fg_color, bd=0)
-            self.toggle_button.pack(side=tk.RIGHT, fill=tk.Y)
-            self.sidebar_expanded = False
-        else:
-            # Expandir
-            self.sidebar.pack_forget()
-            self.create_sidebar()
-            self.sidebar_expanded = True
-    
-    def create_text_editor(self):
-        # Frame do editor
-        editor_frame = tk.Frame(self.root, bg=self.bg_color)
-        editor_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Frame para números de linha e editor
-        text_container = tk.Frame(editor_frame, bg=self.bg_color)
-        text_container.pack(fill=tk.BOTH, expand=True)
-        
-        # Números de linha
-        if self.settings['show_line_numbers']:
-            self.line_numbers = tk.Text(text_container, width=5, padx=3, takefocus=0, border=0,
-                                       bg=self.secondary_color, fg=self.fg_color,
-                                       font=self.default_font, state='disabled', wrap=tk.NONE)
-            self.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
-        
-        # Editor de texto
-        self.text_editor = tk.Text(text_container, bg=self.bg_color, fg=self.fg_color, 
-                                  font=self.default_font, wrap=tk.WORD if self.settings['word_wrap'] else tk.NONE,
-                                  undo=True, bd=0, padx=5, pady=5, insertbackground=self.cursor_color)
-        self.text_editor.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Scrollbar
-        scrollbar = tk.Scrollbar(editor_frame, command=self.on_scrollbar)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.text_editor.config(yscrollcommand=scrollbar.set)
-        
-        # Configurar tags para formatação
-        self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
-        self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
-        self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
-        self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
-                                      foreground=self.highlight_color)
-        self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
-                                      foreground=self.highlight_color)
-        self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
-                                      foreground=self.highlight_color)
-        self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
-                                      foreground="#cccccc")
-        self.text_editor.tag_configure("highlight", background=self.accent_color)
-        self.text_editor.tag_configure("current_line", background=self.line_highlight_color)
-        
-        # Eventos do editor
-        self.text_editor.bind('<KeyRelease>', self.on_text_change)
-        self.text_editor.bind('<ButtonRelease-1>', self.on_cursor_move)
-        self.text_editor.bind('<Key>', self.on_cursor_move)
-        self.text_editor.bind('<FocusIn>', self.on_focus_in)
-        self.text_editor.bind('<FocusOut>', self.on_focus_out)
-        self.text_editor.bind('<MouseWheel>', self.on_mousewheel)
-        
-        # Atualizar números de linha
-        if self.settings['show_line_numbers']:
-            self.update_line_numbers()
-        
-        # Destacar linha atual
-        if self.settings['highlight_current_line']:
-            self.highlight_current_line()
-    
-    def on_scrollbar(self, *args):
-        self.text_editor.yview(*args)
-        if self.settings['show_line_numbers']:
-            self.line_numbers.yview(*args)
-            self.update_line_numbers()
-    
-    def on_text_change(self, event=None):
-        # Atualizar contador de palavras
-        self.update_word_count()
-        
-        # Atualizar números de linha
-        if self.settings['show_line_numbers']:
-            self.update_line_numbers()
-        
-        # Destacar linha atual
-        if self.settings['highlight_current_line']:
-            self.highlight_current_line()
-        
-        # Detectar formato do elemento atual
-        self.detect_current_element_format()
-        
-        # Atualizar status
-        self.update_status("Editando...")
-        
-        # Atualizar indicador de salvamento
-        self.update_save_indicator()
-    
-    def on_cursor_move(self, event=None):
-        # Atualizar posição do cursor
-        line, col = self.text_editor.index(tk.INSERT).split('.')
-        self.cursor_pos_label.config(text=f"Ln {int(line)}, Col {int(col)+1}")
-        
-        # Destacar linha atual
-        if self.settings['highlight_current_line']:
-            self.highlight_current_line()
-        
-        # Detectar formato do elemento atual
-        self.detect_current_element_format()
-    
-    def on_focus_in(self, event=None):
-        # Destacar linha atual quando o editor recebe foco
-        if self.settings['highlight_current_line']:
-            self.highlight_current_line()
-    
-    def on_focus_out(self, event=None):
-        # Remover destaque da linha atual quando o editor perde foco
-        if self.settings['highlight_current_line']:
-            self.text_editor.tag_remove("current_line", "1.0", tk.END)
-    
-    def on_mousewheel(self, event):
-        # Sincronizar a rolagem do mouse com os números de linha
-        if self.settings['show_line_numbers']:
-            self.update_line_numbers()
-    
-    def cursor_blink(self):
-        # Alternar visibilidade do cursor
-        if self.cursor_visible:
-            self.text_editor.config(insertbackground=self.cursor_color)
-        else:
-            self.text_editor.config(insertbackground=self.bg_color)
-        
-        self.cursor_visible = not self.cursor_visible
-        
-        # Agendar próxima alternância
-        self.root.after(500, self.cursor_blink)
-    
-    def highlight_current_line(self):
-        # Remover destaque anterior
-        self.text_editor.tag_remove("current_line", "1.0", tk.END)
-        
-        # Obter linha atual
-        line = self.text_editor.index(tk.INSERT).split('.')[0]
-        start_index = f"{line}.0"
-        end_index = f"{line}.end"
-        
-        # Adicionar destaque
-        self.text_editor.tag_add("current_line", start_index, end_index)
-    
-    def detect_current_element_format(self):
-        # Obter linha atual
-        line = self.text_editor.index(tk.INSERT).split('.')[0]
-        start_index = f"{line}.0"
-        end_index = f"{line}.end"
-        
-        # Obter texto da linha
-        line_text = self.text_editor.get(start_index, end_index).strip()
-        
-        # Detectar formato
-        if line_text.startswith("CENA:"):
-            format_type = "Cena"
-        elif line_text.isupper() and len(line_text) < self.settings['character_width']:
-            format_type = "Personagem"
-        elif line_text.startswith("TRANSIÇÃO:"):
-            format_type = "Transição"
-        elif line_text.startswith("NOTA:"):
-            format_type = "Nota"
-        else:
-            # Verificar se é diálogo (linha após personagem)
-            prev_line = int(line) - 1
-            if prev_line > 0:
-                prev_start = f"{prev_line}.0"
-                prev_end = f"{prev_line}.end"
-                prev_text = self.text_editor.get(prev_start, prev_end).strip()
-                
-                if prev_text.isupper() and len(prev_text) < self.settings['character_width']:
-                    format_type = "Diálogo"
-                else:
-                    format_type = "Ação"
-            else:
-                format_type = "Ação"
-        
-        # Atualizar label
-        self.element_format_label.config(text=format_type)
-    
-    def update_line_numbers(self):
-        if not self.settings['show_line_numbers']:
-            return
-            
-        # Obter número de linhas
-        line_count = int(self.text_editor.index('end-1c').split('.')[0])
-        
-        # Configurar números de linha
-        line_numbers_str = '\n'.join(str(i) for i in range(1, line_count + 1))
-        
-        # Atualizar widget de números de linha
-        self.line_numbers.config(state='normal')
-        self.line_numbers.delete(1.0, tk.END)
-        self.line_numbers.insert(1.0, line_numbers_str)
-        self.line_numbers.config(state='disabled')
-        
-        # Sincronizar scroll
-        self.line_numbers.yview_moveto(self.text_editor.yview()[0])
-    
-    def update_word_count(self):
-        text = self.text_editor.get(1.0, tk.END)
-        words = text.split()
-        word_count = len(words)
-        self.word_count_label.config(text=f"Palavras: {word_count}")
-    
-    def update_status(self, message):
-        self.status_text.set(message)
-        self.root.after(3000, lambda: self.status_text.set("Pronto"))
-    
-    def update_save_indicator(self):
-        # Verificar se o arquivo foi modificado desde o último salvamento
-        if self.text_editor.edit_modified():
-            # Mudar cor do indicador para vermelho
-            self.save_indicator.config(fg="#ff0000")
-        else:
-            # Mudar cor do indicador para verde
-            self.save_indicator.config(fg=self.accent_color)
-    
-    def setup_shortcuts(self):
-        self.root.bind('<Control-n>', lambda e: self.new_file())
-        self.root.bind('<Control-o>', lambda e: self.open_file())
-        self.root.bind('<Control-s>', lambda e: self.save_file())
-        self.root.bind('<Control-Shift-s>', lambda e: self.save_file_as())
-        self.root.bind('<Control-Alt-s>', lambda e: self.save_secure_file())
-        self.root.bind('<Control-e>', lambda e: self.export_pdf())
-        self.root.bind('<Control-q>', lambda e: self.exit_app())
-        self.root.bind('<Control-z>', lambda e: self.undo())
-        self.root.bind('<Control-y>', lambda e: self.redo())
-        self.root.bind('<Control-b>', lambda e: self.toggle_bold())
-        self.root.bind('<Control-i>', lambda e: self.toggle_italic())
-        self.root.bind('<Control-u>', lambda e: self.toggle_underline())
-        self.root.bind('<Control-p>', lambda e: self.insert_character())
-        self.root.bind('<Control-d>', lambda e: self.insert_dialogue())
-        self.root.bind('<Control-Shift-a>', lambda e: self.insert_action())
-        self.root.bind('<Control-Shift-c>', lambda e: self.insert_scene())
-        self.root.bind('<Control-t>', lambda e: self.insert_transition())
-        self.root.bind('<Control-Shift-n>', lambda e: self.insert_note())
-        self.root.bind('<Control-f>', lambda e: self.show_search_dialog())
-        self.root.bind('<Control-r>', lambda e: self.show_replace_dialog())
-        self.root.bind('<Control-g>', lambda e: self.go_to_line())
-        self.root.bind('<Control-plus>', lambda e: self.zoom_in())
-        self.root.bind('<Control-minus>', lambda e: self.zoom_out())
-        self.root.bind('<Control-0>', lambda e: self.zoom_normal())
-        self.root.bind('<F3>', lambda e: self.find_next())
-        self.root.bind('<Shift-F3>', lambda e: self.find_prev())
-        self.root.bind('<Control-a>', lambda e: self.select_all())
-    
-    # Funções de formatação
-    def toggle_bold(self):
-        try:
-            current_tags = self.text_editor.tag_names(tk.SEL_FIRST)
-            if "bold" in current_tags:
-                self.text_editor.tag_remove("bold", tk.SEL_FIRST, tk.SEL_LAST)
-            else:
-                self.text_editor.tag_add("bold", tk.SEL_FIRST, tk.SEL_LAST)
-        except:
-            pass
-    
-    def toggle_italic(self):
-        try:
-            current_tags = self.text_editor.tag_names(tk.SEL_FIRST)
-            if "italic" in current_tags:
-                self.text_editor.tag_remove("italic", tk.SEL_FIRST, tk.SEL_LAST)
-            else:
-                self.text_editor.tag_add("italic", tk.SEL_FIRST, tk.SEL_LAST)
-        except:
-            pass
-    
-    def toggle_underline(self):
-        try:
-            current_tags = self.text_editor.tag_names(tk.SEL_FIRST)
-            if "underline" in current_tags:
-                self.text_editor.tag_remove("underline", tk.SEL_FIRST, tk.SEL_LAST)
-            else:
-                self.text_editor.tag_add("underline", tk.SEL_FIRST, tk.SEL_LAST)
-        except:
-            pass
-    
-    def align_left(self):
-        try:
-            # Alinhar texto à esquerda
-            start_index = self.text_editor.index(tk.SEL_FIRST)
-            end_index = self.text_editor.index(tk.SEL_LAST)
-            
-            # Obter linhas selecionadas
-            start_line = int(start_index.split('.')[0])
-            end_line = int(end_index.split('.')[0])
-            
-            # Alinhar cada linha
-            for line_num in range(start_line, end_line + 1):
-                line_start = f"{line_num}.0"
-                line_end = f"{line_num}.end"
-                line_text = self.text_editor.get(line_start, line_end)
-                
-                # Remover espaços em branco no início
-                stripped_text = line_text.lstrip()
-                
-                # Substituir linha
-                self.text_editor.delete(line_start, line_end)
-                self.text_editor.insert(line_start, stripped_text)
-        except:
-            pass
-    
-    def align_center(self):
-        try:
-            # Centralizar texto
-            start_index = self.text_editor.index(tk.SEL_FIRST)
-            end_index = self.text_editor.index(tk.SEL_LAST)
-            
-            # Obter linhas selecionadas
-            start_line = int(start_index.split('.')[0])
-            end_line = int(end_index.split('.')[0])
-            
-            # Centralizar cada linha
-            for line_num in range(start_line, end_line + 1):
-                line_start = f"{line_num}.0"
-                line_end = f"{line_num}.end"
-                line_text = self.text_editor.get(line_start, line_end).strip()
-                
-                # Calcular espaços necessários para centralizar
-                line_length = len(line_text)
-                total_spaces = self.settings['page_width'] - line_length
-                left_spaces = total_spaces // 2
-                right_spaces = total_spaces - left_spaces
-                
-                # Criar linha centralizada
-                centered_text = ' ' * left_spaces + line_text + ' ' * right_spaces
-                
-                # Substituir linha
-                self.text_editor.delete(line_start, line_end)
-                self.text_editor.insert(line_start, centered_text)
-        except:
-            pass
-    
-    def align_right(self):
-        try:
-            # Alinhar texto à direita
-            start_index = self.text_editor.index(tk.SEL_FIRST)
-            end_index = self.text_editor.index(tk.SEL_LAST)
-            
-            # Obter linhas selecionadas
-            start_line = int(start_index.split('.')[0])
-            end_line = int(end_index.split('.')[0])
-            
-            # Alinhar cada linha
-            for line_num in range(start_line, end_line + 1):
-                line_start = f"{line_num}.0"
-                line_end = f"{line_num}.end"
-                line_text = self.text_editor.get(line_start, line_end).strip()
-                
-                # Calcular espaços necessários para alinhar à direita
-                line_length = len(line_text)
-                left_spaces = self.settings['page_width'] - line_length
-                
-                # Criar linha alinhada à direita
-                right_text = ' ' * left_spaces + line_text
-                
-                # Substituir linha
-                self.text_editor.delete(line_start, line_end)
-                self.text_editor.insert(line_start, right_text)
-        except:
-            pass
-    
-    # Funções de inserção de elementos de roteiro
-    def insert_character(self):
-        # Inserir elemento de personagem formatado
-        self.text_editor.insert(tk.INSERT, "\n\n")
-        
-        # Calcular espaços para centralizar
-        char_name = "NOME DO PERSONAGEM"
-        char_length = len(char_name)
-        total_spaces = self.settings['page_width'] - char_length
-        left_spaces = total_spaces // 2
-        
-        # Inserir nome do personagem centralizado
-        self.text_editor.insert(tk.INSERT, ' ' * left_spaces + char_name + '\n')
-        self.text_editor.tag_add("character", "insert-1l linestart", "insert-1l lineend")
-        
-        # Posicionar cursor para diálogo
-        self.text_editor.insert(tk.INSERT, "\n")
-        self.text_editor.mark_set(tk.INSERT, "insert-1l lineend")
-        
-        self.update_status("Personagem inserido")
-    
-    def insert_dialogue(self):
-        # Inserir elemento de diálogo formatado
-        self.text_editor.insert(tk.INSERT, "\n\n")
-        
-        # Calcular espaços para diálogo
-        dialogue_text = "Diálogo do personagem aqui..."
-        dialogue_length = len(dialogue_text)
-        left_spaces = 15  # Padrão para diálogos
-        
-        # Inserir diálogo
-        self.text_editor.insert(tk.INSERT, ' ' * left_spaces + dialogue_text + '\n')
-        
-        # Posicionar cursor no final do diálogo
-        self.text_editor.mark_set(tk.INSERT, "insert-1l lineend")
-        
-        self.update_status("Diálogo inserido")
-    
-    def insert_action(self):
-        # Inserir elemento de ação formatado
-        self.text_editor.insert(tk.INSERT, "\n\n")
-        
-        # Calcular espaços para ação
-        action_text = "Ação ou descrição da cena..."
-        action_length = len(action_text)
-        left_spaces = 10  # Padrão para ações
-        
-        # Inserir ação
-        self.text_editor.insert(tk.INSERT, ' ' * left_spaces + action_text + '\n')
-        
-        # Posicionar cursor no final da ação
-        self.text_editor.mark_set(tk.INSERT, "insert-1l lineend")
-        
-        self.update_status("Ação inserida")
-    
-    def insert_scene(self):
-        # Inserir elemento de cena formatado
-        self.text_editor.insert(tk.INSERT, "\n\n")
-        
-        # Formato padrão para cenas
-        scene_text = "CENA: LOCAL - DIA/NOITE"
-        
-        # Inserir cena
-        self.text_editor.insert(tk.INSERT, scene_text + '\n')
-        self.text_editor.tag_add("scene", "insert-1l linestart", "insert-1l lineend")
-        
-        # Inserir linha em branco
-        self.text_editor.insert(tk.INSERT, "\n")
-        
-        # Posicionar cursor após a cena
-        self.text_editor.mark_set(tk.INSERT, "insert-1l lineend")
-        
-        self.update_status("Cena inserida")
-    
-    def insert_transition(self):
-        # Inserir elemento de transição formatado
-        self.text_editor.insert(tk.INSERT, "\n\n")
-        
-        # Calcular espaços para transição (alinhado à direita)
-        transition_text = "TRANSIÇÃO: CORTE PARA:"
-        transition_length = len(transition_text)
-        total_spaces = self.settings['page_width'] - transition_length
-        left_spaces = total_spaces
-        
-        # Inserir transição
-        self.text_editor.insert(tk.INSERT, ' ' * left_spaces + transition_text + '\n')
-        self.text_editor.tag_add("transition", "insert-1l linestart", "insert-1l lineend")
-        
-        # Posicionar cursor no final da transição
-        self.text_editor.mark_set(tk.INSERT, "insert lineend")
-        
-        self.update_status("Transição inserida")
-    
-    def insert_note(self):
-        # Inserir elemento de nota formatado
-        self.text_editor.insert(tk.INSERT, "\n\n")
-        
-        # Formato padrão para notas
-        note_text = "NOTA: "
-        
-        # Inserir nota
-        self.text_editor.insert(tk.INSERT, note_text)
-        self.text_editor.tag_add("note", "insert-1l linestart", "insert-1l lineend")
-        
-        # Posicionar cursor após a nota
-        self.text_editor.mark_set(tk.INSERT, "insert lineend")
-        
-        self.update_status("Nota inserida")
-    
-    # Funções de arquivo
-    def new_file(self):
-        if self.current_file and self.text_editor.edit_modified():
-            response = messagebox.askyesnocancel("Salvar alterações", 
-                                                 "Deseja salvar as alterações antes de criar um novo roteiro?")
-            if response is True:
-                self.save_file()
-            elif response is None:
-                return
-        
-        self.text_editor.delete(1.0, tk.END)
-        self.current_file = None
-        self.current_password = None
-        self.text_editor.edit_modified(False)
-        self.root.title("Roteirista Pro - Novo Roteiro")
-        self.update_status("Novo roteiro criado")
-        self.update_save_indicator()
-    
-    def open_file(self):
-        if self.text_editor.edit_modified():
-            response = messagebox.askyesnocancel("Salvar alterações", 
-                                                 "Deseja salvar as alterações antes de abrir outro arquivo?")
-            if response is True:
-                self.save_file()
-            elif response is None:
-                return
-        
-        file_path = filedialog.askopenfilename(
-            initialdir=self.settings['last_dir'],
-            defaultextension=".rtf",
-            filetypes=[("Roteiros", "*.rtf"), ("Arquivos de Texto", "*.txt"), ("Arquivos FDX", "*.fdx"), ("Arquivos Seguros", "*.sec"), ("Todos os Arquivos", "*.*")]
-        )
-        
-        if file_path:
-            try:
-                # Verificar se é um arquivo seguro
-                if file_path.endswith('.sec'):
-                    # Pedir senha
-                    password = simpledialog.askstring("Senha", "Digite a senha para abrir o arquivo:", show='*')
-                    if not password:
-                        return
-                    
-                    # Tentar descriptografar
-                    try:
-                        with open(file_path, "rb") as file:
-                            encrypted_data = file.read()
-                            
-                        # Decodificar base64
-                        encrypted_data = base64.b64decode(encrypted_data)
-                        
-                        # Gerar chave a partir da senha
-                        password_hash = hashlib.sha256(password.encode()).digest()
-                        key = base64.urlsafe_b64encode(password_hash)
-                        
-                        # Descriptografar
-                        fernet = Fernet(key)
-                        decrypted_data = fernet.decrypt(encrypted_data)
-                        
-                        # Decodificar texto
-                        content = decrypted_data.decode('utf-8')
-                        
-                        # Carregar conteúdo
-                        self.text_editor.delete(1.0, tk.END)
-                        self.text_editor.insert(1.0, content)
-                        
-                        # Salvar senha para uso futuro
-                        self.current_password = password
-                    except Exception as e:
-                        messagebox.showerror("Erro", "Senha incorreta ou arquivo corrompido.")
-                        return
-                else:
-                    # Arquivo normal
-                    with open(file_path, "r", encoding="utf-8") as file:
-                        self.text_editor.delete(1.0, tk.END)
-                        self.text_editor.insert(1.0, file.read())
-                        self.current_password = None
-                
-                self.current_file = file_path
-                self.text_editor.edit_modified(False)
-                self.root.title(f"Roteirista Pro - {os.path.basename(file_path)}")
-                self.settings['last_dir'] = os.path.dirname(file_path)
-                self.update_status(f"Arquivo aberto: {os.path.basename(file_path)}")
-                self.update_save_indicator()
-                
-                # Tentar carregar personagens e cenas
-                self.load_metadata()
-            except Exception as e:
-                messagebox.showerror("Erro ao abrir arquivo", f"Não foi possível abrir o arquivo: {str(e)}")
-    
-    def save_file(self):
-        if not self.current_file:
-            self.save_file_as()
-        else:
-            try:
-                with open(self.current_file, "w", encoding="utf-8") as file:
-                    file.write(self.text_editor.get(1.0, tk.END))
-                    self.text_editor.edit_modified(False)
-                    self.root.title(f"Roteirista Pro - {os.path.basename(self.current_file)}")
-                    self.update_status(f"Arquivo salvo: {os.path.basename(self.current_file)}")
-                    self.update_save_indicator()
-                    
-                    # Salvar metadados (personagens e cenas)
-                    self.save_metadata()
-            except Exception as e:
-                messagebox.showerror("Erro ao salvar", f"Não foi possível salvar o arquivo: {str(e)}")
-    
-    def save_file_as(self):
-        file_path = filedialog.asksaveasfilename(
-            initialdir=self.settings['last_dir'],
-            defaultextension=".rtf",
-            filetypes=[("Roteiros", "*.rtf"), ("Arquivos de Texto", "*.txt"), ("Arquivos FDX", "*.fdx"), ("Todos os Arquivos", "*.*")]
-        )
-        
-        if file_path:
-            self.current_file = file_path
-            self.current_password = None
-            self.save_file()
-            self.settings['last_dir'] = os.path.dirname(file_path)
-    
-    def save_secure_file(self):
-        # Pedir senha
-        password = simpledialog.askstring("Senha", "Digite uma senha para o arquivo:", show='*')
-        if not password:
-            return
-        
-        # Confirmar senha
-        confirm_password = simpledialog.askstring("Confirmar Senha", "Confirme a senha:", show='*')
-        if password != confirm_password:
-            messagebox.showerror("Erro", "As senhas não coincidem.")
-            return
-        
-        # Escolher local para salvar
-        file_path = filedialog.asksaveasfilename(
-            initialdir=self.settings['last_dir'],
-            defaultextension=".sec",
-            filetypes=[("Arquivos Seguros", "*.sec"), ("Todos os Arquivos", "*.*")]
-        )
-        
-        if file_path:
-            try:
-                # Obter conteúdo do editor
-                content = self.text_editor.get(1.0, tk.END)
-                
-                # Gerar chave a partir da senha
-                password_hash = hashlib.sha256(password.encode()).digest()
-                key = base64.urlsafe_b64encode(password_hash)
-                
-                # Criptografar conteúdo
-                fernet = Fernet(key)
-                encrypted_data = fernet.encrypt(content.encode('utf-8'))
-                
-                # Codificar em base64
-                encrypted_data = base64.b64encode(encrypted_data)
-                
-                # Salvar arquivo
-                with open(file_path, "wb") as file:
-                    file.write(encrypted_data)
-                
-                self.current_file = file_path
-                self.current_password = password
-                self.text_editor.edit_modified(False)
-                self.root.title(f"Roteirista Pro - {os.path.basename(file_path)} [Seguro]")
-                self.update_status(f"Arquivo seguro salvo: {os.path.basename(file_path)}")
-                self.update_save_indicator()
-                
-                # Salvar metadados (personagens e cenas)
-                self.save_metadata()
-            except Exception as e:
-                messagebox.showerror("Erro ao salvar", f"Não foi possível salvar o arquivo seguro: {str(e)}")
-    
-    def import_file(self):
-        file_path = filedialog.askopenfilename(
-            initialdir=self.settings['last_dir'],
-            filetypes=[("Arquivos FDX", "*.fdx"), ("Arquivos PDF", "*.pdf"), ("Arquivos Word", "*.docx"), ("Arquivos Fountain", "*.fountain"), ("Todos os Arquivos", "*.*")]
-        )
-        
-        if file_path:
-            try:
-                # Lógica de importação depende do tipo de arquivo
-                ext = os.path.splitext(file_path)[1].lower()
-                
-                if ext == '.fdx':
-                    # Importar do Final Draft
-                    self.import_fdx(file_path)
-                elif ext == '.pdf':
-                    # Importar do PDF (mais complexo)
-                    self.import_pdf(file_path)
-                elif ext == '.docx':
-                    # Importar do Word
-                    self.import_docx(file_path)
-                elif ext == '.fountain':
-                    # Importar do Fountain
-                    self.import_fountain(file_path)
-                else:
-                    messagebox.showwarning("Formato não suportado", "Este formato de arquivo não é suportado para importação.")
-                    
-                self.update_status(f"Arquivo importado: {os.path.basename(file_path)}")
-            except Exception as e:
-                messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo: {str(e)}")
-    
-    def export_pdf(self):
-        if not self.current_file:
-            messagebox.showwarning("Exportar PDF", "Por favor, salve o roteiro antes de exportar.")
-            return
-            
-        # Escolher local para salvar
-        pdf_path = filedialog.asksaveasfilename(
-            initialdir=self.settings['last_dir'],
-            defaultextension=".pdf",
-            filetypes=[("Arquivos PDF", "*.pdf"), ("Todos os Arquivos", "*.*")]
-        )
-        
-        if pdf_path:
-            try:
-                # Criar documento PDF
-                doc = SimpleDocTemplate(pdf_path, pagesize=letter)
-                styles = getSampleStyleSheet()
-                story = []
-                
-                # Obter conteúdo do editor
-                content = self.text_editor.get(1.0, tk.END)
-                lines = content.split('\n')
-                
-                # Adicionar título
-                title = os.path.basename(self.current_file)
-                if title.endswith('.rtf') or title.endswith('.txt'):
-                    title = title[:-4]
-                
-                title_style = styles["Title"]
-                title_style.alignment = TA_CENTER
-                story.append(Paragraph(title, title_style))
-                story.append(Spacer(1, 12))
-                
-                # Processar cada linha
-                for line in lines:
-                    stripped = line.strip()
-                    
-                    if not stripped:
-                        # Linha em branco
-                        story.append(Spacer(1, 6))
-                    elif stripped.startswith("CENA:"):
-                        # Cena
-                        scene_style = styles["Normal"]
-                        scene_style.fontName = "Courier-Bold"
-                        scene_style.textColor = blue
-                        scene_style.alignment = TA_LEFT
-                        story.append(Paragraph(stripped, scene_style))
-                        story.append(Spacer(1, 6))
-                    elif stripped.isupper() and len(stripped) < self.settings['character_width']:
-                        # Personagem
-                        char_style = styles["Normal"]
-                        char_style.fontName = "Courier-Bold"
-                        char_style.textColor = blue
-                        char_style.alignment = TA_CENTER
-                        story.append(Paragraph(stripped, char_style))
-                    elif stripped.startswith("TRANSIÇÃO:"):
-                        # Transição
-                        trans_style = styles["Normal"]
-                        trans_style.fontName = "Courier-Bold"
-                        trans_style.textColor = blue
-                        trans_style.alignment = TA_RIGHT
-                        story.append(Paragraph(stripped, trans_style))
-                        story.append(Spacer(1, 6))
-                    elif stripped.startswith("NOTA:"):
-                        # Nota
-                        note_style = styles["Normal"]
-                        note_style.fontName = "Courier-Italic"
-                        note_style.textColor = black
-                        note_style.alignment = TA_LEFT
-                        story.append(Paragraph(stripped, note_style))
-                        story.append(Spacer(1, 6))
-                    else:
-                        # Verificar se é diálogo (linha após personagem)
-                        if story and isinstance(story[-1], Paragraph) and story[-1].style.alignment == TA_CENTER:
-                            # Diálogo
-                            dialogue_style = styles["Normal"]
-                            dialogue_style.fontName = "Courier"
-                            dialogue_style.textColor = black
-                            dialogue_style.leftIndent = 1.5 * inch
-                            story.append(Paragraph(stripped, dialogue_style))
-                        else:
-                            # Ação
-                            action_style = styles["Normal"]
-                            action_style.fontName = "Courier"
-                            action_style.textColor = black
-                            action_style.leftIndent = 0.5 * inch
-                            story.append(Paragraph(stripped, action_style))
-                
-                # Construir PDF
-                doc.build(story)
-                
-                messagebox.showinfo("Exportar PDF", f"PDF exportado com sucesso:\n{pdf_path}")
-                self.update_status(f"PDF exportado: {os.path.basename(pdf_path)}")
-            except Exception as e:
-                messagebox.showerror("Erro ao exportar PDF", f"Não foi possível exportar para PDF: {str(e)}")
-    
-    def export_html(self):
-        if not self.current_file:
-            messagebox.showwarning("Exportar HTML", "Por favor, salve o roteiro antes de exportar.")
-            return
-            
-        html_content = self.generate_html()
-        html_path = os.path.splitext(self.current_file)[0] + '.html'
-        
-        try:
-            with open(html_path, 'w', encoding='utf-8') as file:
-                file.write(html_content)
-            messagebox.showinfo("Exportar HTML", f"HTML exportado com sucesso:\n{html_path}")
-            self.update_status(f"HTML exportado: {os.path.basename(html_path)}")
-        except Exception as e:
-            messagebox.showerror("Erro ao exportar HTML", f"Não foi possível exportar para HTML: {str(e)}")
-    
-    def export_fountain(self):
-        if not self.current_file:
-            messagebox.showwarning("Exportar Fountain", "Por favor, salve o roteiro antes de exportar.")
-            return
-            
-        # Converter para formato Fountain
-        fountain_content = self.convert_to_fountain()
-        fountain_path = os.path.splitext(self.current_file)[0] + '.fountain'
-        
-        try:
-            with open(fountain_path, 'w', encoding='utf-8') as file:
-                file.write(fountain_content)
-            messagebox.showinfo("Exportar Fountain", f"Arquivo Fountain exportado com sucesso:\n{fountain_path}")
-            self.update_status(f"Fountain exportado: {os.path.basename(fountain_path)}")
-        except Exception as e:
-            messagebox.showerror("Erro ao exportar Fountain", f"Não foi possível exportar para Fountain: {str(e)}")
-    
-    def convert_to_fountain(self):
-        # Converter o conteúdo do editor para formato Fountain
-        content = self.text_editor.get(1.0, tk.END)
-        lines = content.split('\n')
-        fountain_lines = []
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            if not stripped:
-                # Linha em branco
-                fountain_lines.append("")
-            elif stripped.startswith("CENA:"):
-                # Cena
-                fountain_lines.append("." + stripped[6:])
-            elif stripped.isupper() and len(stripped) < self.settings['character_width']:
-                # Personagem
-                fountain_lines.append(stripped)
-            elif stripped.startswith("TRANSIÇÃO:"):
-                # Transição
-                fountain_lines.append("> " + stripped[11:])
-            elif stripped.startswith("NOTA:"):
-                # Nota
-                fountain_lines.append("[[" + stripped[6:] + "]]")
-            else:
-                # Ação ou diálogo
-                # Verificar se a linha anterior é um personagem
-                if fountain_lines and fountain_lines[-1].isupper() and len(fountain_lines[-1]) < self.settings['character_width']:
-                    # Diálogo
-                    fountain_lines.append(stripped)
-                else:
-                    # Ação
-                    fountain_lines.append(stripped)
-        
-        return '\n'.join(fountain_lines)
-    
-    def import_fountain(self, file_path):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            # Converter do formato Fountain para o formato interno
-            lines = content.split('\n')
-            converted_lines = []
-            
-            for line in lines:
-                stripped = line.strip()
-                
-                if not stripped:
-                    # Linha em branco
-                    converted_lines.append("")
-                elif stripped.startswith('.'):
-                    # Cena
-                    converted_lines.append("CENA:" + stripped[1:])
-                elif stripped.startswith('[') and stripped.endswith(']'):
-                    # Nota
-                    converted_lines.append("NOTA:" + stripped[2:-2])
-                elif stripped.startswith('>'):
-                    # Transição
-                    converted_lines.append("TRANSIÇÃO:" + stripped[2:])
-                elif stripped.isupper() and len(stripped) < self.settings['character_width']:
-                    # Personagem
-                    converted_lines.append(stripped)
-                else:
-                    # Ação ou diálogo
-                    # Verificar se a linha anterior é um personagem
-                    if converted_lines and converted_lines[-1].isupper() and len(converted_lines[-1]) < self.settings['character_width']:
-                        # Diálogo
-                        converted_lines.append(stripped)
-                    else:
-                        # Ação
-                        converted_lines.append(stripped)
-            
-            # Limpar o editor
-            self.text_editor.delete(1.0, tk.END)
-            
-            # Inserir conteúdo convertido
-            self.text_editor.insert(1.0, '\n'.join(converted_lines))
-            
-            # Aplicar formatação
-            self.apply_formatting()
-            
-            self.update_status(f"Arquivo Fountain importado: {os.path.basename(file_path)}")
-        except Exception as e:
-            messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo Fountain: {str(e)}")
-    
-    def generate_html(self):
-        # Gerar HTML a partir do conteúdo do editor
-        content = self.text_editor.get(1.0, tk.END)
-        
-        # Analisar conteúdo e aplicar formatação HTML
-        lines = content.split('\n')
-        html_lines = []
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            if not stripped:
-                # Linha em branco
-                html_lines.append("<br>")
-            elif stripped.startswith("CENA:"):
-                # Cena
-                html_lines.append(f'<div class="scene">{stripped}</div>')
-            elif stripped.isupper() and len(stripped) < self.settings['character_width']:
-                # Personagem
-                html_lines.append(f'<div class="character">{stripped}</div>')
-            elif stripped.startswith("TRANSIÇÃO:"):
-                # Transição
-                html_lines.append(f'<div class="transition">{stripped}</div>')
-            elif stripped.startswith("NOTA:"):
-                # Nota
-                html_lines.append(f'<div class="note">{stripped}</div>')
-            else:
-                # Ação ou diálogo
-                # Verificar se a linha anterior é um personagem
-                if html_lines and html_lines[-1].startswith('<div class="character">'):
-                    # Diálogo
-                    html_lines.append(f'<div class="dialogue">{stripped}</div>')
-                else:
-                    # Ação
-                    html_lines.append(f'<div class="action">{stripped}</div>')
-        
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>{title}</title>
-            <style>
-                body {{
-                    font-family: Courier, monospace;
-                    font-size: 12pt;
-                    line-height: 1.5;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background-color: #ffffff;
-                    color: #000000;
-                }}
-                .scene {{
-                    font-weight: bold;
-                    color: #0066cc;
-                    text-transform: uppercase;
-                    margin-top: 20px;
-                    text-align: left;
-                }}
-                .character {{
-                    font-weight: bold;
-                    color: #0066cc;
-                    text-align: center;
-                    margin-top: 20px;
-                }}
-                .dialogue {{
-                    margin-left: 150px;
-                    margin-right: 150px;
-                }}
-                .action {{
-                    margin-top: 10px;
-                }}
-                .transition {{
-                    font-weight: bold;
-                    color: #0066cc;
-                    text-align: right;
-                    margin-top: 20px;
-                }}
-                .note {{
-                    font-style: italic;
-                    color: #666666;
-                    margin-top: 10px;
-                }}
-                @page {{
-                    size: A4;
-                    margin: 2cm;
-                }}
-                @media print {{
-                    body {{
-                        margin: 0;
-                        padding: 0;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            {content}
-        </body>
-        </html>
-        """
-        
-        return html_content.format(
-            title=os.path.basename(self.current_file) if self.current_file else "Roteiro",
-            content='\n'.join(html_lines)
-        )
-    
-    def print_script(self):
-        # Imprimir o roteiro
-        try:
-            # Criar um arquivo temporário HTML
-            html_content = self.generate_html()
-            
-            # Salvar o HTML em um arquivo temporário
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as temp_file:
-                temp_file.write(html_content)
-                temp_html_path = temp_file.name
-            
-            # Abrir o HTML no navegador padrão para impressão
-            if sys.platform == 'win32':
-                os.startfile(temp_html_path, 'print')
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', '-a', 'Preview', temp_html_path])
-            else:
-                subprocess.run(['xdg-open', temp_html_path])
-                
-            self.update_status("Roteiro enviado para impressão")
-        except Exception as e:
-            messagebox.showerror("Erro ao imprimir", f"Não foi possível imprimir o roteiro: {str(e)}")
-    
-    def undo(self):
-        self.text_editor.edit_undo()
-        self.update_status("Desfazer")
-    
-    def redo(self):
-        self.text_editor.edit_redo()
-        self.update_status("Refazer")
-    
-    def cut_text(self):
-        try:
-            self.text_editor.event_generate("<<Cut>>")
-            self.update_status("Recortar")
-        except:
-            pass
-    
-    def copy_text(self):
-        try:
-            self.text_editor.event_generate("<<Copy>>")
-            self.update_status("Copiar")
-        except:
-            pass
-    
-    def paste_text(self):
-        try:
-            self.text_editor.event_generate("<<Paste>>")
-            self.update_status("Colar")
-        except:
-            pass
-    
-    def select_all(self):
-        self.text_editor.tag_add(tk.SEL, "1.0", tk.END)
-        self.update_status("Selecionar tudo")
-    
-    def go_to_line(self):
-        # Criar janela para ir para linha
-        goto_window = tk.Toplevel(self.root)
-        goto_window.title("Ir Para Linha")
-        goto_window.geometry("300x120")
-        goto_window.configure(bg=self.secondary_color)
-        goto_window.transient(self.root)
-        goto_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(goto_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Campo para número da linha
-        tk.Label(main_frame, text="Número da linha:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        
-        line_var = tk.StringVar()
-        line_entry = tk.Entry(main_frame, textvariable=line_var, bg=self.bg_color, fg=self.fg_color)
-        line_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        line_entry.focus_set()
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=1, column=0, columnspan=2, pady=10)
-        
-        def go_to():
-            try:
-                line_num = int(line_var.get())
-                if line_num < 1:
-                    line_num = 1
-                
-                # Obter número total de linhas
-                total_lines = int(self.text_editor.index('end-1c').split('.')[0])
-                if line_num > total_lines:
-                    line_num = total_lines
-                
-                # Mover cursor para a linha
-                self.text_editor.mark_set(tk.INSERT, f"{line_num}.0")
-                self.text_editor.see(tk.INSERT)
-                
-                # Destacar linha
-                if self.settings['highlight_current_line']:
-                    self.highlight_current_line()
-                
-                goto_window.destroy()
-                self.update_status(f"Movido para linha {line_num}")
-            except ValueError:
-                messagebox.showwarning("Erro", "Por favor, digite um número válido.")
-        
-        go_btn = tk.Button(button_frame, text="Ir", command=go_to,
-                          bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        go_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=goto_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def show_search_dialog(self):
-        # Criar janela de busca
-        search_window = tk.Toplevel(self.root)
-        search_window.title("Buscar")
-        search_window.geometry("400x150")
-        search_window.configure(bg=self.secondary_color)
-        search_window.transient(self.root)
-        search_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(search_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Campo de busca
-        tk.Label(main_frame, text="Buscar:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        search_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        search_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        search_entry.focus_set()
-        
-        # Opções
-        case_var = tk.IntVar()
-        case_check = tk.Checkbutton(main_frame, text="Diferenciar maiúsculas/minúsculas", 
-                                   variable=case_var, bg=self.secondary_color, fg=self.fg_color,
-                                   selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                   activeforeground=self.fg_color)
-        case_check.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        word_var = tk.IntVar()
-        word_check = tk.Checkbutton(main_frame, text="Palavra inteira", 
-                                   variable=word_var, bg=self.secondary_color, fg=self.fg_color,
-                                   selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                   activeforeground=self.fg_color)
-        word_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=3, column=0, columnspan=2, pady=10)
-        
-        def do_search():
-            term = search_entry.get()
-            if not term:
-                return
-                
-            self.search_term = term
-            self.search_matches = []
-            self.current_match = -1
-            
-            # Configurar opções de busca
-            flags = 0
-            if not case_var.get():
-                flags |= re.IGNORECASE
-                
-            # Buscar no texto
-            text = self.text_editor.get(1.0, tk.END)
-            
-            if word_var.get():
-                # Buscar por palavra inteira
-                pattern = r'\b' + re.escape(term) + r'\b'
-            else:
-                pattern = re.escape(term)
-                
-            matches = list(re.finditer(pattern, text, flags))
-            
-            if matches:
-                self.search_matches = [(m.start(), m.end()) for m in matches]
-                self.find_next()
-                search_window.destroy()
-            else:
-                messagebox.showinfo("Buscar", f"Não foram encontradas ocorrências de '{term}'")
-        
-        search_btn = tk.Button(button_frame, text="Buscar", command=do_search,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        search_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=search_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def show_replace_dialog(self):
-        # Criar janela de substituição
-        replace_window = tk.Toplevel(self.root)
-        replace_window.title("Substituir")
-        replace_window.geometry("400x200")
-        replace_window.configure(bg=self.secondary_color)
-        replace_window.transient(self.root)
-        replace_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(replace_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Campo de busca
-        tk.Label(main_frame, text="Buscar:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        search_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        search_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        search_entry.focus_set()
-        
-        # Campo de substituição
-        tk.Label(main_frame, text="Substituir por:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
-        replace_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        replace_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
-        
-        # Opções
-        case_var = tk.IntVar()
-        case_check = tk.Checkbutton(main_frame, text="Diferenciar maiúsculas/minúsculas", 
-                                   variable=case_var, bg=self.secondary_color, fg=self.fg_color,
-                                   selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                   activeforeground=self.fg_color)
-        case_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        word_var = tk.IntVar()
-        word_check = tk.Checkbutton(main_frame, text="Palavra inteira", 
-                                   variable=word_var, bg=self.secondary_color, fg=self.fg_color,
-                                   selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                   activeforeground=self.fg_color)
-        word_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
-        
-        def do_replace():
-            search_term = search_entry.get()
-            replace_term = replace_entry.get()
-            
-            if not search_term:
-                return
-                
-            # Configurar opções de busca
-            flags = 0
-            if not case_var.get():
-                flags |= re.IGNORECASE
-                
-            # Buscar no texto
-            text = self.text_editor.get(1.0, tk.END)
-            
-            if word_var.get():
-                # Buscar por palavra inteira
-                pattern = r'\b' + re.escape(search_term) + r'\b'
-            else:
-                pattern = re.escape(search_term)
-                
-            # Substituir
-            new_text = re.sub(pattern, replace_term, text, flags=flags)
-            
-            if new_text != text:
-                self.text_editor.delete(1.0, tk.END)
-                self.text_editor.insert(1.0, new_text)
-                count = len(re.findall(pattern, text, flags=flags))
-                messagebox.showinfo("Substituir", f"Foram substituídas {count} ocorrências de '{search_term}' por '{replace_term}'")
-                replace_window.destroy()
-            else:
-                messagebox.showinfo("Substituir", f"Não foram encontradas ocorrências de '{search_term}'")
-        
-        replace_btn = tk.Button(button_frame, text="Substituir Tudo", command=do_replace,
-                               bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        replace_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=replace_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def find_next(self):
-        if not self.search_matches:
-            return
-            
-        self.current_match = (self.current_match + 1) % len(self.search_matches)
-        start, end = self.search_matches[self.current_match]
-        
-        # Converter para índices do Tkinter
-        start_index = f"1.0 + {start} chars"
-        end_index = f"1.0 + {end} chars"
-        
-        # Remover destaque anterior
-        self.text_editor.tag_remove("highlight", "1.0", tk.END)
-        
-        # Adicionar destaque
-        self.text_editor.tag_add("highlight", start_index, end_index)
-        
-        # Rolar para a posição
-        self.text_editor.see(start_index)
-        
-        # Selecionar o texto
-        self.text_editor.tag_add(tk.SEL, start_index, end_index)
-        self.text_editor.mark_set(tk.INSERT, end_index)
-        
-        self.update_status(f"Ocorrência {self.current_match + 1} de {len(self.search_matches)}")
-    
-    def find_prev(self):
-        if not self.search_matches:
-            return
-            
-        self.current_match = (self.current_match - 1) % len(self.search_matches)
-        start, end = self.search_matches[self.current_match]
-        
-        # Converter para índices do Tkinter
-        start_index = f"1.0 + {start} chars"
-        end_index = f"1.0 + {end} chars"
-        
-        # Remover destaque anterior
-        self.text_editor.tag_remove("highlight", "1.0", tk.END)
-        
-        # Adicionar destaque
-        self.text_editor.tag_add("highlight", start_index, end_index)
-        
-        # Rolar para a posição
-        self.text_editor.see(start_index)
-        
-        # Selecionar o texto
-        self.text_editor.tag_add(tk.SEL, start_index, end_index)
-        self.text_editor.mark_set(tk.INSERT, end_index)
-        
-        self.update_status(f"Ocorrência {self.current_match + 1} de {len(self.search_matches)}")
-    
-    def change_font(self):
-        # Criar janela de seleção de fonte
-        font_window = tk.Toplevel(self.root)
-        font_window.title("Selecionar Fonte")
-        font_window.geometry("400x300")
-        font_window.configure(bg=self.secondary_color)
-        font_window.transient(self.root)
-        font_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(font_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Lista de fontes
-        tk.Label(main_frame, text="Fonte:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        
-        font_listbox = tk.Listbox(main_frame, bg=self.bg_color, fg=self.fg_color, height=10)
-        font_listbox.grid(row=1, column=0, columnspan=2, sticky=tk.NSEW, pady=5)
-        
-        # Preencher lista de fontes
-        available_fonts = sorted(font.families())
-        for family in available_fonts:
-            font_listbox.insert(tk.END, family)
-            
-        # Selecionar fonte atual
-        current_font = self.settings['font_family']
-        try:
-            index = available_fonts.index(current_font)
-            font_listbox.selection_set(index)
-            font_listbox.see(index)
-        except ValueError:
-            pass
-        
-        # Tamanho da fonte
-        tk.Label(main_frame, text="Tamanho:", bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
-        
-        size_var = tk.IntVar(value=self.settings['font_size'])
-        size_spinbox = tk.Spinbox(main_frame, from_=8, to=24, textvariable=size_var, 
-                                 bg=self.bg_color, fg=self.fg_color, width=10)
-        size_spinbox.grid(row=2, column=1, sticky=tk.W, pady=5)
-        
-        # Amostra
-        tk.Label(main_frame, text="Amostra:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
-        
-        sample_text = tk.Text(main_frame, height=5, bg=self.bg_color, fg=self.fg_color, 
-                             wrap=tk.WORD, bd=1, relief=tk.SOLID)
-        sample_text.grid(row=4, column=0, columnspan=2, sticky=tk.NSEW, pady=5)
-        sample_text.insert(tk.END, "O rápido raposa marrom salta sobre o cão preguiçoso.\n\n" + 
-                                 "NOME DO PERSONAGEM\n\n" + 
-                                 "Diálogo do personagem aqui...")
-        
-        # Função para atualizar amostra
-        def update_sample(event=None):
-            try:
-                selected = font_listbox.curselection()
-                if selected:
-                    family = available_fonts[selected[0]]
-                    size = size_var.get()
-                    sample_font = font.Font(family=family, size=size)
-                    sample_text.config(font=sample_font)
-            except:
-                pass
-        
-        font_listbox.bind('<<ListboxSelect>>', update_sample)
-        size_spinbox.bind('<KeyRelease>', update_sample)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=5, column=0, columnspan=2, pady=10)
-        
-        def apply_font():
-            try:
-                selected = font_listbox.curselection()
-                if selected:
-                    family = available_fonts[selected[0]]
-                    size = size_var.get()
-                    
-                    # Atualizar configurações
-                    self.settings['font_family'] = family
-                    self.settings['font_size'] = size
-                    
-                    # Atualizar fonte padrão
-                    self.default_font = font.Font(family=family, size=size)
-                    
-                    # Atualizar editor
-                    self.text_editor.config(font=self.default_font)
-                    
-                    # Atualizar tags de formatação
-                    self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
-                    self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
-                    self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
-                    self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
-                                                  foreground=self.highlight_color)
-                    self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
-                                                  foreground=self.highlight_color)
-                    self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
-                                                  foreground=self.highlight_color)
-                    self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
-                                                  foreground="#cccccc")
-                    
-                    # Atualizar números de linha
-                    if self.settings['show_line_numbers']:
-                        self.line_numbers.config(font=self.default_font)
-                        self.update_line_numbers()
-                    
-                    font_window.destroy()
-                    self.update_status(f"Fonte alterada: {family} {size}pt")
-            except Exception as e:
-                messagebox.showerror("Erro", f"Não foi possível alterar a fonte: {str(e)}")
-        
-        apply_btn = tk.Button(button_frame, text="Aplicar", command=apply_font,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        apply_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=font_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(4, weight=1)
-        
-        # Inicializar amostra
-        update_sample()
-    
-    def change_color(self):
-        # Abrir seletor de cores
-        color = colorchooser.askcolor(initialcolor=self.fg_color)
-        
-        if color[1]:
-            # Alterar cor do texto
-            self.fg_color = color[1]
-            self.text_editor.config(fg=self.fg_color)
-            self.update_status(f"Cor alterada: {color[1]}")
-    
-    def toggle_word_wrap(self):
-        self.settings['word_wrap'] = not self.settings['word_wrap']
-        wrap_mode = tk.WORD if self.settings['word_wrap'] else tk.NONE
-        self.text_editor.config(wrap=wrap_mode)
-        self.update_status(f"Quebra de linha: {'Ativada' if self.settings['word_wrap'] else 'Desativada'}")
-    
-    def toggle_line_numbers(self):
-        self.settings['show_line_numbers'] = not self.settings['show_line_numbers']
-        
-        if self.settings['show_line_numbers']:
-            # Recrear o editor com números de linha
-            self.text_editor.pack_forget()
-            self.create_text_editor()
-        else:
-            # Recrear o editor sem números de linha
-            self.text_editor.pack_forget()
-            if hasattr(self, 'line_numbers'):
-                self.line_numbers.pack_forget()
-            self.create_text_editor()
-            
-        self.update_status(f"Números de linha: {'Ativados' if self.settings['show_line_numbers'] else 'Desativados'}")
-    
-    def toggle_line_highlight(self):
-        self.settings['highlight_current_line'] = not self.settings['highlight_current_line']
-        
-        if self.settings['highlight_current_line']:
-            # Destacar linha atual
-            self.highlight_current_line()
-            self.update_status("Destaque de linha atual: Ativado")
-        else:
-            # Remover destaque
-            self.text_editor.tag_remove("current_line", "1.0", tk.END)
-            self.update_status("Destaque de linha atual: Desativado")
-    
-    def toggle_main_toolbar(self):
-        if self.main_toolbar.winfo_ismapped():
-            self.main_toolbar.pack_forget()
-            self.update_status("Barra de ferramentas principal: Oculta")
-        else:
-            self.main_toolbar.pack(side=tk.TOP, fill=tk.X)
-            self.update_status("Barra de ferramentas principal: Visível")
-    
-    def toggle_format_toolbar(self):
-        if self.format_toolbar.winfo_ismapped():
-            self.format_toolbar.pack_forget()
-            self.update_status("Barra de formatação: Oculta")
-        else:
-            self.format_toolbar.pack(side=tk.TOP, fill=tk.X)
-            self.update_status("Barra de formatação: Visível")
-    
-    def toggle_elements_toolbar(self):
-        if self.elements_toolbar.winfo_ismapped():
-            self.elements_toolbar.pack_forget()
-            self.update_status("Barra de elementos: Oculta")
-        else:
-            self.elements_toolbar.pack(side=tk.TOP, fill=tk.X)
-            self.update_status("Barra de elementos: Visível")
-    
-    def toggle_sidebar(self):
-        if self.sidebar.winfo_ismapped():
-            self.sidebar.pack_forget()
-            self.update_status("Barra lateral: Oculta")
-        else:
-            self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
-            self.update_status("Barra lateral: Visível")
-    
-    def toggle_status_bar(self):
-        if self.status_bar.winfo_ismapped():
-            self.status_bar.pack_forget()
-            self.update_status("Barra de status: Oculta")
-        else:
-            self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-            self.update_status("Barra de status: Visível")
-    
-    def change_theme(self, theme):
-        self.settings['theme'] = theme
-        self.apply_theme()
-        
-        # Atualizar cores dos componentes
-        self.root.configure(bg=self.bg_color)
-        self.status_bar.configure(bg=self.secondary_color)
-        self.status_label.configure(bg=self.secondary_color, fg=self.fg_color)
-        self.word_count_label.configure(bg=self.secondary_color, fg=self.fg_color)
-        self.cursor_pos_label.configure(bg=self.secondary_color, fg=self.fg_color)
-        self.element_format_label.configure(bg=self.secondary_color, fg=self.fg_color)
-        
-        # Atualizar cores do editor
-        self.text_editor.configure(bg=self.bg_color, fg=self.fg_color)
-        
-        # Atualizar cores das barras de ferramentas
-        self.main_toolbar.configure(bg=self.secondary_color)
-        self.format_toolbar.configure(bg=self.secondary_color)
-        self.elements_toolbar.configure(bg=self.secondary_color)
-        
-        for widget in self.main_toolbar.winfo_children():
-            if isinstance(widget, tk.Button):
-                widget.configure(bg=self.secondary_color, fg=self.fg_color)
-                
-        for widget in self.format_toolbar.winfo_children():
-            if isinstance(widget, tk.Button):
-                widget.configure(bg=self.secondary_color, fg=self.fg_color)
-                
-        for widget in self.elements_toolbar.winfo_children():
-            if isinstance(widget, tk.Button):
-                widget.configure(bg=self.secondary_color, fg=self.fg_color)
-        
-        # Atualizar cores do menu lateral
-        self.sidebar.configure(bg=self.blue_color)
-        self.toggle_button.configure(bg=self.blue_color, fg=self.fg_color)
-        
-        # Atualizar cores das abas
-        self.characters_frame.configure(bg=self.blue_color)
-        self.scenes_frame.configure(bg=self.blue_color)
-        self.notes_frame.configure(bg=self.blue_color)
-        
-        # Atualizar cores dos widgets das abas
-        self.characters_listbox.configure(bg=self.secondary_color, fg=self.fg_color)
-        self.scenes_listbox.configure(bg=self.secondary_color, fg=self.fg_color)
-        self.notes_editor.configure(bg=self.secondary_color, fg=self.fg_color)
-        
-        self.update_status(f"Tema alterado: {'Claro' if theme == 'light' else 'Escuro'}")
-    
-    def zoom_in(self):
-        current_size = self.settings['font_size']
-        if current_size < 24:
-            self.settings['font_size'] += 1
-            self.default_font = font.Font(family=self.settings['font_family'], size=self.settings['font_size'])
-            self.text_editor.config(font=self.default_font)
-            
-            # Atualizar tags de formatação
-            self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
-            self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
-            self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
-            self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
-                                          foreground="#cccccc")
-            
-            # Atualizar números de linha
-            if self.settings['show_line_numbers']:
-                self.line_numbers.config(font=self.default_font)
-                self.update_line_numbers()
-                
-            self.update_status(f"Zoom: {self.settings['font_size']}pt")
-    
-    def zoom_out(self):
-        current_size = self.settings['font_size']
-        if current_size > 8:
-            self.settings['font_size'] -= 1
-            self.default_font = font.Font(family=self.settings['font_family'], size=self.settings['font_size'])
-            self.text_editor.config(font=self.default_font)
-            
-            # Atualizar tags de formatação
-            self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
-            self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
-            self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
-            self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
-                                          foreground="#cccccc")
-            
-            # Atualizar números de linha
-            if self.settings['show_line_numbers']:
-                self.line_numbers.config(font=self.default_font)
-                self.update_line_numbers()
-                
-            self.update_status(f"Zoom: {self.settings['font_size']}pt")
-    
-    def zoom_normal(self):
-        self.settings['font_size'] = 12
-        self.default_font = font.Font(family=self.settings['font_family'], size=self.settings['font_size'])
-        self.text_editor.config(font=self.default_font)
-        
-        # Atualizar tags de formatação
-        self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
-        self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
-        self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
-        self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
-                                      foreground=self.highlight_color)
-        self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
-                                      foreground=self.highlight_color)
-        self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
-                                      foreground=self.highlight_color)
-        self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
-                                      foreground="#cccccc")
-        
-        # Atualizar números de linha
-        if self.settings['show_line_numbers']:
-            self.line_numbers.config(font=self.default_font)
-            self.update_line_numbers()
-            
-        self.update_status(f"Zoom: {self.settings['font_size']}pt")
-    
-    def toggle_auto_save(self):
-        self.settings['auto_save'] = not self.settings['auto_save']
-        if self.settings['auto_save']:
-            messagebox.showinfo("Auto-salvar", "Auto-salvamento ativado!")
-            self.update_status("Auto-salvamento ativado")
-        else:
-            messagebox.showinfo("Auto-salvar", "Auto-salvamento desativado!")
-            self.update_status("Auto-salvamento desativado")
-    
-    def manage_characters(self):
-        # Criar janela de gerenciamento de personagens
-        char_window = tk.Toplevel(self.root)
-        char_window.title("Gerenciar Personagens")
-        char_window.geometry("500x400")
-        char_window.configure(bg=self.secondary_color)
-        char_window.transient(self.root)
-        char_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(char_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Lista de personagens
-        list_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        list_frame.pack(fill=tk.BOTH, expand=True)
-        
-        tk.Label(list_frame, text="Personagens:", bg=self.secondary_color, fg=self.fg_color, 
-                font=self.title_font).pack(anchor=tk.W, pady=5)
-        
-        # Lista com scrollbar
-        scrollbar = tk.Scrollbar(list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        char_list = tk.Listbox(list_frame, bg=self.bg_color, fg=self.fg_color, 
-                              yscrollcommand=scrollbar.set, height=10)
-        char_list.pack(fill=tk.BOTH, expand=True)
-        scrollbar.config(command=char_list.yview)
-        
-        # Preencher lista
-        for char in self.characters:
-            char_list.insert(tk.END, char['name'])
-        
-        # Detalhes do personagem
-        details_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        details_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(details_frame, text="Nome:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        name_entry = tk.Entry(details_frame, bg=self.bg_color, fg=self.fg_color, width=40)
-        name_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        
-        tk.Label(details_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
-        desc_text = tk.Text(details_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=40)
-        desc_text.grid(row=1, column=1, sticky=tk.EW, pady=5)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
-        
-        def add_character():
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("Aviso", "Por favor, insira um nome para o personagem.")
-                return
-                
-            description = desc_text.get(1.0, tk.END).strip()
-            
-            # Verificar se já existe
-            for char in self.characters:
-                if char['name'].lower() == name.lower():
-                    messagebox.showwarning("Aviso", "Já existe um personagem com este nome.")
-                    return
-            
-            # Adicionar personagem
-            self.characters.append({
-                'name': name,
-                'description': description
-            })
-            
-            # Atualizar listas
-            char_list.insert(tk.END, name)
-            self.characters_listbox.insert(tk.END, name)
-            
-            # Limpar campos
-            name_entry.delete(0, tk.END)
-            desc_text.delete(1.0, tk.END)
-            
-            self.update_status(f"Personagem adicionado: {name}")
-        
-        def update_character():
-            selection = char_list.curselection()
-            if not selection:
-                messagebox.showwarning("Aviso", "Por favor, selecione um personagem para editar.")
-                return
-                
-            index = selection[0]
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("Aviso", "Por favor, insira um nome para o personagem.")
-                return
-                
-            description = desc_text.get(1.0, tk.END).strip()
-            
-            # Verificar se já existe (exceto o atual)
-            for i, char in enumerate(self.characters):
-                if i != index and char['name'].lower() == name.lower():
-                    messagebox.showwarning("Aviso", "Já existe um personagem com este nome.")
-                    return
-            
-            # Atualizar personagem
-            self.characters[index] = {
-                'name': name,
-                'description': description
-            }
-            
-            # Atualizar listas
-            char_list.delete(index)
-            char_list.insert(index, name)
-            char_list.selection_set(index)
-            
-            self.characters_listbox.delete(index)
-            self.characters_listbox.insert(index, name)
-            
-            self.update_status(f"Personagem atualizado: {name}")
-        
-        def delete_character():
-            selection = char_list.curselection()
-            if not selection:
-                messagebox.showwarning("Aviso", "Por favor, selecione um personagem para remover.")
-                return
-                
-            index = selection[0]
-            name = self.characters[index]['name']
-            
-            if messagebox.askyesno("Confirmar", f"Deseja realmente remover o personagem '{name}'?"):
-                # Remover personagem
-                del self.characters[index]
-                
-                # Atualizar listas
-                char_list.delete(index)
-                self.characters_listbox.delete(index)
-                
-                # Limpar campos
-                name_entry.delete(0, tk.END)
-                desc_text.delete(1.0, tk.END)
-                
-                self.update_status(f"Personagem removido: {name}")
-        
-        def select_character(event=None):
-            selection = char_list.curselection()
-            if selection:
-                index = selection[0]
-                char = self.characters[index]
-                name_entry.delete(0, tk.END)
-                name_entry.insert(0, char['name'])
-                desc_text.delete(1.0, tk.END)
-                desc_text.insert(1.0, char['description'])
-        
-        # Configurar eventos
-        char_list.bind('<<ListboxSelect>>', select_character)
-        
-        # Botões
-        add_btn = tk.Button(button_frame, text="Adicionar", command=add_character,
-                           bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        add_btn.pack(side=tk.LEFT, padx=5)
-        
-        update_btn = tk.Button(button_frame, text="Atualizar", command=update_character,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        update_btn.pack(side=tk.LEFT, padx=5)
-        
-        delete_btn = tk.Button(button_frame, text="Remover", command=delete_character,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        delete_btn.pack(side=tk.LEFT, padx=5)
-        
-        close_btn = tk.Button(button_frame, text="Fechar", command=char_window.destroy,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        close_btn.pack(side=tk.RIGHT, padx=5)
-        
-        # Configurar grid
-        details_frame.columnconfigure(1, weight=1)
-    
-    def add_character(self):
-        # Criar janela para adicionar personagem
-        add_window = tk.Toplevel(self.root)
-        add_window.title("Adicionar Personagem")
-        add_window.geometry("400x200")
-        add_window.configure(bg=self.secondary_color)
-        add_window.transient(self.root)
-        add_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(add_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Campos
-        tk.Label(main_frame, text="Nome:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        name_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        name_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        name_entry.focus_set()
-        
-        tk.Label(main_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
-        desc_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=30)
-        desc_text.grid(row=1, column=1, sticky=tk.EW, pady=5)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
-        
-        def save_character():
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("Aviso", "Por favor, insira um nome para o personagem.")
-                return
-                
-            description = desc_text.get(1.0, tk.END).strip()
-            
-            # Verificar se já existe
-            for char in self.characters:
-                if char['name'].lower() == name.lower():
-                    messagebox.showwarning("Aviso", "Já existe um personagem com este nome.")
-                    return
-            
-            # Adicionar personagem
-            self.characters.append({
-                'name': name,
-                'description': description
-            })
-            
-            # Atualizar lista
-            self.characters_listbox.insert(tk.END, name)
-            
-            add_window.destroy()
-            self.update_status(f"Personagem adicionado: {name}")
-        
-        save_btn = tk.Button(button_frame, text="Salvar", command=save_character,
-                            bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        save_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=add_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def edit_character(self):
-        selection = self.characters_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("Aviso", "Por favor, selecione um personagem para editar.")
-            return
-            
-        index = selection[0]
-        char = self.characters[index]
-        
-        # Criar janela para editar personagem
-        edit_window = tk.Toplevel(self.root)
-        edit_window.title("Editar Personagem")
-        edit_window.geometry("400x200")
-        edit_window.configure(bg=self.secondary_color)
-        edit_window.transient(self.root)
-        edit_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(edit_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Campos
-        tk.Label(main_frame, text="Nome:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        name_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        name_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        name_entry.insert(0, char['name'])
-        name_entry.focus_set()
-        
-        tk.Label(main_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
-        desc_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=30)
-        desc_text.grid(row=1, column=1, sticky=tk.EW, pady=5)
-        desc_text.insert(1.0, char['description'])
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
-        
-        def update_character():
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("Aviso", "Por favor, insira um nome para o personagem.")
-                return
-                
-            description = desc_text.get(1.0, tk.END).strip()
-            
-            # Verificar se já existe (exceto o atual)
-            for i, c in enumerate(self.characters):
-                if i != index and c['name'].lower() == name.lower():
-                    messagebox.showwarning("Aviso", "Já existe um personagem com este nome.")
-                    return
-            
-            # Atualizar personagem
-            self.characters[index] = {
-                'name': name,
-                'description': description
-            }
-            
-            # Atualizar lista
-            self.characters_listbox.delete(index)
-            self.characters_listbox.insert(index, name)
-            self.characters_listbox.selection_set(index)
-            
-            edit_window.destroy()
-            self.update_status(f"Personagem atualizado: {name}")
-        
-        update_btn = tk.Button(button_frame, text="Atualizar", command=update_character,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        update_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=edit_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def remove_character(self):
-        selection = self.characters_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("Aviso", "Por favor, selecione um personagem para remover.")
-            return
-            
-        index = selection[0]
-        name = self.characters[index]['name']
-        
-        if messagebox.askyesno("Confirmar", f"Deseja realmente remover o personagem '{name}'?"):
-            # Remover personagem
-            del self.characters[index]
-            
-            # Atualizar lista
-            self.characters_listbox.delete(index)
-            
-            self.update_status(f"Personagem removido: {name}")
-    
-    def manage_scenes(self):
-        # Criar janela de gerenciamento de cenas
-        scene_window = tk.Toplevel(self.root)
-        scene_window.title("Gerenciar Cenas")
-        scene_window.geometry("500x400")
-        scene_window.configure(bg=self.secondary_color)
-        scene_window.transient(self.root)
-        scene_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(scene_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Lista de cenas
-        list_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        list_frame.pack(fill=tk.BOTH, expand=True)
-        
-        tk.Label(list_frame, text="Cenas:", bg=self.secondary_color, fg=self.fg_color, 
-                font=self.title_font).pack(anchor=tk.W, pady=5)
-        
-        # Lista com scrollbar
-        scrollbar = tk.Scrollbar(list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        scene_list = tk.Listbox(list_frame, bg=self.bg_color, fg=self.fg_color, 
-                               yscrollcommand=scrollbar.set, height=10)
-        scene_list.pack(fill=tk.BOTH, expand=True)
-        scrollbar.config(command=scene_list.yview)
-        
-        # Preencher lista
-        for scene in self.scenes:
-            scene_list.insert(tk.END, scene['title'])
-        
-        # Detalhes da cena
-        details_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        details_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(details_frame, text="Título:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        title_entry = tk.Entry(details_frame, bg=self.bg_color, fg=self.fg_color, width=40)
-        title_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        
-        tk.Label(details_frame, text="Local:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
-        location_entry = tk.Entry(details_frame, bg=self.bg_color, fg=self.fg_color, width=40)
-        location_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
-        
-        tk.Label(details_frame, text="Horário:", bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
-        time_entry = tk.Entry(details_frame, bg=self.bg_color, fg=self.fg_color, width=40)
-        time_entry.grid(row=2, column=1, sticky=tk.EW, pady=5)
-        
-        tk.Label(details_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
-        desc_text = tk.Text(details_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=40)
-        desc_text.grid(row=3, column=1, sticky=tk.EW, pady=5)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
-        
-        def add_scene():
-            title = title_entry.get().strip()
-            if not title:
-                messagebox.showwarning("Aviso", "Por favor, insira um título para a cena.")
-                return
-                
-            location = location_entry.get().strip()
-            time = time_entry.get().strip()
-            description = desc_text.get(1.0, tk.END).strip()
-            
-            # Verificar se já existe
-            for scene in self.scenes:
-                if scene['title'].lower() == title.lower():
-                    messagebox.showwarning("Aviso", "Já existe uma cena com este título.")
-                    return
-            
-            # Adicionar cena
-            self.scenes.append({
-                'title': title,
-                'location': location,
-                'time': time,
-                'description': description
-            })
-            
-            # Atualizar listas
-            scene_list.insert(tk.END, title)
-            self.scenes_listbox.insert(tk.END, title)
-            
-            # Limpar campos
-            title_entry.delete(0, tk.END)
-            location_entry.delete(0, tk.END)
-            time_entry.delete(0, tk.END)
-            desc_text.delete(1.0, tk.END)
-            
-            self.update_status(f"Cena adicionada: {title}")
-        
-        def update_scene():
-            selection = scene_list.curselection()
-            if not selection:
-                messagebox.showwarning("Aviso", "Por favor, selecione uma cena para editar.")
-                return
-                
-            index = selection[0]
-            title = title_entry.get().strip()
-            if not title:
-                messagebox.showwarning("Aviso", "Por favor, insira um título para a cena.")
-                return
-                
-            location = location_entry.get().strip()
-            time = time_entry.get().strip()
-            description = desc_text.get(1.0, tk.END).strip()
-            
-            # Verificar se já existe (exceto a atual)
-            for i, scene in enumerate(self.scenes):
-                if i != index and scene['title'].lower() == title.lower():
-                    messagebox.showwarning("Aviso", "Já existe uma cena com este título.")
-                    return
-            
-            # Atualizar cena
-            self.scenes[index] = {
-                'title': title,
-                'location': location,
-                'time': time,
-                'description': description
-            }
-            
-            # Atualizar listas
-            scene_list.delete(index)
-            scene_list.insert(index, title)
-            scene_list.selection_set(index)
-            
-            self.scenes_listbox.delete(index)
-            self.scenes_listbox.insert(index, title)
-            
-            self.update_status(f"Cena atualizada: {title}")
-        
-        def delete_scene():
-            selection = scene_list.curselection()
-            if not selection:
-                messagebox.showwarning("Aviso", "Por favor, selecione uma cena para remover.")
-                return
-                
-            index = selection[0]
-            title = self.scenes[index]['title']
-            
-            if messagebox.askyesno("Confirmar", f"Deseja realmente remover a cena '{title}'?"):
-                # Remover cena
-                del self.scenes[index]
-                
-                # Atualizar listas
-                scene_list.delete(index)
-                self.scenes_listbox.delete(index)
-                
-                # Limpar campos
-                title_entry.delete(0, tk.END)
-                location_entry.delete(0, tk.END)
-                time_entry.delete(0, tk.END)
-                desc_text.delete(1.0, tk.END)
-                
-                self.update_status(f"Cena removida: {title}")
-        
-        def select_scene(event=None):
-            selection = scene_list.curselection()
-            if selection:
-                index = selection[0]
-                scene = self.scenes[index]
-                title_entry.delete(0, tk.END)
-                title_entry.insert(0, scene['title'])
-                location_entry.delete(0, tk.END)
-                location_entry.insert(0, scene['location'])
-                time_entry.delete(0, tk.END)
-                time_entry.insert(0, scene['time'])
-                desc_text.delete(1.0, tk.END)
-                desc_text.insert(1.0, scene['description'])
-        
-        # Configurar eventos
-        scene_list.bind('<<ListboxSelect>>', select_scene)
-        
-        # Botões
-        add_btn = tk.Button(button_frame, text="Adicionar", command=add_scene,
-                           bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        add_btn.pack(side=tk.LEFT, padx=5)
-        
-        update_btn = tk.Button(button_frame, text="Atualizar", command=update_scene,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        update_btn.pack(side=tk.LEFT, padx=5)
-        
-        delete_btn = tk.Button(button_frame, text="Remover", command=delete_scene,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        delete_btn.pack(side=tk.LEFT, padx=5)
-        
-        close_btn = tk.Button(button_frame, text="Fechar", command=scene_window.destroy,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        close_btn.pack(side=tk.RIGHT, padx=5)
-        
-        # Configurar grid
-        details_frame.columnconfigure(1, weight=1)
-    
-    def add_scene(self):
-        # Criar janela para adicionar cena
-        add_window = tk.Toplevel(self.root)
-        add_window.title("Adicionar Cena")
-        add_window.geometry("400x250")
-        add_window.configure(bg=self.secondary_color)
-        add_window.transient(self.root)
-        add_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(add_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Campos
-        tk.Label(main_frame, text="Título:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        title_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        title_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        title_entry.focus_set()
-        
-        tk.Label(main_frame, text="Local:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
-        location_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        location_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
-        
-        tk.Label(main_frame, text="Horário:", bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
-        time_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        time_entry.grid(row=2, column=1, sticky=tk.EW, pady=5)
-        
-        tk.Label(main_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
-        desc_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=30)
-        desc_text.grid(row=3, column=1, sticky=tk.EW, pady=5)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
-        
-        def save_scene():
-            title = title_entry.get().strip()
-            if not title:
-                messagebox.showwarning("Aviso", "Por favor, insira um título para a cena.")
-                return
-                
-            location = location_entry.get().strip()
-            time = time_entry.get().strip()
-            description = desc_text.get(1.0, tk.END).strip()
-            
-            # Verificar se já existe
-            for scene in self.scenes:
-                if scene['title'].lower() == title.lower():
-                    messagebox.showwarning("Aviso", "Já existe uma cena com este título.")
-                    return
-            
-            # Adicionar cena
-            self.scenes.append({
-                'title': title,
-                'location': location,
-                'time': time,
-                'description': description
-            })
-            
-            # Atualizar lista
-            self.scenes_listbox.insert(tk.END, title)
-            
-            add_window.destroy()
-            self.update_status(f"Cena adicionada: {title}")
-        
-        save_btn = tk.Button(button_frame, text="Salvar", command=save_scene,
-                            bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        save_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=add_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def edit_scene(self):
-        selection = self.scenes_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("Aviso", "Por favor, selecione uma cena para editar.")
-            return
-            
-        index = selection[0]
-        scene = self.scenes[index]
-        
-        # Criar janela para editar cena
-        edit_window = tk.Toplevel(self.root)
-        edit_window.title("Editar Cena")
-        edit_window.geometry("400x250")
-        edit_window.configure(bg=self.secondary_color)
-        edit_window.transient(self.root)
-        edit_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(edit_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Campos
-        tk.Label(main_frame, text="Título:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
-        title_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        title_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        title_entry.insert(0, scene['title'])
-        title_entry.focus_set()
-        
-        tk.Label(main_frame, text="Local:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
-        location_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        location_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
-        location_entry.insert(0, scene['location'])
-        
-        tk.Label(main_frame, text="Horário:", bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
-        time_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
-        time_entry.grid(row=2, column=1, sticky=tk.EW, pady=5)
-        time_entry.insert(0, scene['time'])
-        
-        tk.Label(main_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
-        desc_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=30)
-        desc_text.grid(row=3, column=1, sticky=tk.EW, pady=5)
-        desc_text.insert(1.0, scene['description'])
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
-        
-        def update_scene():
-            title = title_entry.get().strip()
-            if not title:
-                messagebox.showwarning("Aviso", "Por favor, insira um título para a cena.")
-                return
-                
-            location = location_entry.get().strip()
-            time = time_entry.get().strip()
-            description = desc_text.get(1.0, tk.END).strip()
-            
-            # Verificar se já existe (exceto a atual)
-            for i, s in enumerate(self.scenes):
-                if i != index and s['title'].lower() == title.lower():
-                    messagebox.showwarning("Aviso", "Já existe uma cena com este título.")
-                    return
-            
-            # Atualizar cena
-            self.scenes[index] = {
-                'title': title,
-                'location': location,
-                'time': time,
-                'description': description
-            }
-            
-            # Atualizar lista
-            self.scenes_listbox.delete(index)
-            self.scenes_listbox.insert(index, title)
-            self.scenes_listbox.selection_set(index)
-            
-            edit_window.destroy()
-            self.update_status(f"Cena atualizada: {title}")
-        
-        update_btn = tk.Button(button_frame, text="Atualizar", command=update_scene,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        update_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=edit_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def remove_scene(self):
-        selection = self.scenes_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("Aviso", "Por favor, selecione uma cena para remover.")
-            return
-            
-        index = selection[0]
-        title = self.scenes[index]['title']
-        
-        if messagebox.askyesno("Confirmar", f"Deseja realmente remover a cena '{title}'?"):
-            # Remover cena
-            del self.scenes[index]
-            
-            # Atualizar lista
-            self.scenes_listbox.delete(index)
-            
-            self.update_status(f"Cena removida: {title}")
-    
-    def save_notes(self):
-        # Salvar notas no arquivo de metadados
-        self.save_metadata()
-        self.update_status("Notas salvas")
-    
-    def word_count(self):
-        text = self.text_editor.get(1.0, tk.END)
-        words = text.split()
-        word_count = len(words)
-        char_count = len(text)
-        messagebox.showinfo("Contagem de Palavras", 
-                           f"Palavras: {word_count}\nCaracteres: {char_count}")
-    
-    def estimate_reading_time(self):
-        text = self.text_editor.get(1.0, tk.END)
-        words = text.split()
-        word_count = len(words)
-        
-        # Estimativa: 200 palavras por minuto
-        reading_time_minutes = word_count / 200
-        
-        # Converter para minutos e segundos
-        minutes = int(reading_time_minutes)
-        seconds = int((reading_time_minutes - minutes) * 60)
-        
-        messagebox.showinfo("Tempo de Leitura", 
-                           f"Tempo estimado de leitura: {minutes} minutos e {seconds} segundos\n"
-                           f"Baseado em 200 palavras por minuto")
-    
-    def show_stats(self):
-        text = self.text_editor.get(1.0, tk.END)
-        words = text.split()
-        word_count = len(words)
-        char_count = len(text)
-        lines = text.split('\n')
-        line_count = len(lines) - 1  # -1 porque a última linha é vazia
-        
-        # Contar personagens
-        character_count = len(self.characters)
-        
-        # Contar cenas
-        scene_count = len(self.scenes)
-        
-        # Contar elementos de roteiro
-        scene_headings = 0
-        character_names = 0
-        dialogues = 0
-        actions = 0
-        transitions = 0
-        notes = 0
-        
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("CENA:"):
-                scene_headings += 1
-            elif stripped.isupper() and len(stripped) < self.settings['character_width']:
-                character_names += 1
-            elif stripped.startswith("TRANSIÇÃO:"):
-                transitions += 1
-            elif stripped.startswith("NOTA:"):
-                notes += 1
-            elif stripped:
-                # Verificar se é diálogo (linha após personagem)
-                # Esta é uma simplificação; em um cenário real, precisaríamos analisar melhor
-                dialogues += 1
-        
-        # Estimar páginas (considerando 55 linhas por página)
-        page_count = max(1, line_count // 55)
-        
-        stats = f"Estatísticas do Roteiro:\n\n"
-        stats += f"Palavras: {word_count}\n"
-        stats += f"Caracteres: {char_count}\n"
-        stats += f"Linhas: {line_count}\n"
-        stats += f"Páginas (estimado): {page_count}\n\n"
-        stats += f"Elementos de Roteiro:\n"
-        stats += f"Cenas: {scene_headings}\n"
-        stats += f"Personagens: {character_names}\n"
-        stats += f"Diálogos: {dialogues}\n"
-        stats += f"Ações: {actions}\n"
-        stats += f"Transições: {transitions}\n"
-        stats += f"Notas: {notes}\n\n"
-        stats += f"Personagens cadastrados: {character_count}\n"
-        stats += f"Cenas cadastradas: {scene_count}"
-        
-        messagebox.showinfo("Estatísticas", stats)
-    
-    def check_spelling(self):
-        # Simulação de verificação ortográfica
-        text = self.text_editor.get(1.0, tk.END)
-        
-        # Palavras comuns em português para simulação
-        common_words = [
-            "o", "a", "os", "as", "um", "uma", "uns", "umas", "de", "do", "da", "dos", "das",
-            "em", "no", "na", "nos", "nas", "por", "pelo", "pela", "pelos", "pelas",
-            "com", "como", "para", "sem", "sob", "sobre", "entre", "até", "a", "ante",
-            "após", "desde", "durante", "mediante", "perante", "salvo", "segundo", "senão",
-            "tirante", "fora", "exceto", "que", "se", "não", "é", "ser", "estar", "ter",
-            "haver", "fazer", "ir", "poder", "dizer", "dar", "ver", "saber", "querer",
-            "chegar", "passar", "ficar", "tomar", "voltar", "por", "ainda", "agora", "já",
-            "aqui", "ali", "lá", "acolá", "hoje", "ontem", "amanhã", "depois", "antes",
-            "muito", "pouco", "mais", "menos", "tão", "quanto", "como", "bem", "mal",
-            "grande", "pequeno", "longe", "perto", "alto", "baixo", "melhor", "pior"
-        ]
-        
-        # Dividir texto em palavras
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Encontrar palavras que não estão na lista de palavras comuns
-        misspelled = [word for word in words if word not in common_words and len(word) > 3]
-        
-        # Remover duplicatas
-        misspelled = list(set(misspelled))
-        
-        if misspelled:
-            # Criar janela de verificação ortográfica
-            spell_window = tk.Toplevel(self.root)
-            spell_window.title("Verificação Ortográfica")
-            spell_window.geometry("400x300")
-            spell_window.configure(bg=self.secondary_color)
-            spell_window.transient(self.root)
-            spell_window.grab_set()
-            
-            # Frame principal
-            main_frame = tk.Frame(spell_window, bg=self.secondary_color)
-            main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            tk.Label(main_frame, text="Possíveis erros de ortografia:", 
-                    bg=self.secondary_color, fg=self.fg_color, font=self.title_font).pack(anchor=tk.W, pady=5)
-            
-            # Lista de palavras
-            list_frame = tk.Frame(main_frame, bg=self.secondary_color)
-            list_frame.pack(fill=tk.BOTH, expand=True)
-            
-            scrollbar = tk.Scrollbar(list_frame)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            
-            word_list = tk.Listbox(list_frame, bg=self.bg_color, fg=self.fg_color, 
-                                  yscrollcommand=scrollbar.set)
-            word_list.pack(fill=tk.BOTH, expand=True)
-            scrollbar.config(command=word_list.yview)
-            
-            # Preencher lista
-            for word in sorted(misspelled):
-                word_list.insert(tk.END, word)
-            
-            # Botões
-            button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-            button_frame.pack(fill=tk.X, pady=10)
-            
-            ignore_btn = tk.Button(button_frame, text="Ignorar Tudo", command=spell_window.destroy,
-                                  bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-            ignore_btn.pack(side=tk.RIGHT, padx=5)
-            
-            # Configurar eventos
-            def on_double_click(event):
-                selection = word_list.curselection()
-                if selection:
-                    word = word_list.get(selection[0])
-                    
-                    # Buscar a palavra no texto
-                    text = self.text_editor.get(1.0, tk.END)
-                    pattern = r'\b' + re.escape(word) + r'\b'
-                    matches = list(re.finditer(pattern, text, re.IGNORECASE))
-                    
-                    if matches:
-                        self.search_matches = [(m.start(), m.end()) for m in matches]
-                        self.current_match = -1
-                        self.find_next()
-            
-            word_list.bind('<Double-Button-1>', on_double_click)
-        else:
-            messagebox.showinfo("Verificação Ortográfica", "Nenhum erro de ortografia encontrado.")
-    
-    def analyze_script(self):
-        # Analisar o roteiro e fornecer sugestões
-        text = self.text_editor.get(1.0, tk.END)
-        lines = text.split('\n')
-        
-        # Análise básica
-        analysis = {
-            'scenes': [],
-            'characters': {},
-            'dialogues': {},
-            'actions': 0,
-            'transitions': 0,
-            'notes': 0,
-            'issues': [],
-            'suggestions': []
-        }
-        
-        # Variáveis para rastrear o estado atual
-        current_character = None
-        current_scene = None
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            
-            if not stripped:
-                continue
-            
-            # Identificar elementos de roteiro
-            if stripped.startswith("CENA:"):
-                # Nova cena
-                current_scene = stripped[6:].strip()
-                analysis['scenes'].append({
-                    'title': current_scene,
-                    'line': i + 1
-                })
-                current_character = None
-            elif stripped.isupper() and len(stripped) < self.settings['character_width']:
-                # Novo personagem
-                current_character = stripped
-                if current_character not in analysis['characters']:
-                    analysis['characters'][current_character] = {
-                        'dialogues': 0,
-                        'first_appearance': i + 1
-                    }
-            elif current_character and not stripped.startswith("TRANSIÇÃO:") and not stripped.startswith("NOTA:"):
-                # Diálogo do personagem atual
-                if current_character not in analysis['dialogues']:
-                    analysis['dialogues'][current_character] = []
-                analysis['dialogues'][current_character].append({
-                    'text': stripped,
-                    'line': i + 1
-                })
-                if current_character in analysis['characters']:
-                    analysis['characters'][current_character]['dialogues'] += 1
-            elif stripped.startswith("TRANSIÇÃO:"):
-                # Transição
-                analysis['transitions'] += 1
-                current_character = None
-            elif stripped.startswith("NOTA:"):
-                # Nota
-                analysis['notes'] += 1
-                current_character = None
-            else:
-                # Ação
-                analysis['actions'] += 1
-                current_character = None
-        
-        # Gerar problemas e sugestões
-        if len(analysis['scenes']) < 3:
-            analysis['issues'].append("O roteiro tem poucas cenas. Considere adicionar mais cenas para desenvolver melhor a história.")
-        
-        if len(analysis['characters']) < 2:
-            analysis['issues'].append("O roteiro tem poucos personagens. Considere adicionar mais personagens para enriquecer a história.")
-        
-        # Verificar personagens com poucos diálogos
-        for char, data in analysis['characters'].items():
-            if data['dialogues'] < 3:
-                analysis['suggestions'].append(f"O personagem '{char}' tem poucos diálogos. Considere desenvolver mais este personagem.")
-        
-        # Verificar cenas muito longas ou muito curtas
-        scene_lengths = {}
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith("CENA:"):
-                scene_name = stripped[6:].strip()
-                if scene_name not in scene_lengths:
-                    scene_lengths[scene_name] = {'start': i, 'lines': 0}
-            elif scene_lengths:
-                # Incrementar contador de linhas para a cena atual
-                current_scene = list(scene_lengths.keys())[-1]
-                scene_lengths[current_scene]['lines'] += 1
-        
-        for scene, data in scene_lengths.items():
-            if data['lines'] < 10:
-                analysis['suggestions'].append(f"A cena '{scene}' parece ser muito curta. Considere adicionar mais detalhes ou diálogos.")
-            elif data['lines'] > 100:
-                analysis['suggestions'].append(f"A cena '{scene}' parece ser muito longa. Considere dividi-la em cenas menores.")
-        
-        # Criar janela de análise
-        analysis_window = tk.Toplevel(self.root)
-        analysis_window.title("Análise de Roteiro")
-        analysis_window.geometry("600x500")
-        analysis_window.configure(bg=self.secondary_color)
-        analysis_window.transient(self.root)
-        
-        # Frame principal
-        main_frame = tk.Frame(analysis_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Notebook para abas
-        notebook = ttk.Notebook(main_frame)
-        notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Aba de resumo
-        summary_frame = tk.Frame(notebook, bg=self.secondary_color)
-        notebook.add(summary_frame, text="Resumo")
-        
-        summary_text = tk.Text(summary_frame, bg=self.bg_color, fg=self.fg_color, 
-                             wrap=tk.WORD, bd=0, padx=10, pady=10)
-        summary_text.pack(fill=tk.BOTH, expand=True)
-        
-        summary_content = f"""
-Resumo da Análise:
-
-Cenas: {len(analysis['scenes'])}
-Personagens: {len(analysis['characters'])}
-Ações: {analysis['actions']}
-Diálogos: {sum(data['dialogues'] for data in analysis['characters'].values())}
-Transições: {analysis['transitions']}
-Notas: {analysis['notes']}
-
-Personagens com mais diálogos:
-"""
-        
-        # Ordenar personagens por número de diálogos
-        sorted_characters = sorted(analysis['characters'].items(), key=lambda x: x[1]['dialogues'], reverse=True)
-        
-        for char, data in sorted_characters[:5]:
-            summary_content += f"- {char}: {data['dialogues']} diálogos\n"
-        
-        summary_text.insert(tk.END, summary_content)
-        summary_text.config(state=tk.DISABLED)
-        
-        # Aba de problemas
-        issues_frame = tk.Frame(notebook, bg=self.secondary_color)
-        notebook.add(issues_frame, text="Problemas")
-        
-        issues_text = tk.Text(issues_frame, bg=self.bg_color, fg=self.fg_color, 
-                            wrap=tk.WORD, bd=0, padx=10, pady=10)
-        issues_text.pack(fill=tk.BOTH, expand=True)
-        
-        if analysis['issues']:
-            for issue in analysis['issues']:
-                issues_text.insert(tk.END, f"• {issue}\n\n")
-        else:
-            issues_text.insert(tk.END, "Nenhum problema identificado.")
-        
-        issues_text.config(state=tk.DISABLED)
-        
-        # Aba de sugestões
-        suggestions_frame = tk.Frame(notebook, bg=self.secondary_color)
-        notebook.add(suggestions_frame, text="Sugestões")
-        
-        suggestions_text = tk.Text(suggestions_frame, bg=self.bg_color, fg=self.fg_color, 
-                                  wrap=tk.WORD, bd=0, padx=10, pady=10)
-        suggestions_text.pack(fill=tk.BOTH, expand=True)
-        
-        if analysis['suggestions']:
-            for suggestion in analysis['suggestions']:
-                suggestions_text.insert(tk.END, f"• {suggestion}\n\n")
-        else:
-            suggestions_text.insert(tk.END, "Nenhuma sugestão no momento.")
-        
-        suggestions_text.config(state=tk.DISABLED)
-        
-        # Aba de personagens
-        characters_frame = tk.Frame(notebook, bg=self.secondary_color)
-        notebook.add(characters_frame, text="Personagens")
-        
-        # Lista de personagens
-        list_frame = tk.Frame(characters_frame, bg=self.secondary_color)
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        scrollbar = tk.Scrollbar(list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        characters_list = tk.Listbox(list_frame, bg=self.bg_color, fg=self.fg_color, 
-                                     yscrollcommand=scrollbar.set)
-        characters_list.pack(fill=tk.BOTH, expand=True)
-        scrollbar.config(command=characters_list.yview)
-        
-        # Preencher lista
-        for char, data in sorted_characters:
-            characters_list.insert(tk.END, f"{char} - {data['dialogues']} diálogos (linha {data['first_appearance']})")
-        
-        # Botão Fechar
-        close_btn = tk.Button(main_frame, text="Fechar", command=analysis_window.destroy,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        close_btn.pack(pady=10)
-    
-    def reformat_script(self):
-        # Reformatar o roteiro de acordo com o padrão da indústria
-        text = self.text_editor.get(1.0, tk.END)
-        lines = text.split('\n')
-        
-        reformatted_lines = []
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            if not stripped:
-                # Manter linhas em branco
-                reformatted_lines.append("")
-            elif stripped.startswith("CENA:"):
-                # Formatar cena
-                scene_text = stripped[6:].strip().upper()
-                reformatted_lines.append(f"CENA: {scene_text}")
-            elif stripped.isupper() and len(stripped) < self.settings['character_width']:
-                # Formatar personagem (centralizado)
-                char_length = len(stripped)
-                total_spaces = self.settings['page_width'] - char_length
-                left_spaces = total_spaces // 2
-                reformatted_lines.append(' ' * left_spaces + stripped)
-            elif stripped.startswith("TRANSIÇÃO:"):
-                # Formatar transição (alinhado à direita)
-                transition_text = stripped[11:].strip().upper()
-                transition_length = len(transition_text) + 11  # Incluir "TRANSIÇÃO: "
-                total_spaces = self.settings['page_width'] - transition_length
-                left_spaces = total_spaces
-                reformatted_lines.append(' ' * left_spaces + f"TRANSIÇÃO: {transition_text}")
-            elif stripped.startswith("NOTA:"):
-                # Formatar nota
-                note_text = stripped[6:].strip()
-                reformatted_lines.append(f"NOTA: {note_text}")
-            else:
-                # Verificar se é diálogo (linha após personagem)
-                if reformatted_lines and reformatted_lines[-1].isupper() and len(reformatted_lines[-1].strip()) < self.settings['character_width']:
-                    # Formatar diálogo (com recuo)
-                    dialogue_text = stripped
-                    reformatted_lines.append(' ' * 15 + dialogue_text)
-                else:
-                    # Formatar ação (com recuo menor)
-                    action_text = stripped
-                    reformatted_lines.append(' ' * 10 + action_text)
-        
-        # Atualizar o editor
-        self.text_editor.delete(1.0, tk.END)
-        self.text_editor.insert(1.0, '\n'.join(reformatted_lines))
-        
-        # Aplicar formatação
-        self.apply_formatting()
-        
-        self.update_status("Roteiro reformatado")
-    
-    def apply_formatting(self):
-        # Aplicar formatação ao texto do editor
-        text = self.text_editor.get(1.0, tk.END)
-        lines = text.split('\n')
-        
-        for i, line in enumerate(lines):
-            if not line.strip():
-                continue
-                
-            start_index = f"{i+1}.0"
-            end_index = f"{i+1}.end"
-            
-            if line.strip().startswith("CENA:"):
-                self.text_editor.tag_add("scene", start_index, end_index)
-            elif line.strip().isupper() and len(line.strip()) < self.settings['character_width']:
-                self.text_editor.tag_add("character", start_index, end_index)
-            elif line.strip().startswith("TRANSIÇÃO:"):
-                self.text_editor.tag_add("transition", start_index, end_index)
-            elif line.strip().startswith("NOTA:"):
-                self.text_editor.tag_add("note", start_index, end_index)
-    
-    def configure_formatting(self):
-        # Criar janela de configuração de formatação
-        format_window = tk.Toplevel(self.root)
-        format_window.title("Configurar Formatação")
-        format_window.geometry("400x300")
-        format_window.configure(bg=self.secondary_color)
-        format_window.transient(self.root)
-        format_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(format_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Configurações
-        tk.Label(main_frame, text="Configurações de Formatação:", bg=self.secondary_color, fg=self.fg_color, 
-                font=self.title_font).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Largura da página
-        tk.Label(main_frame, text="Largura da página (caracteres):", 
-                bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
-        
-        page_width_var = tk.IntVar(value=self.settings['page_width'])
-        page_width_spinbox = tk.Spinbox(main_frame, from_=60, to=100, textvariable=page_width_var, 
-                                       bg=self.bg_color, fg=self.fg_color, width=10)
-        page_width_spinbox.grid(row=1, column=1, sticky=tk.W, pady=5)
-        
-        # Largura do personagem
-        tk.Label(main_frame, text="Largura do personagem (caracteres):", 
-                bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
-        
-        character_width_var = tk.IntVar(value=self.settings['character_width'])
-        character_width_spinbox = tk.Spinbox(main_frame, from_=20, to=60, textvariable=character_width_var, 
-                                           bg=self.bg_color, fg=self.fg_color, width=10)
-        character_width_spinbox.grid(row=2, column=1, sticky=tk.W, pady=5)
-        
-        # Largura do diálogo
-        tk.Label(main_frame, text="Largura do diálogo (caracteres):", 
-                bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
-        
-        dialogue_width_var = tk.IntVar(value=self.settings['dialogue_width'])
-        dialogue_width_spinbox = tk.Spinbox(main_frame, from_=20, to=60, textvariable=dialogue_width_var, 
-                                           bg=self.bg_color, fg=self.fg_color, width=10)
-        dialogue_width_spinbox.grid(row=3, column=1, sticky=tk.W, pady=5)
-        
-        # Largura da ação
-        tk.Label(main_frame, text="Largura da ação (caracteres):", 
-                bg=self.secondary_color, fg=self.fg_color).grid(row=4, column=0, sticky=tk.W, pady=5)
-        
-        action_width_var = tk.IntVar(value=self.settings['action_width'])
-        action_width_spinbox = tk.Spinbox(main_frame, from_=20, to=80, textvariable=action_width_var, 
-                                         bg=self.bg_color, fg=self.fg_color, width=10)
-        action_width_spinbox.grid(row=4, column=1, sticky=tk.W, pady=5)
-        
-        # Largura da cena
-        tk.Label(main_frame, text="Largura da cena (caracteres):", 
-                bg=self.secondary_color, fg=self.fg_color).grid(row=5, column=0, sticky=tk.W, pady=5)
-        
-        scene_width_var = tk.IntVar(value=self.settings['scene_width'])
-        scene_width_spinbox = tk.Spinbox(main_frame, from_=20, to=80, textvariable=scene_width_var, 
-                                        bg=self.bg_color, fg=self.fg_color, width=10)
-        scene_width_spinbox.grid(row=5, column=1, sticky=tk.W, pady=5)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=6, column=0, columnspan=2, pady=10)
-        
-        def save_formatting():
-            # Salvar configurações
-            self.settings['page_width'] = page_width_var.get()
-            self.settings['character_width'] = character_width_var.get()
-            self.settings['dialogue_width'] = dialogue_width_var.get()
-            self.settings['action_width'] = action_width_var.get()
-            self.settings['scene_width'] = scene_width_var.get()
-            
-            format_window.destroy()
-            self.update_status("Configurações de formatação salvas")
-            
-            # Perguntar se deseja reformatar o roteiro
-            if messagebox.askyesno("Reformatar", "Deseja reformatar o roteiro com as novas configurações?"):
-                self.reformat_script()
-        
-        save_btn = tk.Button(button_frame, text="Salvar", command=save_formatting,
-                            bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        save_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=format_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def show_settings(self):
-        # Criar janela de configurações
-        settings_window = tk.Toplevel(self.root)
-        settings_window.title("Configurações")
-        settings_window.geometry("400x350")
-        settings_window.configure(bg=self.secondary_color)
-        settings_window.transient(self.root)
-        settings_window.grab_set()
-        
-        # Frame principal
-        main_frame = tk.Frame(settings_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Configurações
-        tk.Label(main_frame, text="Configurações:", bg=self.secondary_color, fg=self.fg_color, 
-                font=self.title_font).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Auto-salvar
-        auto_save_var = tk.IntVar(value=1 if self.settings['auto_save'] else 0)
-        auto_save_check = tk.Checkbutton(main_frame, text="Auto-salvar", variable=auto_save_var,
-                                        bg=self.secondary_color, fg=self.fg_color,
-                                        selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                        activeforeground=self.fg_color)
-        auto_save_check.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Intervalo de auto-salvamento
-        tk.Label(main_frame, text="Intervalo de auto-salvamento (minutos):", 
-                bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
-        
-        interval_var = tk.IntVar(value=self.settings['auto_save_interval'])
-        interval_spinbox = tk.Spinbox(main_frame, from_=1, to=60, textvariable=interval_var, 
-                                     bg=self.bg_color, fg=self.fg_color, width=10)
-        interval_spinbox.grid(row=2, column=1, sticky=tk.W, pady=5)
-        
-        # Tema
-        tk.Label(main_frame, text="Tema:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
-        
-        theme_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        theme_frame.grid(row=3, column=1, sticky=tk.W, pady=5)
-        
-        theme_var = tk.StringVar(value=self.settings['theme'])
-        dark_radio = tk.Radiobutton(theme_frame, text="Escuro", variable=theme_var, value="dark",
-                                   bg=self.secondary_color, fg=self.fg_color,
-                                   selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                   activeforeground=self.fg_color)
-        dark_radio.pack(side=tk.LEFT, padx=5)
-        
-        light_radio = tk.Radiobutton(theme_frame, text="Claro", variable=theme_var, value="light",
-                                    bg=self.secondary_color, fg=self.fg_color,
-                                    selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                    activeforeground=self.fg_color)
-        light_radio.pack(side=tk.LEFT, padx=5)
-        
-        # Fonte
-        tk.Label(main_frame, text="Fonte:", bg=self.secondary_color, fg=self.fg_color).grid(row=4, column=0, sticky=tk.W, pady=5)
-        
-        font_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        font_frame.grid(row=4, column=1, sticky=tk.W, pady=5)
-        
-        font_var = tk.StringVar(value=self.settings['font_family'])
-        font_combo = ttk.Combobox(font_frame, textvariable=font_var, values=sorted(font.families()), width=15)
-        font_combo.pack(side=tk.LEFT, padx=5)
-        
-        # Tamanho da fonte
-        size_var = tk.IntVar(value=self.settings['font_size'])
-        size_spinbox = tk.Spinbox(font_frame, from_=8, to=24, textvariable=size_var, 
-                                 bg=self.bg_color, fg=self.fg_color, width=5)
-        size_spinbox.pack(side=tk.LEFT, padx=5)
-        
-        # Números de linha
-        line_numbers_var = tk.IntVar(value=1 if self.settings['show_line_numbers'] else 0)
-        line_numbers_check = tk.Checkbutton(main_frame, text="Mostrar números de linha", 
-                                           variable=line_numbers_var,
-                                           bg=self.secondary_color, fg=self.fg_color,
-                                           selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                           activeforeground=self.fg_color)
-        line_numbers_check.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Quebra de linha
-        word_wrap_var = tk.IntVar(value=1 if self.settings['word_wrap'] else 0)
-        word_wrap_check = tk.Checkbutton(main_frame, text="Quebra de linha automática", 
-                                        variable=word_wrap_var,
-                                        bg=self.secondary_color, fg=self.fg_color,
-                                        selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                        activeforeground=self.fg_color)
-        word_wrap_check.grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Destacar linha atual
-        line_highlight_var = tk.IntVar(value=1 if self.settings['highlight_current_line'] else 0)
-        line_highlight_check = tk.Checkbutton(main_frame, text="Destacar linha atual", 
-                                            variable=line_highlight_var,
-                                            bg=self.secondary_color, fg=self.fg_color,
-                                            selectcolor=self.bg_color, activebackground=self.secondary_color,
-                                            activeforeground=self.fg_color)
-        line_highlight_check.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=5)
-        
-        # Botões
-        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        button_frame.grid(row=8, column=0, columnspan=2, pady=10)
-        
-        def save_settings():
-            # Salvar configurações
-            self.settings['auto_save'] = bool(auto_save_var.get())
-            self.settings['auto_save_interval'] = interval_var.get()
-            self.settings['theme'] = theme_var.get()
-            self.settings['font_family'] = font_var.get()
-            self.settings['font_size'] = size_var.get()
-            self.settings['show_line_numbers'] = bool(line_numbers_var.get())
-            self.settings['word_wrap'] = bool(word_wrap_var.get())
-            self.settings['highlight_current_line'] = bool(line_highlight_var.get())
-            
-            # Aplicar configurações
-            self.change_theme(self.settings['theme'])
-            self.default_font = font.Font(family=self.settings['font_family'], size=self.settings['font_size'])
-            self.text_editor.config(font=self.default_font)
-            
-            # Atualizar tags de formatação
-            self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
-            self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
-            self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
-            self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
-                                          foreground=self.highlight_color)
-            self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
-                                          foreground="#cccccc")
-            
-            # Atualizar quebra de linha
-            wrap_mode = tk.WORD if self.settings['word_wrap'] else tk.NONE
-            self.text_editor.config(wrap=wrap_mode)
-            
-            # Atualizar números de linha
-            if self.settings['show_line_numbers']:
-                if not hasattr(self, 'line_numbers'):
-                    # Recrear o editor com números de linha
-                    self.text_editor.pack_forget()
-                    self.create_text_editor()
-                else:
-                    self.line_numbers.config(font=self.default_font)
-                    self.update_line_numbers()
-            else:
-                if hasattr(self, 'line_numbers'):
-                    # Recrear o editor sem números de linha
-                    self.text_editor.pack_forget()
-                    self.line_numbers.pack_forget()
-                    self.create_text_editor()
-            
-            # Atualizar destaque de linha atual
-            if self.settings['highlight_current_line']:
-                self.highlight_current_line()
-            else:
-                self.text_editor.tag_remove("current_line", "1.0", tk.END)
-            
-            settings_window.destroy()
-            self.update_status("Configurações salvas")
-        
-        save_btn = tk.Button(button_frame, text="Salvar", command=save_settings,
-                            bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        save_btn.pack(side=tk.LEFT, padx=5)
-        
-        cancel_btn = tk.Button(button_frame, text="Cancelar", command=settings_window.destroy,
-                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Configurar grid
-        main_frame.columnconfigure(1, weight=1)
-    
-    def show_shortcuts(self):
-        # Criar janela de atalhos
-        shortcuts_window = tk.Toplevel(self.root)
-        shortcuts_window.title("Atalhos de Teclado")
-        shortcuts_window.geometry("500x600")
-        shortcuts_window.configure(bg=self.secondary_color)
-        shortcuts_window.transient(self.root)
-        
-        # Frame principal
-        main_frame = tk.Frame(shortcuts_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Título
-        tk.Label(main_frame, text="Atalhos de Teclado", bg=self.secondary_color, fg=self.fg_color, 
-                font=self.title_font).pack(anchor=tk.W, pady=10)
-        
-        # Frame para atalhos
-        shortcuts_frame = tk.Frame(main_frame, bg=self.secondary_color)
-        shortcuts_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Scrollbar
-        scrollbar = tk.Scrollbar(shortcuts_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Texto com atalhos
-        shortcuts_text = tk.Text(shortcuts_frame, bg=self.bg_color, fg=self.fg_color, 
-                                wrap=tk.WORD, yscrollcommand=scrollbar.set, bd=0, padx=10, pady=10)
-        shortcuts_text.pack(fill=tk.BOTH, expand=True)
-        scrollbar.config(command=shortcuts_text.yview)
-        
-        # Conteúdo
-        shortcuts_content = """
-Arquivo:
-Ctrl+N - Novo Roteiro
-Ctrl+O - Abrir Roteiro
-Ctrl+S - Salvar Roteiro
-Ctrl+Shift+S - Salvar Como
-Ctrl+Alt+S - Salvar Seguro
-Ctrl+E - Exportar PDF
-Ctrl+Q - Sair
-
-Editar:
-Ctrl+Z - Desfazer
-Ctrl+Y - Refazer
-Ctrl+X - Recortar
-Ctrl+C - Copiar
-Ctrl+V - Colar
-Ctrl+F - Buscar
-Ctrl+R - Substituir
-Ctrl+G - Ir Para Linha
-Ctrl+A - Selecionar Tudo
-
-Formato:
-Ctrl+B - Negrito
-Ctrl+I - Itálico
-Ctrl+U - Sublinhado
-Ctrl+P - Inserir Personagem
-Ctrl+D - Inserir Diálogo
-Ctrl+Shift+A - Inserir Ação
-Ctrl+Shift+C - Inserir Cena
-Ctrl+T - Inserir Transição
-Ctrl+Shift+N - Inserir Nota
-
-Visualizar:
-Ctrl++ - Zoom In
-Ctrl+- - Zoom Out
-Ctrl+0 - Zoom Normal
-
-Navegação:
-F3 - Próxima ocorrência
-Shift+F3 - Ocorrência anterior
-        """
-        
-        shortcuts_text.insert(tk.END, shortcuts_content)
-        shortcuts_text.config(state=tk.DISABLED)
-        
-        # Botão Fechar
-        close_btn = tk.Button(main_frame, text="Fechar", command=shortcuts_window.destroy,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        close_btn.pack(pady=10)
-    
-    def show_tutorial(self):
-        # Criar janela de tutorial
-        tutorial_window = tk.Toplevel(self.root)
-        tutorial_window.title("Tutorial")
-        tutorial_window.geometry("700x500")
-        tutorial_window.configure(bg=self.secondary_color)
-        tutorial_window.transient(self.root)
-        
-        # Frame principal
-        main_frame = tk.Frame(tutorial_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Título
-        tk.Label(main_frame, text="Tutorial do Roteirista Pro", bg=self.secondary_color, fg=self.fg_color, 
-                font=self.title_font).pack(anchor=tk.W, pady=10)
-        
-        # Notebook para abas do tutorial
-        tutorial_notebook = ttk.Notebook(main_frame)
-        tutorial_notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Aba 1: Introdução
-        intro_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
-        tutorial_notebook.add(intro_frame, text="Introdução")
-        
-        intro_text = tk.Text(intro_frame, bg=self.bg_color, fg=self.fg_color, 
-                            wrap=tk.WORD, bd=0, padx=10, pady=10)
-        intro_text.pack(fill=tk.BOTH, expand=True)
-        
-        intro_content = """
-Bem-vindo ao Roteirista Pro!
-
-Este é um aplicativo projetado para ajudar roteiristas a criar e formatar roteiros de filmes, séries e vídeos de forma profissional.
-
-Com o Roteirista Pro, você pode:
-
-• Escrever e formatar roteiros no padrão da indústria
-• Gerenciar personagens e cenas
-• Exportar para PDF e outros formatos
-• Usar atalhos de teclado para aumentar sua produtividade
-• Personalizar a aparência do aplicativo
-• Salvar roteiros com segurança usando senha
-• Analisar seu roteiro para obter sugestões de melhoria
-
-Navegue pelas abas deste tutorial para aprender mais sobre cada recurso do aplicativo.
-        """
-        
-        intro_text.insert(tk.END, intro_content)
-        intro_text.config(state=tk.DISABLED)
-        
-        # Aba 2: Interface
-        interface_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
-        tutorial_notebook.add(interface_frame, text="Interface")
-        
-        interface_text = tk.Text(interface_frame, bg=self.bg_color, fg=self.fg_color, 
-                                wrap=tk.WORD, bd=0, padx=10, pady=10)
-        interface_text.pack(fill=tk.BOTH, expand=True)
-        
-        interface_content = """
-Interface do Roteirista Pro
-
-A interface do aplicativo é composta por:
-
-1. Barras de Ferramentas: Localizadas na parte superior, contêm botões para as funções mais comuns, organizadas em três categorias:
-   - Barra principal: funções de arquivo, edição e exportação
-   - Barra de formatação: opções de formatação de texto
-   - Barra de elementos: inserção de elementos de roteiro
-
-2. Menu: Abaixo das barras de ferramentas, oferece acesso a todas as funções do aplicativo.
-
-3. Barra Lateral: No lado esquerdo, contém abas para organizar melhor as ferramentas:
-   - Elementos: inserção de elementos de roteiro
-   - Formatação: opções de formatação de texto
-   - Personagens: gerenciamento de personagens
-   - Cenas: gerenciamento de cenas
-   - Notas: anotações sobre o roteiro
-   - Ferramentas: ferramentas de análise e formatação
-
-4. Editor de Texto: Área principal onde você escreve seu roteiro, com destaque da linha atual e cursor visível.
-
-5. Barra de Status: Na parte inferior, exibe informações sobre o documento, posição do cursor, formato do elemento atual e indicador de salvamento.
-
-Você pode ocultar ou mostrar cada uma das barras de ferramentas e a barra lateral através do menu Visualizar.
-        """
-        
-        interface_text.insert(tk.END, interface_content)
-        interface_text.config(state=tk.DISABLED)
-        
-        # Aba 3: Formatação
-        format_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
-        tutorial_notebook.add(format_frame, text="Formatação")
-        
-        format_text = tk.Text(format_frame, bg=self.bg_color, fg=self.fg_color, 
-                             wrap=tk.WORD, bd=0, padx=10, pady=10)
-        format_text.pack(fill=tk.BOTH, expand=True)
-        
-        format_content = """
-Formatação de Roteiros
-
-O Roteirista Pro facilita a formatação de roteiros no padrão da indústria. Os principais elementos são:
-
-• Cena: Local e horário da cena (ex: "CENA: CASA DE JOÃO - DIA"). Deve estar em maiúsculas.
-
-• Personagem: Nome do personagem em maiúsculas e centralizado.
-
-• Diálogo: Texto falado pelo personagem, com recuo à esquerda.
-
-• Ação: Descrição de ações, cenas e personagens, com recuo menor que o diálogo.
-
-• Transição: Indicações de transição entre cenas (ex: "TRANSIÇÃO: CORTE PARA:"). Alinhado à direita.
-
-• Nota: Comentários ou anotações sobre o roteiro.
-
-Você pode inserir esses elementos usando os botões na barra lateral, no menu Formato ou com atalhos de teclado.
-
-Para formatar texto como negrito, itálico ou sublinhado, selecione o texto e use os botões na barra lateral, no menu Editar ou com atalhos de teclado.
-
-O Roteirista Pro também oferece uma função de reformatar automaticamente todo o roteiro para garantir que ele siga o padrão da indústria.
-        """
-        
-        format_text.insert(tk.END, format_content)
-        format_text.config(state=tk.DISABLED)
-        
-        # Aba 4: Segurança
-        security_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
-        tutorial_notebook.add(security_frame, text="Segurança")
-        
-        security_text = tk.Text(security_frame, bg=self.bg_color, fg=self.fg_color, 
-                              wrap=tk.WORD, bd=0, padx=10, pady=10)
-        security_text.pack(fill=tk.BOTH, expand=True)
-        
-        security_content = """
-Segurança de Roteiros
-
-O Roteirista Pro oferece recursos para proteger seus roteiros:
-
-Salvamento Seguro:
-
-Você pode salvar seus roteiros com proteção por senha usando a função "Salvar Seguro". Isso criptografa o conteúdo do arquivo, tornando-o inacessível sem a senha correta.
-
-Para salvar um roteiro seguro:
-1. Clique em "Salvar Seguro" no menu Arquivo ou na barra lateral
-2. Digite uma senha
-3. Confirme a senha
-4. Escolha onde salvar o arquivo
-
-Para abrir um roteiro seguro:
-1. Clique em "Abrir" no menu Arquivo
-2. Selecione o arquivo seguro (.sec)
-3. Digite a senha correta
-
-Auto-salvamento:
-
-O aplicativo pode salvar automaticamente seu trabalho em intervalos regulares, evitando perda de dados em caso de problemas.
-
-Para configurar o auto-salvamento:
-1. Clique em "Configurações" no menu Ferramentas
-2. Marque a opção "Auto-salvar"
-3. Defina o intervalo de salvamento
-
-Lembre-se de escolher uma senha forte e não compartilhá-la com pessoas não autorizadas.
-        """
-        
-        security_text.insert(tk.END, security_content)
-        security_text.config(state=tk.DISABLED)
-        
-        # Aba 5: Análise
-        analysis_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
-        tutorial_notebook.add(analysis_frame, text="Análise")
-        
-        analysis_text = tk.Text(analysis_frame, bg=self.bg_color, fg=self.fg_color, 
-                               wrap=tk.WORD, bd=0, padx=10, pady=10)
-        analysis_text.pack(fill=tk.BOTH, expand=True)
-        
-        analysis_content = """
-Análise de Roteiros
-
-O Roteirista Pro oferece ferramentas para analisar seu roteiro e obter sugestões de melhoria:
-
-Análise Completa:
-
-A função "Analisar Roteiro" examina seu roteiro e fornece:
-• Contagem de cenas, personagens, diálogos, etc.
-• Identificação de possíveis problemas (poucas cenas, poucos personagens, etc.)
-• Sugestões para melhorar o roteiro
-• Lista de personagens e suas estatísticas
-
-Tempo de Leitura:
-
-Calcula o tempo estimado para ler o roteiro, baseado em 200 palavras por minuto.
-
-Estatísticas:
-
-Fornece estatísticas detalhadas sobre o roteiro, incluindo:
-• Número de palavras e caracteres
-• Número de linhas e páginas estimadas
-• Contagem de cada tipo de elemento de roteiro
-• Informações sobre personagens e cenas
-
-Verificação Ortográfica:
-
-Verifica o texto em busca de possíveis erros de ortografia e permite que você corrija-os facilmente.
-
-Para usar essas ferramentas, acesse o menu Ferramentas ou a aba "Ferramentas" na barra lateral.
-        """
-        
-        analysis_text.insert(tk.END, analysis_content)
-        analysis_text.config(state=tk.DISABLED)
-        
-        # Aba 6: Exportação
-        export_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
-        tutorial_notebook.add(export_frame, text="Exportação")
-        
-        export_text = tk.Text(export_frame, bg=self.bg_color, fg=self.fg_color, 
-                             wrap=tk.WORD, bd=0, padx=10, pady=10)
-        export_text.pack(fill=tk.BOTH, expand=True)
-        
-        export_content = """
-Exportação de Roteiros
-
-O Roteirista Pro oferece várias opções de exportação:
-
-PDF:
-
-Para exportar seu roteiro como PDF:
-1. Salve seu roteiro (Ctrl+S)
-2. Clique em "Exportar PDF" no menu Arquivo ou na barra de ferramentas
-3. Escolha o local para salvar o arquivo PDF
-
-HTML:
-
-Para exportar seu roteiro como HTML:
-1. Salve seu roteiro (Ctrl+S)
-2. Clique em "Exportar HTML" no menu Arquivo
-3. Escolha o local para salvar o arquivo HTML
-
-Fountain:
-
-Para exportar seu roteiro como Fountain:
-1. Salve seu roteiro (Ctrl+S)
-2. Clique em "Exportar Fountain" no menu Arquivo
-3. Escolha o local para salvar o arquivo Fountain
-
-O formato Fountain é um formato de texto simples para roteiros que pode ser lido por humanos e processado por software.
-
-Impressão:
-
-Para imprimir seu roteiro:
-1. Salve seu roteiro (Ctrl+S)
-2. Clique em "Imprimir" no menu Arquivo ou pressione Ctrl+P
-3. Seu roteiro será aberto no navegador padrão para impressão
-
-Importação:
-
-Você também pode importar roteiros de outros formatos:
-• FDX (Final Draft)
-• PDF
-• DOCX (Word)
-• Fountain
-
-Clique em "Importar" no menu Arquivo para selecionar um arquivo para importar.
-        """
-        
-        export_text.insert(tk.END, export_content)
-        export_text.config(state=tk.DISABLED)
-        
-        # Botão Fechar
-        close_btn = tk.Button(main_frame, text="Fechar", command=tutorial_window.destroy,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        close_btn.pack(pady=10)
-    
-    def show_formatting_guide(self):
-        # Criar janela de guia de formatação
-        guide_window = tk.Toplevel(self.root)
-        guide_window.title("Guia de Formatação")
-        guide_window.geometry("700x500")
-        guide_window.configure(bg=self.secondary_color)
-        guide_window.transient(self.root)
-        
-        # Frame principal
-        main_frame = tk.Frame(guide_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Título
-        tk.Label(main_frame, text="Guia de Formatação de Roteiros", bg=self.secondary_color, fg=self.fg_color, 
-                font=self.title_font).pack(anchor=tk.W, pady=10)
-        
-        # Notebook para abas do guia
-        guide_notebook = ttk.Notebook(main_frame)
-        guide_notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Aba 1: Padrão da Indústria
-        standard_frame = tk.Frame(guide_notebook, bg=self.secondary_color)
-        guide_notebook.add(standard_frame, text="Padrão da Indústria")
-        
-        standard_text = tk.Text(standard_frame, bg=self.bg_color, fg=self.fg_color, 
-                               wrap=tk.WORD, bd=0, padx=10, pady=10)
-        standard_text.pack(fill=tk.BOTH, expand=True)
-        
-        standard_content = """
-Padrão de Formatação da Indústria
-
-O padrão de formatação de roteiros segue convenções estabelecidas pela indústria cinematográfica. Aqui estão as principais regras:
-
-Cenas:
-
-As cenas devem ser formatadas da seguinte maneira:
-
-CENA: LOCAL - DIA/NOITE
-
-• A palavra "CENA:" deve estar em maiúsculas
-• O local deve ser descrito de forma clara e concisa
-• O horário deve ser "DIA" ou "NOITE" (ou variações como "MANHÃ", "TARDE", "NOITE", "MADRUGADA", etc.)
-• Cenas devem ser escritas em maiúsculas
-• Cenas devem ser alinhadas à esquerda
-
-Personagens:
-
-Os nomes dos personagens devem ser formatados da seguinte maneira:
-
-                                     NOME DO PERSONAGEM
-
-• Nomes de personagens devem estar em maiúsculas
-• Nomes de personagens devem ser centralizados na página
-• Nomes de personagens não devem ultrapassar 40 caracteres
-
-Diálogos:
-
-Os diálogos devem ser formatados da seguinte maneira:
-
-               Diálogo do personagem aqui...
-
-• Diálogos devem ter um recuo de aproximadamente 15 espaços
-• Diálogos não devem ultrapassar 35 caracteres por linha
-• Diálogos devem seguir imediatamente após o nome do personagem
-
-Ações:
-
-As ações devem ser formatadas da seguinte maneira:
-
-          Ação ou descrição da cena aqui...
-
-• Ações devem ter um recuo de aproximadamente 10 espaços
-• Ações devem ser escritas em letra minúscula, exceto nomes próprios
-• Ações devem descrever visualmente o que acontece na cena
-
-Transições:
-
-As transições devem ser formatadas da seguinte maneira:
-
-                                    TRANSIÇÃO: CORTE PARA:
-
-• Transições devem ser alinhadas à direita
-• Transições devem estar em maiúsculas
-• Transições comuns incluem "CORTE PARA:", "DISSOLVÊNCIA PARA:", "FADE OUT:", etc.
-
-Notas:
-
-As notas devem ser formatadas da seguinte maneira:
-
-NOTA: Esta é uma nota sobre o roteiro.
-
-• Notas devem começar com "NOTA:"
-• Notas devem ser usadas para comentários ou anotações
-• Notas não devem fazer parte do roteiro final
-        """
-        
-        standard_text.insert(tk.END, standard_content)
-        standard_text.config(state=tk.DISABLED)
-        
-        # Aba 2: Exemplos
-        examples_frame = tk.Frame(guide_notebook, bg=self.secondary_color)
-        guide_notebook.add(examples_frame, text="Exemplos")
-        
-        examples_text = tk.Text(examples_frame, bg=self.bg_color, fg=self.fg_color, 
-                               wrap=tk.WORD, bd=0, padx=10, pady=10)
-        examples_text.pack(fill=tk.BOTH, expand=True)
-        
-        examples_content = """
-Exemplos de Formatação
-
-Aqui estão alguns exemplos de como formatar diferentes elementos de um roteiro:
-
-Exemplo de Cena:
-
-CENA: CASA DE JOÃO - SALA DE ESTAR - NOITE
-
-A sala está iluminada apenas pela luz da TV. JOÃO (30) está sentado no sofá, assistindo a um filme.
-
-                                     JOÃO
-               (para si mesmo)
-               Eu deveria ter ido para a cama mais cedo.
-
-João se levanta e caminha até a janela. Ele olha para fora.
-
-                                     JOÃO
-               (suspirando)
-               Mais uma noite sem dormir.
-
-Exemplo de Diálogo:
-
-                                     MARIA
-               Você não vai dormir nunca?
-
-                                     JOÃO
-               (virando-se)
-               Maria! Eu não te ouvi entrar.
-
-                                     MARIA
-               Claro, você estava muito concentrado
-               na TV.
-
-                                     JOÃO
-               É que... eu não consigo dormir
-               ultimamente.
-
-Exemplo de Ação:
-
-Maria se aproxima de João e coloca a mão no seu ombro.
-
-                                     MARIA
-               (com voz suave)
-               Eu sei. Mas você precisa tentar.
-
-João olha para Maria e sorri fracamente.
-
-                                     JOÃO
-               Você sempre sabe o que dizer.
-
-Exemplo de Transição:
-
-CENA: QUARTO DE JOÃO - NOITE
-
-João está deitado na cama, olhando para o teto. Maria está ao seu lado.
-
-                                     MARIA
-               Agora tente dormir. Eu fico aqui
-               com você.
-
-                                     JOÃO
-               (fechando os olhos)
-               Obrigado, Maria.
-
-Maria beija a testa de João.
-
-                                    TRANSIÇÃO: FADE OUT.
-
-Exemplo de Nota:
-
-NOTA: Esta cena precisa de mais diálogo para desenvolver melhor a relação entre os personagens.
-        """
-        
-        examples_text.insert(tk.END, examples_content)
-        examples_text.config(state=tk.DISABLED)
-        
-        # Aba 3: Dicas
-        tips_frame = tk.Frame(guide_notebook, bg=self.secondary_color)
-        guide_notebook.add(tips_frame, text="Dicas")
-        
-        tips_text = tk.Text(tips_frame, bg=self.bg_color, fg=self.fg_color, 
-                           wrap=tk.WORD, bd=0, padx=10, pady=10)
-        tips_text.pack(fill=tk.BOTH, expand=True)
-        
-        tips_content = """
-Dicas de Formatação
-
-Aqui estão algumas dicas para formatar seu roteiro de forma profissional:
-
-Consistência:
-
-Mantenha a formatação consistente em todo o roteiro. Isso torna mais fácil para os leitores (diretores, produtores, atores) entenderem seu trabalho.
-
-Clareza:
-
-Seja claro e conciso em suas descrições. Evite jargões desnecessários e descreva apenas o que pode ser visto ou ouvido.
-
-Diálogos:
-
-Mantenha os diálogos naturais e realistas. Evite monólogos longos, a menos que sejam essenciais para a história.
-
-Personagens:
-
-Apresente seus personagens de forma clara. Na primeira aparição, inclua uma breve descrição entre parênteses.
-
-                                     JOÃO (30)
-               (vestido com roupas informais)
-               Um homem cansado, com olheiras profundas.
-
-Ações:
-
-Descreva as ações de forma visual. Em vez de "João está triste", escreva "João chora silenciosamente" ou "João se senta e esconde o rosto nas mãos".
-
-Cenas:
-
-Mantenha as cenas breves e dinâmicas. Cenas muito longas podem tornar o roteiro cansativo de ler.
-
-Transições:
-
-Use transições com moderação. Na maioria dos casos, "CORTE PARA:" é suficiente. Transições mais elaboradas como "DISSOLVÊNCIA PARA:" devem ser usadas apenas quando necessárias.
-
-Notas:
-
-Use notas com moderação. Elas são úteis para lembrar-se de algo, mas não devem fazer parte do roteiro final.
-
-Revisão:
-
-Revise seu roteiro várias vezes. Verifique a formatação, a gramática e a ortografia. Peça para outras pessoas lerem e darem opiniões.
-
-Software:
-
-Use um software de formatação de roteiros como o Roteirista Pro para garantir que seu roteiro siga o padrão da indústria.
-
-Lembre-se: um roteiro bem formatado é mais fácil de ler e profissional. Isso pode fazer a diferença entre seu roteiro ser lido ou ignorado.
-        """
-        
-        tips_text.insert(tk.END, tips_content)
-        tips_text.config(state=tk.DISABLED)
-        
-        # Botão Fechar
-        close_btn = tk.Button(main_frame, text="Fechar", command=guide_window.destroy,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        close_btn.pack(pady=10)
-    
-    def show_about(self):
-        # Criar janela Sobre
-        about_window = tk.Toplevel(self.root)
-        about_window.title("Sobre")
-        about_window.geometry("400x300")
-        about_window.configure(bg=self.secondary_color)
-        about_window.transient(self.root)
-        
-        # Frame principal
-        main_frame = tk.Frame(about_window, bg=self.secondary_color)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Título
-        tk.Label(main_frame, text="Roteirista Pro v2.0", bg=self.secondary_color, fg=self.fg_color, 
-                font=self.title_font).pack(anchor=tk.W, pady=10)
-        
-        # Conteúdo
-        about_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, 
-                            wrap=tk.WORD, bd=0, padx=10, pady=10, height=10)
-        about_text.pack(fill=tk.BOTH, expand=True)
-        
-        about_content = """
-Roteirista Pro é um aplicativo para escrita de roteiros de filmes, séries e vídeos.
-
-Desenvolvido com Python e Tkinter, este aplicativo oferece uma interface intuitiva e recursos poderosos para roteiristas profissionais e amadores.
-
-Recursos principais:
-• Formatação profissional de roteiros
-• Gerenciamento de personagens e cenas
-• Exportação para PDF, HTML e Fountain
-• Interface personalizável
-• Atalhos de teclado para aumentar a produtividade
-• Salvamento seguro com senha
-• Análise de roteiros com sugestões de melhoria
-
-© 2025 - Todos os direitos reservados.
-        """
-        
-        about_text.insert(tk.END, about_content)
-        about_text.config(state=tk.DISABLED)
-        
-        # Botão Fechar
-        close_btn = tk.Button(main_frame, text="Fechar", command=about_window.destroy,
-                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
-        close_btn.pack(pady=10)
-    
-    def exit_app(self):
-        if self.text_editor.edit_modified():
-            response = messagebox.askyesnocancel("Salvar alterações", 
-                                                 "Deseja salvar as alterações antes de sair?")
-            if response is True:
-                self.save_file()
-            elif response is None:
-                return
-        
-        self.save_settings()
-        self.root.destroy()
-    
-    def auto_save(self):
-        if self.settings['auto_save'] and self.current_file and self.text_editor.edit_modified():
-            self.save_file()
-        
-        # Agendar próximo auto-salvamento
-        self.root.after(self.settings['auto_save_interval'] * 60000, self.auto_save)
-    
-    def load_settings(self):
-        settings_path = os.path.join(os.path.expanduser('~'), '.roteirista_pro_settings.json')
-        if os.path.exists(settings_path):
-            try:
-                with open(settings_path, 'r') as f:
-                    self.settings.update(json.load(f))
-            except:
-                pass
-    
-    def save_settings(self):
-        settings_path = os.path.join(os.path.expanduser('~'), '.roteirista_pro_settings.json')
-        try:
-            with open(settings_path, 'w') as f:
-                json.dump(self.settings, f)
-        except:
-            pass
-    
-    def save_metadata(self):
-        if not self.current_file:
-            return
-            
-        # Salvar metadados (personagens, cenas e notas) em um arquivo separado
-        metadata_path = os.path.splitext(self.current_file)[0] + '.meta'
-        
-        metadata = {
-            'characters': self.characters,
-            'scenes': self.scenes,
-            'notes': self.notes_editor.get(1.0, tk.END).strip()
-        }
-        
-        try:
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f)
-        except:
-            pass
-    
-    def load_metadata(self):
-        if not self.current_file:
-            return
-            
-        # Carregar metadados (personagens, cenas e notas) de um arquivo separado
-        metadata_path = os.path.splitext(self.current_file)[0] + '.meta'
-        
-        if not os.path.exists(metadata_path):
-            return
-            
-        try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-                
-            # Carregar personagens
-            self.characters = metadata.get('characters', [])
-            self.characters_listbox.delete(0, tk.END)
-            for char in self.characters:
-                self.characters_listbox.insert(tk.END, char['name'])
-                
-            # Carregar cenas
-            self.scenes = metadata.get('scenes', [])
-            self.scenes_listbox.delete(0, tk.END)
-            for scene in self.scenes:
-                self.scenes_listbox.insert(tk.END, scene['title'])
-                
-            # Carregar notas
-            notes = metadata.get('notes', '')
-            self.notes_editor.delete(1.0, tk.END)
-            self.notes_editor.insert(1.0, notes)
-        except:
-            pass
-    
-    def import_fdx(self, file_path):
-        # Importar do formato Final Draft (FDX)
-        # Esta é uma implementação simplificada
-        try:
-            import xml.etree.ElementTree as ET
-            
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # Limpar o editor
-            self.text_editor.delete(1.0, tk.END)
-            
-            # Extrair conteúdo
-            for paragraph in root.findall('.//Paragraph'):
-                element_type = paragraph.get('Type')
-                text = paragraph.text or ''
-                
-                if element_type == 'Scene Heading':
-                    self.text_editor.insert(tk.END, f"\n\n{text}\n")
-                    self.text_editor.tag_add("scene", "insert-2l linestart", "insert-2l lineend")
-                elif element_type == 'Character':
-                    self.text_editor.insert(tk.END, f"\n\n{text}\n")
-                    self.text_editor.tag_add("character", "insert-2l linestart", "insert-2l lineend")
-                elif element_type == 'Dialogue':
-                    self.text_editor.insert(tk.END, f"{text}\n")
-                elif element_type == 'Action':
-                    self.text_editor.insert(tk.END, f"\n\n{text}\n")
-                elif element_type == 'Transition':
-                    self.text_editor.insert(tk.END, f"\n\n{text}\n")
-                    self.text_editor.tag_add("transition", "insert-2l linestart", "insert-2l lineend")
-                else:
-                    self.text_editor.insert(tk.END, f"{text}\n")
-            
-            self.update_status(f"Arquivo FDX importado: {os.path.basename(file_path)}")
-        except Exception as e:
-            messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo FDX: {str(e)}")
-    
-    def import_pdf(self, file_path):
-        # Importar do formato PDF
-        # Esta é uma implementação simplificada que requer a biblioteca PyPDF2
-        try:
-            import PyPDF2
-            
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                
-                for page in reader.pages:
-                    text += page.extract_text() + "\n\n"
-                
-                # Limpar o editor
-                self.text_editor.delete(1.0, tk.END)
-                self.text_editor.insert(1.0, text)
-                
-                self.update_status(f"Arquivo PDF importado: {os.path.basename(file_path)}")
-        except ImportError:
-            messagebox.showerror("Erro ao importar", "Para importar arquivos PDF, é necessário instalar a biblioteca PyPDF2.")
-        except Exception as e:
-            messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo PDF: {str(e)}")
-    
-    def import_docx(self, file_path):
-        # Importar do formato DOCX (Word)
-        # Esta é uma implementação simplificada que requer a biblioteca python-docx
-        try:
-            from docx import Document
-            
-            doc = Document(file_path)
-            text = ""
-            
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n\n"
-            
-            # Limpar o editor
-            self.text_editor.delete(1.0, tk.END)
-            self.text_editor.insert(1.0, text)
-            
-            self.update_status(f"Arquivo DOCX importado: {os.path.basename(file_path)}")
-        except ImportError:
-            messagebox.showerror("Erro ao importar", "Para importar arquivos DOCX, é necessário instalar a biblioteca python-docx.")
-        except Exception as e:
-            messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo DOCX: {str(e)}")
-
-def create_desktop_shortcut():
-    """Cria um atalho na área de trabalho para o aplicativo"""
-    try:
-        import win32com.client
-        
-        desktop = os.path.join(os.path.join(os.environ['USERPROFILE']), 'Desktop')
-        path = os.path.join(desktop, "Roteirista Pro.lnk")
-        
-        shell = win32com.client.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortCut(path)
-        shortcut.Targetpath = sys.executable
-        shortcut.Arguments = os.path.abspath(__file__)
-        shortcut.IconLocation = sys.executable + ",0"
-        shortcut.save()
-        
-        messagebox.showinfo("Atalho Criado", "Um atalho foi criado na área de trabalho!")
-    except:
-        messagebox.showwarning("Atalho Não Criado", 
-                             "Não foi possível criar o atalho automaticamente. "
-                             "Você pode criar um manualmente.")
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = ScriptWriterApp(root)
-    
-    # Verificar se foi passado o argumento para criar atalho
-    if len(sys.argv) > 1 and sys.argv[1] == "--create-shortcut":
-        create_desktop_shortcut()
-    
+import tkinter as tk
+from tkinter import filedialog, messagebox, font, ttk, colorchooser, simpledialog
+import os
+import sys
+import json
+from datetime import datetime
+import re
+from PIL import Image, ImageTk
+import tempfile
+import subprocess
+import hashlib
+from cryptography.fernet import Fernet
+import base64
+import time
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
+import functools
+import bisect
+from itertools import accumulate, islice, chain
+from array import array
+from collections import namedtuple, OrderedDict
+import io
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.colors import black, blue
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+
+# Tipos de elemento de roteiro e seus nomes na interface
+ELEMENT_LABELS = {
+    'scene': "Cena",
+    'character': "Personagem",
+    'dialogue': "Diálogo",
+    'action': "Ação",
+    'transition': "Transição",
+    'note': "Nota",
+}
+
+# Documentos grandes: carregados e formatados em fatias pelo agendador
+LOAD_CHUNK_LINES = 2000
+FORMAT_CHUNK_LINES = 1000
+FORMAT_SLICE_MS = 8  # tempo máximo de cada fatia de formatação fora da área visível
+
+# Linhas por bloco das versões imutáveis do texto (TextSnapshot)
+SNAPSHOT_CHUNK_LINES = 512
+
+# Tempo máximo de cada fatia da busca incremental
+SEARCH_SLICE_MS = 8
+
+# Busca por expressão regular (num processo separado): intervalo entre os lotes de ocorrências enviados
+# e tolerância extra para iniciar o processo
+REGEX_FLUSH_MS = 50
+REGEX_STARTUP_MS = 5000
+LARGE_DOCUMENT_LATENCY_MS = 1000
+
+def classify_line(stripped, character_width):
+    """Classifica uma linha (já sem espaços nas pontas) apenas pelo seu conteúdo"""
+    if not stripped:
+        return 'blank'
+    if stripped.startswith("CENA:"):
+        return 'scene'
+    if stripped.startswith("TRANSIÇÃO:"):
+        return 'transition'
+    if stripped.startswith("NOTA:"):
+        return 'note'
+    if stripped.isupper() and len(stripped) < character_width:
+        return 'character'
+    # Ação ou diálogo, dependendo das linhas anteriores
+    return 'text'
+
+def resolve_element(base, state):
+    """Aplica o contexto à classificação básica; devolve (tipo, estado para a próxima linha)"""
+    # Estados: None (fora de fala), 'cue' (após personagem) e 'dialogue' (dentro da fala)
+    if base == 'text':
+        if state is not None:
+            return 'dialogue', 'dialogue'
+        return 'action', None
+    if base == 'blank':
+        # Linhas em branco entre o personagem e a fala são toleradas; depois da fala, encerram-na
+        return 'blank', 'cue' if state == 'cue' else None
+    if base == 'character':
+        return 'character', 'cue'
+    return base, None
+
+# Códigos compactos dos tipos de elemento e dos estados de contexto (colunas em array)
+ELEMENT_KINDS = ('blank', 'scene', 'character', 'dialogue', 'action', 'transition', 'note')
+KIND_CODES = {kind: code for code, kind in enumerate(ELEMENT_KINDS)}
+CONTEXT_STATES = (None, 'cue', 'dialogue')
+STATE_CODES = {state: code for code, state in enumerate(CONTEXT_STATES)}
+UNCLASSIFIED = -1
+
+# Tipos em que linhas consecutivas formam um único elemento
+GROUPED_CODES = frozenset(KIND_CODES[kind] for kind in ('blank', 'action', 'dialogue'))
+
+# Tipos que recebem uma tag de formatação no editor
+TAGGED_CODES = frozenset(KIND_CODES[kind] for kind in ('scene', 'character', 'transition', 'note'))
+
+# Extensões de deixa que não mudam o personagem: (V.O.), (O.S.), (CONT'D)...
+CUE_EXTENSION = re.compile(r"\s*\([^()]*\)")
+
+def character_key(cue):
+    """Nome do personagem de uma deixa, sem extensões como (V.O.), (O.S.) e (CONT'D)"""
+    cue = cue.strip()
+    return sys.intern(CUE_EXTENSION.sub("", cue).strip() or cue)
+
+# Elemento do roteiro: tipo, intervalo de linhas [start, end) e o texto de cada linha (sem espaços nas pontas)
+ScriptElement = namedtuple('ScriptElement', ['kind', 'start', 'end', 'lines'])
+
+class ElementTable:
+    """Elementos do roteiro em colunas compactas; o texto fica nas linhas, referenciado por índice"""
+    
+    __slots__ = ('lines', 'kinds', 'starts', 'speakers', 'names')
+    
+    def __init__(self, lines, codes):
+        # lines: tupla de linhas (compartilhada, sem cópia do texto); codes: tipo de cada linha
+        self.lines = lines
+        self.kinds = array('b')
+        self.starts = array('i')
+        self.speakers = array('i')  # id do personagem em falas e cabeçalhos de personagem, -1 nos demais
+        self.names = []  # id -> nome do personagem (internado)
+        
+        name_ids = {}
+        speaker = -1
+        previous = UNCLASSIFIED
+        for i, code in enumerate(codes):
+            if code == previous and code in GROUPED_CODES:
+                continue
+            previous = code
+            if code == KIND_CODES['character']:
+                name = character_key(lines[i])
+                speaker = name_ids.get(name)
+                if speaker is None:
+                    speaker = name_ids[name] = len(self.names)
+                    self.names.append(name)
+            self.kinds.append(code)
+            self.starts.append(i)
+            self.speakers.append(speaker if code in (KIND_CODES['character'], KIND_CODES['dialogue']) else -1)
+    
+    def __len__(self):
+        return len(self.kinds)
+    
+    def __eq__(self, other):
+        if not isinstance(other, ElementTable):
+            return NotImplemented
+        return (self.kinds == other.kinds and self.starts == other.starts and self.speakers == other.speakers
+                and self.names == other.names and self.lines == other.lines)
+    
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield self.element(index)
+    
+    def end(self, index):
+        return self.starts[index + 1] if index + 1 < len(self.starts) else len(self.lines)
+    
+    def kind(self, index):
+        return ELEMENT_KINDS[self.kinds[index]]
+    
+    def speaker(self, index):
+        speaker = self.speakers[index]
+        return self.names[speaker] if speaker >= 0 else None
+    
+    def element(self, index):
+        # Visão de um elemento com o texto de suas linhas (criada sob demanda)
+        start, end = self.starts[index], self.end(index)
+        return ScriptElement(self.kind(index), start, end, tuple(line.strip() for line in self.lines[start:end]))
+
+@functools.lru_cache(maxsize=1)
+def parse_screenplay(text, character_width):
+    """Divide o roteiro em elementos tipados numa única passada (o último resultado fica em cache)"""
+    lines = tuple(text.split('\n'))
+    codes = array('b')
+    state = None
+    for line in lines:
+        element, state = resolve_element(classify_line(line.strip(), character_width), state)
+        codes.append(KIND_CODES[element])
+    return ElementTable(lines, codes)
+
+def iter_element_lines(elements):
+    """Percorre os elementos linha a linha, devolvendo (tipo, texto da linha, índice da linha)"""
+    lines = elements.lines
+    for index in range(len(elements)):
+        kind = elements.kind(index)
+        for line in range(elements.starts[index], elements.end(index)):
+            yield kind, lines[line].strip(), line
+
+class ElementCache:
+    """Tipo de elemento de cada linha, reclassificado apenas a partir das linhas editadas"""
+    
+    def __init__(self, character_width):
+        self.character_width = character_width
+        self.base_cache = {}  # conteúdo da linha -> classificação básica
+        self.reset()
+    
+    def reset(self, lines=None):
+        self.lines = list(lines) if lines is not None else ['']
+        self.types = array('b', [UNCLASSIFIED]) * len(self.lines)  # código do tipo de cada linha
+        self.states = array('b', [UNCLASSIFIED]) * len(self.lines)  # código do estado após cada linha
+        self.reclassify(0, len(self.lines))
+    
+    def set_character_width(self, character_width):
+        # A largura muda a regra de personagem: descartar o cache e reclassificar tudo
+        self.character_width = character_width
+        self.base_cache.clear()
+        self.reset(self.lines)
+    
+    def base_type(self, line):
+        base = self.base_cache.get(line)
+        if base is None:
+            if len(self.base_cache) > 20000:
+                self.base_cache.clear()
+            base = self.base_cache[line] = classify_line(line.strip(), self.character_width)
+        return base
+    
+    def replace_lines(self, first, removed, new_lines):
+        # Substituir as linhas [first, first + removed) e reclassificar a partir delas
+        self.lines[first:first + removed] = new_lines
+        self.types[first:first + removed] = array('b', [UNCLASSIFIED]) * len(new_lines)
+        self.states[first:first + removed] = array('b', [UNCLASSIFIED]) * len(new_lines)
+        return self.reclassify(first, first + len(new_lines))
+    
+    def reclassify(self, start, changed_end):
+        # Seguir adiante até o estado voltar a coincidir com o que já estava calculado;
+        # devolve o fim (exclusivo) do trecho reclassificado
+        state = CONTEXT_STATES[self.states[start - 1]] if start > 0 else None
+        for i in range(start, len(self.lines)):
+            element, state = resolve_element(self.base_type(self.lines[i]), state)
+            code = KIND_CODES[element]
+            state_code = STATE_CODES[state]
+            if i >= changed_end and code == self.types[i] and state_code == self.states[i]:
+                return i
+            self.types[i] = code
+            self.states[i] = state_code
+        return len(self.lines)
+    
+    def label(self, line):
+        # Nome do elemento da linha (índice a partir de 0) para a barra de status
+        element = ELEMENT_KINDS[self.types[line]]
+        if element == 'blank':
+            # Linha vazia: o que for digitado nela terá o tipo indicado pelo contexto
+            state = CONTEXT_STATES[self.states[line - 1]] if line > 0 else None
+            element = 'dialogue' if state is not None else 'action'
+        return ELEMENT_LABELS[element]
+
+class LineWordIndex:
+    """Contagem de palavras e caracteres por linha, atualizada apenas nas linhas editadas"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self, lines=None):
+        lines = lines if lines is not None else ['']
+        self.line_words = array('i', [len(line.split()) for line in lines])
+        self.line_chars = array('i', [len(line) for line in lines])
+        self.words = sum(self.line_words)
+        self.chars = sum(self.line_chars)
+    
+    def replace_lines(self, first, removed, new_lines):
+        # Substituir as linhas [first, first + removed) pelas novas linhas (índices a partir de 0)
+        new_words = array('i', [len(line.split()) for line in new_lines])
+        new_chars = array('i', [len(line) for line in new_lines])
+        
+        self.words += sum(new_words) - sum(self.line_words[first:first + removed])
+        self.chars += sum(new_chars) - sum(self.line_chars[first:first + removed])
+        
+        self.line_words[first:first + removed] = new_words
+        self.line_chars[first:first + removed] = new_chars
+    
+    @property
+    def line_count(self):
+        return len(self.line_words)
+    
+    @property
+    def char_count(self):
+        # Inclui a quebra de linha de cada linha, como em text_editor.get(1.0, tk.END)
+        return self.chars + len(self.line_chars)
+
+class SceneIndex:
+    """Linhas de início das cenas (ordenadas), atualizadas a partir das linhas editadas"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self, lines=None):
+        self.starts = array('i')  # índice (a partir de 0) da linha de cada cabeçalho CENA:
+        self.titles = []
+        self.version = 0  # incrementada quando cenas entram, saem ou mudam de título
+        self.replace_lines(0, 0, lines or [])
+    
+    @staticmethod
+    def scene_title(line):
+        stripped = line.strip()
+        # Um cabeçalho de cena não depende do contexto (ver classify_line)
+        return stripped[5:].strip() if stripped.startswith("CENA:") else None
+    
+    def replace_lines(self, first, removed, new_lines):
+        lo = bisect.bisect_left(self.starts, first)
+        hi = bisect.bisect_left(self.starts, first + removed)
+        
+        # Cenas das linhas novas
+        new_starts = array('i')
+        new_titles = []
+        for offset, line in enumerate(new_lines):
+            title = self.scene_title(line)
+            if title is not None:
+                new_starts.append(first + offset)
+                new_titles.append(title)
+        
+        # Deslocar as cenas seguintes
+        delta = len(new_lines) - removed
+        if delta:
+            for i in range(hi, len(self.starts)):
+                self.starts[i] += delta
+        
+        if new_titles != self.titles[lo:hi]:
+            self.version += 1
+        self.starts[lo:hi] = new_starts
+        self.titles[lo:hi] = new_titles
+    
+    def scene_at(self, line):
+        # Índice da cena que contém a linha (índice a partir de 0), ou -1 antes da primeira cena
+        return bisect.bisect_right(self.starts, line) - 1
+    
+    def __len__(self):
+        return len(self.starts)
+
+class CharacterIndex:
+    """Deixas de cada personagem e os blocos de diálogo que as seguem, atualizados a partir das linhas editadas"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self, lines=(), types=(), line_words=()):
+        self.names = []  # id -> nome do personagem
+        self.name_ids = {}
+        self.cue_lines = array('i')  # linha (a partir de 0) de cada deixa, em ordem
+        self.cue_ids = array('i')  # personagem de cada deixa
+        self.block_lines = array('i')  # linhas de diálogo do bloco de cada deixa
+        self.block_words = array('i')  # palavras do bloco de cada deixa
+        self.totals = {}  # id -> [deixas, linhas de diálogo, palavras]
+        self.version = getattr(self, 'version', -1) + 1  # nunca volta atrás: as listas comparam com a última vista
+        self.replace_lines(0, 0, lines, types, line_words)
+    
+    def name_id(self, name):
+        name_id = self.name_ids.get(name)
+        if name_id is None:
+            name_id = self.name_ids[name] = len(self.names)
+            self.names.append(name)
+            self.totals[name_id] = [0, 0, 0]
+        return name_id
+    
+    def measure_block(self, cue_line, types, line_words):
+        # A fala vai da deixa até a primeira linha que não seja diálogo nem linha em branco
+        dialogue = KIND_CODES['dialogue']
+        blank = KIND_CODES['blank']
+        lines = words = 0
+        for line in range(cue_line + 1, len(types)):
+            code = types[line]
+            if code == dialogue:
+                lines += 1
+                words += line_words[line]
+            elif code != blank:
+                break
+        return lines, words
+    
+    def account(self, index, sign):
+        totals = self.totals[self.cue_ids[index]]
+        totals[0] += sign
+        totals[1] += sign * self.block_lines[index]
+        totals[2] += sign * self.block_words[index]
+    
+    def replace_lines(self, first, removed, new_lines, types, line_words):
+        # types e line_words já refletem a edição; só o bloco anterior e as deixas editadas mudam
+        lo = bisect.bisect_left(self.cue_lines, first)
+        hi = bisect.bisect_left(self.cue_lines, first + removed)
+        start = max(lo - 1, 0)
+        old_cues = self.cue_lines[lo:hi]
+        old_ids = self.cue_ids[lo:hi]
+        old_totals = {name_id: tuple(self.totals[name_id]) for name_id in self.cue_ids[start:hi]}
+        for index in range(start, hi):
+            self.account(index, -1)
+        
+        delta = len(new_lines) - removed
+        shifted = bool(delta) and hi < len(self.cue_lines)
+        if delta:
+            for index in range(hi, len(self.cue_lines)):
+                self.cue_lines[index] += delta
+        
+        character = KIND_CODES['character']
+        new_cues = array('i')
+        new_ids = array('i')
+        for offset, line in enumerate(new_lines):
+            if types[first + offset] == character:
+                new_cues.append(first + offset)
+                new_ids.append(self.name_id(character_key(line)))
+        
+        zeros = array('i', [0]) * len(new_cues)
+        self.cue_lines[lo:hi] = new_cues
+        self.cue_ids[lo:hi] = new_ids
+        self.block_lines[lo:hi] = zeros
+        self.block_words[lo:hi] = zeros
+        
+        for index in range(start, lo + len(new_cues)):
+            self.block_lines[index], self.block_words[index] = self.measure_block(
+                self.cue_lines[index], types, line_words)
+            self.account(index, 1)
+        
+        # Versão nova só se deixas ou totais mudaram (digitar numa ação não refaz as listas)
+        for name_id in new_ids:
+            old_totals.setdefault(name_id, None)
+        if shifted or new_cues != old_cues or new_ids != old_ids or \
+                any(tuple(self.totals[name_id]) != totals for name_id, totals in old_totals.items()):
+            self.version += 1
+    
+    def first_appearance(self, name):
+        # Linha da primeira deixa do personagem (busca em C no array de ids)
+        name_id = self.name_ids.get(name)
+        if name_id is None or not self.totals[name_id][0]:
+            return None
+        return self.cue_lines[self.cue_ids.index(name_id)]
+    
+    def next_cue(self, name, after_line):
+        # Próxima deixa do personagem depois da linha (volta ao início no fim do roteiro)
+        name_id = self.name_ids.get(name)
+        if name_id is None or not self.totals[name_id][0]:
+            return None
+        position = bisect.bisect_right(self.cue_lines, after_line)
+        try:
+            index = self.cue_ids.index(name_id, position)
+        except ValueError:
+            index = self.cue_ids.index(name_id, 0, position)
+        return self.cue_lines[index]
+    
+    def speaker_lines(self, name, types):
+        # Deixas do personagem e as linhas de diálogo de cada fala, em ordem (sem varrer o texto)
+        name_id = self.name_ids.get(name)
+        lines = []
+        if name_id is None or not self.totals[name_id][0]:
+            return lines
+        dialogue = KIND_CODES['dialogue']
+        blank = KIND_CODES['blank']
+        index = -1
+        while True:
+            try:
+                index = self.cue_ids.index(name_id, index + 1)
+            except ValueError:
+                return lines
+            cue = self.cue_lines[index]
+            lines.append(cue)
+            for line in range(cue + 1, len(types)):
+                code = types[line]
+                if code == dialogue:
+                    lines.append(line)
+                elif code != blank:
+                    break
+    
+    def summary_entry(self, name):
+        name_id = self.name_ids.get(name)
+        if name_id is None or not self.totals[name_id][0]:
+            return None
+        cues, lines, words = self.totals[name_id]
+        return cues, lines, words, self.cue_lines[self.cue_ids.index(name_id)]
+    
+    def summary(self):
+        # nome -> (deixas, linhas de diálogo, palavras, primeira linha) dos personagens presentes no texto
+        return {self.names[name_id]: (cues, lines, words, self.cue_lines[self.cue_ids.index(name_id)])
+                for name_id, (cues, lines, words) in self.totals.items() if cues}
+
+class LineOffsets:
+    """Deslocamento (em caracteres) do início de cada linha, recalculado sob demanda a partir da primeira linha editada"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.starts = array('i', [0])
+        self.valid = 0  # entradas [0, valid) estão corretas
+    
+    def replace_lines(self, first, removed, added):
+        # As linhas novas e todas as seguintes ficam por recalcular
+        self.starts[first:first + removed] = array('i', bytes(4 * added))
+        self.valid = min(self.valid, first)
+    
+    def update(self, lines):
+        # Recalcular só a partir da primeira entrada inválida
+        valid = self.valid
+        if valid >= len(lines):
+            return
+        offset = self.starts[valid - 1] + len(lines[valid - 1]) + 1 if valid else 0
+        lengths = (len(line) + 1 for line in islice(lines, valid, len(lines) - 1))
+        self.starts[valid:] = array('i', accumulate(lengths, initial=offset))
+        self.valid = len(lines)
+    
+    def index(self, lines, offset):
+        # Deslocamento no texto -> índice "linha.coluna" do Tk, por bisseção
+        self.update(lines)
+        line = bisect.bisect_right(self.starts, offset) - 1
+        return f"{line + 1}.{offset - self.starts[line]}"
+    
+    def offset(self, lines, line, column):
+        # Índice do Tk (linha a partir de 1) -> deslocamento no texto
+        self.update(lines)
+        return self.starts[line - 1] + column
+
+class TextSnapshot:
+    """Texto imutável de uma versão do documento, em blocos de linhas compartilhados com as versões vizinhas"""
+    
+    __slots__ = ('version', 'chunks', 'line_count', 'cached_text')
+    
+    def __init__(self, version, chunks):
+        self.version = version
+        self.chunks = chunks  # tupla de tuplas de linhas
+        self.line_count = sum(map(len, chunks))
+        self.cached_text = None
+    
+    def __len__(self):
+        return self.line_count
+    
+    def __iter__(self):
+        return chain.from_iterable(self.chunks)
+    
+    def text(self):
+        # Texto completo (como text_editor.get(1.0, tk.END)), montado uma única vez e só quando pedido
+        if self.cached_text is None:
+            self.cached_text = '\n'.join(self) + '\n'
+        return self.cached_text
+    
+    def write_to(self, file):
+        # Gravar bloco a bloco, sem montar o texto inteiro
+        for chunk in self.chunks:
+            file.write('\n'.join(chunk) + '\n')
+
+class LineChunks:
+    """Linhas do documento em blocos imutáveis (tuplas); uma edição troca apenas os blocos que toca"""
+    
+    def __init__(self):
+        self.reset([''])
+    
+    def reset(self, lines):
+        size = SNAPSHOT_CHUNK_LINES
+        self.chunks = [tuple(lines[i:i + size]) for i in range(0, len(lines), size)] or [('',)]
+        self.starts = array('i', accumulate((len(chunk) for chunk in self.chunks[:-1]), initial=0))
+    
+    def replace_lines(self, first, removed, new_lines):
+        # Blocos que contêm as linhas [first, first + removed)
+        end = first + removed
+        i = bisect.bisect_right(self.starts, first) - 1
+        j = bisect.bisect_right(self.starts, max(first, end - 1)) - 1
+        merged = self.chunks[i][:first - self.starts[i]] + tuple(new_lines) + self.chunks[j][end - self.starts[j]:]
+        
+        # Um bloco que encolheu demais é unido ao seguinte, para não fragmentar a lista
+        size = SNAPSHOT_CHUNK_LINES
+        if len(merged) < size // 2 and j + 1 < len(self.chunks):
+            j += 1
+            merged += self.chunks[j]
+        
+        self.chunks[i:j + 1] = [merged[k:k + size] for k in range(0, len(merged), size)]
+        self.starts[i:] = array('i', accumulate((len(chunk) for chunk in self.chunks[i:-1]), initial=self.starts[i]))
+
+WORD_PATTERN = re.compile(r'\w+')
+
+class SearchIndex:
+    """Índice invertido da busca: palavra -> ids estáveis das linhas, trigrama -> palavras do vocabulário"""
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        self.built = False  # construído só na primeira busca (ou lido do disco)
+        self.line_ids = array('i')  # posição da linha -> id estável
+        self.next_id = 0
+        self.postings = {}  # palavra em minúsculas -> set de ids de linha
+        self.trigrams = {}  # trigrama -> set de palavras do vocabulário
+        self.cached_positions = None  # id -> posição, até a próxima edição
+    
+    def build(self, lines):
+        self.clear()
+        self.line_ids = array('i', range(len(lines)))
+        self.next_id = len(lines)
+        for line_id, line in enumerate(lines):
+            self.add_line(line_id, line)
+        self.built = True
+    
+    def add_line(self, line_id, line):
+        for word in set(WORD_PATTERN.findall(line.lower())):
+            ids = self.postings.get(word)
+            if ids is None:
+                ids = self.postings[word] = set()
+                for i in range(len(word) - 2):
+                    self.trigrams.setdefault(word[i:i + 3], set()).add(word)
+            ids.add(line_id)
+    
+    def remove_line(self, line_id, line):
+        for word in set(WORD_PATTERN.findall(line.lower())):
+            ids = self.postings.get(word)
+            if ids is None:
+                continue
+            ids.discard(line_id)
+            if not ids:
+                # Palavra saiu do vocabulário
+                del self.postings[word]
+                for i in range(len(word) - 2):
+                    words = self.trigrams.get(word[i:i + 3])
+                    if words is not None:
+                        words.discard(word)
+                        if not words:
+                            del self.trigrams[word[i:i + 3]]
+    
+    def replace_lines(self, first, removed, old_lines, new_lines):
+        # As linhas editadas mantêm seus ids; só linhas inseridas ganham ids novos
+        kept = min(removed, len(new_lines))
+        for line_id, line in zip(self.line_ids[first:first + removed], old_lines):
+            self.remove_line(line_id, line)
+        new_ids = self.line_ids[first:first + kept]
+        new_ids.extend(range(self.next_id, self.next_id + len(new_lines) - kept))
+        self.next_id += len(new_lines) - kept
+        self.line_ids[first:first + removed] = new_ids
+        for line_id, line in zip(new_ids, new_lines):
+            self.add_line(line_id, line)
+        self.cached_positions = None
+    
+    def matching_words(self, token, starts, ends):
+        # Palavras do vocabulário que podem conter o pedaço do termo (inteiras, prefixo, sufixo ou trecho)
+        if starts and ends:
+            return [token] if token in self.postings else []
+        if len(token) >= 3:
+            groups = sorted((self.trigrams.get(token[i:i + 3], ()) for i in range(len(token) - 2)), key=len)
+            words = set(groups[0]).intersection(*groups[1:])
+        else:
+            words = self.postings.keys()
+        if starts:
+            return [word for word in words if word.startswith(token)]
+        if ends:
+            return [word for word in words if word.endswith(token)]
+        return [word for word in words if token in word]
+    
+    def candidate_lines(self, term, whole_word=False):
+        # Posições (em ordem) das linhas que podem conter o termo, ou None quando o índice não restringe a busca
+        term = term.lower()
+        candidates = None
+        for match in WORD_PATTERN.finditer(term):
+            # Um pedaço delimitado dentro do termo tem de coincidir com o início/fim de uma palavra da linha
+            starts = whole_word or match.start() > 0
+            ends = whole_word or match.end() < len(term)
+            ids = set()
+            for word in self.matching_words(match.group(), starts, ends):
+                ids |= self.postings[word]
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        if candidates is None or len(candidates) > len(self.line_ids) // 2:
+            # Termo sem letras/dígitos ou comum demais: varrer sai mais barato
+            return None
+        
+        positions = self.positions()
+        return sorted(positions[line_id] for line_id in candidates)
+    
+    def positions(self):
+        # id estável -> posição atual da linha
+        if self.cached_positions is None:
+            self.cached_positions = dict(zip(self.line_ids, range(len(self.line_ids))))
+        return self.cached_positions
+    
+    def save(self, path, content_hash):
+        # Gravar com os ids renumerados pela posição (o arquivo vale só para o texto com esse hash)
+        positions = self.positions()
+        words = {word: base64.b64encode(array('i', sorted(positions[i] for i in ids)).tobytes()).decode('ascii')
+                 for word, ids in self.postings.items()}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'hash': content_hash, 'lines': len(self.line_ids), 'words': words}, f)
+    
+    def load(self, path, content_hash):
+        # Adotar o índice gravado se ele corresponder ao texto atual
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('hash') != content_hash:
+            return False
+        
+        self.clear()
+        self.line_ids = array('i', range(data['lines']))
+        self.next_id = data['lines']
+        for word, encoded in data['words'].items():
+            ids = array('i')
+            ids.frombytes(base64.b64decode(encoded))
+            self.postings[word] = set(ids)
+            for i in range(len(word) - 2):
+                self.trigrams.setdefault(word[i:i + 3], set()).add(word)
+        self.built = True
+        return True
+
+def load_search_index(snapshot, path, content_hash, task):
+    """Índice de busca do snapshot (roda numa thread de trabalho): lido do .idx se corresponder ao texto, senão construído"""
+    index = SearchIndex()
+    if path and os.path.exists(path):
+        try:
+            if index.load(path, content_hash):
+                return index, True
+        except (OSError, ValueError, KeyError):
+            pass
+    task.check_cancelled()
+    index.build(list(snapshot))
+    return index, False
+
+def iter_line_matches(pattern, lines, candidates, starts):
+    """Como iter_search_chunks, mas verificando só as linhas candidatas do índice (starts: início de cada linha)"""
+    for i in range(0, len(candidates), SNAPSHOT_CHUNK_LINES):
+        found = []
+        for line in candidates[i:i + SNAPSHOT_CHUNK_LINES]:
+            for match in pattern.finditer(lines[line]):
+                found.append((line, match.start(), match.end(), starts[line]))
+        yield found
+
+# Local do cabeçalho de cena: INT., EXT. ou os dois (INT./EXT., I/E)
+SCENE_LOCATION = re.compile(r'(INT\.?\s*/\s*EXT|EXT\.?\s*/\s*INT|I/E|INT|EXT)\b')
+
+# Linha inteira sem os espaços das bordas (ocorrência da busca estruturada sem termo)
+TRIMMED_LINE = re.compile(r'\S(?:.*\S)?')
+
+def scene_matches(title, text=None, location=None, period=None):
+    """Filtro de cabeçalho de cena: trecho do título, INT/EXT e período (DIA, NOITE...)"""
+    upper = title.upper()
+    if text and text.upper() not in upper:
+        return False
+    if location:
+        found = SCENE_LOCATION.match(upper)
+        if not found or (found.group(1) in ('INT', 'EXT') and found.group(1) != location):
+            return False
+    if period and period not in WORD_PATTERN.findall(upper):
+        return False
+    return True
+
+class ScriptDocument:
+    """Modelo vivo do roteiro, mantido em sincronia pelas edições do editor (linha a linha)"""
+    
+    def __init__(self, character_width):
+        self.word_index = LineWordIndex()
+        self.element_cache = ElementCache(character_width)
+        self.scene_index = SceneIndex()
+        self.character_index = CharacterIndex()
+        self.line_offsets = LineOffsets()
+        self.line_chunks = LineChunks()
+        self.search_index = SearchIndex()
+        self.index_edits = None  # edições feitas enquanto o índice de busca é construído fora da thread do Tk
+        self.index_source = None  # snapshot dessa construção
+        self.version = 0  # incrementada a cada edição
+        self.cached_elements = None  # (versão, elementos)
+        self.cached_hash = None  # (versão, hash do conteúdo)
+        self.cached_snapshot = None
+    
+    def reset(self, lines=None):
+        self.word_index.reset(lines)
+        self.element_cache.reset(lines)
+        self.scene_index.reset(lines)
+        self.character_index.reset(self.lines, self.types, self.word_index.line_words)
+        self.line_offsets.reset()
+        self.line_chunks.reset(self.lines)
+        self.drop_search_index()
+        self.version += 1
+    
+    def replace_lines(self, first, removed, new_lines):
+        # Substituir as linhas [first, first + removed); só o trecho afetado é reclassificado.
+        # Devolve o fim (exclusivo) das linhas cujo tipo pode ter mudado
+        if self.search_index.built:
+            self.search_index.replace_lines(first, removed, self.lines[first:first + removed], new_lines)
+        elif self.index_edits is not None:
+            self.index_edits.append((first, removed, self.lines[first:first + removed], tuple(new_lines)))
+        self.word_index.replace_lines(first, removed, new_lines)
+        changed_end = self.element_cache.replace_lines(first, removed, new_lines)
+        self.scene_index.replace_lines(first, removed, new_lines)
+        self.character_index.replace_lines(first, removed, new_lines, self.types, self.word_index.line_words)
+        self.line_offsets.replace_lines(first, removed, len(new_lines))
+        self.line_chunks.replace_lines(first, removed, new_lines)
+        self.version += 1
+        return changed_end
+    
+    def set_character_width(self, character_width):
+        self.element_cache.set_character_width(character_width)
+        self.character_index.reset(self.lines, self.types, self.word_index.line_words)
+        self.version += 1
+    
+    @property
+    def lines(self):
+        return self.element_cache.lines
+    
+    @property
+    def types(self):
+        return self.element_cache.types
+    
+    @property
+    def words(self):
+        return self.word_index.words
+    
+    @property
+    def char_count(self):
+        return self.word_index.char_count
+    
+    @property
+    def line_count(self):
+        return self.word_index.line_count
+    
+    def label(self, line):
+        return self.element_cache.label(line)
+    
+    def text(self):
+        # Mesmo conteúdo de text_editor.get(1.0, tk.END), sem consultar o Tk (montado uma vez por versão)
+        return self.snapshot().text()
+    
+    def snapshot(self):
+        # Versão imutável do texto atual; entregar a uma thread ou a um cache custa só a tupla de blocos
+        if self.cached_snapshot is None or self.cached_snapshot.version != self.version:
+            self.cached_snapshot = TextSnapshot(self.version, tuple(self.line_chunks.chunks))
+        return self.cached_snapshot
+    
+    def index(self, offset):
+        # Deslocamento em text() -> índice do Tk, sem "1.0 + N chars" (que o Tk resolve percorrendo o texto)
+        return self.line_offsets.index(self.lines, offset)
+    
+    def offset(self, index):
+        # Índice "linha.coluna" do Tk -> deslocamento em text()
+        line, column = index.split('.')
+        return self.line_offsets.offset(self.lines, int(line), int(column))
+    
+    def drop_search_index(self):
+        # Conteúdo substituído por inteiro: o índice (ou a construção em andamento) não vale mais e
+        # mantê-lo custaria remover e inserir cada linha; a próxima busca o lê do .idx ou reconstrói
+        self.search_index = SearchIndex()
+        self.index_edits = None
+        self.index_source = None
+    
+    def begin_index_build(self):
+        # O índice será construído a partir deste snapshot numa thread de trabalho; as edições
+        # seguintes ficam guardadas para reaplicar nele
+        self.index_edits = []
+        self.index_source = self.snapshot()
+        return self.index_source
+    
+    def adopt_search_index(self, index, snapshot):
+        # Adotar o índice construído (a partir de snapshot) fora da thread do Tk, com as edições feitas
+        # enquanto isso. False se o conteúdo foi substituído nesse meio-tempo
+        if self.index_edits is None or snapshot is not self.index_source:
+            return False
+        for first, removed, old_lines, new_lines in self.index_edits:
+            index.replace_lines(first, removed, old_lines, new_lines)
+        self.index_edits = None
+        self.index_source = None
+        self.search_index = index
+        return True
+    
+    def iter_matches(self, pattern, term, whole_word=False):
+        # Ocorrências bloco a bloco (como iter_search_chunks): pelo índice quando ele restringe
+        # as linhas candidatas, senão (ou enquanto ele não está pronto) varrendo o snapshot
+        if not self.search_index.built:
+            return iter_search_chunks(pattern, self.snapshot())
+        candidates = self.search_index.candidate_lines(term, whole_word)
+        if candidates is None:
+            return iter_search_chunks(pattern, self.snapshot())
+        self.line_offsets.update(self.lines)
+        return iter_line_matches(pattern, self.lines, candidates, self.line_offsets.starts)
+    
+    def structured_lines(self, kind=None, character=None, scene=None, location=None, period=None):
+        # Linhas (a partir de 0, em ordem) que atendem aos filtros, só pelos índices de cenas,
+        # personagens e tipos. Sem tipo nem personagem, valem as linhas não vazias das cenas
+        line_count = self.line_count
+        if scene or location or period:
+            starts = self.scene_index.starts
+            ranges = [(start, starts[i + 1] if i + 1 < len(starts) else line_count)
+                      for i, (start, title) in enumerate(zip(starts, self.scene_index.titles))
+                      if scene_matches(title, scene, location, period)]
+        else:
+            ranges = [(0, line_count)]
+        
+        types = self.types
+        if character:
+            lines = self.character_index.speaker_lines(character_key(character.strip().upper()), types)
+            if kind:
+                code = KIND_CODES[kind]
+                lines = [line for line in lines if types[line] == code]
+            if len(ranges) == 1 and ranges[0] == (0, line_count):
+                return lines
+            selected = []
+            for start, end in ranges:
+                selected.extend(lines[bisect.bisect_left(lines, start):bisect.bisect_left(lines, end)])
+            return selected
+        
+        # Tipos como bytes: cada linha do tipo pedido é achada por bytes.find, em C
+        data = types.tobytes()
+        lines = []
+        if kind:
+            marker = bytes([KIND_CODES[kind]])
+            for start, end in ranges:
+                line = data.find(marker, start, end)
+                while line >= 0:
+                    lines.append(line)
+                    line = data.find(marker, line + 1, end)
+        else:
+            blank = KIND_CODES['blank']
+            for start, end in ranges:
+                lines.extend(line for line in range(start, end) if data[line] != blank)
+        return lines
+    
+    def elements(self):
+        # Elementos no formato de parse_screenplay, agrupados a partir dos tipos já classificados
+        if self.cached_elements is not None and self.cached_elements[0] == self.version:
+            return self.cached_elements[1]
+        
+        elements = ElementTable(tuple(self.lines), self.types)
+        self.cached_elements = (self.version, elements)
+        return elements
+    
+    def content_hash(self):
+        # Hash do texto, calculado no máximo uma vez por versão; desfazer uma edição volta ao mesmo hash
+        if self.cached_hash is not None and self.cached_hash[0] == self.version:
+            return self.cached_hash[1]
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in self.snapshot().chunks:
+            digest.update(('\n'.join(chunk) + '\n').encode('utf-8'))
+        self.cached_hash = (self.version, digest.hexdigest())
+        return self.cached_hash[1]
+
+def estimate_size(value, depth=4):
+    """Estimativa aproximada (em bytes) da memória ocupada por um resultado em cache"""
+    size = sys.getsizeof(value)
+    if depth <= 0 or isinstance(value, (str, bytes, array)):
+        return size
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, depth - 1) + estimate_size(item, depth - 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, depth - 1)
+    return size
+
+class DerivedCache:
+    """Cache LRU de saídas derivadas do texto (HTML, Fountain, estatísticas, análise) com limite de memória"""
+    
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # chave -> (valor, tamanho estimado)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key, default=None):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    
+    def put(self, key, value):
+        size = estimate_size(value)
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+        if size > self.max_bytes:
+            # Resultado maior que o limite inteiro: não vale a pena guardar
+            return value
+        self.entries[key] = (value, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted
+        return value
+    
+    def get_or_compute(self, key, compute):
+        value = self.get(key, self)
+        if value is self:
+            value = self.put(key, compute())
+        return value
+    
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+class DirtyLines:
+    """Linhas com tags de elemento pendentes, marcadas num bytearray (1 = refazer as tags)"""
+    
+    def __init__(self):
+        self.flags = bytearray(1)
+    
+    def reset(self, line_count, dirty=True):
+        self.flags = bytearray([1 if dirty else 0]) * line_count
+    
+    def replace_lines(self, first, removed, added):
+        # Acompanhar a edição: as linhas novas entram pendentes, as seguintes só se deslocam
+        self.flags[first:first + removed] = b'\x01' * added
+    
+    def mark(self, start, end):
+        self.flags[start:end] = b'\x01' * max(0, end - start)
+    
+    def clear(self, start, end):
+        self.flags[start:end] = bytes(max(0, end - start))
+    
+    def next_run(self, start, stop=None):
+        # Próximo trecho contínuo de linhas pendentes em [start, stop), ou None
+        stop = len(self.flags) if stop is None else min(stop, len(self.flags))
+        begin = self.flags.find(1, start, stop)
+        if begin < 0:
+            return None
+        end = self.flags.find(0, begin, stop)
+        return begin, end if end >= 0 else stop
+    
+    def pending(self):
+        return self.flags.find(1) >= 0
+
+@functools.lru_cache(maxsize=64)
+def compile_search(term, match_case=False, whole_word=False, regex=False):
+    """Expressão regular da busca do editor (termo literal ou expressão regular, compilada uma vez por combinação)"""
+    pattern = term if regex else re.escape(term)
+    if whole_word:
+        pattern = r'\b(?:' + pattern + r')\b'
+    return re.compile(pattern, 0 if match_case else re.IGNORECASE)
+
+def iter_search_chunks(pattern, snapshot):
+    """Busca bloco a bloco no snapshot, devolvendo as ocorrências de cada bloco como (linha, início, fim, deslocamento da linha)"""
+    line = 0
+    offset = 0
+    for chunk in snapshot.chunks:
+        found = []
+        for text in chunk:
+            for match in pattern.finditer(text):
+                found.append((line, match.start(), match.end(), offset))
+            line += 1
+            offset += len(text) + 1
+        yield found
+
+class MatchList:
+    """Ocorrências de uma busca (deslocamentos de início e fim no texto) em arrays compactos"""
+    
+    __slots__ = ('starts', 'ends')
+    
+    def __init__(self, spans=()):
+        self.starts = array('i')
+        self.ends = array('i')
+        for start, end in spans:
+            self.append(start, end)
+    
+    def append(self, start, end):
+        self.starts.append(start)
+        self.ends.append(end)
+    
+    def __len__(self):
+        return len(self.starts)
+    
+    def __getitem__(self, index):
+        return self.starts[index], self.ends[index]
+    
+    def first_from(self, offset):
+        # Índice da primeira ocorrência que começa em offset ou depois (len(self) se nenhuma)
+        return bisect.bisect_left(self.starts, offset)
+
+# Busca no projeto: arquivos pesquisados e limite de ocorrências devolvidas por arquivo
+PROJECT_EXTENSIONS = ('.rtf', '.txt', '.fountain', '.meta')
+PROJECT_MATCH_LIMIT = 500
+
+def iter_project_files(folder):
+    """Arquivos pesquisáveis de uma pasta de projeto (e subpastas), em ordem alfabética"""
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        for name in sorted(files):
+            if name.lower().endswith(PROJECT_EXTENSIONS):
+                yield os.path.join(root, name)
+
+def convert_fountain_lines(lines):
+    """Converte linhas do formato Fountain para o formato interno (uma linha convertida por linha do arquivo)"""
+    converted_lines = []
+    for line in lines:
+        stripped = line.strip()
+        
+        if not stripped:
+            # Linha em branco
+            converted_lines.append("")
+        elif stripped.startswith('.'):
+            # Cena
+            converted_lines.append("CENA:" + stripped[1:])
+        elif stripped.startswith('[') and stripped.endswith(']'):
+            # Nota
+            converted_lines.append("NOTA:" + stripped[2:-2])
+        elif stripped.startswith('>'):
+            # Transição
+            converted_lines.append("TRANSIÇÃO:" + stripped[2:])
+        else:
+            # Personagem, ação ou diálogo: o texto sem espaços nas pontas
+            converted_lines.append(stripped)
+    return converted_lines
+
+def search_project_file(path, pattern, flags):
+    """Busca num arquivo do projeto (roda num processo de trabalho): ([(cena, linha, início, fim, texto)], total)"""
+    compiled = re.compile(pattern, flags)
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    
+    lower = path.lower()
+    notes = lower.endswith('.meta')
+    if notes:
+        # Metadados: só as notas do roteiro
+        lines = str(json.loads(content).get('notes', '')).split('\n')
+    elif lower.endswith('.fountain'):
+        # Buscar nas linhas como import_fountain as carrega, para as colunas valerem no editor
+        lines = convert_fountain_lines(content.split('\n'))
+    else:
+        lines = content.split('\n')
+    
+    matches = []
+    total = 0
+    scene = "Notas" if notes else ""
+    for number, line in enumerate(lines):
+        stripped = line.strip()
+        if not notes:
+            heading = SceneIndex.scene_title(line)
+            if heading is not None:
+                scene = heading
+        for match in compiled.finditer(line):
+            total += 1
+            if len(matches) < PROJECT_MATCH_LIMIT:
+                matches.append((scene, number, match.start(), match.end(), stripped[:200]))
+    return matches, total
+
+def regex_worker(connection):
+    """Processo da busca por expressão regular: recebe pedidos pelo Pipe e devolve as ocorrências em lotes"""
+    request = connection.recv()
+    while request is not None:
+        number, query, chunks, candidates, template = request
+        connection.send((number, 'started', None, time.time()))
+        request = None
+        try:
+            pattern = compile_search(*query, True)
+            lines = list(TextSnapshot(0, chunks))
+            starts = array('i', accumulate((len(line) + 1 for line in islice(lines, len(lines) - 1)), initial=0))
+            
+            # Um lote a cada bloco de linhas ou REGEX_FLUSH_MS, para que uma linha que trave a busca
+            # perca só o bloco em andamento
+            found = []
+            flush = time.perf_counter() + REGEX_FLUSH_MS / 1000
+            for count, line in enumerate(range(len(lines)) if candidates is None else candidates, 1):
+                for match in pattern.finditer(lines[line]):
+                    if match.end() > match.start():  # ocorrências vazias (^, \b, x*) não marcam nada
+                        found.append((line, match.start(), match.end(), starts[line]) +
+                                     ((match.expand(template),) if template is not None else ()))
+                if count % SNAPSHOT_CHUNK_LINES == 0 or time.perf_counter() >= flush:
+                    connection.send((number, 'found', found, time.time()))
+                    found = []
+                    flush = time.perf_counter() + REGEX_FLUSH_MS / 1000
+            connection.send((number, 'found', found, time.time()))
+            connection.send((number, 'done', None, time.time()))
+        except (re.error, IndexError) as e:
+            connection.send((number, 'error', str(e), time.time()))
+        request = connection.recv()
+
+class RegexWorker:
+    """Busca por expressão regular num processo à parte, encerrado à força quando passa do tempo limite"""
+    
+    def __init__(self):
+        self.process = None
+        self.connection = None
+        self.request = 0  # número do pedido atual (mensagens de pedidos anteriores são descartadas)
+        self.busy = False
+        self.deadline = 0
+        self.budget = 0
+        self.error = None
+    
+    def start(self, query, snapshot, candidates=None, template=None, budget_ms=2000):
+        # query: argumentos de compile_search (termo, maiúsculas, palavra inteira); template: substituição
+        # com grupos (\1, \g<nome>), expandida no processo para cada ocorrência
+        if self.busy:
+            # Pedido anterior ainda rodando (talvez preso numa linha, sem ler o Pipe): trocar o processo
+            self.poll()
+            if self.busy:
+                self.stop()
+        startup = 0
+        if self.process is None:
+            context = multiprocessing.get_context('spawn')
+            self.connection, child = context.Pipe()
+            self.process = context.Process(target=regex_worker, args=(child,), daemon=True)
+            self.process.start()
+            child.close()
+            startup = REGEX_STARTUP_MS / 1000
+        self.request += 1
+        # O texto passa do buffer do Pipe: enviar numa thread, para a interface nunca esperar o processo
+        request = (self.request, query, snapshot.chunks, candidates, template)
+        threading.Thread(target=self.send_request, args=(self.connection, request), daemon=True).start()
+        self.busy = True
+        self.error = None
+        self.budget = budget_ms / 1000
+        self.deadline = time.perf_counter() + self.budget + startup
+    
+    @staticmethod
+    def send_request(connection, request):
+        try:
+            connection.send(request)
+        except (OSError, ValueError, TypeError):
+            # Processo encerrado (stop) antes de receber o pedido: o Pipe foi fechado no meio do envio
+            pass
+    
+    def poll(self, limit=50):
+        # Lotes recebidos do pedido atual e o estado: None (rodando), 'done', 'timeout' ou 'error'
+        batches = []
+        timed_out = time.perf_counter() > self.deadline
+        try:
+            # Depois do tempo limite, recolher tudo o que já chegou (os resultados parciais)
+            for _ in (iter(int, 1) if timed_out else range(limit)):
+                if not self.connection.poll():
+                    break
+                number, kind, value, sent = self.connection.recv()
+                if number != self.request:
+                    continue
+                if kind == 'started':
+                    # O tempo limite conta a partir do início da busca no processo (sent vem do relógio
+                    # de parede, comparável entre os processos), não de quando a interface leu a mensagem
+                    self.deadline = time.perf_counter() - (time.time() - sent) + self.budget
+                elif kind == 'found':
+                    batches.append(value)
+                elif kind == 'done':
+                    self.busy = False
+                    return batches, 'done'
+                else:
+                    self.busy = False
+                    self.error = value
+                    return batches, 'error'
+        except (EOFError, OSError):
+            self.stop()
+            self.error = "o processo de busca terminou inesperadamente"
+            return batches, 'error'
+        if timed_out:
+            # Padrão lento demais: encerrar o processo (o próximo pedido inicia outro)
+            self.stop()
+            return batches, 'timeout'
+        return batches, None
+    
+    def stop(self):
+        self.busy = False
+        if self.process is None:
+            return
+        self.process.terminate()
+        self.process.join(1)
+        self.connection.close()
+        self.process = None
+        self.connection = None
+
+class AfterScheduler:
+    """Dono de todos os callbacks temporizados (after/after_idle), identificados por nome"""
+    
+    def __init__(self, widget):
+        self.widget = widget
+        self.jobs = {}  # nome -> (id do after, horário previsto, callback, argumentos)
+        self.parked = {}  # nome -> (tempo restante em ms, callback, argumentos)
+    
+    def schedule(self, name, delay_ms, callback, *args, replace=True):
+        # Reagendar um nome substitui o callback pendente (a menos que replace=False)
+        if name in self.jobs or name in self.parked:
+            if not replace:
+                return
+            self.cancel(name)
+        
+        def run():
+            self.jobs.pop(name, None)
+            callback(*args)
+        
+        if delay_ms is None:
+            job = self.widget.after_idle(run)
+            due = time.monotonic()
+        else:
+            job = self.widget.after(delay_ms, run)
+            due = time.monotonic() + delay_ms / 1000
+        self.jobs[name] = (job, due, callback, args)
+    
+    def idle(self, name, callback, *args, replace=True):
+        self.schedule(name, None, callback, *args, replace=replace)
+    
+    def cancel(self, name):
+        self.parked.pop(name, None)
+        entry = self.jobs.pop(name, None)
+        if entry is not None:
+            self.widget.after_cancel(entry[0])
+    
+    def cancel_all(self):
+        self.parked.clear()
+        for name in list(self.jobs):
+            self.cancel(name)
+    
+    def park(self, name):
+        # Suspender um callback, guardando quanto tempo faltava para ele
+        entry = self.jobs.pop(name, None)
+        if entry is not None:
+            job, due, callback, args = entry
+            self.widget.after_cancel(job)
+            remaining = max(0, int((due - time.monotonic()) * 1000))
+            self.parked[name] = (remaining, callback, args)
+    
+    def resume(self, name):
+        entry = self.parked.pop(name, None)
+        if entry is not None:
+            remaining, callback, args = entry
+            self.schedule(name, remaining, callback, *args)
+    
+    def is_pending(self, name):
+        return name in self.jobs
+    
+    @property
+    def pending_count(self):
+        return len(self.jobs)
+
+class PerfMonitor:
+    """Latências das rotinas do editor em buffers circulares de tamanho fixo"""
+    
+    def __init__(self, capacity=2048, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.samples = {}  # nome -> array('d') com as últimas latências em ms
+        self.positions = {}  # nome -> próxima posição de escrita no buffer
+        self.counts = {}  # nome -> total de chamadas desde o último reset
+        self.started = time.time()
+        self.lock = threading.Lock()  # rotinas como build_pdf medem numa thread de trabalho
+    
+    def record(self, name, elapsed_ms):
+        with self.lock:
+            buffer = self.samples.get(name)
+            if buffer is None:
+                buffer = self.samples[name] = array('d')
+                self.positions[name] = 0
+                self.counts[name] = 0
+            if len(buffer) < self.capacity:
+                buffer.append(elapsed_ms)
+            else:
+                position = self.positions[name]
+                buffer[position] = elapsed_ms
+                self.positions[name] = (position + 1) % self.capacity
+            self.counts[name] += 1
+    
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+            self.positions.clear()
+            self.counts.clear()
+            self.started = time.time()
+    
+    def snapshot(self):
+        # Cópia das amostras e contagens, para ler sem disputar com record
+        with self.lock:
+            return ({name: array('d', buffer) for name, buffer in self.samples.items()}, dict(self.counts))
+    
+    @staticmethod
+    def percentile(ordered, fraction):
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return ordered[index]
+    
+    def summary(self):
+        # Estatísticas por rotina, das mais lentas (p95) para as mais rápidas
+        samples, counts = self.snapshot()
+        rows = []
+        for name, buffer in samples.items():
+            ordered = sorted(buffer)
+            rows.append({
+                'name': name,
+                'calls': counts[name],
+                'samples': len(ordered),
+                'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+                'p50': self.percentile(ordered, 0.50),
+                'p95': self.percentile(ordered, 0.95),
+                'p99': self.percentile(ordered, 0.99),
+                'max': ordered[-1] if ordered else 0.0
+            })
+        rows.sort(key=lambda row: row['p95'], reverse=True)
+        return rows
+    
+    def export_json(self, path, extra=None):
+        data = {
+            'generated': datetime.now().isoformat(),
+            'since': datetime.fromtimestamp(self.started).isoformat(),
+            'capacity': self.capacity,
+            'platform': sys.platform,
+            'python': sys.version.split()[0],
+            'routines': self.summary(),
+            'samples': {name: list(buffer) for name, buffer in self.snapshot()[0].items()}
+        }
+        if extra:
+            data.update(extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+def instrumented(name):
+    """Mede a latência do método decorado quando o monitor de desempenho está ativo"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            perf = getattr(self, 'perf', None)
+            if perf is None or not perf.enabled:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                perf.record(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+class TaskCancelled(Exception):
+    """Levantada dentro de uma tarefa em segundo plano quando o usuário a cancela"""
+
+class WorkerTask:
+    """Tarefa em execução numa thread de trabalho; fala com o Tk apenas pela fila de mensagens"""
+    
+    def __init__(self, name, messages):
+        self.name = name
+        self.messages = messages
+        self.cancel_event = threading.Event()
+        self.on_progress = None
+        self.on_done = None
+        self.on_error = None
+    
+    def cancel(self):
+        self.cancel_event.set()
+    
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+    
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise TaskCancelled(self.name)
+    
+    def progress(self, done, total, message=None):
+        # Chamado pela thread de trabalho; também é o ponto de cancelamento
+        self.check_cancelled()
+        self.messages.put(('progress', self, (done, total, message)))
+
+class BackgroundTasks:
+    """Pool de threads para operações pesadas, com resultados entregues ao Tk via after"""
+    
+    def __init__(self, scheduler, max_workers=2, poll_ms=50):
+        self.scheduler = scheduler
+        self.poll_ms = poll_ms
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='roteirista')
+        self.messages = queue.Queue()
+        self.active = set()
+    
+    def submit(self, name, func, *args, on_done=None, on_error=None, on_progress=None):
+        # func recebe a tarefa como último argumento (para progresso e cancelamento)
+        task = WorkerTask(name, self.messages)
+        task.on_done = on_done
+        task.on_error = on_error
+        task.on_progress = on_progress
+        self.active.add(task)
+        self.executor.submit(self.run, task, func, args)
+        self.scheduler.schedule('worker_poll', self.poll_ms, self.poll, replace=False)
+        return task
+    
+    def run(self, task, func, args):
+        try:
+            result = func(*args, task)
+            task.check_cancelled()
+        except BaseException as e:
+            self.messages.put(('error', task, e))
+        else:
+            self.messages.put(('done', task, result))
+    
+    def poll(self):
+        # Executado na thread do Tk: entregar as mensagens acumuladas das threads de trabalho
+        latest_progress = {}
+        finished = []
+        while True:
+            try:
+                kind, task, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                # Só a última atualização de cada tarefa interessa
+                latest_progress[task] = payload
+                continue
+            latest_progress.pop(task, None)
+            self.active.discard(task)
+            finished.append((task.on_done if kind == 'done' else task.on_error, payload))
+        
+        try:
+            for callback, payload in finished:
+                if callback:
+                    callback(payload)
+            for task, payload in latest_progress.items():
+                if task.on_progress and not task.cancelled:
+                    task.on_progress(*payload)
+        finally:
+            if self.active:
+                self.scheduler.schedule('worker_poll', self.poll_ms, self.poll)
+    
+    def shutdown(self):
+        for task in self.active:
+            task.cancel()
+        self.active.clear()
+        self.executor.shutdown(wait=False)
+
+class ScriptWriterApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Roteirista Pro")
+        self.root.geometry("1400x900")
+        self.root.configure(bg='#0a0a0a')  # Fundo preto
+        
+        # Configurar cores
+        self.bg_color = '#0a0a0a'
+        self.fg_color = '#ffffff'
+        self.blue_color = '#003366'
+        self.highlight_color = '#0066cc'
+        self.secondary_color = '#1a1a1a'
+        self.accent_color = '#ff9900'
+        self.cursor_color = '#00ff00'
+        self.line_highlight_color = '#1a1a2e'
+        
+        # Configurar fonte padrão
+        self.default_font = font.Font(family="Courier", size=12)
+        self.title_font = font.Font(family="Arial", size=14, weight="bold")
+        
+        # Variável para controlar o arquivo atual
+        self.current_file = None
+        self.current_password = None
+        self.imported_from = None  # arquivo Fountain de onde veio o texto ainda não salvo
+        
+        # Configurações do aplicativo
+        self.settings = {
+            'auto_save': True,
+            'auto_save_interval': 5,  # minutos
+            'last_dir': os.path.expanduser('~'),
+            'theme': 'dark',
+            'font_size': 12,
+            'font_family': 'Courier',
+            'show_line_numbers': True,
+            'word_wrap': True,
+            'highlight_current_line': True,
+            'show_cursor_position': True,
+            'script_format': 'standard',  # standard, fountain, etc.
+            'page_width': 80,  # caracteres por linha
+            'character_width': 40,  # caracteres para nomes de personagens
+            'dialogue_width': 35,  # caracteres para diálogos
+            'action_width': 60,  # caracteres para ações
+            'scene_width': 60,  # caracteres para cenas
+            'update_latency_ms': 150,  # atraso máximo das atualizações caras durante a digitação
+            'perf_instrumentation': False,  # medir latências das rotinas do editor (Ferramentas > Desempenho)
+            'large_document_threshold': 500000,  # caracteres a partir dos quais o documento é "grande"
+            'derived_cache_mb': 16,  # memória máxima para HTML/Fountain/estatísticas/análise em cache
+            'regex_budget_ms': 2000  # tempo máximo de uma busca por expressão regular
+        }
+        
+        # Agendador central dos callbacks temporizados
+        self.scheduler = AfterScheduler(self.root)
+        
+        # Operações pesadas rodam em threads de trabalho
+        self.workers = BackgroundTasks(self.scheduler)
+        
+        # Atualizações pendentes do editor (processadas uma vez por rajada de teclas)
+        self.pending_updates = set()
+        
+        # Estado da linha atual (número da linha destacada)
+        self.current_line_tag = None
+        
+        # Modo de documento grande e carregamento progressivo
+        self.large_document = False
+        self.loading_document = False
+        
+        # Linhas com tags de elemento pendentes (área visível primeiro, resto em fatias ociosas)
+        self.tag_dirty = DirtyLines()
+        self.tag_position = 0  # onde a próxima fatia fora da área visível começa
+        
+        # Carregar configurações
+        self.load_settings()
+        
+        # Modelo do documento (palavras e tipo de elemento por linha), mantido a partir das edições do editor
+        self.document = ScriptDocument(self.settings['character_width'])
+        
+        # Instrumentação opcional das rotinas mais quentes do editor
+        self.perf = PerfMonitor(enabled=self.settings['perf_instrumentation'])
+        
+        # Saídas derivadas do texto, reaproveitadas enquanto o conteúdo e as configurações não mudam
+        self.derived_cache = DerivedCache(self.settings['derived_cache_mb'] * 1024 * 1024)
+        
+        # Busca no projeto: processos criados na primeira busca e resultados por arquivo (chave inclui o mtime)
+        self.project_pool = None
+        self.regex_worker = RegexWorker()  # processo das buscas por expressão regular (iniciado no primeiro uso)
+        self.project_cache = DerivedCache(8 * 1024 * 1024)
+        
+        # Aplicar tema
+        self.apply_theme()
+        
+        # Criar componentes da interface
+        self.create_toolbar()
+        self.create_menu()
+        self.create_status_bar()
+        self.create_sidebar()
+        self.create_text_editor()
+        
+        # Atalhos de teclado
+        self.setup_shortcuts()
+        
+        # Iniciar auto-salvamento
+        self.auto_save()
+        
+        # Personagens e cenas
+        self.characters = []
+        self.scenes = []
+        
+        # Estado da busca
+        self.search_term = ""
+        self.search_matches = MatchList()
+        self.current_match = -1
+        self.search_scan = None  # (snapshot, ocorrências restantes bloco a bloco, deslocamento de origem)
+        self.loading_filters = False  # filtros sendo redefinidos juntos (uma só nova busca)
+        self.search_partial = False  # busca por expressão regular interrompida pelo tempo limite
+        self.search_stale = False  # texto editado depois da busca: deslocamentos de search_matches desatualizados
+        
+        # Modo de economia de energia (janela sem foco, minimizada ou encoberta)
+        self.background_mode = False
+        self.root_obscured = False
+        self.root.bind('<FocusIn>', self.on_window_activity, add='+')
+        self.root.bind('<FocusOut>', self.on_window_activity, add='+')
+        self.root.bind('<Map>', self.on_window_activity, add='+')
+        self.root.bind('<Unmap>', self.on_window_activity, add='+')
+        self.root.bind('<Visibility>', self.on_window_activity, add='+')
+        
+        # Timer para salvar
+        self.last_saved_time = time.time()
+        
+    def apply_theme(self):
+        if self.settings['theme'] == 'light':
+            self.bg_color = '#f0f0f0'
+            self.fg_color = '#000000'
+            self.blue_color = '#4a86e8'
+            self.highlight_color = '#1155cc'
+            self.secondary_color = '#e0e0e0'
+            self.accent_color = '#ff6600'
+            self.cursor_color = '#006600'
+            self.line_highlight_color = '#e6e6e6'
+        else:
+            self.bg_color = '#0a0a0a'
+            self.fg_color = '#ffffff'
+            self.blue_color = '#003366'
+            self.highlight_color = '#0066cc'
+            self.secondary_color = '#1a1a1a'
+            self.accent_color = '#ff9900'
+            self.cursor_color = '#00ff00'
+            self.line_highlight_color = '#1a1a2e'
+    
+    def create_toolbar(self):
+        # Barra de ferramentas principal
+        self.main_toolbar = tk.Frame(self.root, bg=self.secondary_color, height=40)
+        self.main_toolbar.pack(side=tk.TOP, fill=tk.X)
+        
+        # Barra de ferramentas de formatação
+        self.format_toolbar = tk.Frame(self.root, bg=self.secondary_color, height=40)
+        self.format_toolbar.pack(side=tk.TOP, fill=tk.X)
+        
+        # Barra de ferramentas de elementos
+        self.elements_toolbar = tk.Frame(self.root, bg=self.secondary_color, height=40)
+        self.elements_toolbar.pack(side=tk.TOP, fill=tk.X)
+        
+        # Botões da barra de ferramentas principal
+        main_buttons = [
+            ("Novo", self.new_file, "new.png"),
+            ("Abrir", self.open_file, "open.png"),
+            ("Salvar", self.save_file, "save.png"),
+            ("Salvar Seguro", self.save_secure_file, "secure.png"),
+            ("", None, ""),  # Separador
+            ("Desfazer", self.undo, "undo.png"),
+            ("Refazer", self.redo, "redo.png"),
+            ("", None, ""),  # Separador
+            ("Buscar", self.show_search_dialog, "search.png"),
+            ("Substituir", self.show_replace_dialog, "replace.png"),
+            ("", None, ""),  # Separador
+            ("Estatísticas", self.show_stats, "stats.png"),
+            ("Verificar Ortografia", self.check_spelling, "spell.png"),
+            ("", None, ""),  # Separador
+            ("PDF", self.export_pdf, "pdf.png"),
+            ("Imprimir", self.print_script, "print.png")
+        ]
+        
+        for text, command, icon in main_buttons:
+            if text == "":
+                # Separador
+                separator = ttk.Separator(self.main_toolbar, orient='vertical')
+                separator.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+            else:
+                # Botão
+                btn = tk.Button(self.main_toolbar, text=text, command=command,
+                               bg=self.secondary_color, fg=self.fg_color,
+                               bd=0, padx=10, pady=5)
+                btn.pack(side=tk.LEFT, padx=2)
+                
+                # Adicionar tooltip
+                self.create_tooltip(btn, text)
+        
+        # Botões da barra de ferramentas de formatação
+        format_buttons = [
+            ("Negrito", self.toggle_bold, "bold.png"),
+            ("Itálico", self.toggle_italic, "italic.png"),
+            ("Sublinhado", self.toggle_underline, "underline.png"),
+            ("", None, ""),  # Separador
+            ("Fonte", self.change_font, "font.png"),
+            ("Cor", self.change_color, "color.png"),
+            ("", None, ""),  # Separador
+            ("Zoom In", self.zoom_in, "zoom_in.png"),
+            ("Zoom Out", self.zoom_out, "zoom_out.png"),
+            ("Zoom Normal", self.zoom_normal, "zoom_normal.png")
+        ]
+        
+        for text, command, icon in format_buttons:
+            if text == "":
+                # Separador
+                separator = ttk.Separator(self.format_toolbar, orient='vertical')
+                separator.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+            else:
+                # Botão
+                btn = tk.Button(self.format_toolbar, text=text, command=command,
+                               bg=self.secondary_color, fg=self.fg_color,
+                               bd=0, padx=10, pady=5)
+                btn.pack(side=tk.LEFT, padx=2)
+                
+                # Adicionar tooltip
+                self.create_tooltip(btn, text)
+        
+        # Botões da barra de ferramentas de elementos
+        elements_buttons = [
+            ("Cena", self.insert_scene, "scene.png"),
+            ("Personagem", self.insert_character, "character.png"),
+            ("Diálogo", self.insert_dialogue, "dialogue.png"),
+            ("Ação", self.insert_action, "action.png"),
+            ("Transição", self.insert_transition, "transition.png"),
+            ("Nota", self.insert_note, "note.png"),
+            ("", None, ""),  # Separador
+            ("Reformatar", self.reformat_script, "reformat.png"),
+            ("Análise", self.analyze_script, "analyze.png")
+        ]
+        
+        for text, command, icon in elements_buttons:
+            if text == "":
+                # Separador
+                separator = ttk.Separator(self.elements_toolbar, orient='vertical')
+                separator.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+            else:
+                # Botão
+                btn = tk.Button(self.elements_toolbar, text=text, command=command,
+                               bg=self.secondary_color, fg=self.fg_color,
+                               bd=0, padx=10, pady=5)
+                btn.pack(side=tk.LEFT, padx=2)
+                
+                # Adicionar tooltip
+                self.create_tooltip(btn, text)
+    
+    def create_tooltip(self, widget, text):
+        def on_enter(event):
+            tooltip = tk.Toplevel()
+            tooltip.wm_overrideredirect(True)
+            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            label = tk.Label(tooltip, text=text, bg=self.secondary_color, fg=self.fg_color,
+                            relief=tk.SOLID, borderwidth=1, font=("Arial", 9))
+            label.pack()
+            widget.tooltip = tooltip
+            
+        def on_leave(event):
+            if hasattr(widget, 'tooltip'):
+                widget.tooltip.destroy()
+                del widget.tooltip
+                
+        widget.bind("<Enter>", on_enter)
+        widget.bind("<Leave>", on_leave)
+    
+    def create_menu(self):
+        menubar = tk.Menu(self.root, bg=self.blue_color, fg=self.fg_color)
+        self.root.config(menu=menubar)
+        
+        # Menu Arquivo
+        file_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
+        menubar.add_cascade(label="Arquivo", menu=file_menu)
+        file_menu.add_command(label="Novo", command=self.new_file, accelerator="Ctrl+N")
+        file_menu.add_command(label="Abrir", command=self.open_file, accelerator="Ctrl+O")
+        file_menu.add_separator()
+        file_menu.add_command(label="Salvar", command=self.save_file, accelerator="Ctrl+S")
+        file_menu.add_command(label="Salvar Como", command=self.save_file_as, accelerator="Ctrl+Shift+S")
+        file_menu.add_command(label="Salvar Seguro", command=self.save_secure_file, accelerator="Ctrl+Alt+S")
+        file_menu.add_separator()
+        file_menu.add_command(label="Importar", command=self.import_file)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exportar PDF", command=self.export_pdf, accelerator="Ctrl+E")
+        file_menu.add_command(label="Exportar HTML", command=self.export_html)
+        file_menu.add_command(label="Exportar Fountain", command=self.export_fountain)
+        file_menu.add_separator()
+        file_menu.add_command(label="Imprimir", command=self.print_script, accelerator="Ctrl+P")
+        file_menu.add_separator()
+        file_menu.add_command(label="Sair", command=self.exit_app, accelerator="Ctrl+Q")
+        
+        # Menu Editar
+        edit_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
+        menubar.add_cascade(label="Editar", menu=edit_menu)
+        edit_menu.add_command(label="Desfazer", command=self.undo, accelerator="Ctrl+Z")
+        edit_menu.add_command(label="Refazer", command=self.redo, accelerator="Ctrl+Y")
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Recortar", command=self.cut_text, accelerator="Ctrl+X")
+        edit_menu.add_command(label="Copiar", command=self.copy_text, accelerator="Ctrl+C")
+        edit_menu.add_command(label="Colar", command=self.paste_text, accelerator="Ctrl+V")
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Negrito", command=self.toggle_bold, accelerator="Ctrl+B")
+        edit_menu.add_command(label="Itálico", command=self.toggle_italic, accelerator="Ctrl+I")
+        edit_menu.add_command(label="Sublinhado", command=self.toggle_underline, accelerator="Ctrl+U")
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Buscar", command=self.show_search_dialog, accelerator="Ctrl+F")
+        edit_menu.add_command(label="Substituir", command=self.show_replace_dialog, accelerator="Ctrl+R")
+        edit_menu.add_command(label="Buscar no Projeto", command=self.show_project_search, accelerator="Ctrl+Shift+F")
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Ir Para", command=self.go_to_line, accelerator="Ctrl+G")
+        edit_menu.add_command(label="Selecionar Tudo", command=self.select_all, accelerator="Ctrl+A")
+        
+        # Menu Formato
+        format_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
+        menubar.add_cascade(label="Formato", menu=format_menu)
+        format_menu.add_command(label="Personagem", command=self.insert_character, accelerator="Ctrl+P")
+        format_menu.add_command(label="Diálogo", command=self.insert_dialogue, accelerator="Ctrl+D")
+        format_menu.add_command(label="Ação", command=self.insert_action, accelerator="Ctrl+Shift+A")
+        format_menu.add_command(label="Cena", command=self.insert_scene, accelerator="Ctrl+Shift+C")
+        format_menu.add_command(label="Transição", command=self.insert_transition, accelerator="Ctrl+T")
+        format_menu.add_command(label="Nota", command=self.insert_note, accelerator="Ctrl+Shift+N")
+        format_menu.add_separator()
+        format_menu.add_command(label="Reformatar Roteiro", command=self.reformat_script)
+        format_menu.add_command(label="Configurar Formatação", command=self.configure_formatting)
+        format_menu.add_separator()
+        format_menu.add_command(label="Fonte", command=self.change_font)
+        format_menu.add_command(label="Cor", command=self.change_color)
+        format_menu.add_separator()
+        format_menu.add_checkbutton(label="Quebra de Linha", command=self.toggle_word_wrap)
+        format_menu.add_checkbutton(label="Números de Linha", command=self.toggle_line_numbers)
+        format_menu.add_checkbutton(label="Destacar Linha Atual", command=self.toggle_line_highlight)
+        
+        # Menu Ferramentas
+        tools_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
+        menubar.add_cascade(label="Ferramentas", menu=tools_menu)
+        tools_menu.add_checkbutton(label="Auto-salvar", command=self.toggle_auto_save)
+        tools_menu.add_command(label="Gerenciar Personagens", command=self.manage_characters)
+        tools_menu.add_command(label="Gerenciar Cenas", command=self.manage_scenes)
+        tools_menu.add_command(label="Contar Palavras", command=self.word_count)
+        tools_menu.add_command(label="Estatísticas", command=self.show_stats)
+        tools_menu.add_command(label="Verificar Ortografia", command=self.check_spelling)
+        tools_menu.add_command(label="Analisar Roteiro", command=self.analyze_script)
+        tools_menu.add_command(label="Tempo de Leitura", command=self.estimate_reading_time)
+        tools_menu.add_command(label="Desempenho", command=self.show_performance)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Configurações", command=self.show_settings)
+        
+        # Menu Visualizar
+        view_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
+        menubar.add_cascade(label="Visualizar", menu=view_menu)
+        view_menu.add_radiobutton(label="Tema Escuro", command=lambda: self.change_theme('dark'))
+        view_menu.add_radiobutton(label="Tema Claro", command=lambda: self.change_theme('light'))
+        view_menu.add_separator()
+        view_menu.add_command(label="Zoom In", command=self.zoom_in, accelerator="Ctrl++")
+        view_menu.add_command(label="Zoom Out", command=self.zoom_out, accelerator="Ctrl+-")
+        view_menu.add_command(label="Zoom Normal", command=self.zoom_normal, accelerator="Ctrl+0")
+        view_menu.add_separator()
+        view_menu.add_checkbutton(label="Barra de Ferramentas Principal", command=self.toggle_main_toolbar)
+        view_menu.add_checkbutton(label="Barra de Formatação", command=self.toggle_format_toolbar)
+        view_menu.add_checkbutton(label="Barra de Elementos", command=self.toggle_elements_toolbar)
+        view_menu.add_checkbutton(label="Barra Lateral", command=self.toggle_sidebar)
+        view_menu.add_checkbutton(label="Barra de Status", command=self.toggle_status_bar)
+        
+        # Menu Ajuda
+        help_menu = tk.Menu(menubar, tearoff=0, bg=self.blue_color, fg=self.fg_color)
+        menubar.add_cascade(label="Ajuda", menu=help_menu)
+        help_menu.add_command(label="Atalhos", command=self.show_shortcuts)
+        help_menu.add_command(label="Tutorial", command=self.show_tutorial)
+        help_menu.add_command(label="Guia de Formatação", command=self.show_formatting_guide)
+        help_menu.add_command(label="Sobre", command=self.show_about)
+    
+    def create_status_bar(self):
+        # Barra de status
+        self.status_bar = tk.Frame(self.root, bg=self.secondary_color, height=25)
+        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Frame para informações de status
+        status_info_frame = tk.Frame(self.status_bar, bg=self.secondary_color)
+        status_info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Informações de status
+        self.status_text = tk.StringVar()
+        self.status_text.set("Pronto")
+        
+        self.status_label = tk.Label(status_info_frame, textvariable=self.status_text, 
+                                    bg=self.secondary_color, fg=self.fg_color, 
+                                    anchor=tk.W, padx=10)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Frame para informações do documento
+        doc_info_frame = tk.Frame(self.status_bar, bg=self.secondary_color)
+        doc_info_frame.pack(side=tk.RIGHT)
+        
+        # Contador de palavras
+        self.word_count_label = tk.Label(doc_info_frame, text="Palavras: 0", 
+                                        bg=self.secondary_color, fg=self.fg_color, 
+                                        padx=10)
+        self.word_count_label.pack(side=tk.RIGHT)
+        
+        # Posição do cursor
+        self.cursor_pos_label = tk.Label(doc_info_frame, text="Ln 1, Col 1", 
+                                        bg=self.secondary_color, fg=self.fg_color, 
+                                        padx=10)
+        self.cursor_pos_label.pack(side=tk.RIGHT)
+        
+        # Formato do elemento atual
+        self.element_format_label = tk.Label(doc_info_frame, text="Normal", 
+                                           bg=self.secondary_color, fg=self.fg_color, 
+                                           padx=10)
+        self.element_format_label.pack(side=tk.RIGHT)
+        
+        # Cena em que o cursor está
+        self.scene_label = tk.Label(doc_info_frame, text="", 
+                                   bg=self.secondary_color, fg=self.fg_color, 
+                                   padx=10)
+        self.scene_label.pack(side=tk.RIGHT)
+        
+        # Indicador de salvamento
+        self.save_indicator = tk.Label(doc_info_frame, text="●", 
+                                      bg=self.secondary_color, fg=self.accent_color, 
+                                      padx=5)
+        self.save_indicator.pack(side=tk.RIGHT)
+        
+        # Progresso do carregamento de documentos grandes (visível só durante o carregamento)
+        self.load_progress = ttk.Progressbar(doc_info_frame, length=120, mode='determinate')
+    
+    def create_sidebar(self):
+        # Frame do menu lateral
+        self.sidebar = tk.Frame(self.root, bg=self.blue_color, width=220)
+        self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
+        
+        # Botão para retrair/expandir
+        self.toggle_button = tk.Button(self.sidebar, text="◀", command=self.toggle_sidebar, 
+                                      bg=self.blue_color, fg=self.fg_color, bd=0)
+        self.toggle_button.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Título do menu
+        title_label = tk.Label(self.sidebar, text="Ferramentas de Roteiro", 
+                              bg=self.blue_color, fg=self.fg_color, font=self.title_font)
+        title_label.pack(pady=10)
+        
+        # Notebook para abas
+        self.sidebar_notebook = ttk.Notebook(self.sidebar)
+        self.sidebar_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Aba de elementos
+        elements_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
+        self.sidebar_notebook.add(elements_frame, text="Elementos")
+        
+        # Funções de escrita
+        self.functions = [
+            ("Cena", self.insert_scene, "Ctrl+Shift+C"),
+            ("Personagem", self.insert_character, "Ctrl+P"),
+            ("Diálogo", self.insert_dialogue, "Ctrl+D"),
+            ("Ação", self.insert_action, "Ctrl+Shift+A"),
+            ("Transição", self.insert_transition, "Ctrl+T"),
+            ("Nota", self.insert_note, "Ctrl+Shift+N")
+        ]
+        
+        for func_name, command, shortcut in self.functions:
+            btn_frame = tk.Frame(elements_frame, bg=self.blue_color)
+            btn_frame.pack(fill=tk.X, padx=5, pady=2)
+            
+            # Ícone (simulado com texto)
+            icon_label = tk.Label(btn_frame, text="●", bg=self.blue_color, fg=self.highlight_color)
+            icon_label.pack(side=tk.LEFT, padx=5)
+            
+            # Botão
+            btn = tk.Button(btn_frame, text=f"{func_name}", command=command,
+                           bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w')
+            btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            
+            # Atalho
+            shortcut_label = tk.Label(btn_frame, text=shortcut, bg=self.blue_color, fg=self.fg_color)
+            shortcut_label.pack(side=tk.RIGHT, padx=5)
+        
+        # Aba de formatação
+        format_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
+        self.sidebar_notebook.add(format_frame, text="Formatação")
+        
+        format_functions = [
+            ("Negrito", self.toggle_bold, "Ctrl+B"),
+            ("Itálico", self.toggle_italic, "Ctrl+I"),
+            ("Sublinhado", self.toggle_underline, "Ctrl+U"),
+            ("Alinhar à Esquerda", self.align_left, ""),
+            ("Centralizar", self.align_center, ""),
+            ("Alinhar à Direita", self.align_right, "")
+        ]
+        
+        for func_name, command, shortcut in format_functions:
+            btn_frame = tk.Frame(format_frame, bg=self.blue_color)
+            btn_frame.pack(fill=tk.X, padx=5, pady=2)
+            
+            # Ícone (simulado com texto)
+            icon_label = tk.Label(btn_frame, text="●", bg=self.blue_color, fg=self.highlight_color)
+            icon_label.pack(side=tk.LEFT, padx=5)
+            
+            # Botão
+            btn = tk.Button(btn_frame, text=f"{func_name}", command=command,
+                           bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w')
+            btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            
+            # Atalho
+            if shortcut:
+                shortcut_label = tk.Label(btn_frame, text=shortcut, bg=self.blue_color, fg=self.fg_color)
+                shortcut_label.pack(side=tk.RIGHT, padx=5)
+        
+        # Aba de personagens
+        self.characters_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
+        self.sidebar_notebook.add(self.characters_frame, text="Personagens")
+        
+        # Lista de personagens
+        self.characters_listbox = tk.Listbox(self.characters_frame, bg=self.secondary_color, 
+                                            fg=self.fg_color, bd=0, height=10)
+        self.characters_listbox.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
+        self.characters_listbox.bind('<Double-Button-1>', self.jump_to_registered_character)
+        
+        # Personagens encontrados no texto, com o número de falas (duplo clique: próxima fala)
+        tk.Label(self.characters_frame, text="No roteiro", bg=self.blue_color, 
+                fg=self.fg_color).pack(anchor=tk.W, padx=5)
+        self.script_characters_listbox = tk.Listbox(self.characters_frame, bg=self.secondary_color, 
+                                                   fg=self.fg_color, bd=0, height=8, exportselection=False)
+        self.script_characters_listbox.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
+        self.script_characters_listbox.bind('<Double-Button-1>', self.jump_to_script_character)
+        self.script_characters_listbox.bind('<Return>', self.jump_to_script_character)
+        self.script_character_names = []
+        self.character_list_version = None
+        
+        # Botões para personagens
+        char_buttons_frame = tk.Frame(self.characters_frame, bg=self.blue_color)
+        char_buttons_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        add_char_btn = tk.Button(char_buttons_frame, text="Adicionar", command=self.add_character,
+                                bg=self.blue_color, fg=self.fg_color, bd=0)
+        add_char_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        edit_char_btn = tk.Button(char_buttons_frame, text="Editar", command=self.edit_character,
+                                 bg=self.blue_color, fg=self.fg_color, bd=0)
+        edit_char_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        remove_char_btn = tk.Button(char_buttons_frame, text="Remover", command=self.remove_character,
+                                   bg=self.blue_color, fg=self.fg_color, bd=0)
+        remove_char_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        # Aba de cenas
+        self.scenes_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
+        self.sidebar_notebook.add(self.scenes_frame, text="Cenas")
+        
+        # Cenas encontradas no texto (clique para ir até a cena)
+        tk.Label(self.scenes_frame, text="No roteiro", bg=self.blue_color, 
+                fg=self.fg_color).pack(anchor=tk.W, padx=5)
+        self.script_scenes_listbox = tk.Listbox(self.scenes_frame, bg=self.secondary_color, 
+                                               fg=self.fg_color, bd=0, height=10, exportselection=False)
+        self.script_scenes_listbox.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
+        self.script_scenes_listbox.bind('<<ListboxSelect>>', self.on_script_scene_select)
+        
+        # Estado da lista de cenas do roteiro
+        self.scene_list_version = None
+        self.current_scene_item = -1
+        
+        # Lista de cenas cadastradas
+        tk.Label(self.scenes_frame, text="Cadastradas", bg=self.blue_color, 
+                fg=self.fg_color).pack(anchor=tk.W, padx=5)
+        self.scenes_listbox = tk.Listbox(self.scenes_frame, bg=self.secondary_color, 
+                                        fg=self.fg_color, bd=0, height=10)
+        self.scenes_listbox.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
+        
+        # Botões para cenas
+        scene_buttons_frame = tk.Frame(self.scenes_frame, bg=self.blue_color)
+        scene_buttons_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        add_scene_btn = tk.Button(scene_buttons_frame, text="Adicionar", command=self.add_scene,
+                                 bg=self.blue_color, fg=self.fg_color, bd=0)
+        add_scene_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        edit_scene_btn = tk.Button(scene_buttons_frame, text="Editar", command=self.edit_scene,
+                                 bg=self.blue_color, fg=self.fg_color, bd=0)
+        edit_scene_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        remove_scene_btn = tk.Button(scene_buttons_frame, text="Remover", command=self.remove_scene,
+                                    bg=self.blue_color, fg=self.fg_color, bd=0)
+        remove_scene_btn.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        # Aba de notas
+        self.notes_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
+        self.sidebar_notebook.add(self.notes_frame, text="Notas")
+        
+        # Editor de notas
+        self.notes_editor = tk.Text(self.notes_frame, bg=self.secondary_color, fg=self.fg_color,
+                                   height=10, bd=0, wrap=tk.WORD)
+        self.notes_editor.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
+        
+        # Botão para salvar notas
+        save_notes_btn = tk.Button(self.notes_frame, text="Salvar Notas", command=self.save_notes,
+                                  bg=self.blue_color, fg=self.fg_color, bd=0)
+        save_notes_btn.pack(pady=5, padx=5, fill=tk.X)
+        
+        # Aba de ferramentas
+        tools_frame = tk.Frame(self.sidebar_notebook, bg=self.blue_color)
+        self.sidebar_notebook.add(tools_frame, text="Ferramentas")
+        
+        tools_functions = [
+            ("Verificar Ortografia", self.check_spelling, ""),
+            ("Contar Palavras", self.word_count, ""),
+            ("Estatísticas", self.show_stats, ""),
+            ("Analisar Roteiro", self.analyze_script, ""),
+            ("Tempo de Leitura", self.estimate_reading_time, ""),
+            ("Reformatar Roteiro", self.reformat_script, "")
+        ]
+        
+        for func_name, command, shortcut in tools_functions:
+            btn_frame = tk.Frame(tools_frame, bg=self.blue_color)
+            btn_frame.pack(fill=tk.X, padx=5, pady=2)
+            
+            # Ícone (simulado com texto)
+            icon_label = tk.Label(btn_frame, text="●", bg=self.blue_color, fg=self.highlight_color)
+            icon_label.pack(side=tk.LEFT, padx=5)
+            
+            # Botão
+            btn = tk.Button(btn_frame, text=f"{func_name}", command=command,
+                           bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w')
+            btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Separador
+        separator = tk.Frame(self.sidebar, height=2, bg=self.highlight_color)
+        separator.pack(fill=tk.X, pady=10, padx=5)
+        
+        # Botões de arquivo
+        file_btn = tk.Button(self.sidebar, text="Novo Roteiro", command=self.new_file,
+                            bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w', width=20)
+        file_btn.pack(pady=2, padx=5, fill=tk.X)
+        
+        open_btn = tk.Button(self.sidebar, text="Abrir Roteiro", command=self.open_file,
+                            bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w', width=20)
+        open_btn.pack(pady=2, padx=5, fill=tk.X)
+        
+        save_btn = tk.Button(self.sidebar, text="Salvar Roteiro", command=self.save_file,
+                            bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w', width=20)
+        save_btn.pack(pady=2, padx=5, fill=tk.X)
+        
+        secure_btn = tk.Button(self.sidebar, text="Salvar Seguro", command=self.save_secure_file,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, anchor='w', width=20)
+        secure_btn.pack(pady=2, padx=5, fill=tk.X)
+        
+        # Estado do menu lateral (expandido ou retraído)
+        self.sidebar_expanded = True
+    
+    def toggle_sidebar(self):
+        if self.sidebar_expanded:
+            # Retrair
+            self.sidebar.pack_forget()
+            self.sidebar = tk.Frame(self.root, bg=self.blue_color, width=40)
+            self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
+            self.toggle_button = tk.Button(self.sidebar, text="▶", command=self.toggle_sidebar,
+                                          bg=self.blue_color, fg=self.fg_color, bd=0)
+            self.toggle_button.pack(side=tk.RIGHT, fill=tk.Y)
+            self.sidebar_expanded = False
+        else:
+            # Expandir
+            self.sidebar.pack_forget()
+            self.create_sidebar()
+            self.sidebar_expanded = True
+    
+    def create_text_editor(self):
+        # Frame do editor
+        editor_frame = tk.Frame(self.root, bg=self.bg_color)
+        editor_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Barra de busca (oculta até Ctrl+F)
+        self.create_find_bar(editor_frame)
+        
+        # Frame para números de linha e editor
+        text_container = tk.Frame(editor_frame, bg=self.bg_color)
+        text_container.pack(fill=tk.BOTH, expand=True)
+        self.text_container = text_container
+        
+        # Números de linha (desenhados apenas para as linhas visíveis)
+        if self.settings['show_line_numbers']:
+            self.line_numbers = tk.Canvas(text_container, width=self.default_font.measure("0000") + 10,
+                                         bg=self.secondary_color, bd=0, highlightthickness=0, takefocus=0)
+            self.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
+        
+        # Editor de texto
+        self.text_editor = tk.Text(text_container, bg=self.bg_color, fg=self.fg_color, 
+                                  font=self.default_font, wrap=tk.WORD if self.settings['word_wrap'] else tk.NONE,
+                                  undo=True, bd=0, padx=5, pady=5, insertbackground=self.cursor_color,
+                                  insertontime=500, insertofftime=500)
+        self.text_editor.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Interceptar inserções e remoções para manter os índices do documento
+        self.install_edit_hook()
+        
+        # Scrollbar
+        self.editor_scrollbar = tk.Scrollbar(editor_frame, command=self.on_scrollbar)
+        self.editor_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text_editor.config(yscrollcommand=self.on_text_scroll)
+        
+        # Configurar tags para formatação
+        self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
+        self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
+        self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
+        self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
+                                      foreground=self.highlight_color)
+        self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
+                                      foreground=self.highlight_color)
+        self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
+                                      foreground=self.highlight_color)
+        self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
+                                      foreground="#cccccc")
+        self.text_editor.tag_configure("highlight", background=self.accent_color)
+        self.text_editor.tag_configure("current_line", background=self.line_highlight_color)
+        self.text_editor.tag_configure("search_match", background=self.blue_color)
+        self.text_editor.tag_raise("highlight")
+        
+        # Eventos do editor
+        self.text_editor.bind('<KeyRelease>', self.on_text_change)
+        self.text_editor.bind('<ButtonRelease-1>', self.on_cursor_move)
+        self.text_editor.bind('<Key>', self.on_cursor_move)
+        self.text_editor.bind('<FocusIn>', self.on_focus_in)
+        self.text_editor.bind('<FocusOut>', self.on_focus_out)
+        self.text_editor.bind('<Configure>', lambda e: self.mark_dirty('lines'))
+        
+        # Atualizar números de linha
+        if self.settings['show_line_numbers']:
+            self.update_line_numbers()
+        
+        # Destacar linha atual
+        if self.settings['highlight_current_line']:
+            self.highlight_current_line()
+    
+    def create_find_bar(self, parent):
+        # Barra de busca não modal: busca enquanto se digita e destaca todas as ocorrências
+        self.find_bar = tk.Frame(parent, bg=self.secondary_color)
+        self.find_bar_visible = False
+        
+        tk.Label(self.find_bar, text="Buscar:", bg=self.secondary_color, 
+                fg=self.fg_color).pack(side=tk.LEFT, padx=(10, 5), pady=3)
+        
+        self.find_var = tk.StringVar()
+        self.find_entry = tk.Entry(self.find_bar, textvariable=self.find_var, bg=self.bg_color, fg=self.fg_color, 
+                                  insertbackground=self.cursor_color, width=30)
+        self.find_entry.pack(side=tk.LEFT, pady=3)
+        
+        self.find_case_var = tk.IntVar()
+        self.find_word_var = tk.IntVar()
+        self.find_regex_var = tk.IntVar()
+        for text, variable in (("Aa", self.find_case_var), ("Palavra inteira", self.find_word_var),
+                               ("Regex", self.find_regex_var)):
+            tk.Checkbutton(self.find_bar, text=text, variable=variable, command=self.restart_search,
+                          bg=self.secondary_color, fg=self.fg_color, selectcolor=self.bg_color, 
+                          activebackground=self.secondary_color, 
+                          activeforeground=self.fg_color).pack(side=tk.LEFT, padx=5)
+        
+        # Contagem de ocorrências, atualizada durante a varredura
+        self.find_count_label = tk.Label(self.find_bar, text="", bg=self.secondary_color, fg=self.fg_color, padx=10)
+        self.find_count_label.pack(side=tk.LEFT)
+        
+        for text, command in (("✕", self.hide_find_bar), ("▼", self.find_next), ("▲", self.find_prev),
+                              ("Filtros", self.toggle_find_filters)):
+            tk.Button(self.find_bar, text=text, command=command, bg=self.secondary_color, fg=self.fg_color, 
+                     bd=0, padx=8).pack(side=tk.RIGHT)
+        
+        # Filtros estruturados: tipo de elemento, personagem e cabeçalho da cena
+        self.filter_bar = tk.Frame(parent, bg=self.secondary_color)
+        self.filter_bar_visible = False
+        self.filter_kind_var = tk.StringVar(value="Qualquer")
+        self.filter_character_var = tk.StringVar()
+        self.filter_scene_var = tk.StringVar()
+        self.filter_location_var = tk.StringVar(value="Qualquer")
+        self.filter_period_var = tk.StringVar(value="Qualquer")
+        
+        tk.Label(self.filter_bar, text="Tipo:", bg=self.secondary_color, 
+                fg=self.fg_color).pack(side=tk.LEFT, padx=(10, 5), pady=3)
+        ttk.Combobox(self.filter_bar, textvariable=self.filter_kind_var, state="readonly", width=11,
+                     values=["Qualquer"] + list(ELEMENT_LABELS.values())).pack(side=tk.LEFT)
+        
+        tk.Label(self.filter_bar, text="Personagem:", bg=self.secondary_color, 
+                fg=self.fg_color).pack(side=tk.LEFT, padx=(10, 5))
+        self.filter_character_combo = ttk.Combobox(
+            self.filter_bar, textvariable=self.filter_character_var, width=16,
+            postcommand=lambda: self.filter_character_combo.configure(
+                values=sorted(self.document.character_index.summary())))
+        self.filter_character_combo.pack(side=tk.LEFT)
+        
+        tk.Label(self.filter_bar, text="Cena:", bg=self.secondary_color, 
+                fg=self.fg_color).pack(side=tk.LEFT, padx=(10, 5))
+        tk.Entry(self.filter_bar, textvariable=self.filter_scene_var, bg=self.bg_color, fg=self.fg_color, 
+                insertbackground=self.cursor_color, width=16).pack(side=tk.LEFT)
+        
+        for text, variable, values in (("Local:", self.filter_location_var, ["Qualquer", "INT", "EXT"]),
+                                       ("Período:", self.filter_period_var, ["Qualquer", "DIA", "NOITE"])):
+            tk.Label(self.filter_bar, text=text, bg=self.secondary_color, 
+                    fg=self.fg_color).pack(side=tk.LEFT, padx=(10, 5))
+            ttk.Combobox(self.filter_bar, textvariable=variable, values=values, state="readonly",
+                         width=9).pack(side=tk.LEFT)
+        
+        tk.Button(self.filter_bar, text="Limpar", command=self.clear_find_filters, bg=self.secondary_color, 
+                 fg=self.fg_color, bd=0, padx=8).pack(side=tk.RIGHT)
+        
+        for variable in (self.filter_kind_var, self.filter_character_var, self.filter_scene_var,
+                         self.filter_location_var, self.filter_period_var):
+            variable.trace_add('write', lambda *args: self.restart_search())
+        
+        # Cada alteração do termo recomeça a busca
+        self.find_var.trace_add('write', lambda *args: self.on_find_term_changed())
+        self.find_entry.bind('<Return>', lambda e: self.find_next())
+        self.find_entry.bind('<Shift-Return>', lambda e: self.find_prev())
+        self.find_entry.bind('<Escape>', lambda e: self.hide_find_bar())
+    
+    def install_edit_hook(self):
+        # Renomear o comando Tcl do editor e colocar um intermediário no lugar,
+        # assim toda inserção/remoção (inclusive desfazer/refazer) passa por on_editor_command
+        widget = str(self.text_editor)
+        self.text_editor_command = widget + "_orig"
+        self.root.tk.call("rename", widget, self.text_editor_command)
+        self.root.tk.createcommand(widget, lambda *args: self.on_editor_command(widget, *args))
+        
+        # O novo editor começa vazio
+        self.document.reset()
+        self.tag_dirty.reset(1, dirty=False)
+        self.current_line_tag = None
+    
+    @instrumented('on_editor_command')
+    def on_editor_command(self, widget, *args):
+        original = widget + "_orig"
+        if not args or args[0] not in ('insert', 'delete', 'replace') or widget != str(self.text_editor):
+            return self.root.tk.call((original,) + args)
+        
+        # Linhas afetadas antes da edição (a última linha do Tk nunca é removida)
+        total_before = int(self.root.tk.call(original, 'index', 'end-1c').split('.')[0])
+        if args[0] == 'insert':
+            positions = [args[1]]
+        elif args[0] == 'replace':
+            positions = [args[1], args[2]]
+        else:
+            # "delete índice" remove um único caractere, que pode ser a quebra de linha
+            positions = list(args[1:])
+            if len(positions) % 2 == 1:
+                positions.append(positions[-1] + " +1c")
+        lines = [int(self.root.tk.call(original, 'index', pos).split('.')[0]) for pos in positions]
+        first = min(min(lines), total_before)
+        last = min(max(lines), total_before)
+        
+        result = self.root.tk.call((original,) + args)
+        
+        # Linhas que ocupam o lugar das antigas depois da edição
+        total_after = int(self.root.tk.call(original, 'index', 'end-1c').split('.')[0])
+        new_last = last + total_after - total_before
+        new_lines = self.root.tk.call(original, 'get', f"{first}.0", f"{new_last}.end").split('\n')
+        self.on_lines_changed(first - 1, last - first + 1, new_lines)
+        
+        return result
+    
+    def on_lines_changed(self, first, removed, new_lines):
+        # Atualizar apenas as linhas tocadas pela edição
+        changed_end = self.document.replace_lines(first, removed, new_lines)
+        
+        # Refazer as tags só das linhas editadas e das que mudaram de tipo por causa delas
+        self.tag_dirty.replace_lines(first, removed, len(new_lines))
+        self.tag_dirty.mark(first + len(new_lines), changed_end)
+        
+        # Acompanhar a linha destacada sem varrer o documento
+        if self.current_line_tag is not None:
+            line = self.current_line_tag - 1
+            if line >= first + removed:
+                self.current_line_tag += len(new_lines) - removed
+            elif line >= first:
+                # O destaque pode ter se espalhado pelas linhas editadas
+                self.text_editor.tag_remove("current_line", f"{first + 1}.0", f"{first + len(new_lines)}.end")
+                self.current_line_tag = None
+                self.mark_dirty('highlight')
+        
+        self.mark_dirty('words', 'lines', 'element', 'scene', 'tags')
+        
+        # Ocorrências da barra de busca: refazer quando a digitação pausar, sem mover o cursor;
+        # navegar antes disso refaz a busca na hora (os deslocamentos deixaram de valer).
+        # Ocorrências de fora da barra (verificação ortográfica) são descartadas
+        if self.find_bar_visible and (self.search_term or self.search_filters()):
+            self.search_stale = bool(self.search_matches)
+            self.scheduler.schedule('search_restart', self.settings['update_latency_ms'], 
+                                    self.restart_search, False)
+        elif self.search_matches:
+            self.search_matches = MatchList()
+            self.current_match = -1
+    
+    def on_scrollbar(self, *args):
+        # A régua de números acompanha pelo yscrollcommand
+        self.text_editor.yview(*args)
+    
+    def on_text_scroll(self, first, last):
+        # Chamado pelo Tk sempre que a área visível do editor muda (rolagem, roda do mouse, edição)
+        self.editor_scrollbar.set(first, last)
+        if self.settings['show_line_numbers']:
+            self.update_line_numbers()
+    
+    @instrumented('on_text_change')
+    def on_text_change(self, event=None):
+        # Apenas marcar o que mudou; o trabalho é feito uma vez por rajada de teclas
+        self.mark_dirty('cursor', 'highlight', 'element', 'scene', 'status', 'save', 'words', 'lines')
+    
+    @instrumented('on_cursor_move')
+    def on_cursor_move(self, event=None):
+        # Posição, destaque, formato e cena são atualizados quando o Tk ficar ocioso
+        self.mark_dirty('cursor', 'highlight', 'element', 'scene')
+    
+    def mark_dirty(self, *kinds):
+        self.pending_updates.update(kinds)
+        
+        # Durante o carregamento progressivo tudo fica para o final
+        if self.loading_document:
+            return
+        
+        # Atualizações baratas: uma única chamada quando o Tk ficar ocioso
+        self.scheduler.idle('flush_updates', self.flush_updates, replace=False)
+        
+        # Atualizações caras: agrupadas e feitas no máximo "latência" depois da primeira edição pendente
+        # (o agendamento não é refeito a cada tecla, senão a digitação contínua as adiaria para sempre)
+        if 'words' in self.pending_updates:
+            latency = self.settings['update_latency_ms']
+            if self.large_document:
+                latency = max(latency, LARGE_DOCUMENT_LATENCY_MS)
+            self.scheduler.schedule('deferred_updates', latency, self.flush_deferred_updates, replace=False)
+    
+    @instrumented('flush_updates')
+    def flush_updates(self):
+        pending = self.pending_updates - {'words'}
+        self.pending_updates -= pending
+        
+        if 'cursor' in pending:
+            # Atualizar posição do cursor
+            line, col = self.text_editor.index(tk.INSERT).split('.')
+            self.cursor_pos_label.config(text=f"Ln {int(line)}, Col {int(col)+1}")
+        
+        if 'highlight' in pending and self.settings['highlight_current_line']:
+            # Destacar linha atual
+            self.highlight_current_line()
+        
+        if 'element' in pending:
+            # Detectar formato do elemento atual
+            self.detect_current_element_format()
+        
+        if 'scene' in pending:
+            # Lista de cenas do roteiro e cena atual
+            self.update_scene_navigation()
+        
+        if 'status' in pending:
+            # Atualizar status
+            self.update_status("Editando...")
+        
+        if 'save' in pending:
+            # Atualizar indicador de salvamento
+            self.update_save_indicator()
+        
+        if 'lines' in pending and self.settings['show_line_numbers']:
+            # Atualizar números de linha
+            self.update_line_numbers()
+        
+        if 'tags' in pending:
+            # Tags de elemento: área visível agora, o resto em fatias ociosas
+            self.retag_visible()
+    
+    @instrumented('flush_deferred_updates')
+    def flush_deferred_updates(self):
+        if 'words' in self.pending_updates:
+            # Atualizar contador de palavras
+            self.pending_updates.discard('words')
+            self.update_word_count()
+            self.update_document_mode()
+            self.update_character_lists()
+    
+    def on_focus_in(self, event=None):
+        # Destacar linha atual quando o editor recebe foco
+        if self.settings['highlight_current_line']:
+            self.highlight_current_line()
+    
+    def on_focus_out(self, event=None):
+        # Remover destaque da linha atual quando o editor perde foco
+        if self.settings['highlight_current_line']:
+            self.clear_current_line_highlight()
+    
+    def on_window_activity(self, event=None):
+        # Foco e visibilidade mudam em rajadas (inclusive entre widgets da própria janela),
+        # então o estado é reavaliado uma única vez quando o Tk ficar ocioso
+        if event is not None and event.type == tk.EventType.Visibility and event.widget is self.root:
+            self.root_obscured = event.state == 'VisibilityFullyObscured'
+        self.scheduler.idle('power_check', self.update_power_mode, replace=False)
+    
+    def update_power_mode(self):
+        try:
+            has_focus = self.root.focus_get() is not None
+        except (KeyError, tk.TclError):
+            # focus_get falha para janelas internas do Tk (ex.: lista do Combobox)
+            has_focus = True
+        visible = self.root.state() != 'iconic' and not self.root_obscured
+        
+        if has_focus and visible:
+            self.exit_background_mode()
+        else:
+            self.enter_background_mode()
+    
+    def enter_background_mode(self):
+        if self.background_mode:
+            return
+        self.background_mode = True
+        
+        # Cursor fixo: sem temporizador de piscar enquanto ninguém está olhando
+        self.text_editor.config(insertofftime=0)
+        
+        # Estacionar os laços temporizados
+        self.scheduler.park('auto_save')
+        if self.scheduler.is_pending('status_reset'):
+            self.scheduler.cancel('status_reset')
+            self.status_text.set("Pronto")
+    
+    def exit_background_mode(self):
+        if not self.background_mode:
+            return
+        self.background_mode = False
+        
+        # Retomar imediatamente o que foi estacionado
+        self.text_editor.config(insertofftime=500)
+        self.scheduler.resume('auto_save')
+        self.mark_dirty('cursor', 'highlight', 'lines')
+    
+    def highlight_current_line(self):
+        # Obter linha atual
+        line = int(self.text_editor.index(tk.INSERT).split('.')[0])
+        if line == self.current_line_tag:
+            return
+        
+        # Remover destaque anterior (apenas da linha destacada)
+        self.clear_current_line_highlight()
+        
+        # Adicionar destaque
+        self.text_editor.tag_add("current_line", f"{line}.0", f"{line}.end")
+        self.current_line_tag = line
+    
+    def clear_current_line_highlight(self):
+        if self.current_line_tag is not None:
+            line = self.current_line_tag
+            self.text_editor.tag_remove("current_line", f"{line}.0", f"{line}.end")
+            self.current_line_tag = None
+    
+    def detect_current_element_format(self):
+        # Consultar o tipo da linha atual no cache (sem ler o texto do editor)
+        line = int(self.text_editor.index(tk.INSERT).split('.')[0])
+        format_type = self.document.label(line - 1)
+        
+        # Atualizar label
+        self.element_format_label.config(text=format_type)
+    
+    def update_scene_navigation(self):
+        scene_index = self.document.scene_index
+        
+        # Recriar a lista apenas quando cenas entram, saem ou mudam de título
+        if self.scene_list_version != scene_index.version:
+            self.scene_list_version = scene_index.version
+            self.script_scenes_listbox.delete(0, tk.END)
+            if scene_index.titles:
+                self.script_scenes_listbox.insert(tk.END, *scene_index.titles)
+            self.current_scene_item = -1
+        
+        # Cena atual por busca binária nas linhas de início
+        line = int(self.text_editor.index(tk.INSERT).split('.')[0])
+        current = scene_index.scene_at(line - 1)
+        if current != self.current_scene_item:
+            if 0 <= self.current_scene_item < len(scene_index):
+                self.script_scenes_listbox.itemconfig(self.current_scene_item, bg=self.secondary_color)
+            if current >= 0:
+                self.script_scenes_listbox.itemconfig(current, bg=self.highlight_color)
+                self.script_scenes_listbox.see(current)
+            self.current_scene_item = current
+        
+        if current >= 0:
+            title = scene_index.titles[current]
+            if len(title) > 30:
+                title = title[:29] + "…"
+            self.scene_label.config(text=f"Cena {current + 1}/{len(scene_index)}: {title}")
+        else:
+            self.scene_label.config(text="")
+    
+    def on_script_scene_select(self, event=None):
+        selection = self.script_scenes_listbox.curselection()
+        if not selection:
+            return
+        index = selection[0]
+        if index >= len(self.document.scene_index):
+            return
+        
+        # Ir até o cabeçalho da cena
+        line = self.document.scene_index.starts[index] + 1
+        self.text_editor.mark_set(tk.INSERT, f"{line}.0")
+        self.text_editor.see(f"{line}.0")
+        self.text_editor.focus_set()
+        self.script_scenes_listbox.selection_clear(0, tk.END)
+        self.on_cursor_move()
+    
+    def character_list_label(self, name):
+        # Nome cadastrado com o número de falas no texto (pelo índice de personagens)
+        entry = self.document.character_index.summary_entry(character_key(name.upper()))
+        if entry is None:
+            return name
+        return f"{name} ({entry[0]} falas)"
+    
+    def update_character_lists(self):
+        character_index = self.document.character_index
+        if self.character_list_version == character_index.version:
+            return
+        self.character_list_version = character_index.version
+        
+        # Personagens do texto, dos que mais falam para os que menos falam
+        summary = sorted(character_index.summary().items(), key=lambda item: (-item[1][0], item[0]))
+        self.script_character_names = [name for name, entry in summary]
+        self.script_characters_listbox.delete(0, tk.END)
+        for name, (cues, lines, words, first_line) in summary:
+            self.script_characters_listbox.insert(tk.END, f"{name} — {cues} falas, {words} palavras")
+        
+        # Contagens dos personagens cadastrados (mantendo a seleção)
+        selection = self.characters_listbox.curselection()
+        self.characters_listbox.delete(0, tk.END)
+        for char in self.characters:
+            self.characters_listbox.insert(tk.END, self.character_list_label(char['name']))
+        for index in selection:
+            self.characters_listbox.selection_set(index)
+    
+    def jump_to_character(self, name):
+        # Ir até a próxima deixa do personagem depois do cursor
+        line = int(self.text_editor.index(tk.INSERT).split('.')[0])
+        cue_line = self.document.character_index.next_cue(name, line - 1)
+        if cue_line is None:
+            self.update_status(f"{name} não aparece no roteiro")
+            return
+        self.text_editor.mark_set(tk.INSERT, f"{cue_line + 1}.0")
+        self.text_editor.see(f"{cue_line + 1}.0")
+        self.text_editor.focus_set()
+        self.on_cursor_move()
+    
+    def jump_to_script_character(self, event=None):
+        selection = self.script_characters_listbox.curselection()
+        if selection and selection[0] < len(self.script_character_names):
+            self.jump_to_character(self.script_character_names[selection[0]])
+    
+    def jump_to_registered_character(self, event=None):
+        selection = self.characters_listbox.curselection()
+        if selection and selection[0] < len(self.characters):
+            self.jump_to_character(character_key(self.characters[selection[0]]['name'].upper()))
+    
+    @instrumented('update_line_numbers')
+    def update_line_numbers(self):
+        if not self.settings['show_line_numbers']:
+            return
+        
+        # Ajustar a largura da régua ao maior número de linha
+        line_count = int(self.text_editor.index('end-1c').split('.')[0])
+        width = self.default_font.measure("0" * max(4, len(str(line_count)))) + 10
+        if int(self.line_numbers.cget('width')) != width:
+            self.line_numbers.config(width=width)
+        
+        self.line_numbers.delete('all')
+        
+        # Desenhar apenas as linhas visíveis, a partir da primeira linha lógica na tela
+        first_line = int(self.text_editor.index('@0,0').split('.')[0])
+        line = first_line
+        while line <= line_count:
+            dline = self.text_editor.dlineinfo(f"{line}.0")
+            if dline is None:
+                # Início da linha acima da área visível (linha quebrada) ou abaixo dela
+                if line > first_line:
+                    break
+            else:
+                # dlineinfo devolve a primeira linha de exibição, então linhas quebradas recebem um único número
+                self.line_numbers.create_text(width - 5, dline[1], anchor=tk.NE, text=str(line),
+                                              font=self.default_font, fill=self.fg_color)
+            line += 1
+    
+    def update_word_count(self):
+        # Em documentos grandes a contagem é atualizada com menos frequência
+        prefix = "~" if self.large_document else ""
+        self.word_count_label.config(text=f"Palavras: {prefix}{self.document.words}")
+    
+    def update_document_mode(self):
+        large = self.document.char_count > self.settings['large_document_threshold']
+        if large != self.large_document:
+            self.large_document = large
+            if large:
+                self.update_status("Documento grande: atualizações ao vivo reduzidas")
+            self.update_word_count()
+    
+    def update_status(self, message):
+        self.status_text.set(message)
+        # Um único retorno a "Pronto", reiniciado a cada nova mensagem
+        self.scheduler.schedule('status_reset', 3000, self.status_text.set, "Pronto")
+    
+    def update_save_indicator(self):
+        # Verificar se o arquivo foi modificado desde o último salvamento
+        if self.text_editor.edit_modified():
+            # Mudar cor do indicador para vermelho
+            self.save_indicator.config(fg="#ff0000")
+        else:
+            # Mudar cor do indicador para verde
+            self.save_indicator.config(fg=self.accent_color)
+    
+    def setup_shortcuts(self):
+        self.root.bind('<Control-n>', lambda e: self.new_file())
+        self.root.bind('<Control-o>', lambda e: self.open_file())
+        self.root.bind('<Control-s>', lambda e: self.save_file())
+        self.root.bind('<Control-Shift-s>', lambda e: self.save_file_as())
+        self.root.bind('<Control-Alt-s>', lambda e: self.save_secure_file())
+        self.root.bind('<Control-e>', lambda e: self.export_pdf())
+        self.root.bind('<Control-q>', lambda e: self.exit_app())
+        self.root.bind('<Control-z>', lambda e: self.undo())
+        self.root.bind('<Control-y>', lambda e: self.redo())
+        self.root.bind('<Control-b>', lambda e: self.toggle_bold())
+        self.root.bind('<Control-i>', lambda e: self.toggle_italic())
+        self.root.bind('<Control-u>', lambda e: self.toggle_underline())
+        self.root.bind('<Control-p>', lambda e: self.insert_character())
+        self.root.bind('<Control-d>', lambda e: self.insert_dialogue())
+        self.root.bind('<Control-Shift-a>', lambda e: self.insert_action())
+        self.root.bind('<Control-Shift-c>', lambda e: self.insert_scene())
+        self.root.bind('<Control-t>', lambda e: self.insert_transition())
+        self.root.bind('<Control-Shift-n>', lambda e: self.insert_note())
+        self.root.bind('<Control-f>', lambda e: self.show_search_dialog())
+        self.root.bind('<Control-r>', lambda e: self.show_replace_dialog())
+        self.root.bind('<Control-Shift-F>', lambda e: self.show_project_search())
+        self.root.bind('<Control-g>', lambda e: self.go_to_line())
+        self.root.bind('<Control-plus>', lambda e: self.zoom_in())
+        self.root.bind('<Control-minus>', lambda e: self.zoom_out())
+        self.root.bind('<Control-0>', lambda e: self.zoom_normal())
+        self.root.bind('<F3>', lambda e: self.find_next())
+        self.root.bind('<Shift-F3>', lambda e: self.find_prev())
+        self.root.bind('<Control-a>', lambda e: self.select_all())
+    
+    # Funções de formatação
+    def toggle_bold(self):
+        try:
+            current_tags = self.text_editor.tag_names(tk.SEL_FIRST)
+            if "bold" in current_tags:
+                self.text_editor.tag_remove("bold", tk.SEL_FIRST, tk.SEL_LAST)
+            else:
+                self.text_editor.tag_add("bold", tk.SEL_FIRST, tk.SEL_LAST)
+        except:
+            pass
+    
+    def toggle_italic(self):
+        try:
+            current_tags = self.text_editor.tag_names(tk.SEL_FIRST)
+            if "italic" in current_tags:
+                self.text_editor.tag_remove("italic", tk.SEL_FIRST, tk.SEL_LAST)
+            else:
+                self.text_editor.tag_add("italic", tk.SEL_FIRST, tk.SEL_LAST)
+        except:
+            pass
+    
+    def toggle_underline(self):
+        try:
+            current_tags = self.text_editor.tag_names(tk.SEL_FIRST)
+            if "underline" in current_tags:
+                self.text_editor.tag_remove("underline", tk.SEL_FIRST, tk.SEL_LAST)
+            else:
+                self.text_editor.tag_add("underline", tk.SEL_FIRST, tk.SEL_LAST)
+        except:
+            pass
+    
+    def align_left(self):
+        try:
+            # Alinhar texto à esquerda
+            start_index = self.text_editor.index(tk.SEL_FIRST)
+            end_index = self.text_editor.index(tk.SEL_LAST)
+            
+            # Obter linhas selecionadas
+            start_line = int(start_index.split('.')[0])
+            end_line = int(end_index.split('.')[0])
+            
+            # Alinhar cada linha
+            for line_num in range(start_line, end_line + 1):
+                line_start = f"{line_num}.0"
+                line_end = f"{line_num}.end"
+                line_text = self.text_editor.get(line_start, line_end)
+                
+                # Remover espaços em branco no início
+                stripped_text = line_text.lstrip()
+                
+                # Substituir linha
+                self.text_editor.delete(line_start, line_end)
+                self.text_editor.insert(line_start, stripped_text)
+        except:
+            pass
+    
+    def align_center(self):
+        try:
+            # Centralizar texto
+            start_index = self.text_editor.index(tk.SEL_FIRST)
+            end_index = self.text_editor.index(tk.SEL_LAST)
+            
+            # Obter linhas selecionadas
+            start_line = int(start_index.split('.')[0])
+            end_line = int(end_index.split('.')[0])
+            
+            # Centralizar cada linha
+            for line_num in range(start_line, end_line + 1):
+                line_start = f"{line_num}.0"
+                line_end = f"{line_num}.end"
+                line_text = self.text_editor.get(line_start, line_end).strip()
+                
+                # Calcular espaços necessários para centralizar
+                line_length = len(line_text)
+                total_spaces = self.settings['page_width'] - line_length
+                left_spaces = total_spaces // 2
+                right_spaces = total_spaces - left_spaces
+                
+                # Criar linha centralizada
+                centered_text = ' ' * left_spaces + line_text + ' ' * right_spaces
+                
+                # Substituir linha
+                self.text_editor.delete(line_start, line_end)
+                self.text_editor.insert(line_start, centered_text)
+        except:
+            pass
+    
+    def align_right(self):
+        try:
+            # Alinhar texto à direita
+            start_index = self.text_editor.index(tk.SEL_FIRST)
+            end_index = self.text_editor.index(tk.SEL_LAST)
+            
+            # Obter linhas selecionadas
+            start_line = int(start_index.split('.')[0])
+            end_line = int(end_index.split('.')[0])
+            
+            # Alinhar cada linha
+            for line_num in range(start_line, end_line + 1):
+                line_start = f"{line_num}.0"
+                line_end = f"{line_num}.end"
+                line_text = self.text_editor.get(line_start, line_end).strip()
+                
+                # Calcular espaços necessários para alinhar à direita
+                line_length = len(line_text)
+                left_spaces = self.settings['page_width'] - line_length
+                
+                # Criar linha alinhada à direita
+                right_text = ' ' * left_spaces + line_text
+                
+                # Substituir linha
+                self.text_editor.delete(line_start, line_end)
+                self.text_editor.insert(line_start, right_text)
+        except:
+            pass
+    
+    # Funções de inserção de elementos de roteiro
+    def insert_character(self):
+        # Inserir elemento de personagem formatado
+        self.text_editor.insert(tk.INSERT, "\n\n")
+        
+        # Calcular espaços para centralizar
+        char_name = "NOME DO PERSONAGEM"
+        char_length = len(char_name)
+        total_spaces = self.settings['page_width'] - char_length
+        left_spaces = total_spaces // 2
+        
+        # Inserir nome do personagem centralizado
+        self.text_editor.insert(tk.INSERT, ' ' * left_spaces + char_name + '\n')
+        self.text_editor.tag_add("character", "insert-1l linestart", "insert-1l lineend")
+        
+        # Posicionar cursor para diálogo
+        self.text_editor.insert(tk.INSERT, "\n")
+        self.text_editor.mark_set(tk.INSERT, "insert-1l lineend")
+        
+        self.update_status("Personagem inserido")
+    
+    def insert_dialogue(self):
+        # Inserir elemento de diálogo formatado
+        self.text_editor.insert(tk.INSERT, "\n\n")
+        
+        # Calcular espaços para diálogo
+        dialogue_text = "Diálogo do personagem aqui..."
+        dialogue_length = len(dialogue_text)
+        left_spaces = 15  # Padrão para diálogos
+        
+        # Inserir diálogo
+        self.text_editor.insert(tk.INSERT, ' ' * left_spaces + dialogue_text + '\n')
+        
+        # Posicionar cursor no final do diálogo
+        self.text_editor.mark_set(tk.INSERT, "insert-1l lineend")
+        
+        self.update_status("Diálogo inserido")
+    
+    def insert_action(self):
+        # Inserir elemento de ação formatado
+        self.text_editor.insert(tk.INSERT, "\n\n")
+        
+        # Calcular espaços para ação
+        action_text = "Ação ou descrição da cena..."
+        action_length = len(action_text)
+        left_spaces = 10  # Padrão para ações
+        
+        # Inserir ação
+        self.text_editor.insert(tk.INSERT, ' ' * left_spaces + action_text + '\n')
+        
+        # Posicionar cursor no final da ação
+        self.text_editor.mark_set(tk.INSERT, "insert-1l lineend")
+        
+        self.update_status("Ação inserida")
+    
+    def insert_scene(self):
+        # Inserir elemento de cena formatado
+        self.text_editor.insert(tk.INSERT, "\n\n")
+        
+        # Formato padrão para cenas
+        scene_text = "CENA: LOCAL - DIA/NOITE"
+        
+        # Inserir cena
+        self.text_editor.insert(tk.INSERT, scene_text + '\n')
+        self.text_editor.tag_add("scene", "insert-1l linestart", "insert-1l lineend")
+        
+        # Inserir linha em branco
+        self.text_editor.insert(tk.INSERT, "\n")
+        
+        # Posicionar cursor após a cena
+        self.text_editor.mark_set(tk.INSERT, "insert-1l lineend")
+        
+        self.update_status("Cena inserida")
+    
+    def insert_transition(self):
+        # Inserir elemento de transição formatado
+        self.text_editor.insert(tk.INSERT, "\n\n")
+        
+        # Calcular espaços para transição (alinhado à direita)
+        transition_text = "TRANSIÇÃO: CORTE PARA:"
+        transition_length = len(transition_text)
+        total_spaces = self.settings['page_width'] - transition_length
+        left_spaces = total_spaces
+        
+        # Inserir transição
+        self.text_editor.insert(tk.INSERT, ' ' * left_spaces + transition_text + '\n')
+        self.text_editor.tag_add("transition", "insert-1l linestart", "insert-1l lineend")
+        
+        # Posicionar cursor no final da transição
+        self.text_editor.mark_set(tk.INSERT, "insert lineend")
+        
+        self.update_status("Transição inserida")
+    
+    def insert_note(self):
+        # Inserir elemento de nota formatado
+        self.text_editor.insert(tk.INSERT, "\n\n")
+        
+        # Formato padrão para notas
+        note_text = "NOTA: "
+        
+        # Inserir nota
+        self.text_editor.insert(tk.INSERT, note_text)
+        self.text_editor.tag_add("note", "insert-1l linestart", "insert-1l lineend")
+        
+        # Posicionar cursor após a nota
+        self.text_editor.mark_set(tk.INSERT, "insert lineend")
+        
+        self.update_status("Nota inserida")
+    
+    # Funções de arquivo
+    def new_file(self):
+        if self.current_file and self.text_editor.edit_modified():
+            response = messagebox.askyesnocancel("Salvar alterações", 
+                                                 "Deseja salvar as alterações antes de criar um novo roteiro?")
+            if response is True:
+                self.save_file()
+            elif response is None:
+                return
+        
+        self.load_content("")
+        self.current_file = None
+        self.current_password = None
+        self.imported_from = None
+        self.text_editor.edit_modified(False)
+        self.root.title("Roteirista Pro - Novo Roteiro")
+        self.update_status("Novo roteiro criado")
+        self.update_save_indicator()
+    
+    def confirm_save_changes(self):
+        # Oferecer salvar antes de trocar de arquivo; False se o usuário cancelar
+        if self.text_editor.edit_modified():
+            response = messagebox.askyesnocancel("Salvar alterações", 
+                                                 "Deseja salvar as alterações antes de abrir outro arquivo?")
+            if response is True:
+                self.save_file()
+            elif response is None:
+                return False
+        return True
+    
+    def open_file(self):
+        if not self.confirm_save_changes():
+            return
+        
+        file_path = filedialog.askopenfilename(
+            initialdir=self.settings['last_dir'],
+            defaultextension=".rtf",
+            filetypes=[("Roteiros", "*.rtf"), ("Arquivos de Texto", "*.txt"), ("Arquivos FDX", "*.fdx"), ("Arquivos Seguros", "*.sec"), ("Todos os Arquivos", "*.*")]
+        )
+        
+        if file_path:
+            self.open_path(file_path)
+    
+    def open_path(self, file_path):
+        try:
+            # Verificar se é um arquivo seguro
+            if file_path.endswith('.sec'):
+                # Pedir senha
+                password = simpledialog.askstring("Senha", "Digite a senha para abrir o arquivo:", show='*')
+                if not password:
+                    return
+                
+                # Tentar descriptografar
+                try:
+                    with open(file_path, "rb") as file:
+                        encrypted_data = file.read()
+                        
+                    # Decodificar base64
+                    encrypted_data = base64.b64decode(encrypted_data)
+                    
+                    # Gerar chave a partir da senha
+                    password_hash = hashlib.sha256(password.encode()).digest()
+                    key = base64.urlsafe_b64encode(password_hash)
+                    
+                    # Descriptografar
+                    fernet = Fernet(key)
+                    decrypted_data = fernet.decrypt(encrypted_data)
+                    
+                    # Decodificar texto
+                    content = decrypted_data.decode('utf-8')
+                    
+                    # Carregar conteúdo
+                    self.load_content(content)
+                    
+                    # Salvar senha para uso futuro
+                    self.current_password = password
+                except Exception as e:
+                    messagebox.showerror("Erro", "Senha incorreta ou arquivo corrompido.")
+                    return
+            else:
+                # Arquivo normal
+                with open(file_path, "r", encoding="utf-8") as file:
+                    self.load_content(file.read())
+                    self.current_password = None
+            
+            self.current_file = file_path
+            self.imported_from = None
+            self.text_editor.edit_modified(False)
+            self.root.title(f"Roteirista Pro - {os.path.basename(file_path)}")
+            self.settings['last_dir'] = os.path.dirname(file_path)
+            self.update_status(f"Arquivo aberto: {os.path.basename(file_path)}")
+            self.update_save_indicator()
+            
+            # Tentar carregar personagens e cenas
+            self.load_metadata()
+        except Exception as e:
+            messagebox.showerror("Erro ao abrir arquivo", f"Não foi possível abrir o arquivo: {str(e)}")
+    
+    def load_content(self, content):
+        # Interromper um carregamento anterior que ainda esteja em andamento
+        self.scheduler.cancel('load_chunk')
+        self.scheduler.cancel('format_slice')
+        if self.loading_document:
+            self.finish_loading(quiet=True)
+        
+        self.document.drop_search_index()
+        self.text_editor.delete(1.0, tk.END)
+        self.large_document = len(content) > self.settings['large_document_threshold']
+        if not self.large_document:
+            self.text_editor.insert(1.0, content)
+            self.update_word_count()
+            return
+        
+        # Documento grande: inserir em fatias para a interface continuar respondendo
+        lines = content.split('\n')
+        chunks = ['\n'.join(lines[i:i + LOAD_CHUNK_LINES]) for i in range(0, len(lines), LOAD_CHUNK_LINES)]
+        
+        self.loading_document = True
+        self.text_editor.config(undo=False, state=tk.DISABLED)
+        self.load_progress.config(maximum=len(chunks), value=0)
+        self.load_progress.pack(side=tk.RIGHT, padx=5)
+        self.status_text.set("Carregando documento grande...")
+        self.scheduler.schedule('load_chunk', 1, self.load_next_chunk, chunks, 0)
+    
+    def load_next_chunk(self, chunks, index):
+        self.text_editor.config(state=tk.NORMAL)
+        if index > 0:
+            self.text_editor.insert('end-1c', '\n')
+        self.text_editor.insert('end-1c', chunks[index])
+        self.text_editor.config(state=tk.DISABLED)
+        self.load_progress.config(value=index + 1)
+        
+        if index + 1 < len(chunks):
+            self.scheduler.schedule('load_chunk', 1, self.load_next_chunk, chunks, index + 1)
+        else:
+            self.finish_loading()
+    
+    def finish_loading(self, quiet=False):
+        self.loading_document = False
+        self.text_editor.config(state=tk.NORMAL, undo=True)
+        self.text_editor.edit_reset()
+        self.text_editor.edit_modified(False)
+        self.load_progress.pack_forget()
+        if quiet:
+            return
+        
+        # Destaque, formatação e análises adiados até o fim do carregamento
+        self.mark_dirty('cursor', 'highlight', 'element', 'scene', 'save', 'words', 'lines')
+        self.apply_formatting()
+        self.update_status(f"Documento carregado: {self.document.line_count} linhas")
+    
+    def run_in_background(self, title, func, *args, on_done=None, on_error=None):
+        # Executar func(*args, tarefa) numa thread de trabalho, com janela de progresso compartilhada
+        progress_window = tk.Toplevel(self.root)
+        progress_window.title(title)
+        progress_window.geometry("360x130")
+        progress_window.configure(bg=self.secondary_color)
+        progress_window.transient(self.root)
+        progress_window.withdraw()
+        
+        message_var = tk.StringVar(value="Processando...")
+        tk.Label(progress_window, textvariable=message_var, 
+                bg=self.secondary_color, fg=self.fg_color).pack(anchor=tk.W, padx=10, pady=(10, 5))
+        
+        progress_bar = ttk.Progressbar(progress_window, length=340, mode='indeterminate')
+        progress_bar.pack(padx=10, pady=5)
+        progress_bar.start(15)
+        
+        def on_progress(done, total, message):
+            if total:
+                progress_bar.stop()
+                progress_bar.config(mode='determinate', maximum=total, value=done)
+            if message:
+                message_var.set(message)
+        
+        def close():
+            self.scheduler.cancel(dialog_job)
+            progress_window.destroy()
+        
+        def finished(result):
+            close()
+            if on_done:
+                on_done(result)
+        
+        def failed(error):
+            close()
+            if isinstance(error, TaskCancelled):
+                self.update_status(f"{title}: operação cancelada")
+            elif on_error:
+                on_error(error)
+            else:
+                messagebox.showerror(title, f"A operação falhou: {str(error)}")
+        
+        def cancel():
+            task.cancel()
+            message_var.set("Cancelando...")
+            cancel_btn.config(state=tk.DISABLED)
+        
+        cancel_btn = tk.Button(progress_window, text="Cancelar", command=cancel,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(pady=5)
+        progress_window.protocol("WM_DELETE_WINDOW", cancel)
+        
+        # Operações rápidas terminam antes da janela aparecer
+        task = self.workers.submit(title, func, *args, 
+                                   on_done=finished, on_error=failed, on_progress=on_progress)
+        dialog_job = f"task_dialog_{id(task)}"
+        self.scheduler.schedule(dialog_job, 300, progress_window.deiconify)
+        self.update_status(f"{title}...")
+        return task
+    
+    @instrumented('save_file')
+    def save_file(self):
+        if self.loading_document:
+            # Salvar agora gravaria apenas parte do documento
+            self.update_status("Aguarde o fim do carregamento para salvar")
+            return
+        if not self.current_file:
+            self.save_file_as()
+        else:
+            try:
+                with open(self.current_file, "w", encoding="utf-8") as file:
+                    self.document.snapshot().write_to(file)
+                    self.text_editor.edit_modified(False)
+                    self.root.title(f"Roteirista Pro - {os.path.basename(self.current_file)}")
+                    self.update_status(f"Arquivo salvo: {os.path.basename(self.current_file)}")
+                    self.update_save_indicator()
+                    
+                    # Salvar metadados (personagens e cenas)
+                    self.save_metadata()
+            except Exception as e:
+                messagebox.showerror("Erro ao salvar", f"Não foi possível salvar o arquivo: {str(e)}")
+    
+    def save_file_as(self):
+        file_path = filedialog.asksaveasfilename(
+            initialdir=self.settings['last_dir'],
+            defaultextension=".rtf",
+            filetypes=[("Roteiros", "*.rtf"), ("Arquivos de Texto", "*.txt"), ("Arquivos FDX", "*.fdx"), ("Todos os Arquivos", "*.*")]
+        )
+        
+        if file_path:
+            self.current_file = file_path
+            self.current_password = None
+            self.save_file()
+            self.settings['last_dir'] = os.path.dirname(file_path)
+    
+    def save_secure_file(self):
+        # Pedir senha
+        password = simpledialog.askstring("Senha", "Digite uma senha para o arquivo:", show='*')
+        if not password:
+            return
+        
+        # Confirmar senha
+        confirm_password = simpledialog.askstring("Confirmar Senha", "Confirme a senha:", show='*')
+        if password != confirm_password:
+            messagebox.showerror("Erro", "As senhas não coincidem.")
+            return
+        
+        # Escolher local para salvar
+        file_path = filedialog.asksaveasfilename(
+            initialdir=self.settings['last_dir'],
+            defaultextension=".sec",
+            filetypes=[("Arquivos Seguros", "*.sec"), ("Todos os Arquivos", "*.*")]
+        )
+        
+        if file_path:
+            try:
+                # Obter conteúdo do editor
+                content = self.document.text()
+                
+                # Gerar chave a partir da senha
+                password_hash = hashlib.sha256(password.encode()).digest()
+                key = base64.urlsafe_b64encode(password_hash)
+                
+                # Criptografar conteúdo
+                fernet = Fernet(key)
+                encrypted_data = fernet.encrypt(content.encode('utf-8'))
+                
+                # Codificar em base64
+                encrypted_data = base64.b64encode(encrypted_data)
+                
+                # Salvar arquivo
+                with open(file_path, "wb") as file:
+                    file.write(encrypted_data)
+                
+                self.current_file = file_path
+                self.current_password = password
+                self.text_editor.edit_modified(False)
+                self.root.title(f"Roteirista Pro - {os.path.basename(file_path)} [Seguro]")
+                self.update_status(f"Arquivo seguro salvo: {os.path.basename(file_path)}")
+                self.update_save_indicator()
+                
+                # Salvar metadados (personagens e cenas)
+                self.save_metadata()
+            except Exception as e:
+                messagebox.showerror("Erro ao salvar", f"Não foi possível salvar o arquivo seguro: {str(e)}")
+    
+    def import_file(self):
+        file_path = filedialog.askopenfilename(
+            initialdir=self.settings['last_dir'],
+            filetypes=[("Arquivos FDX", "*.fdx"), ("Arquivos PDF", "*.pdf"), ("Arquivos Word", "*.docx"), ("Arquivos Fountain", "*.fountain"), ("Todos os Arquivos", "*.*")]
+        )
+        
+        if file_path:
+            try:
+                # Lógica de importação depende do tipo de arquivo
+                ext = os.path.splitext(file_path)[1].lower()
+                self.imported_from = None
+                
+                if ext == '.fdx':
+                    # Importar do Final Draft
+                    self.import_fdx(file_path)
+                elif ext == '.pdf':
+                    # Importar do PDF (mais complexo, em segundo plano)
+                    self.import_pdf(file_path)
+                    return
+                elif ext == '.docx':
+                    # Importar do Word (em segundo plano)
+                    self.import_docx(file_path)
+                    return
+                elif ext == '.fountain':
+                    # Importar do Fountain
+                    self.import_fountain(file_path)
+                else:
+                    messagebox.showwarning("Formato não suportado", "Este formato de arquivo não é suportado para importação.")
+                    
+                self.update_status(f"Arquivo importado: {os.path.basename(file_path)}")
+            except Exception as e:
+                messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo: {str(e)}")
+    
+    def export_pdf(self):
+        if not self.current_file:
+            messagebox.showwarning("Exportar PDF", "Por favor, salve o roteiro antes de exportar.")
+            return
+            
+        # Escolher local para salvar
+        pdf_path = filedialog.asksaveasfilename(
+            initialdir=self.settings['last_dir'],
+            defaultextension=".pdf",
+            filetypes=[("Arquivos PDF", "*.pdf"), ("Todos os Arquivos", "*.*")]
+        )
+        
+        if pdf_path:
+            # Elementos do modelo do documento (tupla imutável, segura para a thread de trabalho)
+            elements = self.document.elements()
+            
+            # Adicionar título
+            title = os.path.basename(self.current_file)
+            if title.endswith('.rtf') or title.endswith('.txt'):
+                title = title[:-4]
+            
+            def done(result):
+                messagebox.showinfo("Exportar PDF", f"PDF exportado com sucesso:\n{pdf_path}")
+                self.update_status(f"PDF exportado: {os.path.basename(pdf_path)}")
+            
+            def failed(error):
+                messagebox.showerror("Erro ao exportar PDF", f"Não foi possível exportar para PDF: {str(error)}")
+            
+            # A renderização roda numa thread de trabalho
+            self.run_in_background("Exportar PDF", self.build_pdf, pdf_path, title, elements, 
+                                   on_done=done, on_error=failed)
+    
+    @instrumented('build_pdf')
+    def build_pdf(self, pdf_path, title, elements, task=None):
+        # Criar documento PDF
+        doc = SimpleDocTemplate(pdf_path, pagesize=letter)
+        styles = getSampleStyleSheet()
+        story = []
+        if task:
+            # O ReportLab informa o andamento por elemento; também é onde o cancelamento é verificado
+            estimate = {'total': 0}
+            
+            def on_build_progress(kind, value):
+                if kind == 'SIZE_EST':
+                    estimate['total'] = value
+                elif kind == 'PROGRESS':
+                    task.progress(value, estimate['total'], "Gerando páginas...")
+            
+            doc.setProgressCallBack(on_build_progress)
+        
+        title_style = styles["Title"]
+        title_style.alignment = TA_CENTER
+        story.append(Paragraph(title, title_style))
+        story.append(Spacer(1, 12))
+        
+        # Processar cada linha
+        for kind, stripped, line in iter_element_lines(elements):
+            if kind == 'blank':
+                # Linha em branco
+                story.append(Spacer(1, 6))
+            elif kind == 'scene':
+                # Cena
+                scene_style = styles["Normal"]
+                scene_style.fontName = "Courier-Bold"
+                scene_style.textColor = blue
+                scene_style.alignment = TA_LEFT
+                story.append(Paragraph(stripped, scene_style))
+                story.append(Spacer(1, 6))
+            elif kind == 'character':
+                # Personagem
+                char_style = styles["Normal"]
+                char_style.fontName = "Courier-Bold"
+                char_style.textColor = blue
+                char_style.alignment = TA_CENTER
+                story.append(Paragraph(stripped, char_style))
+            elif kind == 'transition':
+                # Transição
+                trans_style = styles["Normal"]
+                trans_style.fontName = "Courier-Bold"
+                trans_style.textColor = blue
+                trans_style.alignment = TA_RIGHT
+                story.append(Paragraph(stripped, trans_style))
+                story.append(Spacer(1, 6))
+            elif kind == 'note':
+                # Nota
+                note_style = styles["Normal"]
+                note_style.fontName = "Courier-Italic"
+                note_style.textColor = black
+                note_style.alignment = TA_LEFT
+                story.append(Paragraph(stripped, note_style))
+                story.append(Spacer(1, 6))
+            elif kind == 'dialogue':
+                # Diálogo
+                dialogue_style = styles["Normal"]
+                dialogue_style.fontName = "Courier"
+                dialogue_style.textColor = black
+                dialogue_style.leftIndent = 1.5 * inch
+                story.append(Paragraph(stripped, dialogue_style))
+            else:
+                # Ação
+                action_style = styles["Normal"]
+                action_style.fontName = "Courier"
+                action_style.textColor = black
+                action_style.leftIndent = 0.5 * inch
+                story.append(Paragraph(stripped, action_style))
+        
+        # Construir PDF
+        doc.build(story)
+    
+    def export_html(self):
+        if not self.current_file:
+            messagebox.showwarning("Exportar HTML", "Por favor, salve o roteiro antes de exportar.")
+            return
+            
+        html_content = self.generate_html()
+        html_path = os.path.splitext(self.current_file)[0] + '.html'
+        
+        try:
+            with open(html_path, 'w', encoding='utf-8') as file:
+                file.write(html_content)
+            messagebox.showinfo("Exportar HTML", f"HTML exportado com sucesso:\n{html_path}")
+            self.update_status(f"HTML exportado: {os.path.basename(html_path)}")
+        except Exception as e:
+            messagebox.showerror("Erro ao exportar HTML", f"Não foi possível exportar para HTML: {str(e)}")
+    
+    def export_fountain(self):
+        if not self.current_file:
+            messagebox.showwarning("Exportar Fountain", "Por favor, salve o roteiro antes de exportar.")
+            return
+            
+        # Converter para formato Fountain
+        fountain_content = self.convert_to_fountain()
+        fountain_path = os.path.splitext(self.current_file)[0] + '.fountain'
+        
+        try:
+            with open(fountain_path, 'w', encoding='utf-8') as file:
+                file.write(fountain_content)
+            messagebox.showinfo("Exportar Fountain", f"Arquivo Fountain exportado com sucesso:\n{fountain_path}")
+            self.update_status(f"Fountain exportado: {os.path.basename(fountain_path)}")
+        except Exception as e:
+            messagebox.showerror("Erro ao exportar Fountain", f"Não foi possível exportar para Fountain: {str(e)}")
+    
+    def derived_key(self, name, *extra):
+        # Chave do cache de saídas derivadas: hash do conteúdo + configurações que afetam o resultado
+        return (name, self.document.content_hash(), self.settings['character_width']) + extra
+    
+    @instrumented('convert_to_fountain')
+    def convert_to_fountain(self):
+        return self.derived_cache.get_or_compute(self.derived_key('fountain'), self.render_fountain)
+    
+    def render_fountain(self):
+        # Converter o conteúdo do editor para formato Fountain
+        fountain_lines = []
+        
+        for kind, stripped, line in iter_element_lines(self.document.elements()):
+            if kind == 'blank':
+                # Linha em branco
+                fountain_lines.append("")
+            elif kind == 'scene':
+                # Cena
+                fountain_lines.append("." + stripped[6:])
+            elif kind == 'character':
+                # Personagem
+                fountain_lines.append(stripped)
+            elif kind == 'transition':
+                # Transição
+                fountain_lines.append("> " + stripped[11:])
+            elif kind == 'note':
+                # Nota
+                fountain_lines.append("[[" + stripped[6:] + "]]")
+            else:
+                # Ação ou diálogo (no Fountain, o diálogo é o texto logo abaixo do personagem)
+                fountain_lines.append(stripped)
+        
+        return '\n'.join(fountain_lines)
+    
+    def import_fountain(self, file_path):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                content = file.read()
+            
+            # Converter do formato Fountain para o formato interno
+            converted_lines = convert_fountain_lines(content.split('\n'))
+            
+            # Limpar o editor
+            self.document.drop_search_index()
+            self.text_editor.delete(1.0, tk.END)
+            
+            # Inserir conteúdo convertido
+            self.text_editor.insert(1.0, '\n'.join(converted_lines))
+            
+            # Aplicar formatação
+            self.apply_formatting()
+            
+            self.imported_from = file_path
+            self.update_status(f"Arquivo Fountain importado: {os.path.basename(file_path)}")
+        except Exception as e:
+            messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo Fountain: {str(e)}")
+    
+    @instrumented('generate_html')
+    def generate_html(self):
+        title = os.path.basename(self.current_file) if self.current_file else "Roteiro"
+        return self.derived_cache.get_or_compute(self.derived_key('html', title), 
+                                                 lambda: self.render_html(title))
+    
+    def render_html(self, title):
+        # Gerar HTML a partir do modelo do documento
+        html_lines = []
+        
+        for kind, stripped, line in iter_element_lines(self.document.elements()):
+            if kind == 'blank':
+                # Linha em branco
+                html_lines.append("<br>")
+            elif kind == 'scene':
+                # Cena
+                html_lines.append(f'<div class="scene">{stripped}</div>')
+            elif kind == 'character':
+                # Personagem
+                html_lines.append(f'<div class="character">{stripped}</div>')
+            elif kind == 'transition':
+                # Transição
+                html_lines.append(f'<div class="transition">{stripped}</div>')
+            elif kind == 'note':
+                # Nota
+                html_lines.append(f'<div class="note">{stripped}</div>')
+            elif kind == 'dialogue':
+                # Diálogo
+                html_lines.append(f'<div class="dialogue">{stripped}</div>')
+            else:
+                # Ação
+                html_lines.append(f'<div class="action">{stripped}</div>')
+        
+        html_content = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <title>{title}</title>
+            <style>
+                body {{
+                    font-family: Courier, monospace;
+                    font-size: 12pt;
+                    line-height: 1.5;
+                    max-width: 800px;
+                    margin: 0 auto;
+                    padding: 20px;
+                    background-color: #ffffff;
+                    color: #000000;
+                }}
+                .scene {{
+                    font-weight: bold;
+                    color: #0066cc;
+                    text-transform: uppercase;
+                    margin-top: 20px;
+                    text-align: left;
+                }}
+                .character {{
+                    font-weight: bold;
+                    color: #0066cc;
+                    text-align: center;
+                    margin-top: 20px;
+                }}
+                .dialogue {{
+                    margin-left: 150px;
+                    margin-right: 150px;
+                }}
+                .action {{
+                    margin-top: 10px;
+                }}
+                .transition {{
+                    font-weight: bold;
+                    color: #0066cc;
+                    text-align: right;
+                    margin-top: 20px;
+                }}
+                .note {{
+                    font-style: italic;
+                    color: #666666;
+                    margin-top: 10px;
+                }}
+                @page {{
+                    size: A4;
+                    margin: 2cm;
+                }}
+                @media print {{
+                    body {{
+                        margin: 0;
+                        padding: 0;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            {content}
+        </body>
+        </html>
+        """
+        
+        return html_content.format(
+            title=title,
+            content='\n'.join(html_lines)
+        )
+    
+    def print_script(self):
+        # Imprimir o roteiro
+        try:
+            # Criar um arquivo temporário HTML
+            html_content = self.generate_html()
+            
+            # Salvar o HTML em um arquivo temporário
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as temp_file:
+                temp_file.write(html_content)
+                temp_html_path = temp_file.name
+            
+            # Abrir o HTML no navegador padrão para impressão
+            if sys.platform == 'win32':
+                os.startfile(temp_html_path, 'print')
+            elif sys.platform == 'darwin':
+                subprocess.run(['open', '-a', 'Preview', temp_html_path])
+            else:
+                subprocess.run(['xdg-open', temp_html_path])
+                
+            self.update_status("Roteiro enviado para impressão")
+        except Exception as e:
+            messagebox.showerror("Erro ao imprimir", f"Não foi possível imprimir o roteiro: {str(e)}")
+    
+    def undo(self):
+        self.text_editor.edit_undo()
+        self.update_status("Desfazer")
+    
+    def redo(self):
+        self.text_editor.edit_redo()
+        self.update_status("Refazer")
+    
+    def cut_text(self):
+        try:
+            self.text_editor.event_generate("<<Cut>>")
+            self.update_status("Recortar")
+        except:
+            pass
+    
+    def copy_text(self):
+        try:
+            self.text_editor.event_generate("<<Copy>>")
+            self.update_status("Copiar")
+        except:
+            pass
+    
+    def paste_text(self):
+        try:
+            self.text_editor.event_generate("<<Paste>>")
+            self.update_status("Colar")
+        except:
+            pass
+    
+    def select_all(self):
+        self.text_editor.tag_add(tk.SEL, "1.0", tk.END)
+        self.update_status("Selecionar tudo")
+    
+    def go_to_line(self):
+        # Criar janela para ir para linha
+        goto_window = tk.Toplevel(self.root)
+        goto_window.title("Ir Para Linha")
+        goto_window.geometry("300x120")
+        goto_window.configure(bg=self.secondary_color)
+        goto_window.transient(self.root)
+        goto_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(goto_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Campo para número da linha
+        tk.Label(main_frame, text="Número da linha:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        
+        line_var = tk.StringVar()
+        line_entry = tk.Entry(main_frame, textvariable=line_var, bg=self.bg_color, fg=self.fg_color)
+        line_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        line_entry.focus_set()
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=1, column=0, columnspan=2, pady=10)
+        
+        def go_to():
+            try:
+                line_num = int(line_var.get())
+                if line_num < 1:
+                    line_num = 1
+                
+                # Obter número total de linhas
+                total_lines = int(self.text_editor.index('end-1c').split('.')[0])
+                if line_num > total_lines:
+                    line_num = total_lines
+                
+                # Mover cursor para a linha
+                self.text_editor.mark_set(tk.INSERT, f"{line_num}.0")
+                self.text_editor.see(tk.INSERT)
+                
+                # Destacar linha
+                if self.settings['highlight_current_line']:
+                    self.highlight_current_line()
+                
+                goto_window.destroy()
+                self.update_status(f"Movido para linha {line_num}")
+            except ValueError:
+                messagebox.showwarning("Erro", "Por favor, digite um número válido.")
+        
+        go_btn = tk.Button(button_frame, text="Ir", command=go_to,
+                          bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        go_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=goto_window.destroy,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+    
+    def show_search_dialog(self):
+        # Mostrar a barra de busca; uma seleção de uma linha vira o termo buscado
+        if not self.find_bar_visible:
+            self.find_bar.pack(side=tk.TOP, fill=tk.X, before=self.text_container)
+            self.find_bar_visible = True
+        
+        if self.text_editor.tag_ranges(tk.SEL):
+            selected = self.text_editor.get(tk.SEL_FIRST, tk.SEL_LAST)
+            if selected and '\n' not in selected:
+                self.find_var.set(selected)
+        
+        self.find_entry.focus_set()
+        self.find_entry.select_range(0, tk.END)
+    
+    def hide_find_bar(self):
+        self.scheduler.cancel('search_slice')
+        self.scheduler.cancel('search_restart')
+        if self.regex_worker.busy:
+            self.regex_worker.stop()
+        self.search_scan = None
+        self.clear_tag("search_match")
+        self.clear_tag("highlight")
+        # A próxima busca (ou F3) parte do cursor, não da última ocorrência selecionada;
+        # ocorrências desatualizadas por edições não têm mais barra que as refaça
+        self.current_match = -1
+        if self.search_stale:
+            self.search_matches = MatchList()
+            self.search_stale = False
+        self.find_bar.pack_forget()
+        self.filter_bar.pack_forget()
+        self.find_bar_visible = False
+        self.filter_bar_visible = False
+        self.text_editor.focus_set()
+    
+    def clear_tag(self, tag):
+        # Remover a tag só dos trechos onde ela está (o Tk mantém esses intervalos através das edições),
+        # sem percorrer o documento inteiro
+        ranges = self.text_editor.tag_ranges(tag)
+        if ranges:
+            self.text_editor.tag_remove(tag, *ranges)
+    
+    def toggle_find_filters(self):
+        # Mostrar ou esconder a linha de filtros estruturados, logo abaixo da barra de busca
+        if self.filter_bar_visible:
+            self.filter_bar.pack_forget()
+            self.filter_bar_visible = False
+        else:
+            self.filter_bar.pack(side=tk.TOP, fill=tk.X, after=self.find_bar)
+            self.filter_bar_visible = True
+        self.restart_search()
+    
+    def clear_find_filters(self):
+        # Voltar os filtros ao padrão (uma única nova busca no fim)
+        self.loading_filters = True
+        try:
+            self.filter_kind_var.set("Qualquer")
+            self.filter_character_var.set("")
+            self.filter_scene_var.set("")
+            self.filter_location_var.set("Qualquer")
+            self.filter_period_var.set("Qualquer")
+        finally:
+            self.loading_filters = False
+        self.restart_search()
+    
+    def search_filters(self):
+        # Filtros estruturados em vigor (argumentos de structured_lines), ou None sem nenhum
+        if not self.filter_bar_visible:
+            return None
+        kinds = {label: kind for kind, label in ELEMENT_LABELS.items()}
+        filters = {
+            'kind': kinds.get(self.filter_kind_var.get()),
+            'character': self.filter_character_var.get().strip() or None,
+            'scene': self.filter_scene_var.get().strip() or None,
+            'location': self.filter_location_var.get() if self.filter_location_var.get() != "Qualquer" else None,
+            'period': self.filter_period_var.get() if self.filter_period_var.get() != "Qualquer" else None,
+        }
+        return filters if any(filters.values()) else None
+    
+    def on_find_term_changed(self):
+        # No modo regex cada busca vai para o processo de busca: esperar a digitação pausar
+        if self.find_regex_var.get():
+            self.scheduler.schedule('search_restart', self.settings['update_latency_ms'], self.restart_search)
+        else:
+            self.restart_search()
+    
+    def restart_search(self, select=True, origin=None):
+        # Recomeçar a busca incremental: área visível na hora, o restante em fatias de tempo.
+        # Com select, a primeira ocorrência a partir de origin (padrão: search_origin) é selecionada
+        if self.loading_filters:
+            return
+        if select and origin is None:
+            origin = self.search_origin()
+        self.scheduler.cancel('search_slice')
+        self.scheduler.cancel('search_restart')
+        self.clear_tag("search_match")
+        self.clear_tag("highlight")
+        self.search_matches = MatchList()
+        self.current_match = -1
+        self.search_partial = False
+        self.search_stale = False
+        self.search_term = self.find_var.get()
+        filters = self.search_filters()
+        regex = self.find_regex_var.get() and self.search_term
+        if self.regex_worker.busy and not regex:
+            # Busca por expressão regular em andamento que nenhum pedido novo vai substituir
+            self.regex_worker.stop()
+        if not self.search_term and not filters:
+            self.search_scan = None
+            self.find_count_label.config(text="")
+            return
+        
+        snapshot = self.document.snapshot()
+        if regex:
+            # Expressão regular: validada aqui e executada no processo de busca, com tempo limite
+            # (nem a área visível é buscada aqui, para um padrão catastrófico não travar o editor)
+            query = (self.search_term, bool(self.find_case_var.get()), bool(self.find_word_var.get()))
+            try:
+                compile_search(*query, True)
+            except re.error as e:
+                self.search_scan = None
+                self.find_count_label.config(text=f"Expressão inválida: {e}")
+                return
+            candidates = self.document.structured_lines(**filters) if filters else None
+            self.regex_worker.start(query, snapshot, candidates, budget_ms=self.settings['regex_budget_ms'])
+            self.search_scan = (snapshot, self.regex_worker, origin)
+            self.find_count_label.config(text="Buscando...")
+            self.scheduler.schedule('search_slice', REGEX_FLUSH_MS, self.search_next_slice)
+            return
+        
+        if filters:
+            # Busca estruturada: as linhas vêm dos índices de elementos; o termo (ou a linha
+            # inteira, sem termo) só é procurado nelas
+            pattern = (compile_search(self.search_term, self.find_case_var.get(), self.find_word_var.get())
+                       if self.search_term else TRIMMED_LINE)
+            candidates = self.document.structured_lines(**filters)
+            self.document.line_offsets.update(self.document.lines)
+            chunks = iter_line_matches(pattern, self.document.lines, candidates, self.document.line_offsets.starts)
+            self.search_scan = (snapshot, chunks, origin)
+            self.find_count_label.config(text="Buscando...")
+            self.search_next_slice()
+            return
+        
+        pattern = compile_search(self.search_term, self.find_case_var.get(), self.find_word_var.get())
+        
+        # Ocorrências visíveis destacadas antes de qualquer varredura
+        lines = self.document.lines
+        top = int(self.text_editor.index("@0,0").split('.')[0])
+        bottom = int(self.text_editor.index(f"@0,{self.text_editor.winfo_height()}").split('.')[0])
+        ranges = []
+        for line in range(top - 1, min(bottom, len(lines))):
+            for match in pattern.finditer(lines[line]):
+                ranges.extend((f"{line + 1}.{match.start()}", f"{line + 1}.{match.end()}"))
+        if ranges:
+            self.text_editor.tag_add("search_match", *ranges)
+        
+        # A primeira ocorrência a partir do cursor é selecionada quando encontrada
+        self.ensure_search_index()
+        chunks = self.document.iter_matches(pattern, self.search_term, self.find_word_var.get())
+        self.search_scan = (snapshot, chunks, origin)
+        self.find_count_label.config(text="Buscando...")
+        self.search_next_slice()
+    
+    def search_origin(self):
+        # Refinando o termo, a busca recomeça do início da ocorrência selecionada (select_text_range já
+        # levou o cursor para o fim dela); numa busca nova, do cursor
+        if self.current_match >= 0 and not self.search_stale:
+            return self.search_matches.starts[self.current_match]
+        ranges = self.text_editor.tag_ranges("highlight")
+        if ranges:
+            return self.document.offset(str(ranges[0]))
+        return self.document.offset(self.text_editor.index(tk.INSERT))
+    
+    @instrumented('search_slice')
+    def search_next_slice(self):
+        snapshot, chunks, origin = self.search_scan
+        if snapshot.version != self.document.version:
+            # O texto mudou; a busca será refeita quando a digitação pausar
+            return
+        
+        if chunks is self.regex_worker:
+            # Expressão regular: só recolher os lotes que o processo de busca já enviou
+            batches, status = self.regex_worker.poll()
+            for found in batches:
+                self.add_search_matches(found)
+            if status is None:
+                self.update_search_count(scanning=True)
+                self.scheduler.schedule('search_slice', REGEX_FLUSH_MS, self.search_next_slice)
+            elif status == 'error':
+                self.search_scan = None
+                self.find_count_label.config(text=f"Erro na busca: {self.regex_worker.error}")
+            else:
+                self.search_partial = status == 'timeout'
+                self.finish_search()
+                if self.search_partial:
+                    self.update_status(f"Busca interrompida após {self.settings['regex_budget_ms']} ms: "
+                                       f"expressão lenta demais, {len(self.search_matches)} ocorrências parciais")
+            return
+        
+        deadline = time.perf_counter() + SEARCH_SLICE_MS / 1000
+        for found in chunks:
+            self.add_search_matches(found)
+            if time.perf_counter() >= deadline:
+                self.update_search_count(scanning=True)
+                self.scheduler.schedule('search_slice', 1, self.search_next_slice)
+                return
+        self.finish_search()
+    
+    def add_search_matches(self, found):
+        # Registrar e destacar um lote de ocorrências; a primeira a partir da origem é selecionada
+        snapshot, chunks, origin = self.search_scan
+        matches = self.search_matches
+        ranges = []
+        for line, start, end, offset in found:
+            matches.append(offset + start, offset + end)
+            ranges.extend((f"{line + 1}.{start}", f"{line + 1}.{end}"))
+        if ranges:
+            self.text_editor.tag_add("search_match", *ranges)
+        
+        if origin is not None and matches and matches.starts[-1] >= origin:
+            self.current_match = matches.first_from(origin)
+            self.search_scan = (snapshot, chunks, None)
+            self.show_current_match()
+    
+    def finish_search(self):
+        # Varredura concluída
+        origin = self.search_scan[2]
+        self.search_scan = None
+        if origin is not None and self.search_matches:
+            # Nenhuma ocorrência depois do cursor: voltar ao início
+            self.current_match = 0
+            self.show_current_match()
+        self.update_search_count()
+    
+    def search_index_path(self):
+        # Índice gravado ao lado do roteiro (como o .meta); arquivos protegidos por senha não têm índice em claro
+        if not self.current_file or self.current_password:
+            return None
+        return os.path.splitext(self.current_file)[0] + '.idx'
+    
+    def ensure_search_index(self):
+        # Na primeira busca, ler o índice gravado (se corresponder ao texto) ou construí-lo numa thread
+        # de trabalho; até ficar pronto, iter_matches varre o texto
+        document = self.document
+        if document.search_index.built or document.index_edits is not None:
+            return
+        path = self.search_index_path()
+        content_hash = document.content_hash() if path else None
+        snapshot = document.begin_index_build()
+        
+        def done(result):
+            index, loaded = result
+            if document.adopt_search_index(index, snapshot) and loaded:
+                self.update_status("Índice de busca carregado")
+        
+        def failed(error):
+            # Tentar de novo na próxima busca (se o conteúdo não foi substituído nesse meio-tempo)
+            if snapshot is document.index_source:
+                document.drop_search_index()
+        
+        self.workers.submit("Índice de busca", load_search_index, snapshot, path, content_hash,
+                            on_done=done, on_error=failed)
+    
+    def save_search_index(self):
+        index = self.document.search_index
+        path = self.search_index_path()
+        if not index.built or not path:
+            return
+        try:
+            index.save(path, self.document.content_hash())
+        except OSError:
+            pass
+    
+    def update_search_count(self, scanning=False):
+        if not self.find_bar_visible:
+            return
+        total = len(self.search_matches)
+        if scanning:
+            text = f"{total} ocorrências..."
+        elif not total:
+            text = "Nenhuma ocorrência"
+        elif self.current_match >= 0:
+            text = f"{self.current_match + 1} de {total}"
+        else:
+            text = f"{total} ocorrências"
+        if self.search_partial:
+            text += " (parcial: tempo esgotado)"
+        self.find_count_label.config(text=text)
+    
+    def show_replace_dialog(self):
+        # Criar janela de substituição
+        replace_window = tk.Toplevel(self.root)
+        replace_window.title("Substituir")
+        replace_window.geometry("400x240")
+        replace_window.configure(bg=self.secondary_color)
+        replace_window.transient(self.root)
+        replace_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(replace_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Campo de busca
+        tk.Label(main_frame, text="Buscar:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        search_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        search_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        search_entry.focus_set()
+        
+        # Campo de substituição
+        tk.Label(main_frame, text="Substituir por:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
+        replace_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        replace_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        
+        # Opções
+        case_var = tk.IntVar()
+        case_check = tk.Checkbutton(main_frame, text="Diferenciar maiúsculas/minúsculas", 
+                                   variable=case_var, bg=self.secondary_color, fg=self.fg_color,
+                                   selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                   activeforeground=self.fg_color)
+        case_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        word_var = tk.IntVar()
+        word_check = tk.Checkbutton(main_frame, text="Palavra inteira", 
+                                   variable=word_var, bg=self.secondary_color, fg=self.fg_color,
+                                   selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                   activeforeground=self.fg_color)
+        word_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        regex_var = tk.IntVar(value=self.find_regex_var.get())
+        regex_check = tk.Checkbutton(main_frame, text="Expressão regular (\\1 = grupo 1)", 
+                                    variable=regex_var, bg=self.secondary_color, fg=self.fg_color,
+                                    selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                    activeforeground=self.fg_color)
+        regex_check.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=5, column=0, columnspan=2, pady=10)
+        
+        def apply_replace(matches, search_term, replace_term, replacement):
+            if matches:
+                self.replace_matches(matches, replacement)
+                messagebox.showinfo("Substituir", f"Foram substituídas {len(matches)} ocorrências de '{search_term}' por '{replace_term}'")
+                replace_window.destroy()
+            else:
+                messagebox.showinfo("Substituir", f"Não foram encontradas ocorrências de '{search_term}'")
+        
+        def do_replace():
+            search_term = search_entry.get()
+            replace_term = replace_entry.get()
+            
+            if not search_term:
+                return
+            
+            if regex_var.get():
+                # Expressão regular: ocorrências (e substituições com os grupos) vêm do processo de busca
+                query = (search_term, bool(case_var.get()), bool(word_var.get()))
+                try:
+                    compile_search(*query, True)
+                except re.error as e:
+                    messagebox.showerror("Substituir", f"Expressão regular inválida: {e}", parent=replace_window)
+                    return
+                if self.search_scan and self.search_scan[1] is self.regex_worker:
+                    # O processo passa a atender a substituição; a barra de busca refaz a dela depois da edição
+                    self.scheduler.cancel('search_slice')
+                    self.search_scan = None
+                    self.update_search_count()
+                self.scheduler.cancel('search_restart')
+                self.regex_worker.start(query, self.document.snapshot(), template=replace_term,
+                                        budget_ms=self.settings['regex_budget_ms'])
+                replace_btn.config(state=tk.DISABLED, text="Buscando...")
+                self.scheduler.schedule('replace_poll', REGEX_FLUSH_MS, poll_replace, [], search_term, replace_term)
+                return
+                
+            # Buscar no texto (as ocorrências já contadas na mesma passada)
+            pattern = compile_search(search_term, case_var.get(), word_var.get())
+            matches = []
+            self.ensure_search_index()
+            for found in self.document.iter_matches(pattern, search_term, word_var.get()):
+                matches.extend(found)
+            apply_replace(matches, search_term, replace_term, replace_term)
+        
+        def poll_replace(matches, search_term, replace_term):
+            batches, status = self.regex_worker.poll()
+            for found in batches:
+                matches.extend(found)
+            if status is None:
+                self.scheduler.schedule('replace_poll', REGEX_FLUSH_MS, poll_replace, matches, search_term, replace_term)
+                return
+            
+            replace_btn.config(state=tk.NORMAL, text="Substituir Tudo")
+            if self.find_bar_visible and self.search_term:
+                # Refazer a busca da barra, interrompida para atender a substituição
+                self.scheduler.schedule('search_restart', self.settings['update_latency_ms'], 
+                                        self.restart_search, False)
+            if status == 'error':
+                messagebox.showerror("Substituir", f"Erro na expressão regular: {self.regex_worker.error}", 
+                                     parent=replace_window)
+                return
+            if status == 'timeout':
+                # Padrão lento demais: substituir só o que foi encontrado, se o usuário quiser
+                if not matches:
+                    messagebox.showwarning("Substituir", f"A busca passou de {self.settings['regex_budget_ms']} ms "
+                                           "e foi interrompida sem encontrar ocorrências.", parent=replace_window)
+                    return
+                if not messagebox.askyesno("Substituir", f"A busca passou de {self.settings['regex_budget_ms']} ms "
+                                           f"e foi interrompida. Substituir as {len(matches)} ocorrências "
+                                           "encontradas até aqui?", parent=replace_window):
+                    return
+            apply_replace(matches, search_term, replace_term, None)
+        
+        def cancel():
+            self.scheduler.cancel('replace_poll')
+            if self.regex_worker.busy:
+                self.regex_worker.stop()
+            replace_window.destroy()
+        
+        replace_btn = tk.Button(button_frame, text="Substituir Tudo", command=do_replace,
+                               bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        replace_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=cancel,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        replace_window.protocol("WM_DELETE_WINDOW", cancel)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+    
+    def project_executor(self):
+        # Processos de trabalho da busca no projeto ("spawn": a interface já tem threads rodando)
+        if self.project_pool is None:
+            self.project_pool = ProcessPoolExecutor(max_workers=max(1, min(4, (os.cpu_count() or 2) - 1)),
+                                                    mp_context=multiprocessing.get_context('spawn'))
+        return self.project_pool
+    
+    def show_project_search(self):
+        # Janela não modal: busca em todos os roteiros de uma pasta, com resultados chegando aos poucos
+        search_window = tk.Toplevel(self.root)
+        search_window.title("Buscar no Projeto")
+        search_window.geometry("760x520")
+        search_window.configure(bg=self.secondary_color)
+        search_window.transient(self.root)
+        
+        main_frame = tk.Frame(search_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Termo e opções
+        query_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        query_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(query_frame, text="Buscar:", bg=self.secondary_color, fg=self.fg_color).pack(side=tk.LEFT)
+        term_entry = tk.Entry(query_frame, bg=self.bg_color, fg=self.fg_color, insertbackground=self.cursor_color)
+        term_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        term_entry.insert(0, self.find_var.get())
+        term_entry.focus_set()
+        
+        case_var = tk.IntVar()
+        word_var = tk.IntVar()
+        for text, variable in (("Aa", case_var), ("Palavra inteira", word_var)):
+            tk.Checkbutton(query_frame, text=text, variable=variable, 
+                          bg=self.secondary_color, fg=self.fg_color, selectcolor=self.bg_color, 
+                          activebackground=self.secondary_color, 
+                          activeforeground=self.fg_color).pack(side=tk.LEFT, padx=5)
+        
+        # Pasta do projeto
+        folder_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        folder_frame.pack(fill=tk.X, pady=5)
+        
+        folder_var = tk.StringVar(value=self.settings['last_dir'])
+        tk.Label(folder_frame, text="Pasta:", bg=self.secondary_color, fg=self.fg_color).pack(side=tk.LEFT)
+        tk.Label(folder_frame, textvariable=folder_var, bg=self.secondary_color, fg=self.fg_color, 
+                anchor=tk.W).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
+        def choose_folder():
+            folder = filedialog.askdirectory(parent=search_window, initialdir=folder_var.get())
+            if folder:
+                folder_var.set(folder)
+        
+        tk.Button(folder_frame, text="Escolher...", command=choose_folder,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT)
+        
+        # Resultados: arquivo > cena > ocorrência
+        table_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        table_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        scrollbar = tk.Scrollbar(table_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        tree = ttk.Treeview(table_frame, columns=('line', 'text'), yscrollcommand=scrollbar.set)
+        tree.heading('#0', text="Arquivo / Cena")
+        tree.column('#0', width=260)
+        tree.heading('line', text="Linha")
+        tree.column('line', width=60, anchor=tk.E)
+        tree.heading('text', text="Texto")
+        tree.column('text', width=400)
+        tree.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=tree.yview)
+        
+        progress_var = tk.StringVar()
+        tk.Label(main_frame, textvariable=progress_var, 
+                bg=self.secondary_color, fg=self.fg_color).pack(anchor=tk.W)
+        
+        state = {'generation': 0, 'futures': {}, 'done': 0, 'total': 0, 'matches': 0}
+        poll_key = f'project_poll_{id(search_window)}'  # várias janelas podem buscar ao mesmo tempo
+        targets = {}  # item da árvore -> (arquivo, linha, início, fim)
+        results = queue.Queue()  # (geração, arquivo, chave do cache, future) de cada arquivo concluído
+        
+        def update_progress():
+            text = f"{state['done']} de {state['total']} arquivos - {state['matches']} ocorrências"
+            if state['futures']:
+                text += " - buscando..."
+            progress_var.set(text)
+        
+        def show_file(path, found):
+            matches, total = found
+            state['matches'] += total
+            if not total:
+                return
+            
+            label = os.path.relpath(path, folder_var.get())
+            label += f" ({total})" if total == len(matches) else f" ({total}, mostrando {len(matches)})"
+            file_item = tree.insert('', tk.END, text=label, open=True)
+            scene_items = {}
+            for scene, line, start, end, text in matches:
+                scene_item = scene_items.get(scene)
+                if scene_item is None:
+                    scene_item = scene_items[scene] = tree.insert(file_item, tk.END, open=True,
+                                                                  text=scene or "(antes da primeira cena)")
+                targets[tree.insert(scene_item, tk.END, values=(line + 1, text))] = (path, line, start, end)
+        
+        def poll():
+            try:
+                # Alguns arquivos por rodada, para a interface não travar com muitos resultados
+                for _ in range(20):
+                    generation, path, key, future = results.get_nowait()
+                    if generation != state['generation'] or path not in state['futures']:
+                        # Busca anterior ou arquivo pulado
+                        continue
+                    del state['futures'][path]
+                    state['done'] += 1
+                    try:
+                        found = future.result()
+                    except Exception as e:
+                        tree.insert('', tk.END, text=f"{os.path.relpath(path, folder_var.get())}: erro ({e})")
+                        continue
+                    self.project_cache.put(key, found)
+                    show_file(path, found)
+            except queue.Empty:
+                pass
+            finally:
+                update_progress()
+                if state['futures'] or not results.empty():
+                    self.scheduler.schedule(poll_key, 50, poll)
+        
+        def start_search():
+            cancel_search()
+            term = term_entry.get()
+            folder = folder_var.get()
+            if not term or not os.path.isdir(folder):
+                return
+            
+            pattern = compile_search(term, case_var.get(), word_var.get())
+            tree.delete(*tree.get_children())
+            targets.clear()
+            state.update(done=0, total=0, matches=0)
+            generation = state['generation']
+            
+            for path in iter_project_files(folder):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                state['total'] += 1
+                
+                # Arquivo inalterado desde uma busca igual: resultado do cache, sem reprocessar
+                key = ('project', path, stat.st_mtime_ns, stat.st_size, pattern.pattern, pattern.flags)
+                found = self.project_cache.get(key)
+                if found is not None:
+                    state['done'] += 1
+                    show_file(path, found)
+                    continue
+                
+                future = self.project_executor().submit(search_project_file, path, pattern.pattern, pattern.flags)
+                state['futures'][path] = future
+                future.add_done_callback(
+                    lambda future, path=path, key=key: results.put((generation, path, key, future)))
+            
+            update_progress()
+            if state['futures']:
+                self.scheduler.schedule(poll_key, 50, poll)
+        
+        def skip_file():
+            # Pular o arquivo em andamento (o primeiro ainda pendente, na ordem da busca)
+            if not state['futures']:
+                return
+            path = next(iter(state['futures']))
+            state['futures'].pop(path).cancel()
+            state['done'] += 1
+            tree.insert('', tk.END, text=f"{os.path.relpath(path, folder_var.get())} (pulado)")
+            update_progress()
+        
+        def cancel_search():
+            for future in state['futures'].values():
+                future.cancel()
+            state['futures'].clear()
+            state['generation'] += 1
+            self.scheduler.cancel(poll_key)
+            update_progress()
+        
+        def close():
+            cancel_search()
+            search_window.destroy()
+        
+        def open_selected(event=None):
+            target = targets.get(tree.focus())
+            if target:
+                self.open_project_match(*target)
+        
+        tree.bind('<Double-Button-1>', open_selected)
+        tree.bind('<Return>', open_selected)
+        term_entry.bind('<Return>', lambda e: start_search())
+        search_window.protocol("WM_DELETE_WINDOW", close)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Button(button_frame, text="Fechar", command=close,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="Cancelar", command=cancel_search,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="Pular Arquivo", command=skip_file,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="Buscar", command=start_search,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT, padx=5)
+    
+    def open_project_match(self, path, line, start, end):
+        # Abrir o arquivo de um resultado da busca no projeto e selecionar a ocorrência
+        base, ext = os.path.splitext(path)
+        notes = ext.lower() == '.meta'
+        if notes:
+            # Notas ficam no .meta: abrir o roteiro de mesmo nome
+            scripts = [base + extension for extension in ('.rtf', '.txt', '.fountain') 
+                       if os.path.exists(base + extension)]
+            if not scripts:
+                messagebox.showwarning("Buscar no Projeto", "Não há roteiro correspondente a estas notas.")
+                return
+            path = scripts[0]
+        
+        # Já aberto: o próprio arquivo ou o Fountain importado e ainda não salvo com outro nome
+        source = self.current_file or self.imported_from
+        if not (source and os.path.abspath(source) == os.path.abspath(path)):
+            if not self.confirm_save_changes():
+                return
+            if path.lower().endswith('.fountain'):
+                # Fountain é convertido linha a linha; salvar pede um novo nome
+                self.import_fountain(path)
+                self.current_file = None
+            else:
+                self.open_path(path)
+        
+        if notes:
+            self.sidebar_notebook.select(self.notes_frame)
+            self.notes_editor.tag_remove(tk.SEL, "1.0", tk.END)
+            self.notes_editor.tag_add(tk.SEL, f"{line + 1}.{start}", f"{line + 1}.{end}")
+            self.notes_editor.see(f"{line + 1}.{start}")
+            self.notes_editor.focus_set()
+        else:
+            self.show_line_range(line, start, end)
+            self.text_editor.focus_set()
+    
+    def show_line_range(self, line, start, end):
+        if self.loading_document:
+            # Documento grande ainda carregando: tentar de novo em seguida
+            self.scheduler.schedule('project_goto', 100, self.show_line_range, line, start, end)
+            return
+        self.select_text_range(f"{line + 1}.{start}", f"{line + 1}.{end}")
+    
+    def replace_matches(self, matches, replacement):
+        # Trocar só os trechos encontrados, do fim para o começo (os índices anteriores continuam válidos),
+        # num único passo de desfazer; cada trecho novo recebe as tags de formatação do trecho original.
+        # Sem replacement, cada ocorrência traz o próprio texto (expressão regular com grupos já expandidos)
+        transient = {tk.SEL, "highlight", "search_match", "current_line"}
+        view = self.text_editor.yview()[0]
+        autoseparators = self.text_editor.cget('autoseparators')
+        self.text_editor.config(autoseparators=False)
+        self.text_editor.edit_separator()
+        try:
+            for line, start, end, offset, *expansion in reversed(matches):
+                start_index, end_index = f"{line + 1}.{start}", f"{line + 1}.{end}"
+                tags = tuple(tag for tag in self.text_editor.tag_names(start_index) if tag not in transient)
+                text = replacement if replacement is not None else expansion[0]
+                self.text_editor.replace(start_index, end_index, text, tags)
+        finally:
+            self.text_editor.edit_separator()
+            self.text_editor.config(autoseparators=autoseparators)
+        self.text_editor.yview_moveto(view)
+    
+    def find_next(self):
+        if self.search_stale:
+            # Texto editado desde a busca: refazê-la agora, selecionando a partir do cursor (depois da atual)
+            self.restart_search(origin=self.document.offset(self.text_editor.index(tk.INSERT)))
+            return
+        if not self.search_matches:
+            return
+        
+        if self.current_match < 0:
+            # Primeira navegação: a partir do cursor
+            cursor = self.document.offset(self.text_editor.index(tk.INSERT))
+            self.current_match = self.search_matches.first_from(cursor) % len(self.search_matches)
+        else:
+            self.current_match = (self.current_match + 1) % len(self.search_matches)
+        self.show_current_match()
+    
+    def find_prev(self):
+        if self.search_stale:
+            self.restart_search(origin=self.document.offset(self.text_editor.index(tk.INSERT)))
+            return
+        if not self.search_matches:
+            return
+        
+        if self.current_match < 0:
+            cursor = self.document.offset(self.text_editor.index(tk.INSERT))
+            self.current_match = (self.search_matches.first_from(cursor) - 1) % len(self.search_matches)
+        else:
+            self.current_match = (self.current_match - 1) % len(self.search_matches)
+        self.show_current_match()
+    
+    def show_current_match(self):
+        start, end = self.search_matches[self.current_match]
+        
+        # Converter para índices do Tkinter pela tabela de inícios de linha
+        self.select_text_range(self.document.index(start), self.document.index(end))
+        
+        self.update_status(f"Ocorrência {self.current_match + 1} de {len(self.search_matches)}")
+        self.update_search_count(scanning=self.search_scan is not None)
+    
+    def select_text_range(self, start_index, end_index):
+        # Remover destaque anterior (só o trecho da ocorrência anterior, não o documento inteiro)
+        self.clear_tag("highlight")
+        
+        # Adicionar destaque
+        self.text_editor.tag_add("highlight", start_index, end_index)
+        
+        # Rolar para a posição
+        self.text_editor.see(start_index)
+        
+        # Selecionar o texto
+        self.text_editor.tag_add(tk.SEL, start_index, end_index)
+        self.text_editor.mark_set(tk.INSERT, end_index)
+    
+    def change_font(self):
+        # Criar janela de seleção de fonte
+        font_window = tk.Toplevel(self.root)
+        font_window.title("Selecionar Fonte")
+        font_window.geometry("400x300")
+        font_window.configure(bg=self.secondary_color)
+        font_window.transient(self.root)
+        font_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(font_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Lista de fontes
+        tk.Label(main_frame, text="Fonte:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        
+        font_listbox = tk.Listbox(main_frame, bg=self.bg_color, fg=self.fg_color, height=10)
+        font_listbox.grid(row=1, column=0, columnspan=2, sticky=tk.NSEW, pady=5)
+        
+        # Preencher lista de fontes
+        available_fonts = sorted(font.families())
+        for family in available_fonts:
+            font_listbox.insert(tk.END, family)
+            
+        # Selecionar fonte atual
+        current_font = self.settings['font_family']
+        try:
+            index = available_fonts.index(current_font)
+            font_listbox.selection_set(index)
+            font_listbox.see(index)
+        except ValueError:
+            pass
+        
+        # Tamanho da fonte
+        tk.Label(main_frame, text="Tamanho:", bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
+        
+        size_var = tk.IntVar(value=self.settings['font_size'])
+        size_spinbox = tk.Spinbox(main_frame, from_=8, to=24, textvariable=size_var, 
+                                 bg=self.bg_color, fg=self.fg_color, width=10)
+        size_spinbox.grid(row=2, column=1, sticky=tk.W, pady=5)
+        
+        # Amostra
+        tk.Label(main_frame, text="Amostra:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
+        
+        sample_text = tk.Text(main_frame, height=5, bg=self.bg_color, fg=self.fg_color, 
+                             wrap=tk.WORD, bd=1, relief=tk.SOLID)
+        sample_text.grid(row=4, column=0, columnspan=2, sticky=tk.NSEW, pady=5)
+        sample_text.insert(tk.END, "O rápido raposa marrom salta sobre o cão preguiçoso.\n\n" + 
+                                 "NOME DO PERSONAGEM\n\n" + 
+                                 "Diálogo do personagem aqui...")
+        
+        # Função para atualizar amostra
+        def update_sample(event=None):
+            try:
+                selected = font_listbox.curselection()
+                if selected:
+                    family = available_fonts[selected[0]]
+                    size = size_var.get()
+                    sample_font = font.Font(family=family, size=size)
+                    sample_text.config(font=sample_font)
+            except:
+                pass
+        
+        font_listbox.bind('<<ListboxSelect>>', update_sample)
+        size_spinbox.bind('<KeyRelease>', update_sample)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=5, column=0, columnspan=2, pady=10)
+        
+        def apply_font():
+            try:
+                selected = font_listbox.curselection()
+                if selected:
+                    family = available_fonts[selected[0]]
+                    size = size_var.get()
+                    
+                    # Atualizar configurações
+                    self.settings['font_family'] = family
+                    self.settings['font_size'] = size
+                    
+                    # Atualizar fonte padrão
+                    self.default_font = font.Font(family=family, size=size)
+                    
+                    # Atualizar editor
+                    self.text_editor.config(font=self.default_font)
+                    
+                    # Atualizar tags de formatação
+                    self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
+                    self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
+                    self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
+                    self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
+                                                  foreground=self.highlight_color)
+                    self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
+                                                  foreground=self.highlight_color)
+                    self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
+                                                  foreground=self.highlight_color)
+                    self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
+                                                  foreground="#cccccc")
+                    
+                    # Atualizar números de linha
+                    if self.settings['show_line_numbers']:
+                        self.update_line_numbers()
+                    
+                    font_window.destroy()
+                    self.update_status(f"Fonte alterada: {family} {size}pt")
+            except Exception as e:
+                messagebox.showerror("Erro", f"Não foi possível alterar a fonte: {str(e)}")
+        
+        apply_btn = tk.Button(button_frame, text="Aplicar", command=apply_font,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        apply_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=font_window.destroy,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(4, weight=1)
+        
+        # Inicializar amostra
+        update_sample()
+    
+    def change_color(self):
+        # Abrir seletor de cores
+        color = colorchooser.askcolor(initialcolor=self.fg_color)
+        
+        if color[1]:
+            # Alterar cor do texto
+            self.fg_color = color[1]
+            self.text_editor.config(fg=self.fg_color)
+            self.update_status(f"Cor alterada: {color[1]}")
+    
+    def toggle_word_wrap(self):
+        self.settings['word_wrap'] = not self.settings['word_wrap']
+        wrap_mode = tk.WORD if self.settings['word_wrap'] else tk.NONE
+        self.text_editor.config(wrap=wrap_mode)
+        self.update_status(f"Quebra de linha: {'Ativada' if self.settings['word_wrap'] else 'Desativada'}")
+    
+    def toggle_line_numbers(self):
+        self.settings['show_line_numbers'] = not self.settings['show_line_numbers']
+        
+        if self.settings['show_line_numbers']:
+            # Recrear o editor com números de linha
+            self.text_editor.pack_forget()
+            self.create_text_editor()
+        else:
+            # Recrear o editor sem números de linha
+            self.text_editor.pack_forget()
+            if hasattr(self, 'line_numbers'):
+                self.line_numbers.pack_forget()
+            self.create_text_editor()
+            
+        self.update_status(f"Números de linha: {'Ativados' if self.settings['show_line_numbers'] else 'Desativados'}")
+    
+    def toggle_line_highlight(self):
+        self.settings['highlight_current_line'] = not self.settings['highlight_current_line']
+        
+        if self.settings['highlight_current_line']:
+            # Destacar linha atual
+            self.highlight_current_line()
+            self.update_status("Destaque de linha atual: Ativado")
+        else:
+            # Remover destaque
+            self.clear_current_line_highlight()
+            self.update_status("Destaque de linha atual: Desativado")
+    
+    def toggle_main_toolbar(self):
+        if self.main_toolbar.winfo_ismapped():
+            self.main_toolbar.pack_forget()
+            self.update_status("Barra de ferramentas principal: Oculta")
+        else:
+            self.main_toolbar.pack(side=tk.TOP, fill=tk.X)
+            self.update_status("Barra de ferramentas principal: Visível")
+    
+    def toggle_format_toolbar(self):
+        if self.format_toolbar.winfo_ismapped():
+            self.format_toolbar.pack_forget()
+            self.update_status("Barra de formatação: Oculta")
+        else:
+            self.format_toolbar.pack(side=tk.TOP, fill=tk.X)
+            self.update_status("Barra de formatação: Visível")
+    
+    def toggle_elements_toolbar(self):
+        if self.elements_toolbar.winfo_ismapped():
+            self.elements_toolbar.pack_forget()
+            self.update_status("Barra de elementos: Oculta")
+        else:
+            self.elements_toolbar.pack(side=tk.TOP, fill=tk.X)
+            self.update_status("Barra de elementos: Visível")
+    
+    def toggle_sidebar(self):
+        if self.sidebar.winfo_ismapped():
+            self.sidebar.pack_forget()
+            self.update_status("Barra lateral: Oculta")
+        else:
+            self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
+            self.update_status("Barra lateral: Visível")
+    
+    def toggle_status_bar(self):
+        if self.status_bar.winfo_ismapped():
+            self.status_bar.pack_forget()
+            self.update_status("Barra de status: Oculta")
+        else:
+            self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+            self.update_status("Barra de status: Visível")
+    
+    def change_theme(self, theme):
+        self.settings['theme'] = theme
+        self.apply_theme()
+        
+        # Atualizar cores dos componentes
+        self.root.configure(bg=self.bg_color)
+        self.status_bar.configure(bg=self.secondary_color)
+        self.status_label.configure(bg=self.secondary_color, fg=self.fg_color)
+        self.word_count_label.configure(bg=self.secondary_color, fg=self.fg_color)
+        self.cursor_pos_label.configure(bg=self.secondary_color, fg=self.fg_color)
+        self.element_format_label.configure(bg=self.secondary_color, fg=self.fg_color)
+        
+        # Atualizar cores do editor
+        self.text_editor.configure(bg=self.bg_color, fg=self.fg_color)
+        
+        # Atualizar cores das barras de ferramentas
+        self.main_toolbar.configure(bg=self.secondary_color)
+        self.format_toolbar.configure(bg=self.secondary_color)
+        self.elements_toolbar.configure(bg=self.secondary_color)
+        
+        for widget in self.main_toolbar.winfo_children():
+            if isinstance(widget, tk.Button):
+                widget.configure(bg=self.secondary_color, fg=self.fg_color)
+                
+        for widget in self.format_toolbar.winfo_children():
+            if isinstance(widget, tk.Button):
+                widget.configure(bg=self.secondary_color, fg=self.fg_color)
+                
+        for widget in self.elements_toolbar.winfo_children():
+            if isinstance(widget, tk.Button):
+                widget.configure(bg=self.secondary_color, fg=self.fg_color)
+        
+        # Atualizar cores do menu lateral
+        self.sidebar.configure(bg=self.blue_color)
+        self.toggle_button.configure(bg=self.blue_color, fg=self.fg_color)
+        
+        # Atualizar cores das abas
+        self.characters_frame.configure(bg=self.blue_color)
+        self.scenes_frame.configure(bg=self.blue_color)
+        self.notes_frame.configure(bg=self.blue_color)
+        
+        # Atualizar cores dos widgets das abas
+        self.characters_listbox.configure(bg=self.secondary_color, fg=self.fg_color)
+        self.script_characters_listbox.configure(bg=self.secondary_color, fg=self.fg_color)
+        self.scenes_listbox.configure(bg=self.secondary_color, fg=self.fg_color)
+        self.script_scenes_listbox.configure(bg=self.secondary_color, fg=self.fg_color)
+        self.scene_list_version = None  # recriar a lista (e o destaque da cena atual) com as novas cores
+        self.mark_dirty('scene')
+        self.notes_editor.configure(bg=self.secondary_color, fg=self.fg_color)
+        
+        # Atualizar cores da barra de busca
+        for bar in (self.find_bar, self.filter_bar):
+            bar.configure(bg=self.secondary_color)
+        for widget in self.find_bar.winfo_children() + self.filter_bar.winfo_children():
+            if isinstance(widget, ttk.Widget):
+                continue
+            elif isinstance(widget, tk.Entry):
+                widget.configure(bg=self.bg_color, fg=self.fg_color)
+            elif isinstance(widget, tk.Checkbutton):
+                widget.configure(bg=self.secondary_color, fg=self.fg_color, selectcolor=self.bg_color,
+                                 activebackground=self.secondary_color)
+            else:
+                widget.configure(bg=self.secondary_color, fg=self.fg_color)
+        self.text_editor.tag_configure("search_match", background=self.blue_color)
+        
+        self.update_status(f"Tema alterado: {'Claro' if theme == 'light' else 'Escuro'}")
+    
+    def zoom_in(self):
+        current_size = self.settings['font_size']
+        if current_size < 24:
+            self.settings['font_size'] += 1
+            self.default_font = font.Font(family=self.settings['font_family'], size=self.settings['font_size'])
+            self.text_editor.config(font=self.default_font)
+            
+            # Atualizar tags de formatação
+            self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
+            self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
+            self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
+            self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
+                                          foreground="#cccccc")
+            
+            # Atualizar números de linha
+            if self.settings['show_line_numbers']:
+                self.update_line_numbers()
+                
+            self.update_status(f"Zoom: {self.settings['font_size']}pt")
+    
+    def zoom_out(self):
+        current_size = self.settings['font_size']
+        if current_size > 8:
+            self.settings['font_size'] -= 1
+            self.default_font = font.Font(family=self.settings['font_family'], size=self.settings['font_size'])
+            self.text_editor.config(font=self.default_font)
+            
+            # Atualizar tags de formatação
+            self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
+            self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
+            self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
+            self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
+                                          foreground="#cccccc")
+            
+            # Atualizar números de linha
+            if self.settings['show_line_numbers']:
+                self.update_line_numbers()
+                
+            self.update_status(f"Zoom: {self.settings['font_size']}pt")
+    
+    def zoom_normal(self):
+        self.settings['font_size'] = 12
+        self.default_font = font.Font(family=self.settings['font_family'], size=self.settings['font_size'])
+        self.text_editor.config(font=self.default_font)
+        
+        # Atualizar tags de formatação
+        self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
+        self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
+        self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
+        self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
+                                      foreground=self.highlight_color)
+        self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
+                                      foreground=self.highlight_color)
+        self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
+                                      foreground=self.highlight_color)
+        self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
+                                      foreground="#cccccc")
+        
+        # Atualizar números de linha
+        if self.settings['show_line_numbers']:
+            self.update_line_numbers()
+            
+        self.update_status(f"Zoom: {self.settings['font_size']}pt")
+    
+    def toggle_auto_save(self):
+        self.settings['auto_save'] = not self.settings['auto_save']
+        if self.settings['auto_save']:
+            messagebox.showinfo("Auto-salvar", "Auto-salvamento ativado!")
+            self.update_status("Auto-salvamento ativado")
+        else:
+            messagebox.showinfo("Auto-salvar", "Auto-salvamento desativado!")
+            self.update_status("Auto-salvamento desativado")
+    
+    def manage_characters(self):
+        # Criar janela de gerenciamento de personagens
+        char_window = tk.Toplevel(self.root)
+        char_window.title("Gerenciar Personagens")
+        char_window.geometry("500x400")
+        char_window.configure(bg=self.secondary_color)
+        char_window.transient(self.root)
+        char_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(char_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Lista de personagens
+        list_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(list_frame, text="Personagens:", bg=self.secondary_color, fg=self.fg_color, 
+                font=self.title_font).pack(anchor=tk.W, pady=5)
+        
+        # Lista com scrollbar
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        char_list = tk.Listbox(list_frame, bg=self.bg_color, fg=self.fg_color, 
+                              yscrollcommand=scrollbar.set, height=10)
+        char_list.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=char_list.yview)
+        
+        # Preencher lista
+        for char in self.characters:
+            char_list.insert(tk.END, char['name'])
+        
+        # Detalhes do personagem
+        details_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        details_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Label(details_frame, text="Nome:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        name_entry = tk.Entry(details_frame, bg=self.bg_color, fg=self.fg_color, width=40)
+        name_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        
+        tk.Label(details_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
+        desc_text = tk.Text(details_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=40)
+        desc_text.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        
+        def add_character():
+            name = name_entry.get().strip()
+            if not name:
+                messagebox.showwarning("Aviso", "Por favor, insira um nome para o personagem.")
+                return
+                
+            description = desc_text.get(1.0, tk.END).strip()
+            
+            # Verificar se já existe
+            for char in self.characters:
+                if char['name'].lower() == name.lower():
+                    messagebox.showwarning("Aviso", "Já existe um personagem com este nome.")
+                    return
+            
+            # Adicionar personagem
+            self.characters.append({
+                'name': name,
+                'description': description
+            })
+            
+            # Atualizar listas
+            char_list.insert(tk.END, name)
+            self.characters_listbox.insert(tk.END, self.character_list_label(name))
+            
+            # Limpar campos
+            name_entry.delete(0, tk.END)
+            desc_text.delete(1.0, tk.END)
+            
+            self.update_status(f"Personagem adicionado: {name}")
+        
+        def update_character():
+            selection = char_list.curselection()
+            if not selection:
+                messagebox.showwarning("Aviso", "Por favor, selecione um personagem para editar.")
+                return
+                
+            index = selection[0]
+            name = name_entry.get().strip()
+            if not name:
+                messagebox.showwarning("Aviso", "Por favor, insira um nome para o personagem.")
+                return
+                
+            description = desc_text.get(1.0, tk.END).strip()
+            
+            # Verificar se já existe (exceto o atual)
+            for i, char in enumerate(self.characters):
+                if i != index and char['name'].lower() == name.lower():
+                    messagebox.showwarning("Aviso", "Já existe um personagem com este nome.")
+                    return
+            
+            # Atualizar personagem
+            self.characters[index] = {
+                'name': name,
+                'description': description
+            }
+            
+            # Atualizar listas
+            char_list.delete(index)
+            char_list.insert(index, name)
+            char_list.selection_set(index)
+            
+            self.characters_listbox.delete(index)
+            self.characters_listbox.insert(index, self.character_list_label(name))
+            
+            self.update_status(f"Personagem atualizado: {name}")
+        
+        def delete_character():
+            selection = char_list.curselection()
+            if not selection:
+                messagebox.showwarning("Aviso", "Por favor, selecione um personagem para remover.")
+                return
+                
+            index = selection[0]
+            name = self.characters[index]['name']
+            
+            if messagebox.askyesno("Confirmar", f"Deseja realmente remover o personagem '{name}'?"):
+                # Remover personagem
+                del self.characters[index]
+                
+                # Atualizar listas
+                char_list.delete(index)
+                self.characters_listbox.delete(index)
+                
+                # Limpar campos
+                name_entry.delete(0, tk.END)
+                desc_text.delete(1.0, tk.END)
+                
+                self.update_status(f"Personagem removido: {name}")
+        
+        def select_character(event=None):
+            selection = char_list.curselection()
+            if selection:
+                index = selection[0]
+                char = self.characters[index]
+                name_entry.delete(0, tk.END)
+                name_entry.insert(0, char['name'])
+                desc_text.delete(1.0, tk.END)
+                desc_text.insert(1.0, char['description'])
+        
+        # Configurar eventos
+        char_list.bind('<<ListboxSelect>>', select_character)
+        
+        # Botões
+        add_btn = tk.Button(button_frame, text="Adicionar", command=add_character,
+                           bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        add_btn.pack(side=tk.LEFT, padx=5)
+        
+        update_btn = tk.Button(button_frame, text="Atualizar", command=update_character,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        update_btn.pack(side=tk.LEFT, padx=5)
+        
+        delete_btn = tk.Button(button_frame, text="Remover", command=delete_character,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        delete_btn.pack(side=tk.LEFT, padx=5)
+        
+        close_btn = tk.Button(button_frame, text="Fechar", command=char_window.destroy,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        close_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Configurar grid
+        details_frame.columnconfigure(1, weight=1)
+    
+    def add_character(self):
+        # Criar janela para adicionar personagem
+        add_window = tk.Toplevel(self.root)
+        add_window.title("Adicionar Personagem")
+        add_window.geometry("400x200")
+        add_window.configure(bg=self.secondary_color)
+        add_window.transient(self.root)
+        add_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(add_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Campos
+        tk.Label(main_frame, text="Nome:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        name_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        name_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        name_entry.focus_set()
+        
+        tk.Label(main_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
+        desc_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=30)
+        desc_text.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        
+        def save_character():
+            name = name_entry.get().strip()
+            if not name:
+                messagebox.showwarning("Aviso", "Por favor, insira um nome para o personagem.")
+                return
+                
+            description = desc_text.get(1.0, tk.END).strip()
+            
+            # Verificar se já existe
+            for char in self.characters:
+                if char['name'].lower() == name.lower():
+                    messagebox.showwarning("Aviso", "Já existe um personagem com este nome.")
+                    return
+            
+            # Adicionar personagem
+            self.characters.append({
+                'name': name,
+                'description': description
+            })
+            
+            # Atualizar lista
+            self.characters_listbox.insert(tk.END, self.character_list_label(name))
+            
+            add_window.destroy()
+            self.update_status(f"Personagem adicionado: {name}")
+        
+        save_btn = tk.Button(button_frame, text="Salvar", command=save_character,
+                            bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        save_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=add_window.destroy,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+    
+    def edit_character(self):
+        selection = self.characters_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("Aviso", "Por favor, selecione um personagem para editar.")
+            return
+            
+        index = selection[0]
+        char = self.characters[index]
+        
+        # Criar janela para editar personagem
+        edit_window = tk.Toplevel(self.root)
+        edit_window.title("Editar Personagem")
+        edit_window.geometry("400x200")
+        edit_window.configure(bg=self.secondary_color)
+        edit_window.transient(self.root)
+        edit_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(edit_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Campos
+        tk.Label(main_frame, text="Nome:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        name_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        name_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        name_entry.insert(0, char['name'])
+        name_entry.focus_set()
+        
+        tk.Label(main_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
+        desc_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=30)
+        desc_text.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        desc_text.insert(1.0, char['description'])
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        
+        def update_character():
+            name = name_entry.get().strip()
+            if not name:
+                messagebox.showwarning("Aviso", "Por favor, insira um nome para o personagem.")
+                return
+                
+            description = desc_text.get(1.0, tk.END).strip()
+            
+            # Verificar se já existe (exceto o atual)
+            for i, c in enumerate(self.characters):
+                if i != index and c['name'].lower() == name.lower():
+                    messagebox.showwarning("Aviso", "Já existe um personagem com este nome.")
+                    return
+            
+            # Atualizar personagem
+            self.characters[index] = {
+                'name': name,
+                'description': description
+            }
+            
+            # Atualizar lista
+            self.characters_listbox.delete(index)
+            self.characters_listbox.insert(index, self.character_list_label(name))
+            self.characters_listbox.selection_set(index)
+            
+            edit_window.destroy()
+            self.update_status(f"Personagem atualizado: {name}")
+        
+        update_btn = tk.Button(button_frame, text="Atualizar", command=update_character,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        update_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=edit_window.destroy,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+    
+    def remove_character(self):
+        selection = self.characters_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("Aviso", "Por favor, selecione um personagem para remover.")
+            return
+            
+        index = selection[0]
+        name = self.characters[index]['name']
+        
+        if messagebox.askyesno("Confirmar", f"Deseja realmente remover o personagem '{name}'?"):
+            # Remover personagem
+            del self.characters[index]
+            
+            # Atualizar lista
+            self.characters_listbox.delete(index)
+            
+            self.update_status(f"Personagem removido: {name}")
+    
+    def manage_scenes(self):
+        # Criar janela de gerenciamento de cenas
+        scene_window = tk.Toplevel(self.root)
+        scene_window.title("Gerenciar Cenas")
+        scene_window.geometry("500x400")
+        scene_window.configure(bg=self.secondary_color)
+        scene_window.transient(self.root)
+        scene_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(scene_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Lista de cenas
+        list_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(list_frame, text="Cenas:", bg=self.secondary_color, fg=self.fg_color, 
+                font=self.title_font).pack(anchor=tk.W, pady=5)
+        
+        # Lista com scrollbar
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        scene_list = tk.Listbox(list_frame, bg=self.bg_color, fg=self.fg_color, 
+                               yscrollcommand=scrollbar.set, height=10)
+        scene_list.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=scene_list.yview)
+        
+        # Preencher lista
+        for scene in self.scenes:
+            scene_list.insert(tk.END, scene['title'])
+        
+        # Detalhes da cena
+        details_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        details_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Label(details_frame, text="Título:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        title_entry = tk.Entry(details_frame, bg=self.bg_color, fg=self.fg_color, width=40)
+        title_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        
+        tk.Label(details_frame, text="Local:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
+        location_entry = tk.Entry(details_frame, bg=self.bg_color, fg=self.fg_color, width=40)
+        location_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        
+        tk.Label(details_frame, text="Horário:", bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
+        time_entry = tk.Entry(details_frame, bg=self.bg_color, fg=self.fg_color, width=40)
+        time_entry.grid(row=2, column=1, sticky=tk.EW, pady=5)
+        
+        tk.Label(details_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
+        desc_text = tk.Text(details_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=40)
+        desc_text.grid(row=3, column=1, sticky=tk.EW, pady=5)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
+        
+        def add_scene():
+            title = title_entry.get().strip()
+            if not title:
+                messagebox.showwarning("Aviso", "Por favor, insira um título para a cena.")
+                return
+                
+            location = location_entry.get().strip()
+            time = time_entry.get().strip()
+            description = desc_text.get(1.0, tk.END).strip()
+            
+            # Verificar se já existe
+            for scene in self.scenes:
+                if scene['title'].lower() == title.lower():
+                    messagebox.showwarning("Aviso", "Já existe uma cena com este título.")
+                    return
+            
+            # Adicionar cena
+            self.scenes.append({
+                'title': title,
+                'location': location,
+                'time': time,
+                'description': description
+            })
+            
+            # Atualizar listas
+            scene_list.insert(tk.END, title)
+            self.scenes_listbox.insert(tk.END, title)
+            
+            # Limpar campos
+            title_entry.delete(0, tk.END)
+            location_entry.delete(0, tk.END)
+            time_entry.delete(0, tk.END)
+            desc_text.delete(1.0, tk.END)
+            
+            self.update_status(f"Cena adicionada: {title}")
+        
+        def update_scene():
+            selection = scene_list.curselection()
+            if not selection:
+                messagebox.showwarning("Aviso", "Por favor, selecione uma cena para editar.")
+                return
+                
+            index = selection[0]
+            title = title_entry.get().strip()
+            if not title:
+                messagebox.showwarning("Aviso", "Por favor, insira um título para a cena.")
+                return
+                
+            location = location_entry.get().strip()
+            time = time_entry.get().strip()
+            description = desc_text.get(1.0, tk.END).strip()
+            
+            # Verificar se já existe (exceto a atual)
+            for i, scene in enumerate(self.scenes):
+                if i != index and scene['title'].lower() == title.lower():
+                    messagebox.showwarning("Aviso", "Já existe uma cena com este título.")
+                    return
+            
+            # Atualizar cena
+            self.scenes[index] = {
+                'title': title,
+                'location': location,
+                'time': time,
+                'description': description
+            }
+            
+            # Atualizar listas
+            scene_list.delete(index)
+            scene_list.insert(index, title)
+            scene_list.selection_set(index)
+            
+            self.scenes_listbox.delete(index)
+            self.scenes_listbox.insert(index, title)
+            
+            self.update_status(f"Cena atualizada: {title}")
+        
+        def delete_scene():
+            selection = scene_list.curselection()
+            if not selection:
+                messagebox.showwarning("Aviso", "Por favor, selecione uma cena para remover.")
+                return
+                
+            index = selection[0]
+            title = self.scenes[index]['title']
+            
+            if messagebox.askyesno("Confirmar", f"Deseja realmente remover a cena '{title}'?"):
+                # Remover cena
+                del self.scenes[index]
+                
+                # Atualizar listas
+                scene_list.delete(index)
+                self.scenes_listbox.delete(index)
+                
+                # Limpar campos
+                title_entry.delete(0, tk.END)
+                location_entry.delete(0, tk.END)
+                time_entry.delete(0, tk.END)
+                desc_text.delete(1.0, tk.END)
+                
+                self.update_status(f"Cena removida: {title}")
+        
+        def select_scene(event=None):
+            selection = scene_list.curselection()
+            if selection:
+                index = selection[0]
+                scene = self.scenes[index]
+                title_entry.delete(0, tk.END)
+                title_entry.insert(0, scene['title'])
+                location_entry.delete(0, tk.END)
+                location_entry.insert(0, scene['location'])
+                time_entry.delete(0, tk.END)
+                time_entry.insert(0, scene['time'])
+                desc_text.delete(1.0, tk.END)
+                desc_text.insert(1.0, scene['description'])
+        
+        # Configurar eventos
+        scene_list.bind('<<ListboxSelect>>', select_scene)
+        
+        # Botões
+        add_btn = tk.Button(button_frame, text="Adicionar", command=add_scene,
+                           bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        add_btn.pack(side=tk.LEFT, padx=5)
+        
+        update_btn = tk.Button(button_frame, text="Atualizar", command=update_scene,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        update_btn.pack(side=tk.LEFT, padx=5)
+        
+        delete_btn = tk.Button(button_frame, text="Remover", command=delete_scene,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        delete_btn.pack(side=tk.LEFT, padx=5)
+        
+        close_btn = tk.Button(button_frame, text="Fechar", command=scene_window.destroy,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        close_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Configurar grid
+        details_frame.columnconfigure(1, weight=1)
+    
+    def add_scene(self):
+        # Criar janela para adicionar cena
+        add_window = tk.Toplevel(self.root)
+        add_window.title("Adicionar Cena")
+        add_window.geometry("400x250")
+        add_window.configure(bg=self.secondary_color)
+        add_window.transient(self.root)
+        add_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(add_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Campos
+        tk.Label(main_frame, text="Título:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        title_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        title_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        title_entry.focus_set()
+        
+        tk.Label(main_frame, text="Local:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
+        location_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        location_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        
+        tk.Label(main_frame, text="Horário:", bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
+        time_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        time_entry.grid(row=2, column=1, sticky=tk.EW, pady=5)
+        
+        tk.Label(main_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
+        desc_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=30)
+        desc_text.grid(row=3, column=1, sticky=tk.EW, pady=5)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
+        
+        def save_scene():
+            title = title_entry.get().strip()
+            if not title:
+                messagebox.showwarning("Aviso", "Por favor, insira um título para a cena.")
+                return
+                
+            location = location_entry.get().strip()
+            time = time_entry.get().strip()
+            description = desc_text.get(1.0, tk.END).strip()
+            
+            # Verificar se já existe
+            for scene in self.scenes:
+                if scene['title'].lower() == title.lower():
+                    messagebox.showwarning("Aviso", "Já existe uma cena com este título.")
+                    return
+            
+            # Adicionar cena
+            self.scenes.append({
+                'title': title,
+                'location': location,
+                'time': time,
+                'description': description
+            })
+            
+            # Atualizar lista
+            self.scenes_listbox.insert(tk.END, title)
+            
+            add_window.destroy()
+            self.update_status(f"Cena adicionada: {title}")
+        
+        save_btn = tk.Button(button_frame, text="Salvar", command=save_scene,
+                            bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        save_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=add_window.destroy,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+    
+    def edit_scene(self):
+        selection = self.scenes_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("Aviso", "Por favor, selecione uma cena para editar.")
+            return
+            
+        index = selection[0]
+        scene = self.scenes[index]
+        
+        # Criar janela para editar cena
+        edit_window = tk.Toplevel(self.root)
+        edit_window.title("Editar Cena")
+        edit_window.geometry("400x250")
+        edit_window.configure(bg=self.secondary_color)
+        edit_window.transient(self.root)
+        edit_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(edit_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Campos
+        tk.Label(main_frame, text="Título:", bg=self.secondary_color, fg=self.fg_color).grid(row=0, column=0, sticky=tk.W, pady=5)
+        title_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        title_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        title_entry.insert(0, scene['title'])
+        title_entry.focus_set()
+        
+        tk.Label(main_frame, text="Local:", bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
+        location_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        location_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        location_entry.insert(0, scene['location'])
+        
+        tk.Label(main_frame, text="Horário:", bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
+        time_entry = tk.Entry(main_frame, bg=self.bg_color, fg=self.fg_color, width=30)
+        time_entry.grid(row=2, column=1, sticky=tk.EW, pady=5)
+        time_entry.insert(0, scene['time'])
+        
+        tk.Label(main_frame, text="Descrição:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
+        desc_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, height=5, width=30)
+        desc_text.grid(row=3, column=1, sticky=tk.EW, pady=5)
+        desc_text.insert(1.0, scene['description'])
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
+        
+        def update_scene():
+            title = title_entry.get().strip()
+            if not title:
+                messagebox.showwarning("Aviso", "Por favor, insira um título para a cena.")
+                return
+                
+            location = location_entry.get().strip()
+            time = time_entry.get().strip()
+            description = desc_text.get(1.0, tk.END).strip()
+            
+            # Verificar se já existe (exceto a atual)
+            for i, s in enumerate(self.scenes):
+                if i != index and s['title'].lower() == title.lower():
+                    messagebox.showwarning("Aviso", "Já existe uma cena com este título.")
+                    return
+            
+            # Atualizar cena
+            self.scenes[index] = {
+                'title': title,
+                'location': location,
+                'time': time,
+                'description': description
+            }
+            
+            # Atualizar lista
+            self.scenes_listbox.delete(index)
+            self.scenes_listbox.insert(index, title)
+            self.scenes_listbox.selection_set(index)
+            
+            edit_window.destroy()
+            self.update_status(f"Cena atualizada: {title}")
+        
+        update_btn = tk.Button(button_frame, text="Atualizar", command=update_scene,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        update_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=edit_window.destroy,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+    
+    def remove_scene(self):
+        selection = self.scenes_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("Aviso", "Por favor, selecione uma cena para remover.")
+            return
+            
+        index = selection[0]
+        title = self.scenes[index]['title']
+        
+        if messagebox.askyesno("Confirmar", f"Deseja realmente remover a cena '{title}'?"):
+            # Remover cena
+            del self.scenes[index]
+            
+            # Atualizar lista
+            self.scenes_listbox.delete(index)
+            
+            self.update_status(f"Cena removida: {title}")
+    
+    def save_notes(self):
+        # Salvar notas no arquivo de metadados
+        self.save_metadata()
+        self.update_status("Notas salvas")
+    
+    def word_count(self):
+        word_count = self.document.words
+        char_count = self.document.char_count
+        messagebox.showinfo("Contagem de Palavras", 
+                           f"Palavras: {word_count}\nCaracteres: {char_count}")
+    
+    def estimate_reading_time(self):
+        word_count = self.document.words
+        
+        # Estimativa: 200 palavras por minuto
+        reading_time_minutes = word_count / 200
+        
+        # Converter para minutos e segundos
+        minutes = int(reading_time_minutes)
+        seconds = int((reading_time_minutes - minutes) * 60)
+        
+        messagebox.showinfo("Tempo de Leitura", 
+                           f"Tempo estimado de leitura: {minutes} minutos e {seconds} segundos\n"
+                           f"Baseado em 200 palavras por minuto")
+    
+    def show_performance(self):
+        # Janela não modal: pode ficar aberta enquanto se digita no editor
+        perf_window = tk.Toplevel(self.root)
+        perf_window.title("Desempenho")
+        perf_window.geometry("720x420")
+        perf_window.configure(bg=self.secondary_color)
+        perf_window.transient(self.root)
+        refresh_key = f'perf_refresh_{id(perf_window)}'  # cada janela aberta atualiza a sua tabela
+        
+        main_frame = tk.Frame(perf_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        tk.Label(main_frame, text="Latência das rotinas do editor (ms):", 
+                bg=self.secondary_color, fg=self.fg_color, font=self.title_font).pack(anchor=tk.W, pady=5)
+        
+        # Ativar/desativar a coleta
+        enabled_var = tk.IntVar(value=1 if self.perf.enabled else 0)
+        
+        def toggle_instrumentation():
+            self.perf.enabled = bool(enabled_var.get())
+            self.settings['perf_instrumentation'] = self.perf.enabled
+            self.save_settings()
+        
+        tk.Checkbutton(main_frame, text="Coletar medições", variable=enabled_var, 
+                      command=toggle_instrumentation,
+                      bg=self.secondary_color, fg=self.fg_color,
+                      selectcolor=self.bg_color, activebackground=self.secondary_color,
+                      activeforeground=self.fg_color).pack(anchor=tk.W)
+        
+        # Tabela de rotinas
+        table_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        table_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        columns = ('calls', 'p50', 'p95', 'p99', 'max')
+        headings = {'calls': "Chamadas", 'p50': "p50", 'p95': "p95", 'p99': "p99", 'max': "Máx"}
+        
+        scrollbar = tk.Scrollbar(table_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        table = ttk.Treeview(table_frame, columns=columns, yscrollcommand=scrollbar.set)
+        table.heading('#0', text="Rotina")
+        table.column('#0', width=220)
+        for column in columns:
+            table.heading(column, text=headings[column])
+            table.column(column, width=80, anchor=tk.E)
+        table.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=table.yview)
+        
+        summary_var = tk.StringVar()
+        tk.Label(main_frame, textvariable=summary_var, 
+                bg=self.secondary_color, fg=self.fg_color).pack(anchor=tk.W)
+        
+        def refresh():
+            table.delete(*table.get_children())
+            for row in self.perf.summary():
+                table.insert('', tk.END, text=row['name'], 
+                            values=(row['calls'], f"{row['p50']:.2f}", f"{row['p95']:.2f}", 
+                                    f"{row['p99']:.2f}", f"{row['max']:.2f}"))
+            state = "ativa" if self.perf.enabled else "desativada"
+            summary_var.set(f"Coleta {state} - callbacks agendados: {self.scheduler.pending_count}")
+            
+            # Atualizar periodicamente enquanto a janela estiver aberta
+            self.scheduler.schedule(refresh_key, 1000, refresh)
+        
+        def clear():
+            self.perf.reset()
+            refresh()
+        
+        def export():
+            json_path = filedialog.asksaveasfilename(
+                parent=perf_window,
+                initialdir=self.settings['last_dir'],
+                defaultextension=".json",
+                filetypes=[("Arquivos JSON", "*.json"), ("Todos os Arquivos", "*.*")]
+            )
+            if json_path:
+                try:
+                    self.perf.export_json(json_path, extra={
+                        'document_lines': self.document.line_count,
+                        'document_words': self.document.words,
+                        'settings': {key: self.settings[key] for key in 
+                                     ('update_latency_ms', 'highlight_current_line', 
+                                      'show_line_numbers', 'word_wrap')}
+                    })
+                    self.update_status(f"Medições exportadas: {os.path.basename(json_path)}")
+                except Exception as e:
+                    messagebox.showerror("Erro", f"Não foi possível exportar as medições: {str(e)}", 
+                                         parent=perf_window)
+        
+        def close():
+            self.scheduler.cancel(refresh_key)
+            perf_window.destroy()
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Button(button_frame, text="Fechar", command=close,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="Exportar JSON", command=export,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="Limpar", command=clear,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="Atualizar", command=refresh,
+                 bg=self.blue_color, fg=self.fg_color, bd=0, padx=10).pack(side=tk.RIGHT, padx=5)
+        
+        perf_window.protocol("WM_DELETE_WINDOW", close)
+        refresh()
+    
+    def show_stats(self):
+        word_count = self.document.words
+        char_count = self.document.char_count
+        line_count = self.document.line_count
+        
+        # Contar personagens
+        character_count = len(self.characters)
+        
+        # Contar cenas
+        scene_count = len(self.scenes)
+        
+        # Contar elementos de roteiro
+        counts = self.derived_cache.get_or_compute(self.derived_key('stats'), self.count_elements)
+        
+        # Estimar páginas (considerando 55 linhas por página)
+        page_count = max(1, line_count // 55)
+        
+        stats = f"Estatísticas do Roteiro:\n\n"
+        stats += f"Palavras: {word_count}\n"
+        stats += f"Caracteres: {char_count}\n"
+        stats += f"Linhas: {line_count}\n"
+        stats += f"Páginas (estimado): {page_count}\n\n"
+        stats += f"Elementos de Roteiro:\n"
+        stats += f"Cenas: {counts['scene']}\n"
+        stats += f"Personagens: {counts['character']}\n"
+        stats += f"Diálogos: {counts['dialogue']}\n"
+        stats += f"Ações: {counts['action']}\n"
+        stats += f"Transições: {counts['transition']}\n"
+        stats += f"Notas: {counts['note']}\n\n"
+        stats += f"Personagens cadastrados: {character_count}\n"
+        stats += f"Cenas cadastradas: {scene_count}"
+        
+        messagebox.showinfo("Estatísticas", stats)
+    
+    def count_elements(self):
+        # Linhas de cada tipo de elemento do roteiro
+        counts = dict.fromkeys(ELEMENT_KINDS, 0)
+        for kind, stripped, line in iter_element_lines(self.document.elements()):
+            counts[kind] += 1
+        return counts
+    
+    def check_spelling(self):
+        # Simulação de verificação ortográfica (o texto é montado na thread de trabalho)
+        self.run_in_background("Verificação Ortográfica", self.find_misspelled, self.document.snapshot(), 
+                               on_done=self.show_spelling_results)
+    
+    def find_misspelled(self, snapshot, task=None):
+        # Palavras comuns em português para simulação
+        common_words = [
+            "o", "a", "os", "as", "um", "uma", "uns", "umas", "de", "do", "da", "dos", "das",
+            "em", "no", "na", "nos", "nas", "por", "pelo", "pela", "pelos", "pelas",
+            "com", "como", "para", "sem", "sob", "sobre", "entre", "até", "a", "ante",
+            "após", "desde", "durante", "mediante", "perante", "salvo", "segundo", "senão",
+            "tirante", "fora", "exceto", "que", "se", "não", "é", "ser", "estar", "ter",
+            "haver", "fazer", "ir", "poder", "dizer", "dar", "ver", "saber", "querer",
+            "chegar", "passar", "ficar", "tomar", "voltar", "por", "ainda", "agora", "já",
+            "aqui", "ali", "lá", "acolá", "hoje", "ontem", "amanhã", "depois", "antes",
+            "muito", "pouco", "mais", "menos", "tão", "quanto", "como", "bem", "mal",
+            "grande", "pequeno", "longe", "perto", "alto", "baixo", "melhor", "pior"
+        ]
+        
+        # Dividir texto em palavras
+        words = re.findall(r'\b\w+\b', snapshot.text().lower())
+        
+        # Encontrar palavras que não estão na lista de palavras comuns
+        common_words = set(common_words)
+        misspelled = [word for word in words if word not in common_words and len(word) > 3]
+        
+        # Remover duplicatas
+        return list(set(misspelled))
+    
+    def show_spelling_results(self, misspelled):
+        if misspelled:
+            # Criar janela de verificação ortográfica
+            spell_window = tk.Toplevel(self.root)
+            spell_window.title("Verificação Ortográfica")
+            spell_window.geometry("400x300")
+            spell_window.configure(bg=self.secondary_color)
+            spell_window.transient(self.root)
+            spell_window.grab_set()
+            
+            # Frame principal
+            main_frame = tk.Frame(spell_window, bg=self.secondary_color)
+            main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            
+            tk.Label(main_frame, text="Possíveis erros de ortografia:", 
+                    bg=self.secondary_color, fg=self.fg_color, font=self.title_font).pack(anchor=tk.W, pady=5)
+            
+            # Lista de palavras
+            list_frame = tk.Frame(main_frame, bg=self.secondary_color)
+            list_frame.pack(fill=tk.BOTH, expand=True)
+            
+            scrollbar = tk.Scrollbar(list_frame)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            word_list = tk.Listbox(list_frame, bg=self.bg_color, fg=self.fg_color, 
+                                  yscrollcommand=scrollbar.set)
+            word_list.pack(fill=tk.BOTH, expand=True)
+            scrollbar.config(command=word_list.yview)
+            
+            # Preencher lista
+            for word in sorted(misspelled):
+                word_list.insert(tk.END, word)
+            
+            # Botões
+            button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+            button_frame.pack(fill=tk.X, pady=10)
+            
+            ignore_btn = tk.Button(button_frame, text="Ignorar Tudo", command=spell_window.destroy,
+                                  bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+            ignore_btn.pack(side=tk.RIGHT, padx=5)
+            
+            # Configurar eventos
+            def on_double_click(event):
+                selection = word_list.curselection()
+                if selection:
+                    word = word_list.get(selection[0])
+                    
+                    # Buscar a palavra no texto
+                    text = self.document.text()
+                    pattern = r'\b' + re.escape(word) + r'\b'
+                    matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                    
+                    if matches:
+                        self.search_matches = MatchList((m.start(), m.end()) for m in matches)
+                        self.current_match = -1
+                        self.search_stale = False
+                        self.find_next()
+            
+            word_list.bind('<Double-Button-1>', on_double_click)
+        else:
+            messagebox.showinfo("Verificação Ortográfica", "Nenhum erro de ortografia encontrado.")
+    
+    def analyze_script(self):
+        # Analisar o roteiro e fornecer sugestões; texto inalterado reaproveita a última análise
+        key = self.derived_key('analysis')
+        analysis = self.derived_cache.get(key)
+        if analysis is not None:
+            self.show_analysis(analysis)
+            return
+        
+        def on_done(analysis):
+            self.show_analysis(self.derived_cache.put(key, analysis))
+        
+        self.run_in_background("Análise de Roteiro", self.compute_analysis, self.document.elements(), 
+                               self.document.character_index.summary(), on_done=on_done)
+    
+    def compute_analysis(self, elements, characters=None, task=None):
+        # Análise básica
+        analysis = {
+            'scenes': [],
+            'characters': {},
+            'dialogues': {},  # personagem -> números das linhas de fala (o texto fica no documento)
+            'actions': 0,
+            'transitions': 0,
+            'notes': 0,
+            'issues': [],
+            'suggestions': []
+        }
+        
+        # Falas e primeira aparição já agregadas pelo índice de personagens do documento
+        if characters is not None:
+            for character, (cues, dialogue_lines, words, first_line) in characters.items():
+                analysis['characters'][character] = {
+                    'dialogues': dialogue_lines,
+                    'first_appearance': first_line + 1
+                }
+        
+        lines = elements.lines
+        for index in range(len(elements)):
+            start = elements.starts[index]
+            end = elements.end(index)
+            if task and index % 1000 == 0:
+                task.progress(start, len(lines), "Analisando roteiro...")
+            
+            kind = elements.kind(index)
+            
+            # Identificar elementos de roteiro
+            if kind == 'scene':
+                # Nova cena
+                analysis['scenes'].append({
+                    'title': lines[start].strip()[6:].strip(),
+                    'line': start + 1
+                })
+            elif kind == 'character' and characters is None:
+                # Novo personagem
+                character = elements.speaker(index)
+                if character not in analysis['characters']:
+                    analysis['characters'][character] = {
+                        'dialogues': 0,
+                        'first_appearance': start + 1
+                    }
+            elif kind == 'dialogue':
+                # Falas do personagem atual
+                character = elements.speaker(index)
+                if character not in analysis['dialogues']:
+                    analysis['dialogues'][character] = array('i')
+                analysis['dialogues'][character].extend(range(start + 1, end + 1))
+                if characters is None:
+                    analysis['characters'][character]['dialogues'] += end - start
+            elif kind == 'transition':
+                # Transição
+                analysis['transitions'] += 1
+            elif kind == 'note':
+                # Nota
+                analysis['notes'] += 1
+            elif kind == 'action':
+                # Ação
+                analysis['actions'] += end - start
+        
+        # Gerar problemas e sugestões
+        if len(analysis['scenes']) < 3:
+            analysis['issues'].append("O roteiro tem poucas cenas. Considere adicionar mais cenas para desenvolver melhor a história.")
+        
+        if len(analysis['characters']) < 2:
+            analysis['issues'].append("O roteiro tem poucos personagens. Considere adicionar mais personagens para enriquecer a história.")
+        
+        # Verificar personagens com poucos diálogos
+        for char, data in analysis['characters'].items():
+            if data['dialogues'] < 3:
+                analysis['suggestions'].append(f"O personagem '{char}' tem poucos diálogos. Considere desenvolver mais este personagem.")
+        
+        # Verificar cenas muito longas ou muito curtas
+        scene_lengths = {}
+        last_scene = None
+        for index in range(len(elements)):
+            start = elements.starts[index]
+            if elements.kind(index) == 'scene':
+                scene_name = lines[start].strip()[6:].strip()
+                if scene_name not in scene_lengths:
+                    scene_lengths[scene_name] = {'start': start, 'lines': 0}
+                    last_scene = scene_name
+            elif scene_lengths:
+                # Incrementar contador de linhas para a última cena registrada
+                scene_lengths[last_scene]['lines'] += elements.end(index) - start
+        
+        for scene, data in scene_lengths.items():
+            if data['lines'] < 10:
+                analysis['suggestions'].append(f"A cena '{scene}' parece ser muito curta. Considere adicionar mais detalhes ou diálogos.")
+            elif data['lines'] > 100:
+                analysis['suggestions'].append(f"A cena '{scene}' parece ser muito longa. Considere dividi-la em cenas menores.")
+        
+        return analysis
+    
+    def show_analysis(self, analysis):
+        # Criar janela de análise
+        analysis_window = tk.Toplevel(self.root)
+        analysis_window.title("Análise de Roteiro")
+        analysis_window.geometry("600x500")
+        analysis_window.configure(bg=self.secondary_color)
+        analysis_window.transient(self.root)
+        
+        # Frame principal
+        main_frame = tk.Frame(analysis_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Notebook para abas
+        notebook = ttk.Notebook(main_frame)
+        notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Aba de resumo
+        summary_frame = tk.Frame(notebook, bg=self.secondary_color)
+        notebook.add(summary_frame, text="Resumo")
+        
+        summary_text = tk.Text(summary_frame, bg=self.bg_color, fg=self.fg_color, 
+                             wrap=tk.WORD, bd=0, padx=10, pady=10)
+        summary_text.pack(fill=tk.BOTH, expand=True)
+        
+        summary_content = f"""
+Resumo da Análise:
+
+Cenas: {len(analysis['scenes'])}
+Personagens: {len(analysis['characters'])}
+Ações: {analysis['actions']}
+Diálogos: {sum(data['dialogues'] for data in analysis['characters'].values())}
+Transições: {analysis['transitions']}
+Notas: {analysis['notes']}
+
+Personagens com mais diálogos:
+"""
+        
+        # Ordenar personagens por número de diálogos
+        sorted_characters = sorted(analysis['characters'].items(), key=lambda x: x[1]['dialogues'], reverse=True)
+        
+        for char, data in sorted_characters[:5]:
+            summary_content += f"- {char}: {data['dialogues']} diálogos\n"
+        
+        summary_text.insert(tk.END, summary_content)
+        summary_text.config(state=tk.DISABLED)
+        
+        # Aba de problemas
+        issues_frame = tk.Frame(notebook, bg=self.secondary_color)
+        notebook.add(issues_frame, text="Problemas")
+        
+        issues_text = tk.Text(issues_frame, bg=self.bg_color, fg=self.fg_color, 
+                            wrap=tk.WORD, bd=0, padx=10, pady=10)
+        issues_text.pack(fill=tk.BOTH, expand=True)
+        
+        if analysis['issues']:
+            for issue in analysis['issues']:
+                issues_text.insert(tk.END, f"• {issue}\n\n")
+        else:
+            issues_text.insert(tk.END, "Nenhum problema identificado.")
+        
+        issues_text.config(state=tk.DISABLED)
+        
+        # Aba de sugestões
+        suggestions_frame = tk.Frame(notebook, bg=self.secondary_color)
+        notebook.add(suggestions_frame, text="Sugestões")
+        
+        suggestions_text = tk.Text(suggestions_frame, bg=self.bg_color, fg=self.fg_color, 
+                                  wrap=tk.WORD, bd=0, padx=10, pady=10)
+        suggestions_text.pack(fill=tk.BOTH, expand=True)
+        
+        if analysis['suggestions']:
+            for suggestion in analysis['suggestions']:
+                suggestions_text.insert(tk.END, f"• {suggestion}\n\n")
+        else:
+            suggestions_text.insert(tk.END, "Nenhuma sugestão no momento.")
+        
+        suggestions_text.config(state=tk.DISABLED)
+        
+        # Aba de personagens
+        characters_frame = tk.Frame(notebook, bg=self.secondary_color)
+        notebook.add(characters_frame, text="Personagens")
+        
+        # Lista de personagens
+        list_frame = tk.Frame(characters_frame, bg=self.secondary_color)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        characters_list = tk.Listbox(list_frame, bg=self.bg_color, fg=self.fg_color, 
+                                     yscrollcommand=scrollbar.set)
+        characters_list.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=characters_list.yview)
+        
+        # Preencher lista
+        for char, data in sorted_characters:
+            characters_list.insert(tk.END, f"{char} - {data['dialogues']} diálogos (linha {data['first_appearance']})")
+        
+        # Botão Fechar
+        close_btn = tk.Button(main_frame, text="Fechar", command=analysis_window.destroy,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        close_btn.pack(pady=10)
+    
+    def reformat_script(self):
+        # Reformatar o roteiro de acordo com o padrão da indústria
+        elements = self.document.elements()
+        version = self.document.version
+        
+        def done(reformatted):
+            if self.document.version != version:
+                # O texto mudou enquanto a reformatação rodava; aplicar apagaria as edições
+                messagebox.showwarning("Reformatar Roteiro", 
+                                       "O roteiro foi alterado durante a reformatação. Tente novamente.")
+                return
+            
+            # Atualizar o editor
+            self.document.drop_search_index()
+            self.text_editor.delete(1.0, tk.END)
+            self.text_editor.insert(1.0, reformatted)
+            
+            # Aplicar formatação
+            self.apply_formatting()
+            
+            self.update_status("Roteiro reformatado")
+        
+        self.run_in_background("Reformatar Roteiro", self.reformat_text, elements, 
+                               self.settings['page_width'], on_done=done)
+    
+    def reformat_text(self, elements, page_width, task=None):
+        
+        reformatted_lines = []
+        
+        for kind, stripped, i in iter_element_lines(elements):
+            if task and i % 2000 == 0:
+                task.progress(i, len(elements.lines), "Reformatando...")
+            
+            if kind == 'blank':
+                # Manter linhas em branco
+                reformatted_lines.append("")
+            elif kind == 'scene':
+                # Formatar cena
+                scene_text = stripped[6:].strip().upper()
+                reformatted_lines.append(f"CENA: {scene_text}")
+            elif kind == 'character':
+                # Formatar personagem (centralizado)
+                char_length = len(stripped)
+                total_spaces = page_width - char_length
+                left_spaces = total_spaces // 2
+                reformatted_lines.append(' ' * left_spaces + stripped)
+            elif kind == 'transition':
+                # Formatar transição (alinhado à direita)
+                transition_text = stripped[11:].strip().upper()
+                transition_length = len(transition_text) + 11  # Incluir "TRANSIÇÃO: "
+                total_spaces = page_width - transition_length
+                left_spaces = total_spaces
+                reformatted_lines.append(' ' * left_spaces + f"TRANSIÇÃO: {transition_text}")
+            elif kind == 'note':
+                # Formatar nota
+                note_text = stripped[6:].strip()
+                reformatted_lines.append(f"NOTA: {note_text}")
+            elif kind == 'dialogue':
+                # Formatar diálogo (com recuo)
+                dialogue_text = stripped
+                reformatted_lines.append(' ' * 15 + dialogue_text)
+            else:
+                # Formatar ação (com recuo menor)
+                action_text = stripped
+                reformatted_lines.append(' ' * 10 + action_text)
+        
+        return '\n'.join(reformatted_lines)
+    
+    @instrumented('apply_formatting')
+    def apply_formatting(self):
+        # Refazer as tags de todo o documento (tipos já classificados pelo cache de elementos);
+        # a área visível é formatada primeiro e o resto em fatias ociosas
+        self.tag_dirty.reset(self.document.line_count)
+        self.tag_position = 0
+        self.mark_dirty('tags')
+    
+    def retag_visible(self):
+        # Formatar as linhas pendentes que estão na tela e agendar o restante
+        top = int(self.text_editor.index("@0,0").split('.')[0])
+        bottom = int(self.text_editor.index(f"@0,{self.text_editor.winfo_height()}").split('.')[0])
+        self.format_pending(top - 1, bottom)
+        if self.tag_dirty.pending():
+            self.scheduler.schedule('format_slice', 1, self.format_next_slice)
+    
+    @instrumented('format_slice')
+    def format_next_slice(self):
+        # Formatar linhas pendentes fora da tela até esgotar o orçamento da fatia
+        deadline = time.perf_counter() + FORMAT_SLICE_MS / 1000
+        while time.perf_counter() < deadline:
+            run = self.tag_dirty.next_run(self.tag_position) or self.tag_dirty.next_run(0)
+            if run is None:
+                return
+            start, end = run[0], min(run[1], run[0] + FORMAT_CHUNK_LINES)
+            self.format_lines(start, end)
+            self.tag_position = end
+        self.scheduler.schedule('format_slice', 1, self.format_next_slice)
+    
+    def format_pending(self, start, stop):
+        # Formatar os trechos pendentes dentro de [start, stop) (linhas a partir de 0)
+        run = self.tag_dirty.next_run(start, stop)
+        while run is not None:
+            self.format_lines(*run)
+            run = self.tag_dirty.next_run(run[1], stop)
+    
+    def format_lines(self, start, end):
+        # Trocar as tags de elemento das linhas [start, end) (a partir de 0) pelas do tipo atual
+        first, last = start + 1, end
+        for kind in ('scene', 'character', 'transition', 'note'):
+            self.text_editor.tag_remove(kind, f"{first}.0", f"{last + 1}.0")
+        
+        # Uma chamada tag_add por tipo, com todos os intervalos do trecho
+        ranges = {}
+        types = self.document.types
+        for i in range(start, end):
+            code = types[i]
+            if code in TAGGED_CODES:
+                ranges.setdefault(code, []).extend((f"{i + 1}.0", f"{i + 1}.end"))
+        for code, indices in ranges.items():
+            self.text_editor.tag_add(ELEMENT_KINDS[code], *indices)
+        self.tag_dirty.clear(start, end)
+    
+    def configure_formatting(self):
+        # Criar janela de configuração de formatação
+        format_window = tk.Toplevel(self.root)
+        format_window.title("Configurar Formatação")
+        format_window.geometry("400x300")
+        format_window.configure(bg=self.secondary_color)
+        format_window.transient(self.root)
+        format_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(format_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Configurações
+        tk.Label(main_frame, text="Configurações de Formatação:", bg=self.secondary_color, fg=self.fg_color, 
+                font=self.title_font).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Largura da página
+        tk.Label(main_frame, text="Largura da página (caracteres):", 
+                bg=self.secondary_color, fg=self.fg_color).grid(row=1, column=0, sticky=tk.W, pady=5)
+        
+        page_width_var = tk.IntVar(value=self.settings['page_width'])
+        page_width_spinbox = tk.Spinbox(main_frame, from_=60, to=100, textvariable=page_width_var, 
+                                       bg=self.bg_color, fg=self.fg_color, width=10)
+        page_width_spinbox.grid(row=1, column=1, sticky=tk.W, pady=5)
+        
+        # Largura do personagem
+        tk.Label(main_frame, text="Largura do personagem (caracteres):", 
+                bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
+        
+        character_width_var = tk.IntVar(value=self.settings['character_width'])
+        character_width_spinbox = tk.Spinbox(main_frame, from_=20, to=60, textvariable=character_width_var, 
+                                           bg=self.bg_color, fg=self.fg_color, width=10)
+        character_width_spinbox.grid(row=2, column=1, sticky=tk.W, pady=5)
+        
+        # Largura do diálogo
+        tk.Label(main_frame, text="Largura do diálogo (caracteres):", 
+                bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
+        
+        dialogue_width_var = tk.IntVar(value=self.settings['dialogue_width'])
+        dialogue_width_spinbox = tk.Spinbox(main_frame, from_=20, to=60, textvariable=dialogue_width_var, 
+                                           bg=self.bg_color, fg=self.fg_color, width=10)
+        dialogue_width_spinbox.grid(row=3, column=1, sticky=tk.W, pady=5)
+        
+        # Largura da ação
+        tk.Label(main_frame, text="Largura da ação (caracteres):", 
+                bg=self.secondary_color, fg=self.fg_color).grid(row=4, column=0, sticky=tk.W, pady=5)
+        
+        action_width_var = tk.IntVar(value=self.settings['action_width'])
+        action_width_spinbox = tk.Spinbox(main_frame, from_=20, to=80, textvariable=action_width_var, 
+                                         bg=self.bg_color, fg=self.fg_color, width=10)
+        action_width_spinbox.grid(row=4, column=1, sticky=tk.W, pady=5)
+        
+        # Largura da cena
+        tk.Label(main_frame, text="Largura da cena (caracteres):", 
+                bg=self.secondary_color, fg=self.fg_color).grid(row=5, column=0, sticky=tk.W, pady=5)
+        
+        scene_width_var = tk.IntVar(value=self.settings['scene_width'])
+        scene_width_spinbox = tk.Spinbox(main_frame, from_=20, to=80, textvariable=scene_width_var, 
+                                        bg=self.bg_color, fg=self.fg_color, width=10)
+        scene_width_spinbox.grid(row=5, column=1, sticky=tk.W, pady=5)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=6, column=0, columnspan=2, pady=10)
+        
+        def save_formatting():
+            # Salvar configurações
+            self.settings['page_width'] = page_width_var.get()
+            self.settings['character_width'] = character_width_var.get()
+            self.settings['dialogue_width'] = dialogue_width_var.get()
+            self.settings['action_width'] = action_width_var.get()
+            self.settings['scene_width'] = scene_width_var.get()
+            self.document.set_character_width(self.settings['character_width'])
+            self.mark_dirty('element')
+            self.apply_formatting()
+            
+            format_window.destroy()
+            self.update_status("Configurações de formatação salvas")
+            
+            # Perguntar se deseja reformatar o roteiro
+            if messagebox.askyesno("Reformatar", "Deseja reformatar o roteiro com as novas configurações?"):
+                self.reformat_script()
+        
+        save_btn = tk.Button(button_frame, text="Salvar", command=save_formatting,
+                            bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        save_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=format_window.destroy,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+    
+    def show_settings(self):
+        # Criar janela de configurações
+        settings_window = tk.Toplevel(self.root)
+        settings_window.title("Configurações")
+        settings_window.geometry("400x390")
+        settings_window.configure(bg=self.secondary_color)
+        settings_window.transient(self.root)
+        settings_window.grab_set()
+        
+        # Frame principal
+        main_frame = tk.Frame(settings_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Configurações
+        tk.Label(main_frame, text="Configurações:", bg=self.secondary_color, fg=self.fg_color, 
+                font=self.title_font).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Auto-salvar
+        auto_save_var = tk.IntVar(value=1 if self.settings['auto_save'] else 0)
+        auto_save_check = tk.Checkbutton(main_frame, text="Auto-salvar", variable=auto_save_var,
+                                        bg=self.secondary_color, fg=self.fg_color,
+                                        selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                        activeforeground=self.fg_color)
+        auto_save_check.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Intervalo de auto-salvamento
+        tk.Label(main_frame, text="Intervalo de auto-salvamento (minutos):", 
+                bg=self.secondary_color, fg=self.fg_color).grid(row=2, column=0, sticky=tk.W, pady=5)
+        
+        interval_var = tk.IntVar(value=self.settings['auto_save_interval'])
+        interval_spinbox = tk.Spinbox(main_frame, from_=1, to=60, textvariable=interval_var, 
+                                     bg=self.bg_color, fg=self.fg_color, width=10)
+        interval_spinbox.grid(row=2, column=1, sticky=tk.W, pady=5)
+        
+        # Tema
+        tk.Label(main_frame, text="Tema:", bg=self.secondary_color, fg=self.fg_color).grid(row=3, column=0, sticky=tk.W, pady=5)
+        
+        theme_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        theme_frame.grid(row=3, column=1, sticky=tk.W, pady=5)
+        
+        theme_var = tk.StringVar(value=self.settings['theme'])
+        dark_radio = tk.Radiobutton(theme_frame, text="Escuro", variable=theme_var, value="dark",
+                                   bg=self.secondary_color, fg=self.fg_color,
+                                   selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                   activeforeground=self.fg_color)
+        dark_radio.pack(side=tk.LEFT, padx=5)
+        
+        light_radio = tk.Radiobutton(theme_frame, text="Claro", variable=theme_var, value="light",
+                                    bg=self.secondary_color, fg=self.fg_color,
+                                    selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                    activeforeground=self.fg_color)
+        light_radio.pack(side=tk.LEFT, padx=5)
+        
+        # Fonte
+        tk.Label(main_frame, text="Fonte:", bg=self.secondary_color, fg=self.fg_color).grid(row=4, column=0, sticky=tk.W, pady=5)
+        
+        font_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        font_frame.grid(row=4, column=1, sticky=tk.W, pady=5)
+        
+        font_var = tk.StringVar(value=self.settings['font_family'])
+        font_combo = ttk.Combobox(font_frame, textvariable=font_var, values=sorted(font.families()), width=15)
+        font_combo.pack(side=tk.LEFT, padx=5)
+        
+        # Tamanho da fonte
+        size_var = tk.IntVar(value=self.settings['font_size'])
+        size_spinbox = tk.Spinbox(font_frame, from_=8, to=24, textvariable=size_var, 
+                                 bg=self.bg_color, fg=self.fg_color, width=5)
+        size_spinbox.pack(side=tk.LEFT, padx=5)
+        
+        # Números de linha
+        line_numbers_var = tk.IntVar(value=1 if self.settings['show_line_numbers'] else 0)
+        line_numbers_check = tk.Checkbutton(main_frame, text="Mostrar números de linha", 
+                                           variable=line_numbers_var,
+                                           bg=self.secondary_color, fg=self.fg_color,
+                                           selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                           activeforeground=self.fg_color)
+        line_numbers_check.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Quebra de linha
+        word_wrap_var = tk.IntVar(value=1 if self.settings['word_wrap'] else 0)
+        word_wrap_check = tk.Checkbutton(main_frame, text="Quebra de linha automática", 
+                                        variable=word_wrap_var,
+                                        bg=self.secondary_color, fg=self.fg_color,
+                                        selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                        activeforeground=self.fg_color)
+        word_wrap_check.grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Destacar linha atual
+        line_highlight_var = tk.IntVar(value=1 if self.settings['highlight_current_line'] else 0)
+        line_highlight_check = tk.Checkbutton(main_frame, text="Destacar linha atual", 
+                                            variable=line_highlight_var,
+                                            bg=self.secondary_color, fg=self.fg_color,
+                                            selectcolor=self.bg_color, activebackground=self.secondary_color,
+                                            activeforeground=self.fg_color)
+        line_highlight_check.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Atraso das atualizações durante a digitação
+        tk.Label(main_frame, text="Atraso de atualização (ms):", 
+                bg=self.secondary_color, fg=self.fg_color).grid(row=8, column=0, sticky=tk.W, pady=5)
+        
+        latency_var = tk.IntVar(value=self.settings['update_latency_ms'])
+        latency_spinbox = tk.Spinbox(main_frame, from_=0, to=1000, increment=50, textvariable=latency_var, 
+                                    bg=self.bg_color, fg=self.fg_color, width=10)
+        latency_spinbox.grid(row=8, column=1, sticky=tk.W, pady=5)
+        
+        # Botões
+        button_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        button_frame.grid(row=9, column=0, columnspan=2, pady=10)
+        
+        def save_settings():
+            # Salvar configurações
+            self.settings['auto_save'] = bool(auto_save_var.get())
+            self.settings['auto_save_interval'] = interval_var.get()
+            self.settings['theme'] = theme_var.get()
+            self.settings['font_family'] = font_var.get()
+            self.settings['font_size'] = size_var.get()
+            self.settings['show_line_numbers'] = bool(line_numbers_var.get())
+            self.settings['word_wrap'] = bool(word_wrap_var.get())
+            self.settings['highlight_current_line'] = bool(line_highlight_var.get())
+            self.settings['update_latency_ms'] = max(0, latency_var.get())
+            
+            # Reiniciar o auto-salvamento com o novo intervalo
+            self.scheduler.schedule('auto_save', self.settings['auto_save_interval'] * 60000, self.auto_save)
+            
+            # Aplicar configurações
+            self.change_theme(self.settings['theme'])
+            self.default_font = font.Font(family=self.settings['font_family'], size=self.settings['font_size'])
+            self.text_editor.config(font=self.default_font)
+            
+            # Atualizar tags de formatação
+            self.text_editor.tag_configure("bold", font=self.default_font.copy().configure(weight="bold"))
+            self.text_editor.tag_configure("italic", font=self.default_font.copy().configure(slant="italic"))
+            self.text_editor.tag_configure("underline", font=self.default_font.copy().configure(underline=True))
+            self.text_editor.tag_configure("character", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("scene", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("transition", font=self.default_font.copy().configure(weight="bold"), 
+                                          foreground=self.highlight_color)
+            self.text_editor.tag_configure("note", font=self.default_font.copy().configure(slant="italic"), 
+                                          foreground="#cccccc")
+            
+            # Atualizar quebra de linha
+            wrap_mode = tk.WORD if self.settings['word_wrap'] else tk.NONE
+            self.text_editor.config(wrap=wrap_mode)
+            
+            # Atualizar números de linha
+            if self.settings['show_line_numbers']:
+                if not hasattr(self, 'line_numbers'):
+                    # Recrear o editor com números de linha
+                    self.text_editor.pack_forget()
+                    self.create_text_editor()
+                else:
+                    self.update_line_numbers()
+            else:
+                if hasattr(self, 'line_numbers'):
+                    # Recrear o editor sem números de linha
+                    self.text_editor.pack_forget()
+                    self.line_numbers.pack_forget()
+                    self.create_text_editor()
+            
+            # Atualizar destaque de linha atual
+            if self.settings['highlight_current_line']:
+                self.highlight_current_line()
+            else:
+                self.clear_current_line_highlight()
+            
+            settings_window.destroy()
+            self.update_status("Configurações salvas")
+        
+        save_btn = tk.Button(button_frame, text="Salvar", command=save_settings,
+                            bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        save_btn.pack(side=tk.LEFT, padx=5)
+        
+        cancel_btn = tk.Button(button_frame, text="Cancelar", command=settings_window.destroy,
+                              bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Configurar grid
+        main_frame.columnconfigure(1, weight=1)
+    
+    def show_shortcuts(self):
+        # Criar janela de atalhos
+        shortcuts_window = tk.Toplevel(self.root)
+        shortcuts_window.title("Atalhos de Teclado")
+        shortcuts_window.geometry("500x600")
+        shortcuts_window.configure(bg=self.secondary_color)
+        shortcuts_window.transient(self.root)
+        
+        # Frame principal
+        main_frame = tk.Frame(shortcuts_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Título
+        tk.Label(main_frame, text="Atalhos de Teclado", bg=self.secondary_color, fg=self.fg_color, 
+                font=self.title_font).pack(anchor=tk.W, pady=10)
+        
+        # Frame para atalhos
+        shortcuts_frame = tk.Frame(main_frame, bg=self.secondary_color)
+        shortcuts_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Scrollbar
+        scrollbar = tk.Scrollbar(shortcuts_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Texto com atalhos
+        shortcuts_text = tk.Text(shortcuts_frame, bg=self.bg_color, fg=self.fg_color, 
+                                wrap=tk.WORD, yscrollcommand=scrollbar.set, bd=0, padx=10, pady=10)
+        shortcuts_text.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=shortcuts_text.yview)
+        
+        # Conteúdo
+        shortcuts_content = """
+Arquivo:
+Ctrl+N - Novo Roteiro
+Ctrl+O - Abrir Roteiro
+Ctrl+S - Salvar Roteiro
+Ctrl+Shift+S - Salvar Como
+Ctrl+Alt+S - Salvar Seguro
+Ctrl+E - Exportar PDF
+Ctrl+Q - Sair
+
+Editar:
+Ctrl+Z - Desfazer
+Ctrl+Y - Refazer
+Ctrl+X - Recortar
+Ctrl+C - Copiar
+Ctrl+V - Colar
+Ctrl+F - Buscar
+Ctrl+R - Substituir
+Ctrl+G - Ir Para Linha
+Ctrl+A - Selecionar Tudo
+
+Formato:
+Ctrl+B - Negrito
+Ctrl+I - Itálico
+Ctrl+U - Sublinhado
+Ctrl+P - Inserir Personagem
+Ctrl+D - Inserir Diálogo
+Ctrl+Shift+A - Inserir Ação
+Ctrl+Shift+C - Inserir Cena
+Ctrl+T - Inserir Transição
+Ctrl+Shift+N - Inserir Nota
+
+Visualizar:
+Ctrl++ - Zoom In
+Ctrl+- - Zoom Out
+Ctrl+0 - Zoom Normal
+
+Navegação:
+F3 - Próxima ocorrência
+Shift+F3 - Ocorrência anterior
+        """
+        
+        shortcuts_text.insert(tk.END, shortcuts_content)
+        shortcuts_text.config(state=tk.DISABLED)
+        
+        # Botão Fechar
+        close_btn = tk.Button(main_frame, text="Fechar", command=shortcuts_window.destroy,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        close_btn.pack(pady=10)
+    
+    def show_tutorial(self):
+        # Criar janela de tutorial
+        tutorial_window = tk.Toplevel(self.root)
+        tutorial_window.title("Tutorial")
+        tutorial_window.geometry("700x500")
+        tutorial_window.configure(bg=self.secondary_color)
+        tutorial_window.transient(self.root)
+        
+        # Frame principal
+        main_frame = tk.Frame(tutorial_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Título
+        tk.Label(main_frame, text="Tutorial do Roteirista Pro", bg=self.secondary_color, fg=self.fg_color, 
+                font=self.title_font).pack(anchor=tk.W, pady=10)
+        
+        # Notebook para abas do tutorial
+        tutorial_notebook = ttk.Notebook(main_frame)
+        tutorial_notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Aba 1: Introdução
+        intro_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
+        tutorial_notebook.add(intro_frame, text="Introdução")
+        
+        intro_text = tk.Text(intro_frame, bg=self.bg_color, fg=self.fg_color, 
+                            wrap=tk.WORD, bd=0, padx=10, pady=10)
+        intro_text.pack(fill=tk.BOTH, expand=True)
+        
+        intro_content = """
+Bem-vindo ao Roteirista Pro!
+
+Este é um aplicativo projetado para ajudar roteiristas a criar e formatar roteiros de filmes, séries e vídeos de forma profissional.
+
+Com o Roteirista Pro, você pode:
+
+• Escrever e formatar roteiros no padrão da indústria
+• Gerenciar personagens e cenas
+• Exportar para PDF e outros formatos
+• Usar atalhos de teclado para aumentar sua produtividade
+• Personalizar a aparência do aplicativo
+• Salvar roteiros com segurança usando senha
+• Analisar seu roteiro para obter sugestões de melhoria
+
+Navegue pelas abas deste tutorial para aprender mais sobre cada recurso do aplicativo.
+        """
+        
+        intro_text.insert(tk.END, intro_content)
+        intro_text.config(state=tk.DISABLED)
+        
+        # Aba 2: Interface
+        interface_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
+        tutorial_notebook.add(interface_frame, text="Interface")
+        
+        interface_text = tk.Text(interface_frame, bg=self.bg_color, fg=self.fg_color, 
+                                wrap=tk.WORD, bd=0, padx=10, pady=10)
+        interface_text.pack(fill=tk.BOTH, expand=True)
+        
+        interface_content = """
+Interface do Roteirista Pro
+
+A interface do aplicativo é composta por:
+
+1. Barras de Ferramentas: Localizadas na parte superior, contêm botões para as funções mais comuns, organizadas em três categorias:
+   - Barra principal: funções de arquivo, edição e exportação
+   - Barra de formatação: opções de formatação de texto
+   - Barra de elementos: inserção de elementos de roteiro
+
+2. Menu: Abaixo das barras de ferramentas, oferece acesso a todas as funções do aplicativo.
+
+3. Barra Lateral: No lado esquerdo, contém abas para organizar melhor as ferramentas:
+   - Elementos: inserção de elementos de roteiro
+   - Formatação: opções de formatação de texto
+   - Personagens: gerenciamento de personagens
+   - Cenas: gerenciamento de cenas
+   - Notas: anotações sobre o roteiro
+   - Ferramentas: ferramentas de análise e formatação
+
+4. Editor de Texto: Área principal onde você escreve seu roteiro, com destaque da linha atual e cursor visível.
+
+5. Barra de Status: Na parte inferior, exibe informações sobre o documento, posição do cursor, formato do elemento atual e indicador de salvamento.
+
+Você pode ocultar ou mostrar cada uma das barras de ferramentas e a barra lateral através do menu Visualizar.
+        """
+        
+        interface_text.insert(tk.END, interface_content)
+        interface_text.config(state=tk.DISABLED)
+        
+        # Aba 3: Formatação
+        format_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
+        tutorial_notebook.add(format_frame, text="Formatação")
+        
+        format_text = tk.Text(format_frame, bg=self.bg_color, fg=self.fg_color, 
+                             wrap=tk.WORD, bd=0, padx=10, pady=10)
+        format_text.pack(fill=tk.BOTH, expand=True)
+        
+        format_content = """
+Formatação de Roteiros
+
+O Roteirista Pro facilita a formatação de roteiros no padrão da indústria. Os principais elementos são:
+
+• Cena: Local e horário da cena (ex: "CENA: CASA DE JOÃO - DIA"). Deve estar em maiúsculas.
+
+• Personagem: Nome do personagem em maiúsculas e centralizado.
+
+• Diálogo: Texto falado pelo personagem, com recuo à esquerda.
+
+• Ação: Descrição de ações, cenas e personagens, com recuo menor que o diálogo.
+
+• Transição: Indicações de transição entre cenas (ex: "TRANSIÇÃO: CORTE PARA:"). Alinhado à direita.
+
+• Nota: Comentários ou anotações sobre o roteiro.
+
+Você pode inserir esses elementos usando os botões na barra lateral, no menu Formato ou com atalhos de teclado.
+
+Para formatar texto como negrito, itálico ou sublinhado, selecione o texto e use os botões na barra lateral, no menu Editar ou com atalhos de teclado.
+
+O Roteirista Pro também oferece uma função de reformatar automaticamente todo o roteiro para garantir que ele siga o padrão da indústria.
+        """
+        
+        format_text.insert(tk.END, format_content)
+        format_text.config(state=tk.DISABLED)
+        
+        # Aba 4: Segurança
+        security_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
+        tutorial_notebook.add(security_frame, text="Segurança")
+        
+        security_text = tk.Text(security_frame, bg=self.bg_color, fg=self.fg_color, 
+                              wrap=tk.WORD, bd=0, padx=10, pady=10)
+        security_text.pack(fill=tk.BOTH, expand=True)
+        
+        security_content = """
+Segurança de Roteiros
+
+O Roteirista Pro oferece recursos para proteger seus roteiros:
+
+Salvamento Seguro:
+
+Você pode salvar seus roteiros com proteção por senha usando a função "Salvar Seguro". Isso criptografa o conteúdo do arquivo, tornando-o inacessível sem a senha correta.
+
+Para salvar um roteiro seguro:
+1. Clique em "Salvar Seguro" no menu Arquivo ou na barra lateral
+2. Digite uma senha
+3. Confirme a senha
+4. Escolha onde salvar o arquivo
+
+Para abrir um roteiro seguro:
+1. Clique em "Abrir" no menu Arquivo
+2. Selecione o arquivo seguro (.sec)
+3. Digite a senha correta
+
+Auto-salvamento:
+
+O aplicativo pode salvar automaticamente seu trabalho em intervalos regulares, evitando perda de dados em caso de problemas.
+
+Para configurar o auto-salvamento:
+1. Clique em "Configurações" no menu Ferramentas
+2. Marque a opção "Auto-salvar"
+3. Defina o intervalo de salvamento
+
+Lembre-se de escolher uma senha forte e não compartilhá-la com pessoas não autorizadas.
+        """
+        
+        security_text.insert(tk.END, security_content)
+        security_text.config(state=tk.DISABLED)
+        
+        # Aba 5: Análise
+        analysis_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
+        tutorial_notebook.add(analysis_frame, text="Análise")
+        
+        analysis_text = tk.Text(analysis_frame, bg=self.bg_color, fg=self.fg_color, 
+                               wrap=tk.WORD, bd=0, padx=10, pady=10)
+        analysis_text.pack(fill=tk.BOTH, expand=True)
+        
+        analysis_content = """
+Análise de Roteiros
+
+O Roteirista Pro oferece ferramentas para analisar seu roteiro e obter sugestões de melhoria:
+
+Análise Completa:
+
+A função "Analisar Roteiro" examina seu roteiro e fornece:
+• Contagem de cenas, personagens, diálogos, etc.
+• Identificação de possíveis problemas (poucas cenas, poucos personagens, etc.)
+• Sugestões para melhorar o roteiro
+• Lista de personagens e suas estatísticas
+
+Tempo de Leitura:
+
+Calcula o tempo estimado para ler o roteiro, baseado em 200 palavras por minuto.
+
+Estatísticas:
+
+Fornece estatísticas detalhadas sobre o roteiro, incluindo:
+• Número de palavras e caracteres
+• Número de linhas e páginas estimadas
+• Contagem de cada tipo de elemento de roteiro
+• Informações sobre personagens e cenas
+
+Verificação Ortográfica:
+
+Verifica o texto em busca de possíveis erros de ortografia e permite que você corrija-os facilmente.
+
+Para usar essas ferramentas, acesse o menu Ferramentas ou a aba "Ferramentas" na barra lateral.
+        """
+        
+        analysis_text.insert(tk.END, analysis_content)
+        analysis_text.config(state=tk.DISABLED)
+        
+        # Aba 6: Exportação
+        export_frame = tk.Frame(tutorial_notebook, bg=self.secondary_color)
+        tutorial_notebook.add(export_frame, text="Exportação")
+        
+        export_text = tk.Text(export_frame, bg=self.bg_color, fg=self.fg_color, 
+                             wrap=tk.WORD, bd=0, padx=10, pady=10)
+        export_text.pack(fill=tk.BOTH, expand=True)
+        
+        export_content = """
+Exportação de Roteiros
+
+O Roteirista Pro oferece várias opções de exportação:
+
+PDF:
+
+Para exportar seu roteiro como PDF:
+1. Salve seu roteiro (Ctrl+S)
+2. Clique em "Exportar PDF" no menu Arquivo ou na barra de ferramentas
+3. Escolha o local para salvar o arquivo PDF
+
+HTML:
+
+Para exportar seu roteiro como HTML:
+1. Salve seu roteiro (Ctrl+S)
+2. Clique em "Exportar HTML" no menu Arquivo
+3. Escolha o local para salvar o arquivo HTML
+
+Fountain:
+
+Para exportar seu roteiro como Fountain:
+1. Salve seu roteiro (Ctrl+S)
+2. Clique em "Exportar Fountain" no menu Arquivo
+3. Escolha o local para salvar o arquivo Fountain
+
+O formato Fountain é um formato de texto simples para roteiros que pode ser lido por humanos e processado por software.
+
+Impressão:
+
+Para imprimir seu roteiro:
+1. Salve seu roteiro (Ctrl+S)
+2. Clique em "Imprimir" no menu Arquivo ou pressione Ctrl+P
+3. Seu roteiro será aberto no navegador padrão para impressão
+
+Importação:
+
+Você também pode importar roteiros de outros formatos:
+• FDX (Final Draft)
+• PDF
+• DOCX (Word)
+• Fountain
+
+Clique em "Importar" no menu Arquivo para selecionar um arquivo para importar.
+        """
+        
+        export_text.insert(tk.END, export_content)
+        export_text.config(state=tk.DISABLED)
+        
+        # Botão Fechar
+        close_btn = tk.Button(main_frame, text="Fechar", command=tutorial_window.destroy,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        close_btn.pack(pady=10)
+    
+    def show_formatting_guide(self):
+        # Criar janela de guia de formatação
+        guide_window = tk.Toplevel(self.root)
+        guide_window.title("Guia de Formatação")
+        guide_window.geometry("700x500")
+        guide_window.configure(bg=self.secondary_color)
+        guide_window.transient(self.root)
+        
+        # Frame principal
+        main_frame = tk.Frame(guide_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Título
+        tk.Label(main_frame, text="Guia de Formatação de Roteiros", bg=self.secondary_color, fg=self.fg_color, 
+                font=self.title_font).pack(anchor=tk.W, pady=10)
+        
+        # Notebook para abas do guia
+        guide_notebook = ttk.Notebook(main_frame)
+        guide_notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Aba 1: Padrão da Indústria
+        standard_frame = tk.Frame(guide_notebook, bg=self.secondary_color)
+        guide_notebook.add(standard_frame, text="Padrão da Indústria")
+        
+        standard_text = tk.Text(standard_frame, bg=self.bg_color, fg=self.fg_color, 
+                               wrap=tk.WORD, bd=0, padx=10, pady=10)
+        standard_text.pack(fill=tk.BOTH, expand=True)
+        
+        standard_content = """
+Padrão de Formatação da Indústria
+
+O padrão de formatação de roteiros segue convenções estabelecidas pela indústria cinematográfica. Aqui estão as principais regras:
+
+Cenas:
+
+As cenas devem ser formatadas da seguinte maneira:
+
+CENA: LOCAL - DIA/NOITE
+
+• A palavra "CENA:" deve estar em maiúsculas
+• O local deve ser descrito de forma clara e concisa
+• O horário deve ser "DIA" ou "NOITE" (ou variações como "MANHÃ", "TARDE", "NOITE", "MADRUGADA", etc.)
+• Cenas devem ser escritas em maiúsculas
+• Cenas devem ser alinhadas à esquerda
+
+Personagens:
+
+Os nomes dos personagens devem ser formatados da seguinte maneira:
+
+                                     NOME DO PERSONAGEM
+
+• Nomes de personagens devem estar em maiúsculas
+• Nomes de personagens devem ser centralizados na página
+• Nomes de personagens não devem ultrapassar 40 caracteres
+
+Diálogos:
+
+Os diálogos devem ser formatados da seguinte maneira:
+
+               Diálogo do personagem aqui...
+
+• Diálogos devem ter um recuo de aproximadamente 15 espaços
+• Diálogos não devem ultrapassar 35 caracteres por linha
+• Diálogos devem seguir imediatamente após o nome do personagem
+
+Ações:
+
+As ações devem ser formatadas da seguinte maneira:
+
+          Ação ou descrição da cena aqui...
+
+• Ações devem ter um recuo de aproximadamente 10 espaços
+• Ações devem ser escritas em letra minúscula, exceto nomes próprios
+• Ações devem descrever visualmente o que acontece na cena
+
+Transições:
+
+As transições devem ser formatadas da seguinte maneira:
+
+                                    TRANSIÇÃO: CORTE PARA:
+
+• Transições devem ser alinhadas à direita
+• Transições devem estar em maiúsculas
+• Transições comuns incluem "CORTE PARA:", "DISSOLVÊNCIA PARA:", "FADE OUT:", etc.
+
+Notas:
+
+As notas devem ser formatadas da seguinte maneira:
+
+NOTA: Esta é uma nota sobre o roteiro.
+
+• Notas devem começar com "NOTA:"
+• Notas devem ser usadas para comentários ou anotações
+• Notas não devem fazer parte do roteiro final
+        """
+        
+        standard_text.insert(tk.END, standard_content)
+        standard_text.config(state=tk.DISABLED)
+        
+        # Aba 2: Exemplos
+        examples_frame = tk.Frame(guide_notebook, bg=self.secondary_color)
+        guide_notebook.add(examples_frame, text="Exemplos")
+        
+        examples_text = tk.Text(examples_frame, bg=self.bg_color, fg=self.fg_color, 
+                               wrap=tk.WORD, bd=0, padx=10, pady=10)
+        examples_text.pack(fill=tk.BOTH, expand=True)
+        
+        examples_content = """
+Exemplos de Formatação
+
+Aqui estão alguns exemplos de como formatar diferentes elementos de um roteiro:
+
+Exemplo de Cena:
+
+CENA: CASA DE JOÃO - SALA DE ESTAR - NOITE
+
+A sala está iluminada apenas pela luz da TV. JOÃO (30) está sentado no sofá, assistindo a um filme.
+
+                                     JOÃO
+               (para si mesmo)
+               Eu deveria ter ido para a cama mais cedo.
+
+João se levanta e caminha até a janela. Ele olha para fora.
+
+                                     JOÃO
+               (suspirando)
+               Mais uma noite sem dormir.
+
+Exemplo de Diálogo:
+
+                                     MARIA
+               Você não vai dormir nunca?
+
+                                     JOÃO
+               (virando-se)
+               Maria! Eu não te ouvi entrar.
+
+                                     MARIA
+               Claro, você estava muito concentrado
+               na TV.
+
+                                     JOÃO
+               É que... eu não consigo dormir
+               ultimamente.
+
+Exemplo de Ação:
+
+Maria se aproxima de João e coloca a mão no seu ombro.
+
+                                     MARIA
+               (com voz suave)
+               Eu sei. Mas você precisa tentar.
+
+João olha para Maria e sorri fracamente.
+
+                                     JOÃO
+               Você sempre sabe o que dizer.
+
+Exemplo de Transição:
+
+CENA: QUARTO DE JOÃO - NOITE
+
+João está deitado na cama, olhando para o teto. Maria está ao seu lado.
+
+                                     MARIA
+               Agora tente dormir. Eu fico aqui
+               com você.
+
+                                     JOÃO
+               (fechando os olhos)
+               Obrigado, Maria.
+
+Maria beija a testa de João.
+
+                                    TRANSIÇÃO: FADE OUT.
+
+Exemplo de Nota:
+
+NOTA: Esta cena precisa de mais diálogo para desenvolver melhor a relação entre os personagens.
+        """
+        
+        examples_text.insert(tk.END, examples_content)
+        examples_text.config(state=tk.DISABLED)
+        
+        # Aba 3: Dicas
+        tips_frame = tk.Frame(guide_notebook, bg=self.secondary_color)
+        guide_notebook.add(tips_frame, text="Dicas")
+        
+        tips_text = tk.Text(tips_frame, bg=self.bg_color, fg=self.fg_color, 
+                           wrap=tk.WORD, bd=0, padx=10, pady=10)
+        tips_text.pack(fill=tk.BOTH, expand=True)
+        
+        tips_content = """
+Dicas de Formatação
+
+Aqui estão algumas dicas para formatar seu roteiro de forma profissional:
+
+Consistência:
+
+Mantenha a formatação consistente em todo o roteiro. Isso torna mais fácil para os leitores (diretores, produtores, atores) entenderem seu trabalho.
+
+Clareza:
+
+Seja claro e conciso em suas descrições. Evite jargões desnecessários e descreva apenas o que pode ser visto ou ouvido.
+
+Diálogos:
+
+Mantenha os diálogos naturais e realistas. Evite monólogos longos, a menos que sejam essenciais para a história.
+
+Personagens:
+
+Apresente seus personagens de forma clara. Na primeira aparição, inclua uma breve descrição entre parênteses.
+
+                                     JOÃO (30)
+               (vestido com roupas informais)
+               Um homem cansado, com olheiras profundas.
+
+Ações:
+
+Descreva as ações de forma visual. Em vez de "João está triste", escreva "João chora silenciosamente" ou "João se senta e esconde o rosto nas mãos".
+
+Cenas:
+
+Mantenha as cenas breves e dinâmicas. Cenas muito longas podem tornar o roteiro cansativo de ler.
+
+Transições:
+
+Use transições com moderação. Na maioria dos casos, "CORTE PARA:" é suficiente. Transições mais elaboradas como "DISSOLVÊNCIA PARA:" devem ser usadas apenas quando necessárias.
+
+Notas:
+
+Use notas com moderação. Elas são úteis para lembrar-se de algo, mas não devem fazer parte do roteiro final.
+
+Revisão:
+
+Revise seu roteiro várias vezes. Verifique a formatação, a gramática e a ortografia. Peça para outras pessoas lerem e darem opiniões.
+
+Software:
+
+Use um software de formatação de roteiros como o Roteirista Pro para garantir que seu roteiro siga o padrão da indústria.
+
+Lembre-se: um roteiro bem formatado é mais fácil de ler e profissional. Isso pode fazer a diferença entre seu roteiro ser lido ou ignorado.
+        """
+        
+        tips_text.insert(tk.END, tips_content)
+        tips_text.config(state=tk.DISABLED)
+        
+        # Botão Fechar
+        close_btn = tk.Button(main_frame, text="Fechar", command=guide_window.destroy,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        close_btn.pack(pady=10)
+    
+    def show_about(self):
+        # Criar janela Sobre
+        about_window = tk.Toplevel(self.root)
+        about_window.title("Sobre")
+        about_window.geometry("400x300")
+        about_window.configure(bg=self.secondary_color)
+        about_window.transient(self.root)
+        
+        # Frame principal
+        main_frame = tk.Frame(about_window, bg=self.secondary_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Título
+        tk.Label(main_frame, text="Roteirista Pro v2.0", bg=self.secondary_color, fg=self.fg_color, 
+                font=self.title_font).pack(anchor=tk.W, pady=10)
+        
+        # Conteúdo
+        about_text = tk.Text(main_frame, bg=self.bg_color, fg=self.fg_color, 
+                            wrap=tk.WORD, bd=0, padx=10, pady=10, height=10)
+        about_text.pack(fill=tk.BOTH, expand=True)
+        
+        about_content = """
+Roteirista Pro é um aplicativo para escrita de roteiros de filmes, séries e vídeos.
+
+Desenvolvido com Python e Tkinter, este aplicativo oferece uma interface intuitiva e recursos poderosos para roteiristas profissionais e amadores.
+
+Recursos principais:
+• Formatação profissional de roteiros
+• Gerenciamento de personagens e cenas
+• Exportação para PDF, HTML e Fountain
+• Interface personalizável
+• Atalhos de teclado para aumentar a produtividade
+• Salvamento seguro com senha
+• Análise de roteiros com sugestões de melhoria
+
+© 2025 - Todos os direitos reservados.
+        """
+        
+        about_text.insert(tk.END, about_content)
+        about_text.config(state=tk.DISABLED)
+        
+        # Botão Fechar
+        close_btn = tk.Button(main_frame, text="Fechar", command=about_window.destroy,
+                             bg=self.blue_color, fg=self.fg_color, bd=0, padx=10)
+        close_btn.pack(pady=10)
+    
+    def exit_app(self):
+        if self.text_editor.edit_modified():
+            response = messagebox.askyesnocancel("Salvar alterações", 
+                                                 "Deseja salvar as alterações antes de sair?")
+            if response is True:
+                self.save_file()
+            elif response is None:
+                return
+        
+        self.save_settings()
+        self.scheduler.cancel_all()
+        self.workers.shutdown()
+        self.regex_worker.stop()
+        if self.project_pool is not None:
+            self.project_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
+    def auto_save(self):
+        if self.settings['auto_save'] and self.current_file and self.text_editor.edit_modified():
+            self.save_file()
+        
+        # Agendar próximo auto-salvamento
+        self.scheduler.schedule('auto_save', self.settings['auto_save_interval'] * 60000, self.auto_save)
+    
+    def load_settings(self):
+        settings_path = os.path.join(os.path.expanduser('~'), '.roteirista_pro_settings.json')
+        if os.path.exists(settings_path):
+            try:
+                with open(settings_path, 'r') as f:
+                    self.settings.update(json.load(f))
+            except:
+                pass
+    
+    def save_settings(self):
+        settings_path = os.path.join(os.path.expanduser('~'), '.roteirista_pro_settings.json')
+        try:
+            with open(settings_path, 'w') as f:
+                json.dump(self.settings, f)
+        except:
+            pass
+    
+    def save_metadata(self):
+        if not self.current_file:
+            return
+            
+        # Salvar metadados (personagens, cenas e notas) em um arquivo separado
+        metadata_path = os.path.splitext(self.current_file)[0] + '.meta'
+        
+        metadata = {
+            'characters': self.characters,
+            'scenes': self.scenes,
+            'notes': self.notes_editor.get(1.0, tk.END).strip()
+        }
+        
+        try:
+            with open(metadata_path, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f)
+        except:
+            pass
+        
+        # Índice de busca (se já foi construído nesta sessão)
+        self.save_search_index()
+    
+    def load_metadata(self):
+        if not self.current_file:
+            return
+            
+        # Carregar metadados (personagens, cenas e notas) de um arquivo separado
+        metadata_path = os.path.splitext(self.current_file)[0] + '.meta'
+        
+        if not os.path.exists(metadata_path):
+            return
+            
+        try:
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+                
+            # Carregar personagens
+            self.characters = metadata.get('characters', [])
+            self.characters_listbox.delete(0, tk.END)
+            for char in self.characters:
+                self.characters_listbox.insert(tk.END, self.character_list_label(char['name']))
+                
+            # Carregar cenas
+            self.scenes = metadata.get('scenes', [])
+            self.scenes_listbox.delete(0, tk.END)
+            for scene in self.scenes:
+                self.scenes_listbox.insert(tk.END, scene['title'])
+                
+            # Carregar notas
+            notes = metadata.get('notes', '')
+            self.notes_editor.delete(1.0, tk.END)
+            self.notes_editor.insert(1.0, notes)
+        except:
+            pass
+    
+    def import_fdx(self, file_path):
+        # Importar do formato Final Draft (FDX)
+        # Esta é uma implementação simplificada
+        try:
+            import xml.etree.ElementTree as ET
+            
+            tree = ET.parse(file_path)
+            root = tree.getroot()
+            
+            # Limpar o editor
+            self.document.drop_search_index()
+            self.text_editor.delete(1.0, tk.END)
+            
+            # Extrair conteúdo
+            for paragraph in root.findall('.//Paragraph'):
+                element_type = paragraph.get('Type')
+                text = paragraph.text or ''
+                
+                if element_type == 'Scene Heading':
+                    self.text_editor.insert(tk.END, f"\n\n{text}\n")
+                    self.text_editor.tag_add("scene", "insert-2l linestart", "insert-2l lineend")
+                elif element_type == 'Character':
+                    self.text_editor.insert(tk.END, f"\n\n{text}\n")
+                    self.text_editor.tag_add("character", "insert-2l linestart", "insert-2l lineend")
+                elif element_type == 'Dialogue':
+                    self.text_editor.insert(tk.END, f"{text}\n")
+                elif element_type == 'Action':
+                    self.text_editor.insert(tk.END, f"\n\n{text}\n")
+                elif element_type == 'Transition':
+                    self.text_editor.insert(tk.END, f"\n\n{text}\n")
+                    self.text_editor.tag_add("transition", "insert-2l linestart", "insert-2l lineend")
+                else:
+                    self.text_editor.insert(tk.END, f"{text}\n")
+            
+            self.update_status(f"Arquivo FDX importado: {os.path.basename(file_path)}")
+        except Exception as e:
+            messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo FDX: {str(e)}")
+    
+    def import_pdf(self, file_path):
+        # Importar do formato PDF
+        # Esta é uma implementação simplificada que requer a biblioteca PyPDF2
+        def done(text):
+            # Limpar o editor e carregar o texto extraído
+            self.load_content(text)
+            self.update_status(f"Arquivo PDF importado: {os.path.basename(file_path)}")
+        
+        def failed(error):
+            if isinstance(error, ImportError):
+                messagebox.showerror("Erro ao importar", "Para importar arquivos PDF, é necessário instalar a biblioteca PyPDF2.")
+            else:
+                messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo PDF: {str(error)}")
+        
+        self.run_in_background("Importar PDF", self.extract_pdf_text, file_path, on_done=done, on_error=failed)
+    
+    def extract_pdf_text(self, file_path, task=None):
+        import PyPDF2
+        
+        with open(file_path, 'rb') as file:
+            reader = PyPDF2.PdfReader(file)
+            pages = []
+            
+            for i, page in enumerate(reader.pages):
+                if task:
+                    task.progress(i, len(reader.pages), f"Lendo página {i + 1}...")
+                pages.append(page.extract_text() + "\n\n")
+            
+            return "".join(pages)
+    
+    def import_docx(self, file_path):
+        # Importar do formato DOCX (Word)
+        # Esta é uma implementação simplificada que requer a biblioteca python-docx
+        def done(text):
+            # Limpar o editor e carregar o texto extraído
+            self.load_content(text)
+            self.update_status(f"Arquivo DOCX importado: {os.path.basename(file_path)}")
+        
+        def failed(error):
+            if isinstance(error, ImportError):
+                messagebox.showerror("Erro ao importar", "Para importar arquivos DOCX, é necessário instalar a biblioteca python-docx.")
+            else:
+                messagebox.showerror("Erro ao importar", f"Não foi possível importar o arquivo DOCX: {str(error)}")
+        
+        self.run_in_background("Importar DOCX", self.extract_docx_text, file_path, on_done=done, on_error=failed)
+    
+    def extract_docx_text(self, file_path, task=None):
+        from docx import Document
+        
+        doc = Document(file_path)
+        paragraphs = []
+        
+        for i, paragraph in enumerate(doc.paragraphs):
+            if task and i % 500 == 0:
+                task.progress(i, len(doc.paragraphs), "Lendo parágrafos...")
+            paragraphs.append(paragraph.text + "\n\n")
+        
+        return "".join(paragraphs)
+
+def create_desktop_shortcut():
+    """Cria um atalho na área de trabalho para o aplicativo"""
+    try:
+        import win32com.client
+        
+        desktop = os.path.join(os.path.join(os.environ['USERPROFILE']), 'Desktop')
+        path = os.path.join(desktop, "Roteirista Pro.lnk")
+        
+        shell = win32com.client.Dispatch("WScript.Shell")
+        shortcut = shell.CreateShortCut(path)
+        shortcut.Targetpath = sys.executable
+        shortcut.Arguments = os.path.abspath(__file__)
+        shortcut.IconLocation = sys.executable + ",0"
+        shortcut.save()
+        
+        messagebox.showinfo("Atalho Criado", "Um atalho foi criado na área de trabalho!")
+    except:
+        messagebox.showwarning("Atalho Não Criado", 
+                             "Não foi possível criar o atalho automaticamente. "
+                             "Você pode criar um manualmente.")
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = ScriptWriterApp(root)
+    
+    # Verificar se foi passado o argumento para criar atalho
+    if len(sys.argv) > 1 and sys.argv[1] == "--create-shortcut":
+        create_desktop_shortcut()
+    
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""Roteiro sintético usado pelos testes e pelos benchmarks"""
+
+def generate_sample_script(pages, lines_per_page=55):
+    """Gera um roteiro sintético com o número de páginas pedido (usado nos benchmarks)"""
+    characters = ["JOÃO", "MARIA", "PEDRO", "ANA", "DETETIVE SOUZA"]
+    block = []
+    scene = 0
+    while len(block) < pages * lines_per_page:
+        scene += 1
+        block.append(f"CENA: {'INT' if scene % 2 else 'EXT'}. LOCAL {scene} - {'DIA' if scene % 3 else 'NOITE'}")
+        block.append("")
+        block.append("          Ação descrevendo o ambiente e o movimento dos personagens em cena.")
+        block.append("")
+        for turn in range(4):
+            name = characters[(scene + turn) % len(characters)]
+            block.append(' ' * ((80 - len(name)) // 2) + name)
+            block.append("               Diálogo do personagem com algumas palavras a mais aqui.")
+            block.append("")
+        block.append("                                                  TRANSIÇÃO: CORTE PARA:")
+        block.append("")
+    return '\n'.join(block[:pages * lines_per_page])
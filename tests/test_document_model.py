@@ -0,0 +1,172 @@
+"""Modelo incremental do documento (ScriptDocument) contra uma análise completa do texto"""
+
+import os
+import random
+import tempfile
+
+import pytest
+
+from roteirista_pro import (ELEMENT_LABELS, KIND_CODES, ScriptDocument, SearchIndex, character_key,
+                            compile_search, iter_element_lines, iter_search_chunks, parse_screenplay,
+                            scene_matches)
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_document_model(seed, iterations=5000):
+    """Compara o modelo incremental do documento com uma análise completa após edições aleatórias"""
+    rng = random.Random(seed)
+    snippets = ["\n", "\n\n", "CENA: INT. CASA - DIA", "CENA: EXT. RUA - NOITE", "JOÃO", "MARIA\n", "DETETIVE SOUZA\n",
+                "JOÃO (V.O.)\n", " (CONT'D)", "(O.S.)",
+                "TRANSIÇÃO: CORTE PARA:", "NOTA: revisar", "fala do personagem ", "ação ", "   ", "x", "Ok."]
+    character_width = 40
+    document = ScriptDocument(character_width)
+    document.search_index.build(document.lines)
+    text = ""
+    snapshot = document.snapshot()
+    pending_index = None  # snapshot de um índice "em construção" (como na thread de trabalho)
+    character_summary, character_version = {}, document.character_index.version
+    
+    for iteration in range(iterations):
+        # Índice refeito a partir de um snapshot e adotado algumas edições depois
+        if pending_index is None and rng.random() < 0.005:
+            document.search_index.clear()
+            pending_index = document.begin_index_build()
+        elif pending_index is not None and rng.random() < 0.05:
+            index = SearchIndex()
+            index.build(list(pending_index))
+            if rng.random() < 0.2:
+                # Conteúdo substituído (outro arquivo aberto) durante a construção: o índice antigo é recusado
+                document.drop_search_index()
+                assert not document.adopt_search_index(index, pending_index) and not document.search_index.built, \
+                    f"Divergência na iteração {iteration}: índice de busca descartado"
+            else:
+                document.adopt_search_index(index, pending_index)
+            pending_index = None
+        
+        # Edição aleatória expressa como o gancho do editor a veria: linhas [first, last] -> novas linhas
+        if text and rng.random() < 0.4:
+            start = rng.randrange(len(text))
+            end = min(len(text), start + rng.randint(1, 40))
+        else:
+            start = end = rng.randint(0, len(text))
+        inserted = "" if end > start else "".join(rng.choice(snippets) for _ in range(rng.randint(1, 4)))
+        
+        first = text.count('\n', 0, start)
+        last = text.count('\n', 0, end)
+        text_before = text + '\n'
+        text = text[:start] + inserted + text[end:]
+        lines = text.split('\n')
+        
+        # As quebras removidas somem do intervalo; as inseridas criam novas linhas
+        new_last = first + inserted.count('\n')
+        old_types = document.types[:]
+        changed_end = document.replace_lines(first, last - first + 1, lines[first:new_last + 1])
+        
+        # Fora de [first, changed_end) nenhum tipo pode mudar (senão as tags ficariam desatualizadas)
+        shift = new_last - last
+        untouched = document.types[changed_end:] == old_types[changed_end - shift:]
+        
+        if rng.random() < 0.01:
+            character_width = rng.choice((10, 20, 40))
+            document.set_character_width(character_width)
+        
+        expected = parse_screenplay('\n'.join(lines), character_width)
+        problems = []
+        if not untouched:
+            problems.append("tags")
+        
+        # A versão anterior continua intacta e a atual reflete a edição
+        previous_text, previous = text_before, snapshot
+        snapshot = document.snapshot()
+        if previous.text() != previous_text or list(snapshot) != lines:
+            problems.append("versões")
+        if document.lines != lines:
+            problems.append("linhas")
+        if document.words != sum(len(line.split()) for line in lines):
+            problems.append("palavras")
+        if document.char_count != len(text) + 1:
+            problems.append("caracteres")
+        if document.elements() != expected:
+            problems.append("elementos")
+        if rng.random() < 0.3:
+            # Conversão deslocamento -> índice do Tk (consultada só às vezes, para exercitar o recálculo parcial)
+            offset = rng.randint(0, len(text))
+            line = text.count('\n', 0, offset)
+            column = offset - text.rfind('\n', 0, offset) - 1
+            index = f"{line + 1}.{column}"
+            if document.index(offset) != index or document.offset(index) != offset:
+                problems.append("deslocamentos")
+        if text and rng.random() < 0.1:
+            # Busca pelo índice (mantido pelas edições) igual à varredura completa
+            start = rng.randrange(len(text))
+            term = text[start:start + rng.randint(1, 8)]
+            pattern = compile_search(term, rng.random() < 0.5, rng.random() < 0.3)
+            whole_word = pattern.pattern.startswith(r'\b')
+            indexed = [match for found in document.iter_matches(pattern, term, whole_word) for match in found]
+            scanned = [match for found in iter_search_chunks(pattern, document.snapshot()) for match in found]
+            if indexed != scanned:
+                problems.append("índice de busca")
+        scene_code = KIND_CODES['scene']
+        scene_starts = [expected.starts[i] for i in range(len(expected)) if expected.kinds[i] == scene_code]
+        scene_titles = [lines[start].strip()[5:].strip() for start in scene_starts]
+        if list(document.scene_index.starts) != scene_starts or document.scene_index.titles != scene_titles:
+            problems.append("cenas")
+        
+        # Personagens: deixas, linhas e palavras de diálogo e primeira aparição
+        characters = {}
+        for kind, stripped, line in iter_element_lines(expected):
+            if kind == 'character':
+                entry = characters.setdefault(character_key(stripped), [0, 0, 0, line])
+                entry[0] += 1
+                speaker = entry
+            elif kind == 'dialogue':
+                speaker[1] += 1
+                speaker[2] += len(stripped.split())
+        summary = document.character_index.summary()
+        if summary != {name: tuple(entry) for name, entry in characters.items()}:
+            problems.append("personagens")
+        if summary != character_summary and document.character_index.version == character_version:
+            problems.append("versão dos personagens")
+        character_summary, character_version = summary, document.character_index.version
+        if rng.random() < 0.1:
+            # Busca estruturada pelos índices igual a percorrer os elementos
+            filters = {
+                'kind': rng.choice((None,) + tuple(ELEMENT_LABELS)),
+                'character': rng.choice([None, "joão", "Maria"] + list(characters)),
+                'scene': rng.choice((None, "casa", "rua")),
+                'location': rng.choice((None, 'INT', 'EXT')),
+                'period': rng.choice((None, 'DIA', 'NOITE')),
+            }
+            name = character_key(filters['character'].upper()) if filters['character'] else None
+            scoped = filters['scene'] or filters['location'] or filters['period']
+            walked = []
+            title = speaker = None
+            for kind, stripped, line in iter_element_lines(expected):
+                if kind == 'scene':
+                    title = stripped[5:].strip()
+                if kind == 'character':
+                    speaker = character_key(stripped)
+                elif kind not in ('dialogue', 'blank'):
+                    speaker = None
+                if kind == 'blank' or (filters['kind'] and kind != filters['kind']):
+                    continue
+                if name and (speaker != name or kind not in ('character', 'dialogue')):
+                    continue
+                if scoped and (title is None or not scene_matches(title, filters['scene'], filters['location'],
+                                                                  filters['period'])):
+                    continue
+                walked.append(line)
+            if document.structured_lines(**filters) != walked:
+                problems.append("busca estruturada")
+        assert not problems, f"Divergência na iteração {iteration}: {', '.join(problems)}"
+    
+    # O índice gravado volta igual para o mesmo texto e é recusado para outro
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'roteiro.idx')
+        index = document.search_index
+        index.save(path, document.content_hash())
+        positions = index.positions()
+        expected = {word: {positions[line_id] for line_id in ids} for word, ids in index.postings.items()}
+        restored = SearchIndex()
+        assert restored.load(path, document.content_hash()) and restored.postings == expected \
+            and not restored.load(path, "outro"), "Divergência no índice de busca gravado"
@@ -0,0 +1,87 @@
+"""Busca por expressão regular no processo à parte (RegexWorker): resultados, substituições e tempo limite"""
+
+import threading
+import time
+
+from roteirista_pro import REGEX_FLUSH_MS, SNAPSHOT_CHUNK_LINES, RegexWorker, ScriptDocument, compile_search
+
+from tests.sample_script import generate_sample_script
+
+
+def run(worker, *args, **kwargs):
+    worker.start(*args, **kwargs)
+    return collect(worker)
+
+def collect(worker):
+    found = []
+    while True:
+        batches, status = worker.poll()
+        for batch in batches:
+            found.extend(batch)
+        if status is not None:
+            return found, status
+        time.sleep(REGEX_FLUSH_MS / 1000 / 5)
+
+def test_regex_worker(budget_ms=500):
+    """Ocorrências iguais às do re, tempo limite respeitado e pedidos novos atendidos sem bloquear"""
+    document = ScriptDocument(40)
+    document.reset(generate_sample_script(100).split('\n'))
+    worker = RegexWorker()
+    problems = []
+    try:
+        # Ocorrências e grupos expandidos iguais aos do re no próprio processo
+        query = (r"LOCAL (\d+) - (DIA|NOITE)", False, False)
+        pattern = compile_search(*query, True)
+        expected = [(line, match.start(), match.end(), match.expand(r"\2 \1"))
+                    for line, text in enumerate(document.lines) for match in pattern.finditer(text)]
+        found, status = run(worker, query, document.snapshot(), template=r"\2 \1", budget_ms=budget_ms * 10)
+        if status != 'done' or [(line, start, end, text) for line, start, end, offset, text in found] != expected:
+            problems.append("ocorrências")
+        
+        # Padrão catastrófico numa linha: interrompido no tempo limite, com as ocorrências anteriores
+        lines = document.lines[:2 * SNAPSHOT_CHUNK_LINES] + ["a" * 40 + "!"] + document.lines
+        document.reset(lines)
+        query = (r"(a+)+$", False, False)
+        pattern = compile_search(*query, True)
+        expected = [(line, match.start(), match.end(), 0) for line, text in enumerate(lines[:2 * SNAPSHOT_CHUNK_LINES])
+                    for match in pattern.finditer(text)]
+        start = time.perf_counter()
+        found, status = run(worker, query, document.snapshot(), budget_ms=budget_ms)
+        elapsed = (time.perf_counter() - start) * 1000
+        if status != 'timeout' or elapsed > budget_ms + 1000 or \
+                [(line, start, end, 0) for line, start, end, offset in found] != expected:
+            problems.append("tempo limite")
+        
+        # Um pedido novo logo depois do último lote de um pedido travado, com um texto maior que o buffer
+        # do Pipe: start volta na hora (o processo é trocado) e a nova busca termina
+        lines = lines[:2 * SNAPSHOT_CHUNK_LINES + 1] + generate_sample_script(300).split('\n')
+        document.reset(lines)
+        run(worker, ("CENA", True, True), document.snapshot())  # processo já iniciado
+        worker.start(query, document.snapshot(), budget_ms=budget_ms * 100)
+        received = 0
+        give_up = time.perf_counter() + 10
+        while received < 2 and time.perf_counter() < give_up:
+            received += len(worker.poll()[0])
+            time.sleep(REGEX_FLUSH_MS / 1000 / 5)
+        sender = threading.Thread(target=worker.start, args=(("CENA", True, True), document.snapshot()),
+                                  kwargs={'budget_ms': budget_ms * 10}, daemon=True)
+        start = time.perf_counter()
+        sender.start()
+        sender.join(5)
+        if sender.is_alive() or time.perf_counter() - start > 2:
+            problems.append("pedido novo bloqueado")
+            worker.stop()
+            sender.join(5)
+        else:
+            found, status = collect(worker)
+            if status != 'done' or len(found) != sum(line.count("CENA") for line in lines):
+                problems.append("pedido novo")
+        
+        # Grupo inexistente na substituição
+        found, status = run(worker, ("LOCAL", False, False), document.snapshot(), template=r"\9")
+        if status != 'error':
+            problems.append("erro")
+    finally:
+        worker.stop()
+    
+    assert not problems, f"Busca por expressão regular: falhou ({', '.join(problems)})"